@@ -0,0 +1,237 @@
+# app/adapters/card_compaction.py
+"""
+Teams 전송 전 card 크기 줄이기
+
+- Teams webhook 은 일정 크기(약 28KB)를 넘는 card 를 거부한다.
+  긴 Cause or Stack Trace fact 하나가 card 대부분을 차지하는 경우가 많다.
+- 이미 만든 인코딩(encode_card, Graph 원본 바이트)으로 먼저 판단한다.
+  - 전체 크기가 fact 상한 이하면 어떤 fact 도 상한을 넘을 수 없으므로 fact 는 보지 않는다.
+  - 줄일 것이 없으면 (대부분의 card) 그 바이트를 그대로 보낸다 → 추가 인코딩 없음
+- 줄여야 할 때만 사본을 만들어 인코딩한다.
+  - fact value, card / section 의 text·title 을 fact_max_bytes (UTF-8) 로 자르고 표시를 붙인다.
+  - 빈 section (값이 모두 비어 있음) 은 뺀다.
+  - 그래도 max_bytes 를 넘으면 상한을 절반씩 줄여 다시 시도 (최소 _MIN_FACT_BYTES)
+  - 최소 상한에서도 넘으면 뒤쪽 section / fact 부터 빼고 "… N more" section 을 붙인다 (degraded card)
+  - 그래도 넘으면 제목과 안내 문구만 남긴 card
+  → 알림은 버리지 않는다 (특히 장애 채널). 항상 전송할 바이트를 돌려준다.
+- EncodedCard 는 결과를 캐시한다 (포워딩 + 장애 채널로 같은 card 를 보내도 한 번만 처리)
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple
+import logging
+
+from app import metrics
+from app.adapters.card_encoding import EncodedCard, dumps_card, encode_card
+
+logger = logging.getLogger(__name__)
+
+# 잘린 fact 뒤에 붙이는 표시
+TRUNCATED_MARKER = "\n… [truncated {} bytes]"
+
+# fact 상한을 줄여 가는 하한
+_MIN_FACT_BYTES = 256
+
+# 자르는 문자열 필드
+_CARD_TEXT_FIELDS = ("title", "summary", "text")
+_SECTION_TEXT_FIELDS = ("title", "text", "activityTitle", "activitySubtitle", "activityText")
+
+# 최후의 card 에 남기는 필드 (나머지는 버림)
+_FALLBACK_FIELDS = ("@type", "@context", "themeColor", "title", "summary")
+
+
+def truncate_utf8(value: str, limit: int) -> str:
+    """UTF-8 기준 limit 바이트로 자르고 잘린 바이트 수 표시 (문자 중간에서 자르지 않음)"""
+    raw = value.encode("utf-8")
+    if len(raw) <= limit:
+        return value
+    kept = raw[:limit].decode("utf-8", "ignore")
+    return kept + TRUNCATED_MARKER.format(len(raw) - len(kept.encode("utf-8")))
+
+
+def _is_empty_section(section: Any) -> bool:
+    return isinstance(section, dict) and not any(section.values())
+
+
+def _fact_too_large(fact: Any, limit: int) -> bool:
+    if not isinstance(fact, dict):
+        return False
+    return _text_too_large(fact.get("value"), limit)
+
+
+def _text_too_large(value: Any, limit: int) -> bool:
+    # 한 글자는 최대 4바이트 → 글자 수로 먼저 거르고 필요할 때만 인코딩
+    return isinstance(value, str) and len(value) * 4 > limit and len(value.encode("utf-8")) > limit
+
+
+def _more_marker(sections: int, facts: int) -> Dict[str, Any]:
+    """뺀 section / fact 수 안내 section"""
+    parts = []
+    if sections:
+        parts.append(f"{sections} more sections")
+    if facts:
+        parts.append(f"{facts} more facts")
+    return {"text": f"… {', '.join(parts)} (omitted: Teams size limit)"}
+
+
+class CardCompactor:
+    """전송할 card → 크기 제한을 지킨 JSON 바이트"""
+
+    def __init__(self, max_bytes: int = 28_000, fact_max_bytes: int = 4_096):
+        """
+        Args:
+            max_bytes: 전송 본문 상한 (바이트)
+            fact_max_bytes: fact value / text 하나의 상한 (UTF-8 바이트)
+        """
+        if max_bytes <= 0 or fact_max_bytes <= 0:
+            raise ValueError("max_bytes and fact_max_bytes must be positive")
+        self.max_bytes = max_bytes
+        self.fact_max_bytes = fact_max_bytes
+
+    def encode(self, card: Dict[str, Any]) -> bytes:
+        """
+        card → 전송 본문
+
+        Returns:
+            JSON 바이트 (줄일 것이 없으면 encode_card 결과 그대로).
+            max_bytes 안으로 줄일 수 없으면 내용을 뺀 degraded card (항상 bytes)
+        """
+        key = (self.max_bytes, self.fact_max_bytes)
+        if isinstance(card, EncodedCard) and card._compacted is not None and card._compacted[0] == key:
+            return card._compacted[1]
+
+        body = self._encode(card)
+        if isinstance(card, EncodedCard):
+            card._compacted = (key, body)
+        return body
+
+    def _encode(self, card: Dict[str, Any]) -> bytes:
+        body = encode_card(card)
+        sections = card.get("sections")
+        if not isinstance(sections, list):
+            sections = []
+        if len(body) <= self.max_bytes and not self._needs_compaction(sections, len(body)):
+            return body
+
+        original = len(body)
+        limit = self.fact_max_bytes
+        while True:
+            compacted, truncated = self._truncate(card, sections, limit)
+            body = dumps_card(compacted)
+            if len(body) <= self.max_bytes or limit <= _MIN_FACT_BYTES:
+                break
+            limit = max(limit // 2, _MIN_FACT_BYTES)
+
+        if len(body) > self.max_bytes:
+            body = self._degrade(compacted, original)
+
+        metrics.increment("teams_cards_compacted")
+        if truncated:
+            metrics.increment("teams_facts_truncated", truncated)
+        logger.info(f"✂️ Card compacted: {original} → {len(body)} bytes ({truncated} fields truncated)")
+        return body
+
+    def _truncate(self, card: Dict[str, Any], sections: List[Any], limit: int) -> Tuple[Dict[str, Any], int]:
+        """긴 fact value / text 를 limit 로 자르고 빈 section 을 뺀 사본 → (사본, 자른 개수)"""
+        truncated = 0
+        compacted = dict(card)
+        for name in _CARD_TEXT_FIELDS:
+            if _text_too_large(compacted.get(name), limit):
+                compacted[name] = truncate_utf8(compacted[name], limit)
+                truncated += 1
+        compacted["sections"] = []
+        for section in sections:
+            if _is_empty_section(section):
+                continue
+            if isinstance(section, dict):
+                section = dict(section)
+                for name in _SECTION_TEXT_FIELDS:
+                    if _text_too_large(section.get(name), limit):
+                        section[name] = truncate_utf8(section[name], limit)
+                        truncated += 1
+                if isinstance(section.get("facts"), list):
+                    facts: List[Any] = []
+                    for fact in section["facts"]:
+                        if _fact_too_large(fact, limit):
+                            fact = {**fact, "value": truncate_utf8(fact["value"], limit)}
+                            truncated += 1
+                        facts.append(fact)
+                    section["facts"] = facts
+            compacted["sections"].append(section)
+        return compacted, truncated
+
+    def _degrade(self, compacted: Dict[str, Any], original: int) -> bytes:
+        """
+        뒤쪽 section / fact 를 빼서 max_bytes 에 맞춘다.
+
+        section 머리(fact 제외)와 fact 를 card 순서대로 늘어놓고, 앞에서부터 남길 수 있는
+        최대 개수를 이분 탐색한다 (인코딩 O(log n) 번).
+        """
+        metrics.increment("teams_cards_degraded")
+        sections = compacted["sections"]
+        items: List[Tuple[int, int]] = []  # (section index, fact index / -1 = section 머리)
+        for si, section in enumerate(sections):
+            items.append((si, -1))
+            if isinstance(section, dict) and isinstance(section.get("facts"), list):
+                items.extend((si, fi) for fi in range(len(section["facts"])))
+
+        def build(keep: int) -> bytes:
+            kept: Dict[int, Any] = {}
+            kept_facts = 0
+            for si, fi in items[:keep]:
+                if fi < 0:
+                    section = sections[si]
+                    if isinstance(section, dict) and isinstance(section.get("facts"), list):
+                        section = {**section, "facts": []}
+                    kept[si] = section
+                else:
+                    kept[si]["facts"].append(sections[si]["facts"][fi])
+                    kept_facts += 1
+            dropped_sections = len(sections) - len(kept)
+            dropped_facts = sum(1 for _, fi in items if fi >= 0) - kept_facts
+            return dumps_card({
+                **compacted,
+                "sections": [*kept.values(), _more_marker(dropped_sections, dropped_facts)],
+            })
+
+        low, high = 0, len(items) - 1  # 전부 남기면 넘는다는 것은 이미 확인
+        best = build(0)
+        if len(best) <= self.max_bytes:
+            while low < high:
+                mid = (low + high + 1) // 2
+                body = build(mid)
+                if len(body) <= self.max_bytes:
+                    low, best = mid, body
+                else:
+                    high = mid - 1
+            logger.warning(
+                f"⚠️ Card too large for Teams, sending degraded card "
+                f"({original} → {len(best)} bytes, kept {low}/{len(items)} sections+facts)"
+            )
+            return best
+
+        # section 없이도 넘음 (긴 필드가 section 밖에 있음) → 제목과 안내만
+        fallback = {name: compacted[name] for name in _FALLBACK_FIELDS if name in compacted}
+        for name in ("title", "summary"):
+            if isinstance(fallback.get(name), str):
+                fallback[name] = truncate_utf8(fallback[name], _MIN_FACT_BYTES)
+        fallback["text"] = f"⚠️ Card content omitted: {original} bytes exceeds Teams size limit"
+        body = dumps_card(fallback)
+        metrics.increment("teams_payload_too_large")
+        logger.error(
+            f"❌ Card is too large for Teams even without sections, sending title only "
+            f"({original} → {len(body)} bytes, limit {self.max_bytes})"
+        )
+        return body
+
+    def _needs_compaction(self, sections: List[Any], size: int) -> bool:
+        """빈 section 이 있거나 fact 상한을 넘는 fact 가 있는지"""
+        # 전체가 fact 상한 이하면 fact 하나가 상한을 넘을 수 없다
+        check_facts = size > self.fact_max_bytes
+        for section in sections:
+            if _is_empty_section(section):
+                return True
+            if check_facts and isinstance(section, dict) and isinstance(section.get("facts"), list):
+                if any(_fact_too_large(fact, self.fact_max_bytes) for fact in section["facts"]):
+                    return True
+        return False
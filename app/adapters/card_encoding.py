@@ -0,0 +1,54 @@
+# app/adapters/card_encoding.py
+"""
+MessageCard JSON 인코딩
+
+- 같은 payload 가 포워딩 채널과 장애 채널로 같이 나가면 채널마다 json.dumps 를 하게 된다.
+  (Cause or Stack Trace 가 긴 카드는 인코딩 비용이 크다)
+- EncodedCard: 인코딩 결과(bytes)를 같이 들고 다니는 card dict → 처음 한 번만 인코딩
+- Graph 첨부의 원본 JSON 문자열로 만든 EncodedCard 는 그 바이트를 그대로 전송 (다시 인코딩하지 않음)
+- card 는 만든 뒤 수정하지 않는다고 가정한다. 바꿀 때는 사본을 만든다 (ex. with_extra_section).
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Mapping, Optional, Tuple
+import json
+
+
+class EncodedCard(dict):
+    """인코딩 결과를 캐시하는 card dict"""
+
+    # _compacted: CardCompactor 결과 캐시 (설정값, 전송 바이트)
+    __slots__ = ("_encoded", "_compacted")
+
+    def __init__(self, card: Mapping[str, Any], encoded: Optional[bytes] = None):
+        """
+        Args:
+            card: MessageCard 딕셔너리
+            encoded: card 의 JSON 인코딩 (있으면 그대로 사용, ex. Graph 첨부 원본)
+        """
+        super().__init__(card)
+        self._encoded = encoded
+        self._compacted: Optional[Tuple[Tuple[int, int], bytes]] = None
+
+    @classmethod
+    def wrap(cls, card: Dict[str, Any]) -> "EncodedCard":
+        """이미 EncodedCard 면 그대로, 아니면 감싼다 (요청 하나에서 인코딩 공유)"""
+        return card if isinstance(card, cls) else cls(card)
+
+
+def dumps_card(card: Dict[str, Any]) -> bytes:
+    """card → UTF-8 JSON (공백 없이, 한글은 escape 하지 않음)"""
+    return json.dumps(card, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def encode_card(card: Dict[str, Any]) -> bytes:
+    """
+    card 의 JSON 인코딩
+
+    EncodedCard 면 처음 한 번만 인코딩하고 결과를 재사용한다.
+    """
+    if not isinstance(card, EncodedCard):
+        return dumps_card(card)
+    if card._encoded is None:
+        card._encoded = dumps_card(card)
+    return card._encoded
@@ -0,0 +1,31 @@
+# app/adapters/memory_anomaly_state.py
+"""
+프로세스 내 장애 탐지 상태 어댑터
+
+단일 replica 배포의 기본값. AnomalyDetector 를 그대로 감싼다.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Hashable, Optional
+
+from app.domain.anomaly import AnomalyDetector
+from app.domain.incident_type import IncidentType
+
+
+class InMemoryAnomalyState:
+    """AnomalyDetector 를 AnomalyStateBackend 로 노출"""
+
+    def __init__(self, detector: AnomalyDetector | None = None):
+        self.detector = detector if detector is not None else AnomalyDetector()
+
+    async def record_event(
+        self,
+        incident_type: IncidentType,
+        timestamp: datetime,
+        dimension: Optional[Hashable] = None,
+    ) -> bool:
+        return self.detector.record_event(incident_type, timestamp, dimension)
+
+    async def reset(self) -> None:
+        self.detector.reset()
@@ -0,0 +1,93 @@
+# app/adapters/memory_outbox.py
+"""
+프로세스 내 outbox 저장소 어댑터
+
+- 대기 메시지는 채널별 (next_attempt_at, id) heap 으로 관리 → claim 은 전송 시각이 된 것만 O(log n)
+- channel 없이 claim 하면 CHANNEL_PRIORITY 순서 (장애 채널이 먼저)
+- put 은 heap push 한 번 (I/O 없음)
+- 프로세스가 종료되면 대기 중인 메시지는 사라진다.
+"""
+from __future__ import annotations
+
+from collections import Counter, defaultdict, deque
+from itertools import count
+from typing import Any, DefaultDict, Deque, Dict, List, Optional, Tuple
+import heapq
+
+from app.application.ports.notifier import CHANNEL_PRIORITY
+from app.application.ports.outbox import OutboxMessage
+
+
+class InMemoryOutboxStore:
+    """채널별 heap + dict 기반 OutboxStore"""
+
+    def __init__(self, dead_letter_size: int = 1000):
+        """
+        Args:
+            dead_letter_size: 보관할 dead letter 최대 개수 (오래된 것부터 버림)
+        """
+        self._ids = count(1)
+        self._messages: Dict[int, OutboxMessage] = {}
+        self._ready: DefaultDict[str, List[Tuple[float, int]]] = defaultdict(list)
+        self._pending: Counter = Counter()
+        self._dead: Deque[OutboxMessage] = deque(maxlen=dead_letter_size)
+
+    async def open(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    def put(self, channel: str, card: Dict[str, Any], now: float) -> int:
+        message_id = next(self._ids)
+        self._add(OutboxMessage(message_id, channel, card, now, now))
+        return message_id
+
+    def _add(self, message: OutboxMessage) -> None:
+        """새 메시지 (또는 복구한 메시지) 등록"""
+        self._messages[message.id] = message
+        self._pending[message.channel] += 1
+        heapq.heappush(self._ready[message.channel], (message.next_attempt_at, message.id))
+
+    def _channels(self, channel: Optional[str]) -> List[str]:
+        if channel is not None:
+            return [channel]
+        others = sorted(c for c in self._ready if c not in CHANNEL_PRIORITY)
+        return [*CHANNEL_PRIORITY, *others]
+
+    async def claim(
+        self, limit: int, now: float, channel: Optional[str] = None
+    ) -> List[OutboxMessage]:
+        claimed = []
+        for name in self._channels(channel):
+            ready = self._ready.get(name)
+            while ready and len(claimed) < limit and ready[0][0] <= now:
+                _, message_id = heapq.heappop(ready)
+                claimed.append(self._messages[message_id])
+        return claimed
+
+    async def next_due(self, channel: Optional[str] = None) -> Optional[float]:
+        heads = [ready[0][0] for name in self._channels(channel) if (ready := self._ready.get(name))]
+        return min(heads) if heads else None
+
+    async def complete(self, message: OutboxMessage) -> None:
+        self._remove(message)
+
+    async def reschedule(self, message: OutboxMessage) -> None:
+        heapq.heappush(self._ready[message.channel], (message.next_attempt_at, message.id))
+
+    async def dead_letter(self, message: OutboxMessage) -> None:
+        self._remove(message)
+        self._dead.append(message)
+
+    def _remove(self, message: OutboxMessage) -> None:
+        if self._messages.pop(message.id, None) is not None:
+            self._pending[message.channel] -= 1
+
+    async def dead_letters(self, limit: int = 50) -> List[OutboxMessage]:
+        return list(reversed(self._dead))[:limit]
+
+    async def pending(self, channel: Optional[str] = None) -> int:
+        if channel is not None:
+            return self._pending[channel]
+        return len(self._messages)
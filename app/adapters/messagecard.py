@@ -1,9 +1,12 @@
 # app/adapters/messagecard.py
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+import json
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+
+from app.adapters.card_encoding import EncodedCard
 
 
 class Fact(BaseModel):
@@ -39,6 +42,30 @@ class VTWebhookMessage(BaseModel):
     summary: Optional[str] = None
     sections: List[Section] = Field(default_factory=list)
 
+    # 원본 JSON 으로 만든 경우 원본 payload (모델에 없는 필드 포함, 인코딩 캐시 = 원본 바이트)
+    _source: Optional[EncodedCard] = PrivateAttr(default=None)
+
+    @classmethod
+    def from_json(cls, content: str) -> "VTWebhookMessage":
+        """
+        원본 JSON 문자열 (ex. Graph 첨부 content) → VTWebhookMessage
+
+        to_payload() 는 원본 dict 를 돌려주고, 전송할 때는 원본 문자열을 다시 인코딩하지 않고 그대로 보낸다.
+
+        Raises:
+            json.JSONDecodeError, ValidationError
+        """
+        card = json.loads(content)
+        msg = cls.model_validate(card)
+        msg._source = EncodedCard(card, content.encode("utf-8"))
+        return msg
+
+    def to_payload(self) -> Dict[str, Any]:
+        """전송/처리용 payload (from_json 으로 만들었으면 원본, 아니면 model_dump)"""
+        if self._source is not None:
+            return self._source
+        return self.model_dump()
+
     def get_fact(self, name: str) -> Optional[str]:
         """
         sections[].facts[] 중에서 name 이 일치하는 value 를 찾아준다.
@@ -49,3 +76,78 @@ class VTWebhookMessage(BaseModel):
                 if fact.name == name:
                     return fact.value
         return None
+
+
+def with_extra_section(
+    payload: Dict[str, Any],
+    title: str,
+    facts: List[Tuple[str, str]],
+) -> Dict[str, Any]:
+    """
+    원본 MessageCard payload 는 그대로 두고, 맨 뒤에 section 하나를 덧붙인 사본을 만든다.
+    ex) 장애 카드에 "Top offenders" 섹션 추가
+    """
+    card = dict(payload)
+    card["sections"] = [
+        *payload.get("sections", []),
+        {
+            "activityTitle": title,
+            "facts": [{"name": name, "value": value} for name, value in facts],
+        },
+    ]
+    return card
+
+
+# digest 카드 샘플에 옮겨 적을 fact
+DIGEST_SAMPLE_FACTS = ("Project", "Error Message", "Time")
+
+
+def build_digest_card(
+    group_name: str,
+    group_value: str,
+    count: int,
+    window_seconds: float,
+    samples: List[Dict[str, Any]],
+    projects: List[Tuple[str, int]] | None = None,
+) -> Dict[str, Any]:
+    """
+    같은 그룹으로 묶인 포워딩 에러 여러 건 → MessageCard 하나
+
+    Args:
+        group_name: 묶은 기준 (ex. "failure_reason")
+        group_value: 그룹 값 (ex. "AUDIO_PIPELINE_FAILED")
+        count: 묶인 건수
+        window_seconds: 묶은 구간 길이 (초)
+        samples: 원본 payload 몇 건 (DIGEST_SAMPLE_FACTS 만 옮겨 적음)
+        projects: (project, 건수) 목록 (많은 순)
+    """
+    summary_facts = [
+        {"name": group_name, "value": group_value},
+        {"name": "Count", "value": str(count)},
+        {"name": "Window", "value": f"{window_seconds:.0f}s"},
+    ]
+    if projects:
+        summary_facts.append({
+            "name": "Projects",
+            "value": ", ".join(f"{project or '-'} ({n})" for project, n in projects),
+        })
+
+    sections = [{"activityTitle": "Digest", "facts": summary_facts}]
+    for i, sample in enumerate(samples, 1):
+        msg = VTWebhookMessage.model_validate(sample)
+        facts = [
+            {"name": name, "value": value}
+            for name in DIGEST_SAMPLE_FACTS
+            if (value := msg.get_fact(name))
+        ]
+        sample_title = f"Sample {i}: {msg.title}" if msg.title else f"Sample {i}"
+        sections.append({"activityTitle": sample_title, "facts": facts})
+
+    title = f"🧾 {count} more {group_value} errors in {window_seconds:.0f}s"
+    return {
+        "@type": "MessageCard",
+        "@context": "http://schema.org/extensions",
+        "title": title,
+        "summary": title,
+        "sections": sections,
+    }
@@ -0,0 +1,190 @@
+# app/adapters/rate_limiter.py
+"""
+전송 대상(webhook URL)별 적응형 rate limiter
+
+- token bucket: 초당 rate 개, 최대 burst 개까지 몰아서 보낼 수 있다.
+- semaphore: 대상별 동시 전송 수 상한 (max_concurrency)
+- AIMD 로 rate 조정
+  - 429: rate *= decrease (multiplicative decrease), Retry-After 가 있으면 그때까지 전송 중지
+    → 이미 보내던 요청들이 연달아 429 를 받아도 한 번만 줄인다 (줄인 뒤 시작한 요청의 429 만 반영)
+  - 성공: 성공 한 번마다 increase / rate 만큼 올림 → 최대 속도로 보낼 때 초당 increase 씩 증가
+  - rate 는 [min_rate, max_rate] 범위
+- 대기 시간(semaphore + token)은 metrics.observe("teams_send_queue_delay_seconds") 로 기록
+
+Teams webhook 한도에 맞춰 429 가 나기 직전 속도 근처에서 유지된다.
+"""
+from __future__ import annotations
+
+from typing import Awaitable, Callable, Dict, Optional
+import asyncio
+import logging
+import time
+
+from app import metrics
+
+logger = logging.getLogger(__name__)
+
+# 부동소수점 오차로 token 이 0.999... 에서 멈추지 않도록
+_EPSILON = 1e-9
+
+
+class _Destination:
+    """대상 하나의 bucket 상태"""
+
+    __slots__ = ("label", "rate", "tokens", "updated", "paused_until", "decreased_at",
+                 "slots", "lock", "in_flight")
+
+    def __init__(self, label: str, rate: float, burst: float, max_concurrency: int, now: float):
+        self.label = label
+        self.rate = rate
+        self.tokens = burst
+        self.updated = now
+        self.paused_until = 0.0
+        self.decreased_at = float("-inf")
+        self.slots = asyncio.Semaphore(max_concurrency)
+        # token 대기는 도착 순서대로 (asyncio.Lock 은 FIFO)
+        self.lock = asyncio.Lock()
+        self.in_flight = 0
+
+
+class AdaptiveRateLimiter:
+    """대상별 token bucket + 동시 전송 제한 + AIMD"""
+
+    def __init__(
+        self,
+        rate: float = 4.0,
+        burst: float = 4.0,
+        max_concurrency: int = 4,
+        min_rate: float = 0.2,
+        max_rate: float = 10.0,
+        decrease: float = 0.5,
+        increase: float = 0.2,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        """
+        Args:
+            rate: 시작 속도 (초당 전송 수)
+            burst: bucket 크기 (쉬고 있다가 한 번에 보낼 수 있는 수)
+            max_concurrency: 대상별 동시 전송 수
+            min_rate / max_rate: rate 조정 범위
+            decrease: 429 시 rate 에 곱하는 값 (0~1)
+            increase: 최대 속도로 성공할 때 초당 rate 증가량
+            clock: 단조 시계 (초)
+            sleep: 대기 함수 (테스트용)
+        """
+        if not 0 < min_rate <= rate <= max_rate:
+            raise ValueError("expected 0 < min_rate <= rate <= max_rate")
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        self.initial_rate = rate
+        self.burst = max(burst, 1.0)
+        self.max_concurrency = max_concurrency
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.decrease = decrease
+        self.increase = increase
+        self._clock = clock
+        self._sleep = sleep
+        self._destinations: Dict[str, _Destination] = {}
+
+    def _get(self, key: str, label: str) -> _Destination:
+        dest = self._destinations.get(key)
+        if dest is None:
+            dest = _Destination(label or key, self.initial_rate, self.burst,
+                                self.max_concurrency, self._clock())
+            self._destinations[key] = dest
+        return dest
+
+    def rate(self, key: str) -> Optional[float]:
+        """대상의 현재 rate (아직 보낸 적 없으면 None)"""
+        dest = self._destinations.get(key)
+        return dest.rate if dest else None
+
+    async def acquire(self, key: str, label: str = "") -> float:
+        """
+        전송 슬롯 + token 하나를 얻을 때까지 대기
+
+        반드시 release(key) 와 짝으로 호출한다.
+
+        Args:
+            key: 대상 식별자 (webhook URL)
+            label: 로그/통계용 이름 (URL 을 노출하지 않도록)
+
+        Returns:
+            전송 시작 시각 (success / throttled 에 그대로 넘긴다)
+        """
+        dest = self._get(key, label)
+        requested = self._clock()
+        await dest.slots.acquire()
+        try:
+            async with dest.lock:
+                while True:
+                    now = self._clock()
+                    if now < dest.paused_until:
+                        await self._sleep(dest.paused_until - now)
+                        continue
+                    dest.tokens = min(self.burst, dest.tokens + (now - dest.updated) * dest.rate)
+                    dest.updated = now
+                    if dest.tokens >= 1.0 - _EPSILON:
+                        dest.tokens = max(dest.tokens - 1.0, 0.0)
+                        break
+                    await self._sleep((1.0 - dest.tokens) / dest.rate)
+        except BaseException:
+            dest.slots.release()
+            raise
+
+        dest.in_flight += 1
+        started = self._clock()
+        metrics.observe("teams_send_queue_delay_seconds", started - requested)
+        return started
+
+    def release(self, key: str) -> None:
+        """acquire 로 얻은 전송 슬롯 반납"""
+        dest = self._destinations[key]
+        dest.in_flight -= 1
+        dest.slots.release()
+
+    def success(self, key: str) -> None:
+        """전송 성공 → additive increase"""
+        dest = self._destinations[key]
+        if dest.rate < self.max_rate:
+            dest.rate = min(self.max_rate, dest.rate + self.increase / dest.rate)
+
+    def throttled(self, key: str, started: float, retry_after: Optional[float] = None) -> None:
+        """
+        429 → multiplicative decrease (+ Retry-After 동안 전송 중지)
+
+        Args:
+            started: acquire 가 반환한 시각. 마지막 감소 이전(같은 시각 포함)에 시작한 요청이면 rate 는 그대로 둔다.
+            retry_after: Retry-After (초)
+        """
+        dest = self._destinations[key]
+        now = self._clock()
+        metrics.increment("teams_throttled")
+        if retry_after:
+            dest.paused_until = max(dest.paused_until, now + retry_after)
+        if started <= dest.decreased_at:
+            return
+        previous = dest.rate
+        dest.rate = max(self.min_rate, dest.rate * self.decrease)
+        dest.tokens = min(dest.tokens, 0.0)
+        dest.decreased_at = now
+        logger.warning(
+            f"🐢 {dest.label} throttled: rate {previous:.2f}/s → {dest.rate:.2f}/s"
+            + (f", paused {retry_after:.1f}s" if retry_after else "")
+        )
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """대상별 현재 rate / 전송 중 수 (label 기준)"""
+        now = self._clock()
+        return {
+            dest.label: {
+                "rate": round(dest.rate, 3),
+                "in_flight": dest.in_flight,
+                "paused_seconds": round(max(dest.paused_until - now, 0.0), 3),
+            }
+            for dest in self._destinations.values()
+        }
@@ -0,0 +1,231 @@
+# app/adapters/redis_anomaly_state.py
+"""
+Redis 프로토콜 기반 공유 장애 탐지 상태 어댑터
+
+여러 replica 가 같은 저장소에 이벤트를 기록하므로 전체 트래픽 기준으로 탐지하고,
+쿨다운 claim 까지 스크립트 하나 안에서 처리하므로 한 replica 만 성공한다.
+
+키 (prefix:유형:dimension:...):
+- dimension 자리: 값이 있으면 `=값`, None 이면 `-` (실제 "-" 값과 겹치지 않음)
+- :w  윈도우
+  - 정확 윈도우 (resolution=None): sorted set, score = 이벤트 시각(us), 이벤트마다 member 하나
+  - slot 윈도우 (resolution 지정): hash, field = slot 번호, value = 건수 (프로세스 내 BucketedWindowCounter 와 같은 slot)
+- :m:<epoch-minute>  카운터 → 동일 분 기준
+- :cd  쿨다운 (값 = 알림 이벤트 시각, TTL = cooldown)
+
+record_event 한 번 = EVALSHA 왕복 1회. 스크립트 안에서 원자적으로
+    윈도우 추가 / 오래된 항목 정리 / 건수, 동일 분 INCR,
+    기준 충족 시 쿨다운 SET NX PX
+까지 처리한다 (두 replica 가 동시에 기준을 넘어도 claim 은 하나).
+서버에 스크립트가 없으면 (NOSCRIPT, 서버 재시작 등) EVAL 로 한 번 더 보내 등록한다.
+
+프로세스 내 탐지기와의 차이:
+- 윈도우 건수는 이벤트 자신의 시각 기준 (event - window, event] 으로 센다.
+  replica 간 도착 순서와 무관하게 같은 결과가 나온다.
+- 쿨다운은 저장소 TTL(벽시계) 기준이다.
+- 윈도우는 window + allowed_lateness 보다 오래된 항목을 매번 정리한다.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from itertools import count
+from typing import Any, Hashable, List, Mapping, Optional, Sequence
+import hashlib
+import logging
+import os
+
+from app.adapters.resp_client import RespClient, RespError
+from app.domain.anomaly import DEFAULT_ALLOWED_LATENESS, evaluate_counts, label_of
+from app.domain.counters import epoch_micros
+from app.domain.incident_config import INCIDENT_THRESHOLDS, IncidentThreshold
+from app.domain.incident_type import IncidentType
+
+logger = logging.getLogger(__name__)
+
+_ONE_MICROSECOND = timedelta(microseconds=1)
+_ONE_MILLISECOND = timedelta(milliseconds=1)
+_MINUTE_US = 60_000_000
+
+# KEYS: 윈도우, 동일 분, 쿨다운
+# ARGV: [1] 윈도우 종류 (e / b / 빈 값), [2] score 또는 slot, [3] member, [4] 정리 기준, [5] 건수 하한 (초과),
+#       [6] 윈도우 TTL(ms), [7] 윈도우 기준 건수, [8] 동일 분 기준 건수 (빈 값이면 사용 안 함),
+#       [9] 동일 분 TTL(ms), [10] 쿨다운(ms, 0 이면 쿨다운 없음 → SET 하지 않음), [11] 쿨다운 값
+# 반환: {윈도우 건수, 동일 분 건수, claim 여부, 쿨다운 남은 ms}  (사용하지 않는 건수는 -1)
+# 큰 숫자(us)는 Lua double → 문자열 변환 시 지수 표기가 되므로 경계값은 호출 측에서 문자열로 넘긴다.
+RECORD_EVENT_SCRIPT = """
+local window_count = -1
+if ARGV[1] == 'e' then
+  redis.call('ZADD', KEYS[1], ARGV[2], ARGV[3])
+  redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[4])
+  window_count = redis.call('ZCOUNT', KEYS[1], ARGV[5], ARGV[2])
+  redis.call('PEXPIRE', KEYS[1], ARGV[6])
+elseif ARGV[1] == 'b' then
+  local slot = tonumber(ARGV[2])
+  local prune = tonumber(ARGV[4])
+  local low = tonumber(ARGV[5])
+  redis.call('HINCRBY', KEYS[1], ARGV[2], 1)
+  window_count = 0
+  local fields = redis.call('HGETALL', KEYS[1])
+  for i = 1, #fields, 2 do
+    local s = tonumber(fields[i])
+    if s < prune then
+      redis.call('HDEL', KEYS[1], fields[i])
+    elseif s > low and s <= slot then
+      window_count = window_count + tonumber(fields[i + 1])
+    end
+  end
+  redis.call('PEXPIRE', KEYS[1], ARGV[6])
+end
+local minute_count = -1
+if ARGV[8] ~= '' then
+  minute_count = redis.call('INCR', KEYS[2])
+  redis.call('PEXPIRE', KEYS[2], ARGV[9])
+end
+local triggered = (window_count >= 0 and window_count >= tonumber(ARGV[7]))
+  or (minute_count >= 0 and minute_count >= tonumber(ARGV[8]))
+local claimed = 0
+if triggered then
+  -- PX 0 은 Redis 가 거부한다 (invalid expire time)
+  if tonumber(ARGV[10]) <= 0 or redis.call('SET', KEYS[3], ARGV[11], 'NX', 'PX', ARGV[10]) then
+    claimed = 1
+  end
+end
+return {window_count, minute_count, claimed, redis.call('PTTL', KEYS[3])}
+"""
+RECORD_EVENT_SCRIPT_SHA = hashlib.sha1(RECORD_EVENT_SCRIPT.encode("utf-8")).hexdigest()
+
+
+class RedisAnomalyState:
+    """Redis 호환 저장소를 쓰는 AnomalyStateBackend"""
+
+    def __init__(
+        self,
+        client: RespClient,
+        thresholds: Mapping[IncidentType, IncidentThreshold] = INCIDENT_THRESHOLDS,
+        prefix: str = "vt:anomaly",
+        allowed_lateness: timedelta = DEFAULT_ALLOWED_LATENESS,
+    ):
+        """
+        Args:
+            client: RESP 클라이언트
+            thresholds: 장애 유형별 기준 설정
+            prefix: 키 prefix (환경/서비스별로 분리)
+            allowed_lateness: 늦은 이벤트를 윈도우에 남겨 두는 여유 시간
+        """
+        self.client = client
+        self.thresholds = thresholds
+        self.prefix = prefix
+        self._lateness_us = allowed_lateness // _ONE_MICROSECOND
+        self._lateness_ms = allowed_lateness // _ONE_MILLISECOND
+        # sorted set member 를 replica 간에 유일하게 만들기 위한 prefix + 순번
+        self._member_prefix = os.urandom(4).hex()
+        self._seq = count()
+
+    def _key(self, incident_type: IncidentType, dimension: Optional[Hashable]) -> str:
+        if dimension is None:
+            return f"{self.prefix}:{incident_type.name}:-"
+        # 값에는 "=" 를 붙여 None 자리("-")와 구분
+        return f"{self.prefix}:{incident_type.name}:={dimension}"
+
+    async def record_event(
+        self,
+        incident_type: IncidentType,
+        timestamp: datetime,
+        dimension: Optional[Hashable] = None,
+    ) -> bool:
+        if not isinstance(timestamp, datetime):
+            raise TypeError("timestamp must be a datetime instance")
+
+        config = self.thresholds.get(incident_type)
+        if config is None:
+            logger.warning("Unknown incident type: %r", incident_type)
+            return False
+
+        key = self._key(incident_type, dimension)
+        event_us = epoch_micros(timestamp)
+        # 사용하지 않는 기준의 자리는 빈 값
+        window_args: List[Any] = ["", "", "", "", "", 0, 0]
+
+        if config.window is not None and config.count > 0:
+            window_us = config.window // _ONE_MICROSECOND
+            window_ttl_ms = window_us // 1000 + self._lateness_ms
+            if config.resolution is None:
+                member = f"{event_us}:{self._member_prefix}:{next(self._seq)}"
+                window_args = [
+                    "e", event_us, member,
+                    f"({event_us - window_us - self._lateness_us}",
+                    f"({event_us - window_us}",
+                    window_ttl_ms, config.count,
+                ]
+            else:
+                # 프로세스 내 BucketedWindowCounter 와 같은 slot 경계
+                resolution_us = config.resolution // _ONE_MICROSECOND
+                size = window_us // resolution_us
+                slot = event_us // resolution_us
+                lateness_slots = -(-self._lateness_us // resolution_us)
+                window_args = [
+                    "b", slot, "",
+                    slot - size - lateness_slots + 1,
+                    slot - size,
+                    window_ttl_ms, config.count,
+                ]
+
+        minute_args: List[Any] = ["", 0]
+        if config.same_minute_count is not None:
+            minute_args = [config.same_minute_count, 60_000 + self._lateness_ms]
+
+        keys = (f"{key}:w", f"{key}:m:{event_us // _MINUTE_US}", f"{key}:cd")
+        # 1ms 미만 쿨다운은 1ms 로 (0 으로 내리면 쿨다운 없음이 됨)
+        cooldown_ms = max(config.cooldown // _ONE_MILLISECOND, 1) if config.cooldown > timedelta(0) else 0
+        args = [*window_args, *minute_args, cooldown_ms, event_us]
+        reply = await self._run_script(keys, args)
+        if not isinstance(reply, list) or len(reply) != 4:
+            raise RespError(f"unexpected script reply: {reply!r}")
+        window_count, minute_count, claimed, cooldown_ttl_ms = reply
+
+        label = label_of(incident_type, dimension)
+        triggered, reason = evaluate_counts(
+            config,
+            window_count if window_count >= 0 else None,
+            minute_count if minute_count >= 0 else None,
+        )
+
+        if not triggered:
+            logger.info(f"📊 Event recorded: {label} ({reason}) - threshold 미달")
+            return False
+
+        if claimed:
+            logger.info(f"✅ Incident triggered: {label} ({reason})")
+            return True
+
+        cooldown_minutes = int(config.cooldown.total_seconds() / 60)
+        remaining = f"{cooldown_ttl_ms / 1000:.0f}s" if cooldown_ttl_ms > 0 else "N/A"
+        logger.info(f"⏸️ Threshold met but in cooldown: {label} ({reason})")
+        logger.info(f"   남은 쿨다운: {remaining}, 쿨다운: {cooldown_minutes}분")
+        return False
+
+    async def _run_script(self, keys: Sequence[str], args: Sequence[Any]) -> Any:
+        """EVALSHA (캐시에 없으면 EVAL 로 등록하며 실행)"""
+        try:
+            return await self.client.execute(
+                "EVALSHA", RECORD_EVENT_SCRIPT_SHA, len(keys), *keys, *args,
+            )
+        except RespError as exc:
+            if not str(exc).startswith("NOSCRIPT"):
+                raise
+        return await self.client.execute("EVAL", RECORD_EVENT_SCRIPT, len(keys), *keys, *args)
+
+    async def reset(self) -> None:
+        """prefix 아래 모든 키 삭제"""
+        cursor = b"0"
+        while True:
+            cursor, keys = await self.client.execute(
+                "SCAN", cursor, "MATCH", f"{self.prefix}:*", "COUNT", 1000,
+            )
+            if keys:
+                await self.client.execute("DEL", *keys)
+            if cursor == b"0":
+                break
+
+    async def close(self) -> None:
+        await self.client.close()
@@ -0,0 +1,184 @@
+# app/adapters/resp_client.py
+"""
+최소한의 Redis 프로토콜(RESP2) 비동기 클라이언트
+
+- asyncio streams 위에서 연결 하나를 재사용한다.
+- pipeline(commands): 여러 명령을 한 번에 쓰고 응답을 순서대로 읽는다 (왕복 1회).
+- 연결이 끊기면 다음 호출에서 다시 연결한다.
+
+장애 탐지 상태 공유에 필요한 정도만 구현했으며, Redis 호환 서버(Redis, Valkey, KeyDB 등)와 쓸 수 있다.
+"""
+from __future__ import annotations
+
+from typing import Any, List, Optional, Sequence, Tuple, Union
+from urllib.parse import unquote, urlparse
+import asyncio
+
+RespValue = Union[None, int, bytes, "RespError", List[Any]]
+
+
+class RespError(Exception):
+    """서버가 에러 응답(-ERR ...)을 보낸 경우"""
+
+
+class RespConnectionError(ConnectionError):
+    """연결/프로토콜 오류"""
+
+
+def encode_command(*args: Union[str, bytes, int, float]) -> bytes:
+    """명령 하나를 RESP array of bulk strings 로 인코딩한다."""
+    out = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if isinstance(arg, bytes):
+            data = arg
+        elif isinstance(arg, str):
+            data = arg.encode("utf-8")
+        else:
+            data = str(arg).encode("ascii")
+        out.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(out)
+
+
+async def read_reply(reader: asyncio.StreamReader) -> RespValue:
+    """
+    응답 하나를 읽는다.
+
+    에러 응답은 예외로 던지지 않고 RespError 인스턴스로 돌려준다 (pipeline 나머지 응답을 읽어야 하므로).
+    """
+    line = await reader.readline()
+    if not line.endswith(b"\r\n"):
+        raise RespConnectionError("connection closed")
+    kind, body = line[:1], line[1:-2]
+
+    if kind == b"+":
+        return body
+    if kind == b"-":
+        return RespError(body.decode("utf-8", "replace"))
+    if kind == b":":
+        return int(body)
+    if kind == b"$":
+        length = int(body)
+        if length < 0:
+            return None
+        data = await reader.readexactly(length + 2)
+        return data[:-2]
+    if kind == b"*":
+        length = int(body)
+        if length < 0:
+            return None
+        return [await read_reply(reader) for _ in range(length)]
+    raise RespConnectionError(f"unexpected reply type: {line!r}")
+
+
+def parse_redis_url(url: str) -> Tuple[str, int, int, Optional[str]]:
+    """redis://[:password@]host[:port][/db] → (host, port, db, password)"""
+    parsed = urlparse(url)
+    if parsed.scheme not in ("redis", ""):
+        raise ValueError(f"unsupported redis url scheme: {parsed.scheme!r}")
+    db = int(parsed.path.lstrip("/") or 0)
+    password = unquote(parsed.password) if parsed.password else None
+    return parsed.hostname or "localhost", parsed.port or 6379, db, password
+
+
+class RespClient:
+    """
+    RESP 클라이언트 (연결 1개, 요청 직렬화)
+
+    pipeline 단위로 lock 을 잡으므로 여러 코루틴이 동시에 호출해도 응답이 섞이지 않는다.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        timeout: float = 2.0,
+    ):
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.timeout = timeout
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_url(cls, url: str, timeout: float = 2.0) -> "RespClient":
+        host, port, db, password = parse_redis_url(url)
+        return cls(host, port, db, password, timeout)
+
+    async def _connect(self) -> None:
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port),
+            self.timeout,
+        )
+        setup: List[Sequence[Any]] = []
+        if self.password:
+            setup.append(("AUTH", self.password))
+        if self.db:
+            setup.append(("SELECT", self.db))
+        if setup:
+            for reply in await self._roundtrip(setup):
+                if isinstance(reply, RespError):
+                    await self.close()
+                    raise reply
+
+    async def _roundtrip(self, commands: Sequence[Sequence[Any]]) -> List[RespValue]:
+        assert self._reader is not None and self._writer is not None
+        self._writer.write(b"".join(encode_command(*cmd) for cmd in commands))
+        await self._writer.drain()
+        return [await read_reply(self._reader) for _ in commands]
+
+    async def pipeline(self, commands: Sequence[Sequence[Any]]) -> List[RespValue]:
+        """
+        명령 여러 개를 한 번의 왕복으로 실행한다.
+
+        Returns:
+            명령별 응답 (에러 응답은 RespError 인스턴스)
+
+        Raises:
+            RespConnectionError: 연결 실패 / 타임아웃 (연결은 닫히고 다음 호출에서 재연결)
+
+        도중에 취소되면 연결을 버린다 (다음 호출에서 재연결).
+        """
+        async with self._lock:
+            try:
+                if self._writer is None:
+                    await self._connect()
+                return await asyncio.wait_for(self._roundtrip(commands), self.timeout)
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, RespConnectionError) as exc:
+                await self.close()
+                raise RespConnectionError(f"redis {self.host}:{self.port}: {exc!r}") from exc
+            except BaseException:
+                # 취소(CancelledError) 등으로 응답을 다 읽지 못했으면 남은 응답이
+                # 다음 명령의 응답으로 읽히므로 연결을 버린다 (await 없이 바로 닫음)
+                self._discard()
+                raise
+
+    async def execute(self, *args: Any) -> RespValue:
+        """
+        명령 하나 실행
+
+        Raises:
+            RespError: 서버 에러 응답
+        """
+        (reply,) = await self.pipeline([args])
+        if isinstance(reply, RespError):
+            raise reply
+        return reply
+
+    def _discard(self) -> None:
+        writer, self._reader, self._writer = self._writer, None, None
+        if writer is not None:
+            writer.close()
+
+    async def close(self) -> None:
+        writer, self._reader, self._writer = self._writer, None, None
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
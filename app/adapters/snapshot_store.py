@@ -0,0 +1,77 @@
+# app/adapters/snapshot_store.py
+"""
+로컬 파일 스냅샷 저장소 어댑터
+
+- 포맷: zlib 압축한 compact JSON
+- 저장: 같은 디렉터리의 고유 임시 파일(mkstemp)에 쓰고 fsync 후 os.replace 로 교체
+  (중간에 죽어도 이전 파일 유지, 동시에 저장해도 임시 파일이 섞이지 않음)
+- 파일은 프로세스 하나의 상태다. worker 가 여러 개면 worker 마다 다른 경로 (claim_worker_slot)
+- 직렬화/압축/파일 I/O 는 모두 asyncio.to_thread 에서 수행 (이벤트 루프 비차단)
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import zlib
+
+logger = logging.getLogger(__name__)
+
+
+class FileSnapshotStore:
+    """스냅샷을 로컬 파일 하나에 저장"""
+
+    def __init__(self, path: str, compress_level: int = 6):
+        """
+        Args:
+            path: 스냅샷 파일 경로
+            compress_level: zlib 압축 레벨
+        """
+        self.path = path
+        self.compress_level = compress_level
+
+    async def load(self) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._read)
+
+    async def save(self, snapshot: Dict[str, Any]) -> None:
+        await asyncio.to_thread(self._write, snapshot)
+
+    def _read(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+
+        try:
+            return json.loads(zlib.decompress(data))
+        except (zlib.error, ValueError) as exc:
+            logger.warning(f"⚠️ Corrupted snapshot ignored: {self.path} ({exc})")
+            return None
+
+    def _write(self, snapshot: Dict[str, Any]) -> None:
+        data = zlib.compress(
+            json.dumps(snapshot, separators=(",", ":")).encode("utf-8"),
+            self.compress_level,
+        )
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(
+            dir=directory, prefix=f"{os.path.basename(self.path)}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
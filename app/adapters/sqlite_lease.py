@@ -0,0 +1,155 @@
+# app/adapters/sqlite_lease.py
+"""
+SQLite 리스 저장소 어댑터
+
+- 같은 호스트에서 여러 uvicorn worker 가 파일 하나(LEADER_LEASE_PATH)를 공유한다.
+- acquire 는 BEGIN IMMEDIATE 트랜잭션 안에서 읽고 쓰므로 동시에 호출해도 holder 는 하나다.
+- 만료 판단은 벽시계(time.time) 기준 (프로세스 간 공유되는 시계이므로)
+- lease_watermarks: 리스 이름별 key → 값. 쓸 때 같은 트랜잭션에서 token 을 확인한다 (fencing)
+- 모든 DB 작업은 asyncio.to_thread 에서 수행 (이벤트 루프 비차단)
+"""
+from __future__ import annotations
+
+from typing import Callable, Dict, Optional
+import asyncio
+import os
+import sqlite3
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS leases (
+    name TEXT PRIMARY KEY,
+    holder TEXT NOT NULL,
+    token INTEGER NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS lease_watermarks (
+    name TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (name, key)
+);
+"""
+
+
+class SqliteLeaseStore:
+    """리스를 SQLite 파일 하나에 저장하는 LeaseStore"""
+
+    def __init__(
+        self,
+        path: str,
+        busy_timeout: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로
+            busy_timeout: 다른 worker 가 잠금 중일 때 대기 시간 (초)
+            clock: 현재 시각 (epoch 초)
+        """
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self._clock = clock
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        # isolation_level=None: 트랜잭션을 직접 BEGIN IMMEDIATE 로 연다
+        conn = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+        if not self._initialized:
+            conn.executescript(_SCHEMA)
+            self._initialized = True
+        return conn
+
+    async def acquire(self, name: str, holder: str, ttl: float) -> Optional[int]:
+        return await asyncio.to_thread(self._acquire, name, holder, ttl)
+
+    async def release(self, name: str, holder: str) -> None:
+        await asyncio.to_thread(self._release, name, holder)
+
+    async def load_watermarks(self, name: str) -> Dict[str, str]:
+        return await asyncio.to_thread(self._load_watermarks, name)
+
+    async def save_watermark(self, name: str, token: int, key: str, value: str) -> bool:
+        return await asyncio.to_thread(self._save_watermark, name, token, key, value)
+
+    def _acquire(self, name: str, holder: str, ttl: float) -> Optional[int]:
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            now = self._clock()
+            row = conn.execute(
+                "SELECT holder, token, expires_at FROM leases WHERE name = ?", (name,)
+            ).fetchone()
+
+            if row is None:
+                token = 1
+                conn.execute(
+                    "INSERT INTO leases (name, holder, token, expires_at) VALUES (?, ?, ?, ?)",
+                    (name, holder, token, now + ttl),
+                )
+            else:
+                current_holder, current_token, expires_at = row
+                if expires_at > now and current_holder != holder:
+                    conn.execute("ROLLBACK")
+                    return None
+                # 보유 중 갱신이면 token 유지, 만료 후 (재)획득이면 token 증가
+                token = current_token if expires_at > now else current_token + 1
+                conn.execute(
+                    "UPDATE leases SET holder = ?, token = ?, expires_at = ? WHERE name = ?",
+                    (holder, token, now + ttl, name),
+                )
+            conn.execute("COMMIT")
+            return token
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def _release(self, name: str, holder: str) -> None:
+        conn = self._connect()
+        try:
+            # token 은 남겨 두어 다음 holder 의 token 이 계속 증가하도록 한다
+            conn.execute(
+                "UPDATE leases SET expires_at = 0 WHERE name = ? AND holder = ?",
+                (name, holder),
+            )
+        finally:
+            conn.close()
+
+    def _load_watermarks(self, name: str) -> Dict[str, str]:
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT key, value FROM lease_watermarks WHERE name = ?", (name,)
+            ).fetchall()
+            return dict(rows)
+        finally:
+            conn.close()
+
+    def _save_watermark(self, name: str, token: int, key: str, value: str) -> bool:
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT token FROM leases WHERE name = ?", (name,)).fetchone()
+            if row is None or row[0] != token:
+                conn.execute("ROLLBACK")
+                return False
+            conn.execute(
+                "INSERT INTO lease_watermarks (name, key, value) VALUES (?, ?, ?) "
+                "ON CONFLICT(name, key) DO UPDATE SET value = excluded.value",
+                (name, key, value),
+            )
+            conn.execute("COMMIT")
+            return True
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
@@ -0,0 +1,112 @@
+# app/adapters/sqlite_membership.py
+"""
+SQLite 멤버십 / 워터마크 저장소 어댑터
+
+- 같은 호스트에서 여러 poller worker 가 파일 하나(POLLER_MEMBERSHIP_PATH)를 공유한다.
+- members: member → 만료 시각 (heartbeat 마다 연장)
+- watermarks: channel_id → 마지막 polling 시각 (ISO 8601 UTC, 문자열 비교 = 시각 비교)
+- 만료 판단은 벽시계(time.time) 기준, DB 작업은 asyncio.to_thread 에서 수행
+"""
+from __future__ import annotations
+
+from typing import Callable, List, Optional
+import asyncio
+import os
+import sqlite3
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS members (
+    member TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS watermarks (
+    channel_id TEXT PRIMARY KEY,
+    since TEXT NOT NULL
+);
+"""
+
+
+class SqliteMembershipStore:
+    """멤버십과 워터마크를 SQLite 파일 하나에 저장하는 MembershipStore"""
+
+    def __init__(
+        self,
+        path: str,
+        busy_timeout: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로
+            busy_timeout: 다른 worker 가 잠금 중일 때 대기 시간 (초)
+            clock: 현재 시각 (epoch 초)
+        """
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self._clock = clock
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+        if not self._initialized:
+            conn.executescript(_SCHEMA)
+            self._initialized = True
+        return conn
+
+    async def heartbeat(self, member: str, ttl: float) -> List[str]:
+        return await asyncio.to_thread(self._heartbeat, member, ttl)
+
+    async def leave(self, member: str) -> None:
+        await asyncio.to_thread(self._execute, "DELETE FROM members WHERE member = ?", (member,))
+
+    async def load_watermark(self, channel_id: str) -> Optional[str]:
+        return await asyncio.to_thread(self._load_watermark, channel_id)
+
+    async def save_watermark(self, channel_id: str, since: str) -> None:
+        await asyncio.to_thread(
+            self._execute,
+            "INSERT INTO watermarks (channel_id, since) VALUES (?, ?) "
+            "ON CONFLICT(channel_id) DO UPDATE SET since = excluded.since "
+            "WHERE excluded.since > watermarks.since",
+            (channel_id, since),
+        )
+
+    def _heartbeat(self, member: str, ttl: float) -> List[str]:
+        conn = self._connect()
+        try:
+            now = self._clock()
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute(
+                    "INSERT INTO members (member, expires_at) VALUES (?, ?) "
+                    "ON CONFLICT(member) DO UPDATE SET expires_at = excluded.expires_at",
+                    (member, now + ttl),
+                )
+                # 만료된 멤버 정리 (비정상 종료한 replica)
+                conn.execute("DELETE FROM members WHERE expires_at <= ?", (now,))
+                rows = conn.execute("SELECT member FROM members ORDER BY member").fetchall()
+            return [row[0] for row in rows]
+        finally:
+            conn.close()
+
+    def _load_watermark(self, channel_id: str) -> Optional[str]:
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT since FROM watermarks WHERE channel_id = ?", (channel_id,)
+            ).fetchone()
+            return row[0] if row else None
+        finally:
+            conn.close()
+
+    def _execute(self, sql: str, params: tuple) -> None:
+        conn = self._connect()
+        try:
+            conn.execute(sql, params)
+        finally:
+            conn.close()
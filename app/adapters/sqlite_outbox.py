@@ -0,0 +1,271 @@
+# app/adapters/sqlite_outbox.py
+"""
+SQLite(WAL) outbox 저장소 어댑터
+
+- 대기열 조회/claim 은 InMemoryOutboxStore 와 같은 heap 으로 처리하고,
+  모든 변경(put / claim / complete / reschedule / dead_letter)을 journal 에 쌓아 SQLite 에 기록한다.
+- group commit: flusher 가 flush_interval 마다(또는 journal 이 batch_size 에 도달하면)
+  쌓인 변경을 트랜잭션 하나로 기록한다. put 자체는 I/O 없음.
+- journal_mode=WAL + synchronous=NORMAL → 커밋마다 fsync 하지 않음 (checkpoint 때만)
+  프로세스가 죽어도 커밋된 변경은 남고, 전원 장애 시에는 마지막 일부 커밋을 잃을 수 있다.
+  마지막 flush 이후 접수된 메시지(최대 flush_interval)는 프로세스가 죽으면 잃는다.
+- open() 시 pending / claimed(전송 중 종료) 메시지를 다시 대기열에 올린다 (at-least-once).
+- card 는 전송할 때와 같은 JSON 인코딩(encode_card)으로 저장하고, 복구한 card 는 저장된 바이트를 그대로 전송한다.
+- journal 에는 변경 시점의 값을 tuple 로 복사해 둔다. 기록 스레드는 이벤트 루프가 계속 바꾸는
+  OutboxMessage 를 읽지 않는다. card 는 이때 encode_card 로 인코딩되며, 전송 때 같은 바이트를 재사용한다.
+- 파일은 프로세스 하나가 독점한다 (locking_mode=EXCLUSIVE).
+  컨테이너는 worker slot 으로 worker 마다 다른 파일을 잡는다 (outbox.db, outbox.1.db, ... / 경로의 {worker}).
+"""
+from __future__ import annotations
+
+from itertools import count
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+
+from app.adapters.card_encoding import EncodedCard, encode_card
+from app.adapters.memory_outbox import InMemoryOutboxStore
+from app.application.ports.outbox import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY,
+    channel TEXT NOT NULL,
+    card TEXT NOT NULL,
+    enqueued_at REAL NOT NULL,
+    next_attempt_at REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL DEFAULT 'pending'
+);
+CREATE INDEX IF NOT EXISTS outbox_status ON outbox (status, id);
+"""
+
+# journal 항목: (op, id, channel, card JSON, enqueued_at, next_attempt_at, attempts, last_error)
+# channel / card / enqueued_at 은 put 에서만 사용
+_PUT = "put"
+_CLAIM = "claim"
+_DONE = "done"
+_RETRY = "retry"
+_DEAD = "dead"
+
+_JournalEntry = Tuple[str, int, str, str, float, float, int, str]
+
+
+class SqliteOutboxStore(InMemoryOutboxStore):
+    """메모리 대기열 + SQLite write-behind journal 기반 OutboxStore"""
+
+    def __init__(
+        self,
+        path: str,
+        dead_letter_size: int = 1000,
+        flush_interval: float = 0.05,
+        batch_size: int = 500,
+        busy_timeout: float = 5.0,
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로
+            dead_letter_size: 보관할 dead letter 최대 개수 (파일에서도 오래된 것부터 삭제)
+            flush_interval: group commit 주기 (초)
+            batch_size: journal 이 이만큼 쌓이면 주기를 기다리지 않고 기록
+            busy_timeout: 파일이 잠겨 있을 때 대기 시간 (초)
+        """
+        super().__init__(dead_letter_size)
+        self.path = path
+        self.dead_letter_size = dead_letter_size
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.busy_timeout = busy_timeout
+        self._conn: Optional[sqlite3.Connection] = None
+        self._journal: List[_JournalEntry] = []
+        self._flush_now = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flusher: Optional[asyncio.Task] = None
+        self._closing = False
+
+    # --- lifecycle ---------------------------------------------------------
+
+    async def open(self) -> None:
+        """파일을 열고 미전송 메시지를 복구한 뒤 flusher 시작"""
+        if self._conn is not None:
+            return
+        self._conn = await asyncio.to_thread(self._connect)
+        pending, dead, max_id = await asyncio.to_thread(self._load)
+
+        for message in pending:
+            self._add(message)
+        self._dead.extend(dead)
+        self._ids = count(max_id + 1)
+
+        self._closing = False
+        self._flusher = asyncio.create_task(self._run_flusher())
+        if pending:
+            logger.info(f"📮 Outbox replaying {len(pending)} unsent messages from {self.path}")
+
+    async def close(self) -> None:
+        """flusher 종료 + 남은 journal 기록"""
+        if self._conn is None:
+            return
+        # 스레드에서 기록 중인 batch 가 있을 수 있으므로 cancel 하지 않고 멈추게 한다
+        self._closing = True
+        self._flush_now.set()
+        if self._flusher is not None:
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        await self.flush()
+        conn, self._conn = self._conn, None
+        await asyncio.to_thread(conn.close)
+
+    # --- OutboxStore -------------------------------------------------------
+
+    def put(self, channel: str, card: Dict[str, Any], now: float) -> int:
+        message_id = super().put(channel, card, now)
+        self._append(_PUT, self._messages[message_id])
+        return message_id
+
+    async def claim(
+        self, limit: int, now: float, channel: Optional[str] = None
+    ) -> List[OutboxMessage]:
+        claimed = await super().claim(limit, now, channel)
+        for message in claimed:
+            self._append(_CLAIM, message)
+        return claimed
+
+    async def complete(self, message: OutboxMessage) -> None:
+        await super().complete(message)
+        self._append(_DONE, message)
+
+    async def reschedule(self, message: OutboxMessage) -> None:
+        await super().reschedule(message)
+        self._append(_RETRY, message)
+
+    async def dead_letter(self, message: OutboxMessage) -> None:
+        await super().dead_letter(message)
+        self._append(_DEAD, message)
+
+    # --- group commit ------------------------------------------------------
+
+    def _append(self, op: str, message: OutboxMessage) -> None:
+        # 기록 스레드가 읽을 값은 지금 복사한다 (message 는 이후에도 이벤트 루프에서 바뀜)
+        card = encode_card(message.card).decode("utf-8") if op == _PUT else ""
+        self._journal.append((
+            op, message.id, message.channel, card, message.enqueued_at,
+            message.next_attempt_at, message.attempts, message.last_error,
+        ))
+        if len(self._journal) >= self.batch_size:
+            self._flush_now.set()
+
+    async def flush(self) -> int:
+        """
+        쌓인 journal 을 트랜잭션 하나로 기록
+
+        Returns:
+            기록한 변경 수
+        """
+        async with self._flush_lock:
+            if not self._journal or self._conn is None:
+                return 0
+            batch, self._journal = self._journal, []
+            try:
+                await asyncio.to_thread(self._write, batch)
+            except Exception:
+                # 다음 flush 때 다시 시도 (순서 유지)
+                self._journal = batch + self._journal
+                raise
+            return len(batch)
+
+    async def _run_flusher(self) -> None:
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._flush_now.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_now.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"❌ Outbox flush failed ({self.path}): {e}", exc_info=True)
+
+    # --- SQLite (to_thread) ------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(
+            self.path, timeout=self.busy_timeout, isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA locking_mode=EXCLUSIVE")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def _load(self) -> Tuple[List[OutboxMessage], List[OutboxMessage], int]:
+        columns = "id, channel, card, enqueued_at, next_attempt_at, attempts, last_error"
+        pending = [
+            self._row_to_message(row)
+            for row in self._conn.execute(
+                f"SELECT {columns} FROM outbox WHERE status != 'dead' ORDER BY id"
+            )
+        ]
+        dead = [
+            self._row_to_message(row)
+            for row in self._conn.execute(
+                f"SELECT {columns} FROM outbox WHERE status = 'dead' ORDER BY id DESC LIMIT ?",
+                (self.dead_letter_size,),
+            )
+        ]
+        dead.reverse()
+        max_id = self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM outbox").fetchone()[0]
+        return pending, dead, max_id
+
+    @staticmethod
+    def _row_to_message(row: tuple) -> OutboxMessage:
+        message_id, channel, card, enqueued_at, next_attempt_at, attempts, last_error = row
+        return OutboxMessage(
+            message_id, channel, EncodedCard(json.loads(card), card.encode("utf-8")),
+            enqueued_at, next_attempt_at, attempts, last_error,
+        )
+
+    def _write(self, batch: List[_JournalEntry]) -> None:
+        conn = self._conn
+        has_dead = False
+        with conn:
+            conn.execute("BEGIN")
+            for op, message_id, channel, card, enqueued_at, next_attempt_at, attempts, last_error in batch:
+                if op == _PUT:
+                    conn.execute(
+                        "INSERT OR IGNORE INTO outbox "
+                        "(id, channel, card, enqueued_at, next_attempt_at) VALUES (?, ?, ?, ?, ?)",
+                        (message_id, channel, card, enqueued_at, next_attempt_at),
+                    )
+                elif op == _CLAIM:
+                    conn.execute("UPDATE outbox SET status = 'claimed' WHERE id = ?", (message_id,))
+                elif op == _DONE:
+                    conn.execute("DELETE FROM outbox WHERE id = ?", (message_id,))
+                elif op == _RETRY:
+                    conn.execute(
+                        "UPDATE outbox SET status = 'pending', attempts = ?, "
+                        "next_attempt_at = ?, last_error = ? WHERE id = ?",
+                        (attempts, next_attempt_at, last_error, message_id),
+                    )
+                elif op == _DEAD:
+                    has_dead = True
+                    conn.execute(
+                        "UPDATE outbox SET status = 'dead', attempts = ?, last_error = ? WHERE id = ?",
+                        (attempts, last_error, message_id),
+                    )
+            if has_dead:
+                # 보관 개수를 넘은 오래된 dead letter 정리
+                conn.execute(
+                    "DELETE FROM outbox WHERE status = 'dead' AND id NOT IN "
+                    "(SELECT id FROM outbox WHERE status = 'dead' ORDER BY id DESC LIMIT ?)",
+                    (self.dead_letter_size,),
+                )
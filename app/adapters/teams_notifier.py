@@ -1,22 +1,170 @@
 # app/adapters/teams_notifier.py
 """
 Teams Webhook 알림 전송 어댑터
+
+- notifier 하나가 httpx.AsyncClient 하나를 오래 유지한다 (연결 풀 + keep-alive).
+  메시지마다 클라이언트를 만들면 매번 TCP/TLS handshake 비용이 든다.
+- 클라이언트는 lifespan 에서 open() 으로 만들고 aclose() 로 닫는다.
+  open() 전에 전송하면 처음 전송할 때 만든다 (모듈 레벨 함수 / 테스트 호환).
+- HTTP/2 는 h2 패키지(httpx[http2])가 설치된 경우에만 사용한다.
+- deliver(): 한 번 전송하고 DeliveryResult 반환 (429/5xx/네트워크 오류는 retryable, Retry-After 해석).
+  재시도는 outbox(NotificationOutbox) 가 맡는다.
+- 본문은 encode_card 로 만든다. 같은 EncodedCard 는 채널이 달라도 한 번만 인코딩하고,
+  Graph 첨부 원본으로 만든 card 는 원본 바이트를 그대로 보낸다.
+- 보내기 전에 CardCompactor 로 크기를 줄인다 (긴 fact / text 자르기, 빈 section 제거, Teams 크기 한도).
+  한도 안으로 줄일 수 없으면 뒤쪽 내용을 뺀 degraded card 를 보낸다 (알림을 버리지 않음).
+- webhook URL 별 AdaptiveRateLimiter (token bucket + 동시 전송 제한, 429 에 맞춰 속도 조정)
+  를 거쳐 전송한다. TEAMS_RATE_LIMIT_PER_SECOND=0 이면 제한 없음.
 """
-from typing import Dict, Any
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional
+import importlib.util
 import httpx
 import logging
 
-from app.config import TEAMS_FORWARD_WEBHOOK_URL, TEAMS_INCIDENT_WEBHOOK_URL
+from app.adapters.card_compaction import CardCompactor
+from app.adapters.card_encoding import encode_card
+from app.adapters.rate_limiter import AdaptiveRateLimiter
+from app.application.ports.notifier import FORWARD_CHANNEL, INCIDENT_CHANNEL, DeliveryResult
+
+from app import metrics
+from app.config import (
+    TEAMS_CARD_FACT_MAX_BYTES,
+    TEAMS_CARD_MAX_BYTES,
+    TEAMS_FORWARD_WEBHOOK_URL,
+    TEAMS_INCIDENT_WEBHOOK_URL,
+    TEAMS_HTTP2,
+    TEAMS_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    TEAMS_HTTP_MAX_CONNECTIONS,
+    TEAMS_HTTP_MAX_KEEPALIVE,
+    TEAMS_MAX_CONCURRENCY,
+    TEAMS_RATE_LIMIT_BURST,
+    TEAMS_RATE_LIMIT_MAX_PER_SECOND,
+    TEAMS_RATE_LIMIT_MIN_PER_SECOND,
+    TEAMS_RATE_LIMIT_PER_SECOND,
+)
 
 logger = logging.getLogger(__name__)
 
 
+# 재시도할 수 있는 응답 (그 외 4xx 는 다시 보내도 실패)
+_RETRYABLE_STATUS = frozenset({408, 409, 425, 429})
+_THROTTLED_IN_BODY = "HTTP error 429"
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After 헤더 → 대기 시간 (초)
+
+    초 단위 숫자와 HTTP-date 둘 다 지원한다. 없거나 해석할 수 없으면 None.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+def default_rate_limiter() -> Optional[AdaptiveRateLimiter]:
+    """설정값으로 만든 rate limiter (TEAMS_RATE_LIMIT_PER_SECOND <= 0 이면 None)"""
+    if TEAMS_RATE_LIMIT_PER_SECOND <= 0:
+        return None
+    return AdaptiveRateLimiter(
+        rate=TEAMS_RATE_LIMIT_PER_SECOND,
+        burst=TEAMS_RATE_LIMIT_BURST,
+        max_concurrency=TEAMS_MAX_CONCURRENCY,
+        min_rate=min(TEAMS_RATE_LIMIT_MIN_PER_SECOND, TEAMS_RATE_LIMIT_PER_SECOND),
+        max_rate=max(TEAMS_RATE_LIMIT_MAX_PER_SECOND, TEAMS_RATE_LIMIT_PER_SECOND),
+    )
+
+
+def default_card_compactor() -> Optional[CardCompactor]:
+    """설정값으로 만든 card compactor (TEAMS_CARD_MAX_BYTES <= 0 이면 None)"""
+    if TEAMS_CARD_MAX_BYTES <= 0:
+        return None
+    return CardCompactor(
+        max_bytes=TEAMS_CARD_MAX_BYTES,
+        fact_max_bytes=max(TEAMS_CARD_FACT_MAX_BYTES, 1),
+    )
+
+
+def http2_available() -> bool:
+    """httpx HTTP/2 지원(h2 패키지) 설치 여부"""
+    return importlib.util.find_spec("h2") is not None
+
+
 class TeamsNotifier:
     """Teams Webhook으로 MessageCard 전송"""
     
-    def __init__(self, timeout: float = 5.0, verify_ssl: bool = False):
+    def __init__(
+        self,
+        timeout: float = 5.0,
+        verify_ssl: bool = False,
+        max_connections: int = TEAMS_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections: int = TEAMS_HTTP_MAX_KEEPALIVE,
+        keepalive_expiry: float = TEAMS_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        http2: bool = TEAMS_HTTP2,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        compactor: Optional[CardCompactor] = None,
+    ):
+        """
+        Args:
+            timeout: 요청 타임아웃 (초)
+            verify_ssl: TLS 인증서 검증 여부
+            max_connections: 동시 연결 상한
+            max_keepalive_connections: 유지할 유휴 연결 수
+            keepalive_expiry: 유휴 연결 유지 시간 (초)
+            http2: HTTP/2 사용 (h2 미설치 시 HTTP/1.1)
+            transport: 테스트용 transport
+            rate_limiter: webhook URL 별 전송 속도 제한 (None 이면 설정값으로 생성)
+            compactor: 전송 전 card 크기 줄이기 (None 이면 설정값으로 생성)
+        """
         self.timeout = timeout
         self.verify_ssl = verify_ssl
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        if http2 and not http2_available():
+            logger.warning("⚠️ HTTP/2 requested but h2 is not installed. Using HTTP/1.1.")
+            http2 = False
+        self.http2 = http2
+        self._transport = transport
+        self.rate_limiter = rate_limiter if rate_limiter is not None else default_rate_limiter()
+        self.compactor = compactor if compactor is not None else default_card_compactor()
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def open(self) -> httpx.AsyncClient:
+        """연결 풀 클라이언트 생성 (이미 있으면 그대로 반환)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                verify=self.verify_ssl,
+                limits=self.limits,
+                http2=self.http2,
+                transport=self._transport,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """클라이언트와 풀의 연결을 닫는다 (이후 전송 시 다시 생성)."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
     
     async def send_to_forward_channel(self, card: Dict[str, Any]) -> bool:
         """
@@ -50,6 +198,20 @@ class TeamsNotifier:
             "Teams incident"
         )
     
+    async def deliver(self, channel: str, card: Dict[str, Any]) -> DeliveryResult:
+        """
+        NotificationSender 구현: 채널 이름으로 한 번 전송하고 결과를 돌려준다 (재시도 없음).
+
+        Args:
+            channel: FORWARD_CHANNEL / INCIDENT_CHANNEL
+            card: MessageCard 딕셔너리
+        """
+        if channel == INCIDENT_CHANNEL:
+            return await self._post(TEAMS_INCIDENT_WEBHOOK_URL, card, "Teams incident")
+        if channel == FORWARD_CHANNEL:
+            return await self._post(TEAMS_FORWARD_WEBHOOK_URL, card, "Teams forward")
+        return DeliveryResult(ok=False, error=f"unknown channel: {channel}")
+
     async def _post_to_teams(
         self,
         webhook_url: str,
@@ -67,36 +229,88 @@ class TeamsNotifier:
         Returns:
             전송 성공 여부
         """
+        result = await self._post(webhook_url, card, log_prefix)
+        return result.ok
+
+    async def _post(
+        self,
+        webhook_url: str,
+        card: Dict[str, Any],
+        log_prefix: str
+    ) -> DeliveryResult:
+        """Teams Webhook POST 한 번 (rate limiter 경유) → DeliveryResult"""
         if not webhook_url:
             logger.warning(f"❌ {log_prefix} webhook url is not configured. Skip sending.")
-            return False
-        
-        async with httpx.AsyncClient(
-            timeout=self.timeout,
-            verify=self.verify_ssl
-        ) as client:
-            try:
-                resp = await client.post(webhook_url, json=card)
-                
-                if resp.is_error:
-                    logger.error(
-                        f"❌ {log_prefix} response error. "
-                        f"status={resp.status_code} body={resp.text[:200]}"
-                    )
-                    return False
-
-                logger.info(f"✅ {log_prefix} message successfully posted to Teams.")
-                return True
-
-            except httpx.RequestError as exc:
-                logger.error(f"❌ {log_prefix} request error: {exc}", exc_info=True)
-                return False
+            return DeliveryResult(ok=False, error="webhook url is not configured")
+
+        body = self._encode(card)
+
+        limiter = self.rate_limiter
+        if limiter is None:
+            return await self._send(webhook_url, body, log_prefix)
+
+        started = await limiter.acquire(webhook_url, log_prefix)
+        try:
+            result = await self._send(webhook_url, body, log_prefix)
+        finally:
+            limiter.release(webhook_url)
+        if result.ok:
+            limiter.success(webhook_url)
+        elif result.status == 429:
+            limiter.throttled(webhook_url, started, result.retry_after)
+        return result
+
+    def _encode(self, card: Dict[str, Any]) -> bytes:
+        """전송 본문 (compactor 가 있으면 크기 제한 적용)"""
+        if self.compactor is None:
+            return encode_card(card)
+        return self.compactor.encode(card)
+
+    async def _send(
+        self,
+        webhook_url: str,
+        body: bytes,
+        log_prefix: str
+    ) -> DeliveryResult:
+        """POST 한 번 (속도 제한 없이) → 응답 분류"""
+        client = self.open()
+        metrics.observe("teams_payload_bytes", len(body))
+        try:
+            resp = await client.post(webhook_url, content=body, headers=_JSON_HEADERS)
+        except httpx.RequestError as exc:
+            logger.error(f"❌ {log_prefix} request error: {exc}", exc_info=True)
+            return DeliveryResult(ok=False, retryable=True, error=f"request error: {exc!r}")
+
+        status = resp.status_code
+        if resp.is_error or _THROTTLED_IN_BODY in resp.text:
+            # 커넥터 webhook 은 throttling 을 200 + 본문 메시지로 알려주기도 한다
+            throttled = status == 429 or not resp.is_error
+            logger.error(
+                f"❌ {log_prefix} response error. "
+                f"status={status} body={resp.text[:200]}"
+            )
+            return DeliveryResult(
+                ok=False,
+                status=429 if throttled else status,
+                retryable=throttled or status in _RETRYABLE_STATUS or status >= 500,
+                retry_after=parse_retry_after(resp.headers.get("Retry-After")),
+                error=f"status={status} body={resp.text[:200]}",
+            )
+
+        logger.info(f"✅ {log_prefix} message successfully posted to Teams.")
+        return DeliveryResult(ok=True, status=status)
 
 
 # 하위 호환성을 위한 모듈 레벨 인스턴스 (임시)
+# 컨테이너도 이 인스턴스를 사용하므로 프로세스 전체가 연결 풀 하나를 공유한다.
 _default_notifier = TeamsNotifier()
 
 
+def get_default_notifier() -> TeamsNotifier:
+    """프로세스 공용 TeamsNotifier"""
+    return _default_notifier
+
+
 async def post_to_forward_channel(card: Dict[str, Any]) -> None:
     """
     [DEPRECATED] 하위 호환성을 위한 함수
@@ -0,0 +1,84 @@
+# app/adapters/worker_slot.py
+"""
+worker 프로세스별 파일 경로
+
+uvicorn --workers N 이면 모든 worker 가 같은 환경 변수(ex. ANOMALY_SNAPSHOT_PATH, OUTBOX_PATH)를 받는다.
+파일을 프로세스 하나만 써야 하는 저장소는 worker 마다 다른 파일이 필요하다.
+
+- slot 0, 1, 2 ... 순서로 `<경로>.lock` 에 flock(LOCK_EX | LOCK_NB) 을 시도해 처음 잡히는 slot 을 쓴다.
+  lock 은 프로세스가 살아 있는 동안 유지되고, 죽으면 OS 가 풀어 준다.
+- slot 경로: 경로에 `{worker}` 가 있으면 slot 번호로 치환,
+  없으면 slot 0 은 경로 그대로, 그 외는 확장자 앞에 번호 (data/outbox.db → data/outbox.1.db)
+- 재시작한 worker 는 비어 있는 slot 을 잡으므로 이전 worker 의 파일(스냅샷, 미전송 알림)을 이어받는다.
+  worker 수를 줄이면 남는 slot 의 파일은 읽히지 않는다.
+- flock 이 없는 플랫폼(Windows)에서는 slot 0 경로를 그대로 쓴다 (worker 하나 전제).
+"""
+from __future__ import annotations
+
+from typing import Optional
+import logging
+import os
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+WORKER_PLACEHOLDER = "{worker}"
+
+
+def slot_path(path: str, index: int) -> str:
+    """slot 번호 → 파일 경로"""
+    if WORKER_PLACEHOLDER in path:
+        return path.replace(WORKER_PLACEHOLDER, str(index))
+    if index == 0:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}.{index}{ext}"
+
+
+class WorkerSlot:
+    """이 프로세스가 잡은 slot (release 전까지 다른 프로세스는 같은 slot 을 못 잡음)"""
+
+    def __init__(self, path: str, index: int, fd: Optional[int]):
+        self.path = path
+        self.index = index
+        self._fd = fd
+
+    def release(self) -> None:
+        fd, self._fd = self._fd, None
+        if fd is not None:
+            os.close(fd)
+
+    def __repr__(self) -> str:
+        return f"WorkerSlot({self.path!r}, index={self.index})"
+
+
+def claim_worker_slot(path: str, max_slots: int = 64) -> WorkerSlot:
+    """
+    비어 있는 slot 하나를 잡는다.
+
+    Raises:
+        RuntimeError: max_slots 개가 모두 다른 프로세스에 잡혀 있는 경우
+    """
+    if fcntl is None:
+        return WorkerSlot(slot_path(path, 0), 0, None)
+
+    for index in range(max_slots):
+        candidate = slot_path(path, index)
+        directory = os.path.dirname(candidate)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        fd = os.open(f"{candidate}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            continue
+        if index:
+            logger.info(f"🔒 Worker slot {index} claimed: {candidate}")
+        return WorkerSlot(candidate, index, fd)
+
+    raise RuntimeError(f"no free worker slot for {path} (max {max_slots})")
@@ -0,0 +1,43 @@
+# app/application/ports/anomaly_state.py
+"""
+장애 탐지 상태 저장소 포트 (인터페이스)
+
+Secondary Port: 윈도우 / 동일 분 bucket / 쿨다운 상태를 어디에 둘지 추상화한다.
+required Port
+"""
+from datetime import datetime
+from typing import Hashable, Optional, Protocol
+
+from app.domain.incident_type import IncidentType
+
+
+class AnomalyStateBackend(Protocol):
+    """
+    장애 탐지 상태 저장 인터페이스
+
+    이 Protocol을 구현하는 어댑터:
+    - InMemoryAnomalyState (adapters/memory_anomaly_state.py): 프로세스 내 AnomalyDetector
+    - RedisAnomalyState (adapters/redis_anomaly_state.py): 여러 replica 가 공유하는 Redis 프로토콜 저장소
+
+    Protocol을 사용하는 서비스:
+    - incident.py (Feed1 장애 판단)
+    - monitoring.py (Feed2 장애 판단)
+    """
+
+    async def record_event(
+        self,
+        incident_type: IncidentType,
+        timestamp: datetime,
+        dimension: Optional[Hashable] = None,
+    ) -> bool:
+        """
+        이벤트 하나를 기록하고 장애 알림을 보내야 하는지 판별한다.
+
+        Returns:
+            True 면 이 호출이 장애 알림 권한을 얻음 (쿨다운은 저장소 전체에서 한 번)
+        """
+        ...
+
+    async def reset(self) -> None:
+        """탐지 상태 초기화 (디버깅/테스트용)"""
+        ...
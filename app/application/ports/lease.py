@@ -0,0 +1,66 @@
+# app/application/ports/lease.py
+"""
+리스(lease) 저장소 포트 (인터페이스)
+
+Secondary Port: 여러 worker / replica 중 하나만 특정 작업을 맡도록 리더 리스를 관리한다.
+required Port
+"""
+from typing import Dict, Optional, Protocol
+
+
+class LeaseStore(Protocol):
+    """
+    리스 저장 인터페이스
+
+    리스는 이름별로 하나의 holder 만 가질 수 있고, TTL 안에 갱신하지 않으면 만료된다.
+    holder 가 바뀔 때마다 fencing token 이 1씩 증가한다.
+    리스에 딸린 워터마크는 현재 token 으로만 쓸 수 있다 (이전 리더의 늦은 쓰기는 거부).
+
+    이 Protocol을 구현하는 어댑터:
+    - SqliteLeaseStore (adapters/sqlite_lease.py): 같은 호스트의 worker 간 (파일 하나 공유)
+    - Redis / etcd 등 (미래 확장): 호스트가 다른 replica 간
+
+    Protocol을 사용하는 서비스:
+    - leader.py (MessagePoller 리더 선출)
+    """
+
+    async def acquire(self, name: str, holder: str, ttl: float) -> Optional[int]:
+        """
+        리스를 획득하거나 (이미 보유 중이면) 갱신한다.
+
+        Args:
+            name: 리스 이름
+            holder: 요청자 식별자 (프로세스마다 유일)
+            ttl: 리스 유효 시간 (초)
+
+        Returns:
+            fencing token (다른 holder 가 유효한 리스를 갖고 있으면 None)
+            - 보유 중 갱신: 같은 token
+            - 새로 획득 (비어 있거나 만료): 이전 token + 1
+        """
+        ...
+
+    async def release(self, name: str, holder: str) -> None:
+        """
+        보유 중인 리스를 즉시 만료시킨다 (다른 worker 가 바로 이어받도록).
+        holder 가 다르면 아무것도 하지 않는다.
+        """
+        ...
+
+    async def load_watermarks(self, name: str) -> Dict[str, str]:
+        """
+        리스에 딸린 워터마크 전체
+
+        Returns:
+            key(ex. channel_id) → 값 (ex. 마지막 polling 시각)
+        """
+        ...
+
+    async def save_watermark(self, name: str, token: int, key: str, value: str) -> bool:
+        """
+        워터마크 저장 (fencing)
+
+        Returns:
+            token 이 리스의 현재 token 이면 True (저장됨), 아니면 False (저장 안 함)
+        """
+        ...
@@ -0,0 +1,50 @@
+# app/application/ports/membership.py
+"""
+poller 멤버십 / 워터마크 저장소 포트 (인터페이스)
+
+Secondary Port: 채널 샤딩에 참여하는 poller replica 목록과 채널별 마지막 polling 시각을 공유한다.
+required Port
+"""
+from typing import List, Optional, Protocol
+
+
+class MembershipStore(Protocol):
+    """
+    멤버십 + 워터마크 저장 인터페이스
+
+    이 Protocol을 구현하는 어댑터:
+    - SqliteMembershipStore (adapters/sqlite_membership.py): 같은 호스트의 worker 간
+    - Redis / etcd 등 (미래 확장): 호스트가 다른 replica 간
+
+    Protocol을 사용하는 서비스:
+    - sharding.py (ShardCoordinator)
+    """
+
+    async def heartbeat(self, member: str, ttl: float) -> List[str]:
+        """
+        member 의 생존 기록을 ttl 초 연장하고 현재 살아 있는 멤버 목록을 돌려준다.
+
+        Returns:
+            만료되지 않은 멤버 식별자 (정렬, member 자신 포함)
+        """
+        ...
+
+    async def leave(self, member: str) -> None:
+        """member 를 즉시 제거한다 (종료 시, 다른 멤버가 바로 재분배하도록)."""
+        ...
+
+    async def load_watermark(self, channel_id: str) -> Optional[str]:
+        """
+        채널의 마지막 polling 시각 (ISO 8601, UTC)
+
+        Returns:
+            저장된 값이 없으면 None
+        """
+        ...
+
+    async def save_watermark(self, channel_id: str, since: str) -> None:
+        """
+        채널의 마지막 polling 시각을 저장한다.
+        저장된 값보다 이전 시각이면 무시한다 (워터마크는 뒤로 가지 않음).
+        """
+        ...
@@ -5,7 +5,14 @@
 Secondary Port: 애플리케이션이 외부 알림 시스템을 사용하기 위한 인터페이스
 required Port
 """
-from typing import Protocol, Dict, Any
+from dataclasses import dataclass
+from typing import Protocol, Dict, Any, Optional
+
+# 전송 대상 채널
+FORWARD_CHANNEL = "forward"
+INCIDENT_CHANNEL = "incident"
+# 전송 우선순위 (앞쪽 채널이 먼저, outbox 는 채널마다 lane 을 따로 둔다)
+CHANNEL_PRIORITY = (INCIDENT_CHANNEL, FORWARD_CHANNEL)
 
 
 class Notifier(Protocol):
@@ -13,7 +20,8 @@ class Notifier(Protocol):
     알림 전송 인터페이스
     
     이 Protocol을 구현하는 어댑터:
-    - TeamsNotifier (adapters/teams_notifier.py)
+    - TeamsNotifier (adapters/teams_notifier.py): 바로 전송
+    - QueuedNotifier (services/outbox.py): outbox 에 넣고 백그라운드 전송
     - SlackNotifier (미래 확장)
     
     Protocol을 사용하는 서비스:
@@ -30,7 +38,7 @@ class Notifier(Protocol):
             card: MessageCard 형식의 딕셔너리
             
         Returns:
-            전송 성공 여부
+            전송 성공 여부 (QueuedNotifier 는 outbox 접수 여부)
         """
         ...
     
@@ -42,6 +50,45 @@ class Notifier(Protocol):
             card: MessageCard 형식의 딕셔너리
             
         Returns:
-            전송 성공 여부
+            전송 성공 여부 (QueuedNotifier 는 outbox 접수 여부)
+        """
+        ...
+
+
+@dataclass(frozen=True)
+class DeliveryResult:
+    """
+    전송 한 번의 결과
+
+    Attributes:
+        ok: 성공 여부
+        status: HTTP 상태 코드 (요청 자체가 실패하면 None)
+        retryable: 다시 보내면 성공할 수 있는 실패인지 (429, 5xx, 네트워크 오류)
+        retry_after: 서버가 요청한 재시도 대기 시간 (초, Retry-After)
+        error: 실패 사유
+    """
+    ok: bool
+    status: Optional[int] = None
+    retryable: bool = False
+    retry_after: Optional[float] = None
+    error: str = ""
+
+
+class NotificationSender(Protocol):
+    """
+    채널 이름으로 한 번 전송하고 결과를 돌려주는 인터페이스 (재시도는 호출 측 책임)
+
+    이 Protocol을 구현하는 어댑터:
+    - TeamsNotifier (adapters/teams_notifier.py)
+
+    Protocol을 사용하는 서비스:
+    - outbox.py (NotificationOutbox 백그라운드 전송)
+    """
+
+    async def deliver(self, channel: str, card: Dict[str, Any]) -> DeliveryResult:
         """
-        ...
\ No newline at end of file
+        Args:
+            channel: FORWARD_CHANNEL / INCIDENT_CHANNEL
+            card: MessageCard 딕셔너리
+        """
+        ...
@@ -0,0 +1,98 @@
+# app/application/ports/outbox.py
+"""
+알림 outbox 저장소 포트 (인터페이스)
+
+Secondary Port: 보낼 알림을 전송 전까지 보관하고, 재시도 일정과 dead letter 를 관리한다.
+required Port
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Protocol
+
+
+@dataclass(slots=True)
+class OutboxMessage:
+    """
+    outbox 에 들어간 알림 하나
+
+    Attributes:
+        id: 저장소가 부여한 식별자 (증가)
+        channel: 전송 채널 (FORWARD_CHANNEL / INCIDENT_CHANNEL)
+        card: MessageCard 딕셔너리
+        enqueued_at: 접수 시각 (epoch 초)
+        next_attempt_at: 다음 전송 가능 시각 (epoch 초)
+        attempts: 지금까지 전송 시도 횟수
+        last_error: 마지막 실패 사유
+    """
+    id: int
+    channel: str
+    card: Dict[str, Any]
+    enqueued_at: float
+    next_attempt_at: float
+    attempts: int = 0
+    last_error: str = ""
+
+
+class OutboxStore(Protocol):
+    """
+    outbox 저장 인터페이스
+
+    이 Protocol을 구현하는 어댑터:
+    - InMemoryOutboxStore (adapters/memory_outbox.py)
+    - SqliteOutboxStore (adapters/sqlite_outbox.py)
+
+    Protocol을 사용하는 서비스:
+    - outbox.py (NotificationOutbox)
+    """
+
+    async def open(self) -> None:
+        """전송 시작 전 호출 (영속 저장소는 여기서 미전송 메시지를 복구)"""
+        ...
+
+    async def close(self) -> None:
+        """종료 시 호출 (쓰지 못한 변경을 마저 기록)"""
+        ...
+
+    def put(self, channel: str, card: Dict[str, Any], now: float) -> int:
+        """
+        알림을 접수한다. 요청 경로에서 호출되므로 I/O 없이 바로 반환해야 한다.
+
+        Returns:
+            메시지 id
+        """
+        ...
+
+    async def claim(
+        self, limit: int, now: float, channel: Optional[str] = None
+    ) -> List[OutboxMessage]:
+        """
+        전송 시각이 된 메시지를 최대 limit 개 가져온다.
+        가져간 메시지는 complete / reschedule / dead_letter 전까지 다시 나오지 않는다.
+
+        Args:
+            channel: 지정하면 그 채널만, None 이면 CHANNEL_PRIORITY 순서로 (장애 채널 먼저)
+        """
+        ...
+
+    async def next_due(self, channel: Optional[str] = None) -> Optional[float]:
+        """가장 이른 대기 메시지의 전송 가능 시각 (없으면 None, channel 지정 시 그 채널만)"""
+        ...
+
+    async def complete(self, message: OutboxMessage) -> None:
+        """전송 완료 → 삭제"""
+        ...
+
+    async def reschedule(self, message: OutboxMessage) -> None:
+        """message.attempts / next_attempt_at / last_error 를 반영해 다시 대기시킨다."""
+        ...
+
+    async def dead_letter(self, message: OutboxMessage) -> None:
+        """재시도를 포기한 메시지를 dead letter 로 옮긴다."""
+        ...
+
+    async def dead_letters(self, limit: int = 50) -> List[OutboxMessage]:
+        """최근 dead letter (최신순)"""
+        ...
+
+    async def pending(self, channel: Optional[str] = None) -> int:
+        """아직 완료되지 않은 메시지 수 (대기 + 전송 중, channel 지정 시 그 채널만)"""
+        ...
@@ -0,0 +1,38 @@
+# app/application/ports/snapshot_store.py
+"""
+스냅샷 저장소 포트 (인터페이스)
+
+Secondary Port: 탐지기 상태 스냅샷을 영속화하기 위한 인터페이스
+required Port
+"""
+from typing import Any, Dict, Optional, Protocol
+
+
+class SnapshotStore(Protocol):
+    """
+    스냅샷 저장 인터페이스
+
+    이 Protocol을 구현하는 어댑터:
+    - FileSnapshotStore (adapters/snapshot_store.py)
+
+    Protocol을 사용하는 서비스:
+    - snapshot.py (AnomalyDetector 주기 저장 / 시작 시 복원)
+    """
+
+    async def load(self) -> Optional[Dict[str, Any]]:
+        """
+        마지막으로 저장된 스냅샷을 읽는다.
+
+        Returns:
+            스냅샷 dict (없거나 읽을 수 없으면 None)
+        """
+        ...
+
+    async def save(self, snapshot: Dict[str, Any]) -> None:
+        """
+        스냅샷을 저장한다. 이벤트 루프를 막지 않아야 한다.
+
+        Args:
+            snapshot: JSON 직렬화 가능한 dict
+        """
+        ...
@@ -0,0 +1,182 @@
+# app/application/services/digest.py
+"""
+포워딩 digest
+
+장애 폭주 때 포워딩 에러를 한 건씩 보내지 않고 그룹(failure_reason / fingerprint)별로 묶어 보낸다.
+
+- 그룹의 첫 이벤트는 바로 원본 카드로 전송하고 window 초 동안 그룹을 연다.
+- 그룹이 열려 있는 동안 들어온 이벤트는 건수 + 샘플만 모은다.
+- window 가 끝나면 모인 이벤트를 digest 카드 하나로 전송하고 그룹을 닫는다.
+  (모인 것이 없으면 보내지 않음 → 다음 이벤트는 다시 바로 전송)
+- 모인 건수가 flush_count 에 도달하면 window 를 기다리지 않고 digest 를 보내고 새 window 를 시작한다.
+- window 만료 확인은 run() 의 주기 작업 + add() 시점에 한다.
+- active 조건을 주면 그 조건일 때만 새 그룹을 연다 (ex. outbox 포워딩 적체 시에만 digest).
+"""
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any, Callable, Dict, List
+import asyncio
+import logging
+import time
+
+from app import metrics
+from app.adapters.messagecard import build_digest_card
+from app.application.ports.notifier import Notifier
+from app.domain.events import VTErrorEvent
+
+logger = logging.getLogger(__name__)
+
+# 묶을 수 있는 기준
+DIGEST_GROUP_FIELDS = ("failure_reason", "fingerprint")
+
+# 그룹 값이 비어 있을 때 표시
+_UNKNOWN = "UNKNOWN"
+
+# digest 카드 Projects 줄에 표시할 project 수
+_TOP_PROJECTS = 5
+
+
+class _Group:
+    """열려 있는 그룹 하나"""
+
+    __slots__ = ("opened_at", "count", "samples", "projects")
+
+    def __init__(self, opened_at: float):
+        self.opened_at = opened_at
+        self.count = 0
+        self.samples: List[Dict[str, Any]] = []
+        self.projects: Counter = Counter()
+
+
+class ForwardDigest:
+    """
+    포워딩 digest 서비스
+
+    책임:
+    - 포워딩 이벤트 그룹화 (첫 이벤트 즉시 전송)
+    - window 만료 / 건수 초과 시 digest 카드 전송
+    """
+
+    def __init__(
+        self,
+        notifier: Notifier,
+        window: float = 30.0,
+        group_by: str = "failure_reason",
+        flush_count: int = 50,
+        max_samples: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+        active: Callable[[], bool] | None = None,
+    ):
+        """
+        Args:
+            notifier: 알림 전송 구현체
+            window: 그룹을 열어 두는 시간 (초)
+            group_by: 묶는 기준 (failure_reason / fingerprint)
+            flush_count: 모인 건수가 이만큼이면 window 전이라도 digest 전송
+            max_samples: digest 카드에 넣을 원본 샘플 수
+            clock: 단조 시계 (초)
+            active: 새 그룹을 열지 여부 (None 이면 항상 digest, False 면 한 건씩 전송)
+
+        Raises:
+            ValueError: 지원하지 않는 group_by
+        """
+        if group_by not in DIGEST_GROUP_FIELDS:
+            raise ValueError(f"unknown digest group_by: {group_by!r}")
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.notifier = notifier
+        self.window = window
+        self.group_by = group_by
+        self.flush_count = max(flush_count, 1)
+        self.max_samples = max_samples
+        self._clock = clock
+        self._active = active
+        self._groups: Dict[str, _Group] = {}
+
+    def group_key(self, event: VTErrorEvent) -> str:
+        return getattr(event, self.group_by) or _UNKNOWN
+
+    async def add(self, event: VTErrorEvent, payload: Dict[str, Any]) -> bool:
+        """
+        포워딩 이벤트 하나 추가
+
+        Returns:
+            True  -> 그룹의 첫 이벤트라 원본 카드를 바로 보냄
+            False -> digest 로 모음
+        """
+        key = self.group_key(event)
+        now = self._clock()
+        group = self._groups.get(key)
+        if group is not None and now - group.opened_at >= self.window:
+            await self._flush(key, group, now, reopen=False)
+            group = None
+
+        if group is None:
+            if self._active is None or self._active():
+                self._groups[key] = _Group(now)
+            await self.notifier.send_to_forward_channel(payload)
+            return True
+
+        group.count += 1
+        group.projects[event.project] += 1
+        if len(group.samples) < self.max_samples:
+            group.samples.append(payload)
+        metrics.increment("forward_digested")
+        if group.count >= self.flush_count:
+            await self._flush(key, group, now, reopen=True)
+        return False
+
+    async def flush_due(self) -> int:
+        """window 가 끝난 그룹 정리 → 보낸 digest 수"""
+        now = self._clock()
+        expired = [(k, g) for k, g in self._groups.items() if now - g.opened_at >= self.window]
+        sent = 0
+        for key, group in expired:
+            sent += await self._flush(key, group, now, reopen=False)
+        return sent
+
+    async def flush_all(self) -> int:
+        """모든 그룹의 digest 전송 (종료 시) → 보낸 digest 수"""
+        now = self._clock()
+        sent = 0
+        for key, group in list(self._groups.items()):
+            sent += await self._flush(key, group, now, reopen=False)
+        return sent
+
+    async def run(self, interval: float = 1.0) -> None:
+        """window 만료 확인 주기 작업 (lifespan 에서 task 로 실행)"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.flush_due()
+            except Exception as e:
+                logger.error(f"❌ Forward digest flush error: {e}", exc_info=True)
+
+    async def _flush(self, key: str, group: _Group, now: float, reopen: bool) -> int:
+        """
+        그룹의 모인 이벤트를 digest 카드로 전송
+
+        Args:
+            reopen: True 면 그룹을 새 window 로 다시 연다 (건수 초과 flush),
+                    False 면 그룹을 닫는다 (다음 이벤트는 바로 전송)
+        """
+        if reopen:
+            self._groups[key] = _Group(now)
+        else:
+            self._groups.pop(key, None)
+        if group.count == 0:
+            return 0
+
+        card = build_digest_card(
+            self.group_by,
+            key,
+            group.count,
+            now - group.opened_at,
+            group.samples,
+            group.projects.most_common(_TOP_PROJECTS),
+        )
+        await self.notifier.send_to_forward_channel(card)
+        metrics.increment("forward_digests_sent")
+        logger.info(f"🧾 Forward digest sent ({self.group_by}={key}, {group.count} events)")
+        return 1
@@ -1,41 +1,142 @@
 from __future__ import annotations
 
+import json
 import logging
+import os
+import time
+from typing import Callable, Optional, Tuple
 
-from app.domain.rules import FORWARD_FAILURE_REASONS, SPECIAL_FORWARD_KEYWORDS
+from app.config import FORWARD_RULES_PATH, FORWARD_RULES_RELOAD_SECONDS
 from app.domain.events import VTErrorEvent
+from app.domain.forward_rules import (
+    DEFAULT_FORWARD_RULES,
+    ForwardDecision,
+    ForwardRuleSet,
+    compile_rules,
+)
 
 logger = logging.getLogger(__name__)
 
 
-def should_forward(event: VTErrorEvent) -> bool:
+class ForwardRuleEngine:
     """
-    VTErrorEvent 가 일반 에러 피드로 포워딩되어야 하는지 여부.
+    파일 기반 포워딩 규칙 엔진
+
+    책임:
+    - 규칙 파일(JSON)을 읽어 결정 테이블(ForwardRuleSet)로 컴파일
+    - reload_interval 마다 파일 변경(mtime/size)을 확인하고, 바뀌었으면 다시 컴파일
+    - 새 테이블은 완성된 뒤 참조 하나만 교체 (atomic swap)
+    - 파일이 잘못되면 이전 테이블을 그대로 유지
     """
-    if event.failure_reason in FORWARD_FAILURE_REASONS:
+
+    def __init__(
+        self,
+        path: str = "",
+        reload_interval: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            path: 규칙 파일 경로 (빈 값이면 rules.py 기본 규칙만 사용)
+            reload_interval: 파일 변경 확인 주기 (초)
+            clock: 단조 시계 (테스트용 주입)
+        """
+        self.path = path
+        self.reload_interval = reload_interval
+        self._clock = clock
+        self._ruleset: ForwardRuleSet = DEFAULT_FORWARD_RULES
+        self._file_signature: Optional[Tuple[float, int]] = None
+        self._next_check = 0.0
+
+        if path:
+            self.reload()
+
+    @property
+    def ruleset(self) -> ForwardRuleSet:
+        """현재 적용 중인 결정 테이블"""
+        return self._ruleset
+
+    def evaluate(self, event: VTErrorEvent) -> ForwardDecision:
+        """이벤트 포워딩 판정 (필요 시 규칙 파일 재확인)"""
+        if self.path and self._clock() >= self._next_check:
+            self._check_for_changes()
+        return self._ruleset.evaluate(event)
+
+    def _check_for_changes(self) -> None:
+        self._next_check = self._clock() + self.reload_interval
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return
+        if (stat.st_mtime, stat.st_size) != self._file_signature:
+            self.reload()
+
+    def reload(self) -> bool:
+        """
+        규칙 파일을 다시 읽어 컴파일한다.
+
+        Returns:
+            교체 성공 여부 (실패 시 기존 테이블 유지)
+        """
+        try:
+            stat = os.stat(self.path)
+            with open(self.path, encoding="utf-8") as f:
+                spec = json.load(f)
+            ruleset = compile_rules(spec, source=self.path)
+        except (OSError, ValueError) as exc:
+            logger.error(f"❌ Failed to load forward rules from {self.path}: {exc}")
+            return False
+
+        self._file_signature = (stat.st_mtime, stat.st_size)
+        self._ruleset = ruleset
         logger.info(
-            "Forwarding VT alert (failure_reason=%s, project=%s)",
-            event.failure_reason,
-            event.project,
+            f"📜 Forward rules loaded from {self.path} "
+            f"(failure_reasons={len(ruleset.failure_reasons)}, "
+            f"keywords={len(ruleset.keyword_decisions)}, "
+            f"field_rules={len(ruleset.field_rules)})"
         )
         return True
 
-    blob = " ".join(
-        [
-            event.error_message or "",
-            event.error_detail or "",
-            event.cause_or_stack_trace or "",
-        ]
+
+# 모듈 레벨 기본 엔진 (FORWARD_RULES_PATH 설정 시 파일 규칙 사용)
+_default_engine = ForwardRuleEngine(FORWARD_RULES_PATH, FORWARD_RULES_RELOAD_SECONDS)
+
+
+def get_default_engine() -> ForwardRuleEngine:
+    """모듈 레벨 기본 ForwardRuleEngine"""
+    return _default_engine
+
+
+def match_special_keyword(event: VTErrorEvent) -> Optional[str]:
+    """
+    Error Message / Error Detail / Cause 중 처음 매칭된 특수 키워드를 반환한다.
+    필드를 이어 붙이지 않고 각 필드를 그대로 스캔한다.
+    """
+    return _default_engine.ruleset.keyword_matcher.search(
+        event.error_message,
+        event.error_detail,
+        event.cause_or_stack_trace,
     )
-    if any(keyword in blob for keyword in SPECIAL_FORWARD_KEYWORDS):
+
+
+def should_forward(event: VTErrorEvent, engine: ForwardRuleEngine | None = None) -> bool:
+    """
+    VTErrorEvent 가 일반 에러 피드로 포워딩되어야 하는지 여부.
+    """
+    decision = (engine or _default_engine).evaluate(event)
+
+    if decision.forward:
         logger.info(
-            "Forwarding VT alert (special keyword matched, project=%s)",
+            "Forwarding VT alert (rule=%s, matched=%s, project=%s)",
+            decision.rule,
+            decision.detail,
             event.project,
         )
         return True
 
     logger.info(
-        "Dropping VT alert (failure_reason=%s, project=%s)",
+        "Dropping VT alert (rule=%s, failure_reason=%s, project=%s)",
+        decision.rule,
         event.failure_reason,
         event.project,
     )
@@ -2,14 +2,18 @@
 from __future__ import annotations
 
 from typing import Any, Dict
+import asyncio
 import logging
 
 from pydantic import ValidationError
 
 from app.application.ports.notifier import Notifier
+from app.adapters.card_encoding import EncodedCard
 from app.adapters.messagecard import VTWebhookMessage
 from app.domain.events import VTErrorEvent
-from .forwarding import should_forward
+from app.domain.heavy_hitters import HeavyHitterTracker
+from .digest import ForwardDigest
+from .forwarding import ForwardRuleEngine, should_forward
 from .incident import IncidentService
 
 logger = logging.getLogger(__name__)
@@ -25,14 +29,27 @@ class AlertHandler:
     - 장애 기준 체크 및 알림
     """
     
-    def __init__(self, notifier: Notifier, incident_service: IncidentService):
+    def __init__(
+        self,
+        notifier: Notifier,
+        incident_service: IncidentService,
+        rule_engine: ForwardRuleEngine | None = None,
+        heavy_hitters: HeavyHitterTracker | None = None,
+        digest: ForwardDigest | None = None,
+    ):
         """
         Args:
             notifier: 알림 전송 구현체
             incident_service: 장애 처리 서비스
+            rule_engine: 포워딩 규칙 엔진 (None이면 모듈 기본 엔진)
+            heavy_hitters: top-K 추적기 (None이면 집계 안 함)
+            digest: 포워딩 digest (None이면 포워딩 에러를 한 건씩 전송)
         """
         self.notifier = notifier
         self.incident_service = incident_service
+        self.rule_engine = rule_engine
+        self.heavy_hitters = heavy_hitters
+        self.digest = digest
     
     async def handle_raw_alert(self, payload: Dict[str, Any]) -> bool:
         """
@@ -57,14 +74,37 @@ class AlertHandler:
             return False
 
         event = VTErrorEvent.from_message(msg)
+        # 포워딩 / 장애 채널이 같은 payload 를 보내면 JSON 인코딩은 한 번만
+        payload = EncodedCard.wrap(payload)
+
+        if self.heavy_hitters is not None:
+            self.heavy_hitters.record(event)
 
         # ------ (1) 일반 에러 피드 포워딩 (개선사항 1) ------
-        forwarded = False
-        if should_forward(event):
-            await self.notifier.send_to_forward_channel(payload)
-            forwarded = True
+        # 장애 알림이 포워딩 전송(최대 timeout)을 기다리지 않도록 별도 task 로 보낸다.
+        # task 는 아래 장애 처리가 처음 await 할 때 시작하므로 장애 평가가 먼저 진행된다.
+        forward_task = None
+        if should_forward(event, self.rule_engine):
+            forward_task = asyncio.create_task(self._forward(event, payload))
 
         # ------ (2) 장애 기준 체크 (개선사항 2) ------
-        await self.incident_service.handle_incident(event, payload)
+        try:
+            await self.incident_service.handle_incident(event, payload)
+        except BaseException:
+            # 장애 처리 에러를 그대로 올린다. 포워딩은 끝까지 기다리되 그 에러는 로그만 남긴다
+            if forward_task is not None:
+                (forward_error,) = await asyncio.gather(forward_task, return_exceptions=True)
+                if isinstance(forward_error, BaseException):
+                    logger.error(f"❌ Forwarding failed: {forward_error!r}", exc_info=forward_error)
+            raise
+
+        if forward_task is not None:
+            await forward_task
+        return forward_task is not None
 
-        return forwarded
\ No newline at end of file
+    async def _forward(self, event: VTErrorEvent, payload: Dict[str, Any]) -> None:
+        """포워딩 채널 전송 (digest 모드면 digest 에 추가)"""
+        if self.digest is not None:
+            await self.digest.add(event, payload)
+        else:
+            await self.notifier.send_to_forward_channel(payload)
\ No newline at end of file
@@ -1,14 +1,36 @@
 # app/application/services/incident.py
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
+from app.application.ports.anomaly_state import AnomalyStateBackend
 from app.application.ports.notifier import Notifier
-from app.domain.events import VTErrorEvent
-from app.domain.anomaly import record_event
+from app.adapters.memory_anomaly_state import InMemoryAnomalyState
+from app.adapters.messagecard import with_extra_section
+from app.domain.events import EVENT_DIMENSIONS, VTErrorEvent
+from app.domain.anomaly import AnomalyDetector
+from app.domain.heavy_hitters import HeavyHitterTracker
 from app.domain.incident_type import IncidentType
 
 
+# 장애 카드에 표시할 dimension 별 top offender 수
+TOP_OFFENDERS_ON_CARD = 3
+
+
+def parse_dimension_fields(spec: str) -> Tuple[str, ...]:
+    """
+    "project,failure_reason" 형태의 설정값 → 필드 이름 튜플
+
+    Raises:
+        ValueError: VTErrorEvent 에 없는 필드 (fingerprint 는 허용)
+    """
+    fields = tuple(f.strip() for f in spec.split(",") if f.strip())
+    unknown = [f for f in fields if f not in EVENT_DIMENSIONS]
+    if unknown:
+        raise ValueError(f"unknown anomaly dimension field(s): {', '.join(unknown)}")
+    return fields
+
+
 class IncidentService:
     """
     장애 처리 서비스
@@ -18,12 +40,30 @@ class IncidentService:
     - 장애 알림 전송
     """
     
-    def __init__(self, notifier: Notifier):
+    def __init__(
+        self,
+        notifier: Notifier,
+        detector: AnomalyDetector | None = None,
+        dimension: str = "",
+        heavy_hitters: HeavyHitterTracker | None = None,
+        state: AnomalyStateBackend | None = None,
+    ):
         """
         Args:
             notifier: 알림 전송 구현체
+            detector: 장애 탐지기 (None이면 전용 탐지기 생성)
+            dimension: 장애 집계 단위로 쓸 VTErrorEvent 필드/fingerprint (쉼표 구분, 비어 있으면 유형 단위)
+            heavy_hitters: 지정하면 장애 카드에 top offender 섹션을 덧붙인다
+            state: 탐지 상태 저장소 (None이면 detector 를 쓰는 프로세스 내 저장소)
+
+        Raises:
+            ValueError: dimension 에 VTErrorEvent 에 없는 필드가 있는 경우
         """
         self.notifier = notifier
+        self.detector = detector if detector is not None else AnomalyDetector()
+        self.state = state if state is not None else InMemoryAnomalyState(self.detector)
+        self.dimension_fields = parse_dimension_fields(dimension)
+        self.heavy_hitters = heavy_hitters
     
     async def handle_incident(self, event: VTErrorEvent, raw_payload: Dict[str, Any]) -> None:
         """
@@ -33,10 +73,24 @@ class IncidentService:
             event: VT 에러 이벤트
             raw_payload: 원본 payload (Teams 전송용)
         """
-        if self._should_trigger_incident(event):
-            await self.notifier.send_to_incident_channel(raw_payload)
+        if await self._should_trigger_incident(event):
+            await self.notifier.send_to_incident_channel(self._incident_card(raw_payload))
+
+    def _incident_card(self, raw_payload: Dict[str, Any]) -> Dict[str, Any]:
+        """장애 카드 (heavy hitter 추적기가 있으면 top offender 섹션 추가)"""
+        if self.heavy_hitters is None:
+            return raw_payload
+
+        facts = []
+        for dimension in self.heavy_hitters.dimensions:
+            top = self.heavy_hitters.top(dimension, TOP_OFFENDERS_ON_CARD)
+            if top:
+                facts.append((dimension, ", ".join(f"{value} ({count})" for value, count in top)))
+        if not facts:
+            return raw_payload
+        return with_extra_section(raw_payload, "Top offenders (최근 윈도우)", facts)
     
-    def _should_trigger_incident(self, event: VTErrorEvent) -> bool:
+    async def _should_trigger_incident(self, event: VTErrorEvent) -> bool:
         """
         장애 발생 여부 판단
         
@@ -52,4 +106,17 @@ class IncidentService:
         if incident_type is None:
             return False
         
-        return record_event(incident_type, event.event_datetime())
\ No newline at end of file
+        return await self.state.record_event(
+            incident_type,
+            event.event_datetime(),
+            self._dimension_of(event),
+        )
+
+    def _dimension_of(self, event: VTErrorEvent) -> Optional[str]:
+        """설정된 필드 값으로 장애 집계 단위를 만든다 (설정이 없으면 None)"""
+        fields = self.dimension_fields
+        if not fields:
+            return None
+        if len(fields) == 1:
+            return getattr(event, fields[0]) or ""
+        return "|".join(getattr(event, f) or "" for f in fields)
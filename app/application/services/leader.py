@@ -0,0 +1,188 @@
+# app/application/services/leader.py
+"""
+리더 선출 서비스
+
+여러 worker / replica 중 리스를 가진 하나만 Graph 폴링을 수행한다.
+(HTTP 웹훅 엔드포인트는 리더 여부와 무관하게 모든 worker 가 처리)
+
+- run(): renew_interval 마다 리스 획득/갱신 시도
+  - 팔로워는 같은 주기로 재시도하므로, 리더가 종료(release)하면 renew_interval 안에,
+    비정상 종료하면 ttl + renew_interval 안에 이어받는다.
+- is_leader: 마지막으로 갱신에 성공한 시점(요청 시작 기준) + ttl 이 지나지 않았을 때만 True
+  갱신이 실패하면 저장소의 리스가 만료되기 전에 스스로 리더를 내려놓는다.
+- token: 리스 fencing token. 리더가 바뀔 때마다 증가한다.
+  - 저장소가 확인하는 곳: save_watermark → 현재 token 이 아니면 저장소가 거부하고, 이 프로세스는 리더를 내려놓는다.
+    이전 리더가 늦게 쓴 워터마크가 새 리더의 워터마크를 덮지 않는다.
+  - Teams 전송은 받는 쪽이 token 을 확인할 수 없으므로 fencing 되지 않는다.
+    poller 는 메시지마다 is_leader 를 확인할 뿐이라, 리스가 끊긴 직후 처리 중이던 메시지 하나는 중복 전송될 수 있다.
+"""
+from __future__ import annotations
+
+from typing import Callable, Dict, Optional
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+
+from app import metrics
+from app.application.ports.lease import LeaseStore
+
+logger = logging.getLogger(__name__)
+
+
+def default_holder_id() -> str:
+    """호스트 + pid + 임의값 (재시작해도 이전 프로세스와 구분)"""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class LeaderElector:
+    """
+    리스 기반 리더 선출
+
+    책임:
+    - 리스 주기 갱신
+    - 리더 여부 / fencing token 제공
+    - 종료 시 리스 반납
+    """
+
+    def __init__(
+        self,
+        store: LeaseStore,
+        name: str = "message-poller",
+        holder: Optional[str] = None,
+        ttl: float = 15.0,
+        renew_interval: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            store: 리스 저장소
+            name: 리스 이름
+            holder: 이 프로세스의 식별자 (None이면 자동 생성)
+            ttl: 리스 유효 시간 (초)
+            renew_interval: 갱신/재시도 주기 (None이면 ttl / 3)
+            clock: 단조 시계 (리더 유효 기간 계산용)
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.store = store
+        self.name = name
+        self.holder = holder or default_holder_id()
+        self.ttl = ttl
+        self.renew_interval = renew_interval if renew_interval is not None else ttl / 3
+        self._clock = clock
+        self._token: Optional[int] = None
+        self._deadline = 0.0
+        self._elected = asyncio.Event()
+        self.running = False
+
+    @property
+    def is_leader(self) -> bool:
+        return self._token is not None and self._clock() < self._deadline
+
+    @property
+    def token(self) -> Optional[int]:
+        """현재 리더 임기의 fencing token (리더가 아니면 None)"""
+        return self._token if self.is_leader else None
+
+    async def try_acquire(self) -> bool:
+        """
+        리스 획득/갱신을 한 번 시도한다.
+
+        Returns:
+            시도 후 리더 여부
+        """
+        started = self._clock()
+        try:
+            token = await self._acquire()
+        except Exception as e:
+            # 갱신 실패: 기존 deadline 까지만 리더 유지
+            logger.warning(f"⚠️ Lease renewal failed ({self.name}): {e}")
+            if not self.is_leader:
+                self._step_down()
+            return self.is_leader
+
+        if token is None:
+            self._step_down()
+            return False
+
+        if token != self._token:
+            logger.info(f"👑 Leadership acquired: {self.name} (holder={self.holder}, token={token})")
+            metrics.increment("leader_elected")
+        self._token = token
+        self._deadline = started + self.ttl
+        self._elected.set()
+        return True
+
+    async def load_watermarks(self) -> Dict[str, str]:
+        """리스에 딸린 워터마크 (이전 리더가 마지막으로 저장한 값)"""
+        return await self.store.load_watermarks(self.name)
+
+    async def save_watermark(self, key: str, value: str) -> bool:
+        """
+        현재 token 으로 워터마크 저장
+
+        Returns:
+            저장 여부. 저장소가 token 을 거부하면 (다른 holder 가 이미 이어받음) 리더를 내려놓고 False
+        """
+        token = self.token
+        if token is None:
+            return False
+        if await self.store.save_watermark(self.name, token, key, value):
+            return True
+        logger.warning(f"🔻 Watermark rejected, lease moved on: {self.name} (token={token})")
+        self._step_down()
+        return False
+
+    async def _acquire(self) -> Optional[int]:
+        """
+        store.acquire (취소되어도 진행 중인 요청은 끝까지 기다린다)
+
+        저장소 요청은 스레드(ex. SQLite)에서 돌면 취소되지 않는다. 그대로 취소를 전파하면
+        종료 시 release() 뒤에 갱신이 커밋되어, 종료 중인 프로세스가 ttl 동안 리스를 쥐게 된다.
+        """
+        pending = asyncio.ensure_future(self.store.acquire(self.name, self.holder, self.ttl))
+        try:
+            return await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            await asyncio.gather(pending, return_exceptions=True)
+            raise
+
+    def _step_down(self) -> None:
+        if self._token is not None:
+            logger.warning(f"🔻 Leadership lost: {self.name} (token={self._token})")
+            metrics.increment("leader_lost")
+        self._token = None
+        self._elected.clear()
+
+    async def wait_until_leader(self) -> None:
+        """리더가 될 때까지 대기"""
+        while not self.is_leader:
+            self._elected.clear()
+            await self._elected.wait()
+
+    async def run(self) -> None:
+        """갱신 루프 (stop() 까지)"""
+        self.running = True
+        while self.running:
+            await self.try_acquire()
+            await asyncio.sleep(self.renew_interval)
+
+    def stop(self) -> None:
+        """갱신 중지 (리스 반납은 release() 로)"""
+        self.running = False
+
+    async def release(self) -> None:
+        """리스 반납 → 팔로워가 다음 재시도에서 바로 이어받는다."""
+        was_leader = self._token is not None
+        self._token = None
+        self._elected.clear()
+        if not was_leader:
+            return
+        try:
+            await self.store.release(self.name, self.holder)
+            logger.info(f"👋 Leadership released: {self.name}")
+        except Exception as e:
+            logger.warning(f"⚠️ Lease release failed ({self.name}): {e}")
@@ -52,7 +52,7 @@ class TeamsMessageParser:
         
         content_str = attachment.get("content", "{}")
         try:
-            card_dict = json.loads(content_str)
-            return VTWebhookMessage.model_validate(card_dict)
+            # 원본 문자열을 들고 있어서 포워딩 시 다시 인코딩하지 않는다
+            return VTWebhookMessage.from_json(content_str)
         except (json.JSONDecodeError, Exception):
             return None
\ No newline at end of file
@@ -3,19 +3,18 @@
 채널 메시지 Polling 서비스
 """
 import asyncio
-from datetime import datetime, timezone
-from typing import Dict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
 import logging
 
 from app.adapters.graph_client import GraphClient
 from app.application.services.message_parser import TeamsMessageParser
 from app.application.services.message_processor import MessageProcessor
 from app.application.services.duplicate_tracker import DuplicateTracker
-from app.config import (
-    TEAMS_TEAM_ID,
-    TEAMS_FEED1_CHANNEL_ID,
-    TEAMS_FEED2_CHANNEL_ID
-)
+from app.application.services.leader import LeaderElector
+from app.application.services.poll_channels import default_poll_channels
+from app.application.services.sharding import ShardCoordinator
+from app.config import TEAMS_TEAM_ID
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +27,8 @@ class MessagePoller:
     - 채널에서 새 메시지 조회
     - Feed별로 적절한 processor에게 위임
     - Polling 생명주기 관리
+    - (leader 지정 시) 리더일 때만 polling
+    - (shards 지정 시) 이 replica 가 맡은 채널만 polling, 워터마크 인계
     """
     
     def __init__(
@@ -35,15 +36,42 @@ class MessagePoller:
         graph_client: GraphClient,
         parser: TeamsMessageParser = None,
         processor: MessageProcessor = None,
-        duplicate_tracker: DuplicateTracker = None
+        duplicate_tracker: DuplicateTracker = None,
+        leader: Optional[LeaderElector] = None,
+        channels: Optional[Sequence[Tuple[str, str]]] = None,
+        shards: Optional[ShardCoordinator] = None,
     ):
         self.graph = graph_client
         self.parser = parser or TeamsMessageParser()
         self.processor = processor or MessageProcessor()
         self.tracker = duplicate_tracker or DuplicateTracker()
+        self.leader = leader
+        self.channels: List[Tuple[str, str]] = list(channels) if channels else default_poll_channels()
+        self.shards = shards
         
         self.last_check: Dict[str, str] = {}
         self.running = False
+        self._leader_token: Optional[int] = None
+        self._owned: frozenset = frozenset()
+
+    def _holds_leadership(self) -> bool:
+        """지금 임기(token)의 리더인지 (리더 선출 미사용 시 항상 True)"""
+        if self.leader is None:
+            return True
+        return self.leader.is_leader and self.leader.token == self._leader_token
+
+    async def _take_over(self) -> None:
+        """
+        리더가 되면 리스에 저장된 워터마크(이전 리더의 마지막 polling 시각)부터 읽는다.
+
+        워터마크가 없는 채널(처음 실행)은 지금부터.
+        """
+        self._leader_token = self.leader.token
+        watermarks = await self.leader.load_watermarks()
+        now = datetime.now(timezone.utc).isoformat()
+        for channel_id, _ in self.channels:
+            self.last_check[channel_id] = watermarks.get(channel_id) or now
+        logger.info(f"👑 Poller took over (token={self._leader_token}), resuming from lease watermarks")
     
     async def poll_channel(self, channel_id: str, feed_type: str):
         """
@@ -63,10 +91,18 @@ class MessagePoller:
             )
             
             for message in messages:
+                # 처리 도중 리더를 잃으면 중단 (새 리더가 이어서 처리)
+                if not self._holds_leadership():
+                    logger.warning(f"🔻 Leadership lost while polling {feed_type}, stopping")
+                    return
                 await self._process_single_message(message, feed_type)
             
             # 마지막 확인 시간 업데이트
             self.last_check[channel_id] = datetime.now(timezone.utc).isoformat()
+            if self.shards is not None:
+                await self.shards.save_watermark(channel_id, self.last_check[channel_id])
+            if self.leader is not None:
+                await self.leader.save_watermark(channel_id, self.last_check[channel_id])
             
         except Exception as e:
             logger.error(f"Polling error for {feed_type}: {e}", exc_info=True)
@@ -106,6 +142,28 @@ class MessagePoller:
         # 처리 완료 기록
         self.tracker.mark_processed(msg_id)
     
+    async def _channels_to_poll(self) -> List[Tuple[str, str]]:
+        """
+        이번 주기에 polling 할 채널
+
+        샤딩 시 분배를 다시 계산하고, 새로 맡은 채널은 저장된 워터마크부터 (없으면 지금부터),
+        넘겨준 채널은 last_check 에서 제거한다.
+        """
+        if self.shards is None:
+            return self.channels
+
+        owned = await self.shards.refresh()
+        if owned != self._owned:
+            now = datetime.now(timezone.utc).isoformat()
+            for channel_id, _ in self.channels:
+                if channel_id in owned and channel_id not in self._owned:
+                    since = await self.shards.load_watermark(channel_id)
+                    self.last_check[channel_id] = since or now
+                elif channel_id not in owned:
+                    self.last_check.pop(channel_id, None)
+            self._owned = owned
+        return [(c, f) for c, f in self.channels if c in owned]
+
     async def start(self, poll_interval: int = 10):
         """
         Polling 시작
@@ -118,27 +176,36 @@ class MessagePoller:
         logger.info("=" * 80)
         logger.info("🚀 Starting message poller...")
 
-        # 서버 시작 시각 기록 (첫 polling 스킵)
+        # 서버 시작 시각 기록 (첫 polling 스킵, 샤딩 시에는 채널을 맡을 때 워터마크로 결정)
         now = datetime.now(timezone.utc).isoformat()
-        self.last_check[TEAMS_FEED1_CHANNEL_ID] = now
-        self.last_check[TEAMS_FEED2_CHANNEL_ID] = now
+        if self.shards is None:
+            for channel_id, _ in self.channels:
+                self.last_check[channel_id] = now
 
         logger.info(f"📍 Starting from: {now}")
         logger.info(f"📍 Team ID: {TEAMS_TEAM_ID}")
-        logger.info(f"📍 Feed1: {TEAMS_FEED1_CHANNEL_ID}")
-        logger.info(f"📍 Feed2: {TEAMS_FEED2_CHANNEL_ID}")
+        for channel_id, feed_type in self.channels:
+            logger.info(f"📍 {feed_type}: {channel_id}")
+        if self.shards is not None:
+            logger.info(f"📍 Sharded poller: {self.shards.member}")
         logger.info(f"📍 Poll interval: {poll_interval}s")
         logger.info("=" * 80)
         
         while self.running:
             try:
+                if self.leader is not None and not self._holds_leadership():
+                    if not self.leader.is_leader:
+                        # 팔로워: 리더가 될 때까지 대기 (HTTP 엔드포인트는 계속 처리)
+                        await self.leader.wait_until_leader()
+                        if not self.running:
+                            break
+                    await self._take_over()
+
                 logger.info(f"\n⏰ Polling at {datetime.now().isoformat()}")
                 
-                # Feed1 polling
-                await self.poll_channel(TEAMS_FEED1_CHANNEL_ID, "feed1")
-                
-                # Feed2 polling
-                await self.poll_channel(TEAMS_FEED2_CHANNEL_ID, "feed2")
+                # 채널별 polling (Feed1 / Feed2)
+                for channel_id, feed_type in await self._channels_to_poll():
+                    await self.poll_channel(channel_id, feed_type)
                 
                 # 대기
                 await asyncio.sleep(poll_interval)
@@ -2,12 +2,12 @@
 """
 Feed별 메시지 처리 로직
 """
-import re
 from typing import Optional
 import logging
 
 from app.adapters.messagecard import VTWebhookMessage
 from app.container import get_container
+from app.domain.normalization import strip_html_tags
 
 logger = logging.getLogger(__name__)
 
@@ -22,26 +22,26 @@ class MessageProcessor:
         Returns:
             포워딩 여부
         """
-        logger.info(f"📨 Processing Feed1: {card.title}")
+        # 로그 레벨에서 버려질 출력이면 fact 조회/정규화 자체를 생략
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"📨 Processing Feed1: {card.title}")
 
-        # Error Detail 출력 추가
-        error_detail = card.get_fact("Error Detail")
-        if error_detail:
-            error_clean = re.sub(r'<[^>]+>', '', error_detail)
-            logger.info(f"📋 Error Detail: {error_clean}")
+            # Error Detail 출력 추가
+            error_detail = card.get_fact("Error Detail")
+            if error_detail:
+                logger.info(f"📋 Error Detail: {strip_html_tags(error_detail)}")
 
-        # Error Message 출력 (있으면)
-        error_message = card.get_fact("Error Message")
-        if error_message:
-            error_clean = re.sub(r'<[^>]+>', '', error_message)
-            logger.info(f"📋 Error Message: {error_clean}")
+            # Error Message 출력 (있으면)
+            error_message = card.get_fact("Error Message")
+            if error_message:
+                logger.info(f"📋 Error Message: {strip_html_tags(error_message)}")
         
         # 컨테이너에서 AlertHandler 가져오기
         container = get_container()
         handler = container.alert_handler
         
         # 처리
-        payload = card.model_dump() if hasattr(card, 'model_dump') else card.model_dump()
+        payload = card.to_payload()
         forwarded = await handler.handle_raw_alert(payload)
 
         if forwarded:
@@ -58,20 +58,20 @@ class MessageProcessor:
         Returns:
             장애 발생 여부
         """
-        logger.info(f"📨 Processing Feed2: {card.title}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"📨 Processing Feed2: {card.title}")
 
-        # Description 추출 및 출력
-        desc = card.get_fact("Description")
-        if desc:
-            desc_clean = re.sub(r'<[^>]+>', '', desc)
-            logger.info(f"📋 Description: {desc_clean}")
+            # Description 추출 및 출력
+            desc = card.get_fact("Description")
+            if desc:
+                logger.info(f"📋 Description: {strip_html_tags(desc)}")
         
         # 컨테이너에서 MonitoringHandler 가져오기
         container = get_container()
         handler = container.monitoring_handler
         
         # 처리
-        payload = card.model_dump() if hasattr(card, 'model_dump') else card.model_dump()
+        payload = card.to_payload()
         triggered = await handler.handle_monitoring_alert(payload)
 
         if triggered:
@@ -6,10 +6,12 @@ import logging
 
 from pydantic import ValidationError
 
+from app.application.ports.anomaly_state import AnomalyStateBackend
 from app.application.ports.notifier import Notifier
+from app.adapters.memory_anomaly_state import InMemoryAnomalyState
 from app.adapters.messagecard import VTWebhookMessage
-from app.domain.events import VTErrorEvent
-from app.domain.anomaly import record_event
+from app.domain.events import MonitoringEvent
+from app.domain.anomaly import AnomalyDetector
 
 logger = logging.getLogger(__name__)
 
@@ -24,12 +26,21 @@ class MonitoringHandler:
     - 장애 알림 전송
     """
     
-    def __init__(self, notifier: Notifier):
+    def __init__(
+        self,
+        notifier: Notifier,
+        detector: AnomalyDetector | None = None,
+        state: AnomalyStateBackend | None = None,
+    ):
         """
         Args:
             notifier: 알림 전송 구현체
+            detector: 장애 탐지기 (None이면 전용 탐지기 생성)
+            state: 탐지 상태 저장소 (None이면 detector 를 쓰는 프로세스 내 저장소)
         """
         self.notifier = notifier
+        self.detector = detector if detector is not None else AnomalyDetector()
+        self.state = state if state is not None else InMemoryAnomalyState(self.detector)
     
     async def handle_monitoring_alert(self, payload: Dict[str, Any]) -> bool:
         try:
@@ -39,16 +50,13 @@ class MonitoringHandler:
             return False
         
         # ✅ MonitoringEvent로 변환
-        from app.domain.events import MonitoringEvent
-        from app.domain.anomaly import record_event
-        
         event = MonitoringEvent.from_message(msg)
         
         # ✅ 이벤트 자체가 변환 담당
         incident_type = event.to_incident_type()
         
         if incident_type is not None:
-            if record_event(incident_type, event.event_datetime()):
+            if await self.state.record_event(incident_type, event.event_datetime()):
                 await self.notifier.send_to_incident_channel(payload)
                 return True
         
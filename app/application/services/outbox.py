@@ -0,0 +1,352 @@
+# app/application/services/outbox.py
+"""
+알림 outbox 서비스
+
+요청 경로에서는 알림을 outbox 에 넣기만 하고 (I/O 없음), 전송은 백그라운드 worker 가 한다.
+
+- 채널마다 lane 을 따로 둔다 (Lane: worker 수, 지연 SLO, 과부하 시 버리는 기준).
+  lane 마다 dispatcher 하나 + worker 들이 있어서, 장애 알림은 포워딩 메시지가 수백 건
+  밀려 있어도 그 뒤에서 기다리지 않는다.
+- dispatcher 가 전송 시각이 된 메시지를 claim 해서 lane 의 worker 들에게 넘긴다.
+  (넘겨받을 worker 가 없으면 기다림 → 한 번에 claim 하는 양은 worker 수로 제한)
+- worker 가 NotificationSender.deliver 로 한 번 전송하고 결과에 따라
+  - 성공: complete
+  - 재시도 가능(429, 5xx, 네트워크 오류): 지수 백오프(상한 + jitter) 후 재시도.
+    Retry-After 가 있으면 그 시간을 따른다.
+  - 재시도 불가(그 외 4xx) 또는 max_attempts 도달: dead letter
+- 과부하 시 버리기 (장애 lane 은 기본값으로 버리지 않음)
+  - max_pending: lane 에 대기 중인 메시지가 이만큼이면 새 메시지는 접수하지 않음
+  - max_age_seconds: 전송 차례가 왔을 때 이보다 오래된 메시지는 보내지 않음
+- lane 별 지연(접수 → 전송 완료)을 기록하고 SLO 를 넘긴 건수를 센다.
+- QueuedNotifier: Notifier 포트 구현. send_to_* 가 outbox 접수만 하고 바로 반환.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import asyncio
+import logging
+import random
+import time
+
+from app import metrics
+from app.application.ports.notifier import (
+    FORWARD_CHANNEL,
+    INCIDENT_CHANNEL,
+    DeliveryResult,
+    NotificationSender,
+)
+from app.application.ports.outbox import OutboxMessage, OutboxStore
+
+logger = logging.getLogger(__name__)
+
+# 새 메시지 / 재시도 시각을 놓치지 않도록 dispatcher 가 최소한 이 간격으로 확인
+_IDLE_CHECK_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class Lane:
+    """
+    채널 하나의 전송 lane 설정
+
+    Attributes:
+        channel: 전송 채널
+        workers: 동시 전송 worker 수
+        slo_seconds: 접수 → 전송 완료 목표 시간 (넘기면 outbox_slo_missed.<channel> 증가)
+        max_pending: 대기 메시지 상한, 넘으면 새 메시지를 버림 (0 이면 제한 없음)
+        max_age_seconds: 이보다 오래 기다린 메시지는 보내지 않고 버림 (0 이면 제한 없음)
+    """
+    channel: str
+    workers: int
+    slo_seconds: float
+    max_pending: int = 0
+    max_age_seconds: float = 0.0
+
+
+def default_lanes(
+    workers: int = 4,
+    incident_workers: int = 2,
+    incident_slo: float = 10.0,
+    forward_slo: float = 60.0,
+    forward_max_pending: int = 0,
+    forward_max_age: float = 0.0,
+) -> List[Lane]:
+    """장애 lane (버리지 않음) + 포워딩 lane"""
+    return [
+        Lane(INCIDENT_CHANNEL, incident_workers, incident_slo),
+        Lane(FORWARD_CHANNEL, workers, forward_slo, forward_max_pending, forward_max_age),
+    ]
+
+
+class _LaneState:
+    """lane 하나의 실행 상태"""
+
+    def __init__(self, lane: Lane):
+        self.lane = lane
+        self.wakeup = asyncio.Event()
+        self.handoff: asyncio.Queue[OutboxMessage] = asyncio.Queue(maxsize=lane.workers)
+        self.inflight = 0
+        # 완료되지 않은 메시지 수 (max_pending 판단용, 저장소를 조회하지 않도록 직접 센다)
+        self.depth = 0
+
+
+class NotificationOutbox:
+    """
+    outbox 백그라운드 전송
+
+    책임:
+    - 접수 (enqueue), 과부하 시 버리기
+    - lane 별 worker 로 전송, 재시도 일정, dead letter
+    - 종료 시 남은 메시지 drain
+    """
+
+    def __init__(
+        self,
+        store: OutboxStore,
+        sender: NotificationSender,
+        workers: int = 4,
+        max_attempts: int = 8,
+        base_delay: float = 1.0,
+        max_delay: float = 300.0,
+        clock: Callable[[], float] = time.time,
+        jitter: Callable[[], float] = random.random,
+        lanes: Optional[Sequence[Lane]] = None,
+    ):
+        """
+        Args:
+            store: outbox 저장소
+            sender: 실제 전송 구현체
+            workers: 포워딩 lane worker 수 (lanes 를 지정하지 않은 경우)
+            max_attempts: dead letter 로 보내기 전 최대 시도 횟수
+            base_delay: 첫 재시도 대기 (초), 이후 2배씩
+            max_delay: 재시도 대기 상한 (초, Retry-After 는 제외)
+            clock: 현재 시각 (epoch 초)
+            jitter: [0, 1) 난수
+            lanes: 채널별 lane 설정 (None 이면 default_lanes(workers))
+        """
+        lanes = list(lanes) if lanes is not None else default_lanes(workers)
+        if any(lane.workers <= 0 for lane in lanes):
+            raise ValueError("workers must be positive")
+        if max_attempts <= 0:
+            raise ValueError("max_attempts must be positive")
+        self.store = store
+        self.sender = sender
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._clock = clock
+        self._jitter = jitter
+        self._lanes: Dict[str, _LaneState] = {lane.channel: _LaneState(lane) for lane in lanes}
+        self._tasks: List[asyncio.Task] = []
+        self.running = False
+
+    @property
+    def lanes(self) -> List[Lane]:
+        return [state.lane for state in self._lanes.values()]
+
+    def depth(self, channel: str) -> int:
+        """lane 에 완료되지 않은 메시지 수 (I/O 없음)"""
+        state = self._lanes.get(channel)
+        return state.depth if state else 0
+
+    def enqueue(self, channel: str, card: Dict[str, Any]) -> Optional[int]:
+        """
+        알림 접수 (I/O 없음)
+
+        Returns:
+            메시지 id (lane 이 가득 차 버린 경우 None)
+
+        Raises:
+            ValueError: lane 이 없는 채널
+        """
+        state = self._lanes.get(channel)
+        if state is None:
+            raise ValueError(f"no outbox lane for channel: {channel!r}")
+        max_pending = state.lane.max_pending
+        if max_pending and state.depth >= max_pending:
+            metrics.increment(f"outbox_shed.{channel}")
+            return None
+
+        message_id = self.store.put(channel, card, self._clock())
+        state.depth += 1
+        state.wakeup.set()
+        metrics.increment("outbox_enqueued")
+        return message_id
+
+    def backoff(self, attempts: int, retry_after: Optional[float] = None) -> float:
+        """
+        attempts 번 실패한 뒤 다음 시도까지 대기 시간 (초)
+
+        Retry-After 가 있으면 그대로, 없으면 min(max_delay, base * 2^(attempts-1)) 의 50~100% (jitter)
+        """
+        if retry_after is not None:
+            return max(retry_after, 0.0)
+        delay = min(self.max_delay, self.base_delay * (2 ** (attempts - 1)))
+        return delay * (0.5 + self._jitter() / 2)
+
+    async def start(self) -> None:
+        """저장소 열기 + lane 별 dispatcher / worker 시작"""
+        if self.running:
+            return
+        await self.store.open()
+        for channel, state in self._lanes.items():
+            # 영속 저장소에서 복구한 메시지도 depth 에 포함
+            state.depth = await self.store.pending(channel)
+        self.running = True
+        for state in self._lanes.values():
+            self._tasks.append(asyncio.create_task(self._dispatch(state)))
+            self._tasks += [asyncio.create_task(self._work(state)) for _ in range(state.lane.workers)]
+        layout = ", ".join(f"{s.lane.channel}={s.lane.workers}" for s in self._lanes.values())
+        logger.info(f"📮 Notification outbox started (workers: {layout})")
+
+    async def close(self, drain_timeout: float = 5.0) -> None:
+        """
+        남은 메시지를 drain_timeout 초까지 보내고 종료한다.
+        (보내지 못한 메시지는 저장소에 남는다 → 영속 저장소면 다음 시작 때 재전송)
+        """
+        if not self.running:
+            return
+        deadline = self._clock() + drain_timeout
+        while self._clock() < deadline and await self._has_due_messages():
+            await asyncio.sleep(0.05)
+
+        self.running = False
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await self.store.close()
+
+        remaining = await self.store.pending()
+        if remaining:
+            logger.warning(f"⚠️ Notification outbox closed with {remaining} pending messages")
+        else:
+            logger.info("👋 Notification outbox drained")
+
+    async def _has_due_messages(self) -> bool:
+        """지금 보낼 수 있는(또는 전송 중인) 메시지가 있는지 (재시도 대기 중인 것만 남으면 False)"""
+        if any(state.inflight for state in self._lanes.values()):
+            return True
+        next_due = await self.store.next_due()
+        return next_due is not None and next_due <= self._clock()
+
+    async def _dispatch(self, state: _LaneState) -> None:
+        channel = state.lane.channel
+        while self.running:
+            try:
+                state.wakeup.clear()
+                messages = await self.store.claim(state.lane.workers, self._clock(), channel)
+                # claim 시점부터 전송 중으로 센다 (handoff 대기 중인 것도 drain 대상)
+                state.inflight += len(messages)
+                for message in messages:
+                    await state.handoff.put(message)
+                if messages:
+                    continue
+
+                next_due = await self.store.next_due(channel)
+                timeout = _IDLE_CHECK_SECONDS
+                if next_due is not None:
+                    timeout = min(timeout, max(next_due - self._clock(), 0.0))
+                try:
+                    await asyncio.wait_for(state.wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Outbox dispatch error ({channel}): {e}", exc_info=True)
+                await asyncio.sleep(_IDLE_CHECK_SECONDS)
+
+    async def _work(self, state: _LaneState) -> None:
+        while True:
+            message = await state.handoff.get()
+            try:
+                await self._deliver(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Outbox worker error (id={message.id}): {e}", exc_info=True)
+            finally:
+                state.inflight -= 1
+                state.handoff.task_done()
+
+    async def _deliver(self, message: OutboxMessage) -> None:
+        state = self._lanes[message.channel]
+        lane = state.lane
+        age = self._clock() - message.enqueued_at
+        if lane.max_age_seconds and age > lane.max_age_seconds:
+            # 너무 늦은 포워딩 사본은 보내지 않는다 (장애 lane 은 기본값으로 버리지 않음)
+            await self.store.complete(message)
+            state.depth -= 1
+            metrics.increment(f"outbox_shed.{lane.channel}")
+            return
+
+        message.attempts += 1
+        try:
+            result = await self.sender.deliver(message.channel, message.card)
+        except Exception as e:
+            result = DeliveryResult(ok=False, retryable=True, error=repr(e))
+
+        now = self._clock()
+        if result.ok:
+            await self.store.complete(message)
+            state.depth -= 1
+            latency = now - message.enqueued_at
+            metrics.increment("outbox_delivered")
+            metrics.observe("outbox_delivery_latency_seconds", latency)
+            metrics.observe(f"outbox_delivery_latency_seconds.{lane.channel}", latency)
+            if latency > lane.slo_seconds:
+                metrics.increment(f"outbox_slo_missed.{lane.channel}")
+            return
+
+        message.last_error = result.error or f"status={result.status}"
+        if result.retryable and message.attempts < self.max_attempts:
+            delay = self.backoff(message.attempts, result.retry_after)
+            message.next_attempt_at = now + delay
+            await self.store.reschedule(message)
+            state.wakeup.set()
+            metrics.increment("outbox_retried")
+            logger.warning(
+                f"🔁 Outbox retry {message.attempts}/{self.max_attempts} "
+                f"(id={message.id}, {message.channel}) in {delay:.1f}s: {message.last_error}"
+            )
+            return
+
+        await self.store.dead_letter(message)
+        state.depth -= 1
+        metrics.increment("outbox_dead_lettered")
+        logger.error(
+            f"💀 Outbox dead letter (id={message.id}, {message.channel}, "
+            f"attempts={message.attempts}): {message.last_error}"
+        )
+
+    def lane_stats(self) -> Dict[str, Dict[str, Any]]:
+        """lane 별 대기 / 전송 중 수와 지연 통계 (/stats/outbox 용)"""
+        observations = metrics.snapshot()["observations"]
+        stats = {}
+        for channel, state in self._lanes.items():
+            latency = observations.get(f"outbox_delivery_latency_seconds.{channel}", {})
+            stats[channel] = {
+                "workers": state.lane.workers,
+                "pending": state.depth,
+                "in_flight": state.inflight,
+                "slo_seconds": state.lane.slo_seconds,
+                "slo_missed": metrics.get_counter(f"outbox_slo_missed.{channel}"),
+                "shed": metrics.get_counter(f"outbox_shed.{channel}"),
+                "latency_avg": latency.get("avg"),
+                "latency_max": latency.get("max"),
+            }
+        return stats
+
+
+class QueuedNotifier:
+    """Notifier 포트를 outbox 접수로 구현 (호출자는 Teams 응답을 기다리지 않음)"""
+
+    def __init__(self, outbox: NotificationOutbox):
+        self.outbox = outbox
+
+    async def send_to_forward_channel(self, card: Dict[str, Any]) -> bool:
+        return self.outbox.enqueue(FORWARD_CHANNEL, card) is not None
+
+    async def send_to_incident_channel(self, card: Dict[str, Any]) -> bool:
+        return self.outbox.enqueue(INCIDENT_CHANNEL, card) is not None
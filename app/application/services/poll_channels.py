@@ -0,0 +1,37 @@
+# app/application/services/poll_channels.py
+"""
+Graph polling 대상 채널 설정
+
+채널 하나 = (채널 ID, feed 유형). feed 유형에 따라 MessageProcessor 의 처리 경로가 정해진다.
+"""
+from typing import List, Tuple
+
+from app.config import TEAMS_FEED1_CHANNEL_ID, TEAMS_FEED2_CHANNEL_ID
+
+FEED_TYPES = ("feed1", "feed2")
+
+
+def default_poll_channels() -> List[Tuple[str, str]]:
+    """설정된 Feed1 / Feed2 채널"""
+    return [(TEAMS_FEED1_CHANNEL_ID, "feed1"), (TEAMS_FEED2_CHANNEL_ID, "feed2")]
+
+
+def parse_poll_channels(spec: str) -> List[Tuple[str, str]]:
+    """
+    POLL_CHANNELS 설정 파싱 (비어 있으면 Feed1/Feed2 채널)
+
+    ex) "feed1:19:abc@thread.tacv2,feed2:19:def@thread.tacv2"
+        -> [("19:abc@thread.tacv2", "feed1"), ("19:def@thread.tacv2", "feed2")]
+
+    Raises:
+        ValueError: feed 유형이 feed1/feed2 가 아니거나 채널 ID 가 비어 있는 경우
+    """
+    channels = []
+    for item in (part.strip() for part in spec.split(",")):
+        if not item:
+            continue
+        feed_type, _, channel_id = item.partition(":")
+        if feed_type not in FEED_TYPES or not channel_id:
+            raise ValueError(f"invalid poll channel: {item!r} (expected feed1:<id> or feed2:<id>)")
+        channels.append((channel_id, feed_type))
+    return channels or default_poll_channels()
@@ -0,0 +1,113 @@
+# app/application/services/sharding.py
+"""
+poller 채널 샤딩 서비스
+
+여러 poller replica 가 설정된 채널 집합을 나눠 polling 한다 (replica 수만큼 polling 용량 증가).
+
+- refresh(): heartbeat 후 살아 있는 멤버로 HashRing 을 만들어 이 replica 가 맡을 채널을 계산
+  - replica 가 추가/종료/만료되면 다음 refresh 에서 자동으로 재분배
+  - consistent hashing 이므로 멤버 하나가 바뀔 때 약 1/N 채널만 주인이 바뀐다
+- 워터마크 인계: polling 후 채널별 마지막 시각을 저장소에 기록하고,
+  채널을 새로 맡은 replica 는 그 시각부터 이어서 읽는다.
+"""
+from __future__ import annotations
+
+from typing import FrozenSet, Iterable, List, Optional
+import logging
+
+from app import metrics
+from app.application.ports.membership import MembershipStore
+from app.application.services.leader import default_holder_id
+from app.domain.hash_ring import DEFAULT_VNODES, HashRing
+
+logger = logging.getLogger(__name__)
+
+
+class ShardCoordinator:
+    """
+    consistent hashing 기반 채널 분배
+
+    책임:
+    - 멤버 heartbeat / 종료 시 탈퇴
+    - 이 replica 가 맡을 채널 계산, 변경 감지
+    - 채널 워터마크 저장/조회
+    """
+
+    def __init__(
+        self,
+        store: MembershipStore,
+        channel_ids: Iterable[str],
+        member: Optional[str] = None,
+        ttl: float = 30.0,
+        vnodes: int = DEFAULT_VNODES,
+    ):
+        """
+        Args:
+            store: 멤버십 / 워터마크 저장소
+            channel_ids: 전체 채널 ID (모든 replica 가 같은 설정을 사용해야 함)
+            member: 이 replica 의 식별자 (None이면 자동 생성)
+            ttl: heartbeat 유효 시간 (초, polling 주기보다 충분히 길게)
+            vnodes: 멤버당 가상 노드 수
+        """
+        self.store = store
+        self.channel_ids: List[str] = list(dict.fromkeys(channel_ids))
+        self.member = member or default_holder_id()
+        self.ttl = ttl
+        self.vnodes = vnodes
+        self.members: tuple = ()
+        self.owned: FrozenSet[str] = frozenset()
+        self._ring: Optional[HashRing] = None
+
+    async def refresh(self) -> FrozenSet[str]:
+        """
+        heartbeat 후 맡을 채널을 다시 계산한다.
+
+        저장소 오류 시에는 마지막 분배를 유지한다
+        (만료되어 다른 replica 가 맡으면 잠시 중복 polling 될 수 있으나 DuplicateTracker/워터마크로 흡수).
+
+        Returns:
+            이 replica 가 맡은 채널 ID
+        """
+        try:
+            members = await self.store.heartbeat(self.member, self.ttl)
+        except Exception as e:
+            logger.warning(f"⚠️ Membership heartbeat failed: {e}")
+            return self.owned
+
+        members = tuple(sorted(set(members) | {self.member}))
+        if self._ring is None or members != self.members:
+            self._ring = HashRing(members, self.vnodes)
+            self.members = members
+
+        owned = frozenset(c for c in self.channel_ids if self._ring.owner(c) == self.member)
+        if owned != self.owned:
+            gained, lost = owned - self.owned, self.owned - owned
+            logger.info(
+                f"🔀 Shard rebalanced: {len(owned)}/{len(self.channel_ids)} channels, "
+                f"{len(members)} members (+{len(gained)} -{len(lost)})"
+            )
+            metrics.increment("shard_rebalances")
+            self.owned = owned
+        return owned
+
+    async def leave(self) -> None:
+        """멤버십 탈퇴 (종료 시)"""
+        self.owned = frozenset()
+        try:
+            await self.store.leave(self.member)
+            logger.info(f"👋 Left poller membership: {self.member}")
+        except Exception as e:
+            logger.warning(f"⚠️ Membership leave failed: {e}")
+
+    async def load_watermark(self, channel_id: str) -> Optional[str]:
+        try:
+            return await self.store.load_watermark(channel_id)
+        except Exception as e:
+            logger.warning(f"⚠️ Watermark load failed ({channel_id}): {e}")
+            return None
+
+    async def save_watermark(self, channel_id: str, since: str) -> None:
+        try:
+            await self.store.save_watermark(channel_id, since)
+        except Exception as e:
+            logger.warning(f"⚠️ Watermark save failed ({channel_id}): {e}")
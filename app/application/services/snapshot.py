@@ -0,0 +1,118 @@
+# app/application/services/snapshot.py
+"""
+AnomalyDetector 스냅샷 서비스
+
+- 시작 시(폴링 전) 마지막 스냅샷으로 탐지 상태 복원 → 재시작 직후 쿨다운 유지
+- 주기적으로, 그리고 종료 시 스냅샷 저장
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from app.application.ports.snapshot_store import SnapshotStore
+from app.domain.anomaly import AnomalyDetector, SnapshotVersionError
+
+logger = logging.getLogger(__name__)
+
+
+class AnomalySnapshotService:
+    """
+    탐지기 상태 스냅샷 저장/복원
+
+    책임:
+    - 시작 시 복원
+    - 주기 저장 (마지막 저장 이후 기록된 이벤트가 없으면 건너뜀)
+    - 종료 시 저장
+    """
+
+    def __init__(
+        self,
+        detector: AnomalyDetector,
+        store: SnapshotStore,
+        interval: float = 30.0,
+    ):
+        """
+        Args:
+            detector: 대상 탐지기
+            store: 스냅샷 저장소
+            interval: 주기 저장 간격 (초)
+        """
+        self.detector = detector
+        self.store = store
+        self.interval = interval
+        self.running = False
+        self._saved_updates: int | None = None
+
+    async def restore(self) -> bool:
+        """
+        저장된 스냅샷으로 탐지기 상태를 복원한다.
+
+        Returns:
+            복원 여부 (스냅샷이 없거나 버전이 다르면 False)
+        """
+        try:
+            snapshot = await self.store.load()
+        except Exception as e:
+            logger.error(f"❌ Failed to load anomaly snapshot: {e}", exc_info=True)
+            return False
+
+        if snapshot is None:
+            logger.info("📭 No anomaly snapshot to restore")
+            return False
+
+        try:
+            restored = self.detector.restore(snapshot)
+        except SnapshotVersionError as e:
+            logger.warning(f"⚠️ Anomaly snapshot ignored: {e}")
+            return False
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning(f"⚠️ Invalid anomaly snapshot ignored: {e}")
+            self.detector.reset()
+            return False
+
+        self._saved_updates = self.detector.updates
+        logger.info(f"♻️ Anomaly state restored: {restored} keys")
+        return True
+
+    async def save(self, force: bool = False) -> bool:
+        """
+        현재 상태를 저장한다.
+
+        상태 수집은 이벤트 루프에서(일관된 시점), 직렬화/쓰기는 저장소가 스레드에서 수행한다.
+
+        Returns:
+            저장 여부 (변경이 없어 건너뛰었거나 실패하면 False)
+        """
+        updates = self.detector.updates
+        if not force and updates == self._saved_updates:
+            return False
+
+        snapshot = self.detector.snapshot()
+        # 쓰기는 스레드에서 돌아 취소되지 않는다 → 취소되면 쓰기가 끝난 뒤에 전파
+        # (종료 시 마지막 저장보다 주기 저장이 늦게 끝나 덮어쓰지 않도록)
+        pending = asyncio.ensure_future(self.store.save(snapshot))
+        try:
+            await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            await asyncio.gather(pending, return_exceptions=True)
+            raise
+        except Exception as e:
+            logger.error(f"❌ Failed to save anomaly snapshot: {e}", exc_info=True)
+            return False
+
+        self._saved_updates = updates
+        logger.debug(f"💾 Anomaly snapshot saved: {len(snapshot['keys'])} keys")
+        return True
+
+    async def run(self) -> None:
+        """주기 저장 루프 (stop() 까지)"""
+        self.running = True
+        while self.running:
+            await asyncio.sleep(self.interval)
+            if self.running:
+                await self.save()
+
+    def stop(self) -> None:
+        """주기 저장 중지 (종료 시 save(force=True) 는 호출 측에서)"""
+        self.running = False
@@ -17,6 +17,94 @@ TEAMS_FEED2_CHANNEL_ID = os.getenv("TEAMS_FEED2_CHANNEL_ID", "")
 # Forward Webhooks
 TEAMS_FORWARD_WEBHOOK_URL = os.getenv("TEAMS_FORWARD_WEBHOOK_URL", "")
 TEAMS_INCIDENT_WEBHOOK_URL = os.getenv("TEAMS_INCIDENT_WEBHOOK_URL", "")
+# Webhook HTTP 연결 풀 (notifier 하나가 클라이언트 하나를 재사용)
+TEAMS_HTTP_MAX_CONNECTIONS = int(os.getenv("TEAMS_HTTP_MAX_CONNECTIONS", "20"))
+TEAMS_HTTP_MAX_KEEPALIVE = int(os.getenv("TEAMS_HTTP_MAX_KEEPALIVE", "10"))
+TEAMS_HTTP_KEEPALIVE_EXPIRY_SECONDS = float(os.getenv("TEAMS_HTTP_KEEPALIVE_EXPIRY_SECONDS", "60"))
+# HTTP/2 (httpx[http2] 설치 필요, 없으면 HTTP/1.1)
+TEAMS_HTTP2 = os.getenv("TEAMS_HTTP2", "false").lower() == "true"
+# webhook URL 별 전송 속도 (초당, 0 이면 제한 없음). 429 를 받으면 줄이고 성공하면 max 까지 늘림
+TEAMS_RATE_LIMIT_PER_SECOND = float(os.getenv("TEAMS_RATE_LIMIT_PER_SECOND", "4"))
+TEAMS_RATE_LIMIT_BURST = float(os.getenv("TEAMS_RATE_LIMIT_BURST", "4"))
+TEAMS_RATE_LIMIT_MIN_PER_SECOND = float(os.getenv("TEAMS_RATE_LIMIT_MIN_PER_SECOND", "0.2"))
+TEAMS_RATE_LIMIT_MAX_PER_SECOND = float(os.getenv("TEAMS_RATE_LIMIT_MAX_PER_SECOND", "10"))
+# webhook URL 별 동시 전송 수
+TEAMS_MAX_CONCURRENCY = int(os.getenv("TEAMS_MAX_CONCURRENCY", "4"))
+# 전송 card 크기 상한 (Teams 한도 약 28KB, 0 이면 줄이지 않음) / fact value 하나의 상한
+TEAMS_CARD_MAX_BYTES = int(os.getenv("TEAMS_CARD_MAX_BYTES", "28000"))
+TEAMS_CARD_FACT_MAX_BYTES = int(os.getenv("TEAMS_CARD_FACT_MAX_BYTES", "4096"))
+
+# Notification outbox (요청 경로는 접수만, 전송/재시도는 백그라운드 worker)
+# 기본값은 사용 안 함 (요청 경로에서 바로 전송, 기존 동작)
+OUTBOX_ENABLED = os.getenv("OUTBOX_ENABLED", "false").lower() == "true"
+# 채널별 lane: 장애 알림은 전용 worker 로 보내 포워딩 적체 뒤에서 기다리지 않음
+OUTBOX_WORKERS = int(os.getenv("OUTBOX_WORKERS", "4"))
+OUTBOX_INCIDENT_WORKERS = int(os.getenv("OUTBOX_INCIDENT_WORKERS", "2"))
+# lane 별 지연 목표 (접수 → 전송 완료, 넘기면 outbox_slo_missed.<channel>)
+OUTBOX_INCIDENT_SLO_SECONDS = float(os.getenv("OUTBOX_INCIDENT_SLO_SECONDS", "10"))
+OUTBOX_FORWARD_SLO_SECONDS = float(os.getenv("OUTBOX_FORWARD_SLO_SECONDS", "60"))
+# 포워딩 과부하 시: 대기 상한 (넘으면 버림), 이보다 오래 기다린 사본은 보내지 않음 (0 = 제한 없음)
+OUTBOX_FORWARD_MAX_PENDING = int(os.getenv("OUTBOX_FORWARD_MAX_PENDING", "5000"))
+OUTBOX_FORWARD_MAX_AGE_SECONDS = float(os.getenv("OUTBOX_FORWARD_MAX_AGE_SECONDS", "0"))
+# 포워딩 대기가 이만큼 쌓이면 digest 로 전환 (FORWARD_DIGEST_ENABLED=false 일 때, 0 = 사용 안 함, 기본값)
+OUTBOX_FORWARD_DIGEST_BACKLOG = int(os.getenv("OUTBOX_FORWARD_DIGEST_BACKLOG", "0"))
+# 이 횟수만큼 실패하면 dead letter
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "8"))
+# 재시도 대기: base * 2^(시도-1), 상한 max (Retry-After 가 있으면 그 값)
+OUTBOX_BASE_DELAY_SECONDS = float(os.getenv("OUTBOX_BASE_DELAY_SECONDS", "1"))
+OUTBOX_MAX_DELAY_SECONDS = float(os.getenv("OUTBOX_MAX_DELAY_SECONDS", "300"))
+OUTBOX_DEAD_LETTER_SIZE = int(os.getenv("OUTBOX_DEAD_LETTER_SIZE", "1000"))
+# outbox 저장소 (memory / sqlite). sqlite 는 재시작 후 미전송 알림 재전송
+OUTBOX_BACKEND = os.getenv("OUTBOX_BACKEND", "memory")
+# 프로세스(worker)마다 다른 파일을 사용 (한 프로세스가 독점)
+OUTBOX_PATH = os.getenv("OUTBOX_PATH", "data/outbox.db")
+# group commit 주기: 이 간격마다 쌓인 변경을 트랜잭션 하나로 기록
+OUTBOX_FLUSH_INTERVAL_SECONDS = float(os.getenv("OUTBOX_FLUSH_INTERVAL_SECONDS", "0.05"))
+# 종료 시 남은 메시지를 보내기 위해 기다리는 시간
+OUTBOX_DRAIN_SECONDS = float(os.getenv("OUTBOX_DRAIN_SECONDS", "5"))
+
+# Forwarding rules (JSON 파일, 비어 있으면 app/domain/rules.py 기본값 사용)
+FORWARD_RULES_PATH = os.getenv("FORWARD_RULES_PATH", "")
+FORWARD_RULES_RELOAD_SECONDS = float(os.getenv("FORWARD_RULES_RELOAD_SECONDS", "5"))
+# 포워딩 digest: 그룹(failure_reason / fingerprint)의 첫 에러만 바로 보내고
+# window 동안 들어온 나머지는 카드 하나로 묶어 전송 (flush_count 건이 모이면 바로 전송)
+FORWARD_DIGEST_ENABLED = os.getenv("FORWARD_DIGEST_ENABLED", "false").lower() == "true"
+FORWARD_DIGEST_WINDOW_SECONDS = float(os.getenv("FORWARD_DIGEST_WINDOW_SECONDS", "30"))
+FORWARD_DIGEST_GROUP_BY = os.getenv("FORWARD_DIGEST_GROUP_BY", "failure_reason")
+FORWARD_DIGEST_FLUSH_COUNT = int(os.getenv("FORWARD_DIGEST_FLUSH_COUNT", "50"))
+FORWARD_DIGEST_SAMPLES = int(os.getenv("FORWARD_DIGEST_SAMPLES", "3"))
+
+# Graph polling 채널 (feed1:<id>,feed2:<id>,... 비어 있으면 TEAMS_FEED1/2_CHANNEL_ID)
+POLL_CHANNELS = os.getenv("POLL_CHANNELS", "")
+# polling 방식
+# - standalone: 프로세스마다 모든 채널 polling (단일 프로세스 배포, 기본값)
+# - leader: 리더 하나가 모든 채널 polling (worker / replica 가 여러 개일 때 지정)
+# - sharded: 살아 있는 poller 가 채널을 consistent hashing 으로 나눠 polling
+POLLER_MODE = os.getenv("POLLER_MODE", "standalone")
+# 리스 파일 (같은 호스트의 worker 가 공유)
+LEADER_LEASE_PATH = os.getenv("LEADER_LEASE_PATH", "data/leader.db")
+LEADER_LEASE_TTL_SECONDS = float(os.getenv("LEADER_LEASE_TTL_SECONDS", "15"))
+# 샤딩 멤버십 / 워터마크 파일, heartbeat 유효 시간 (polling 주기보다 충분히 길게)
+POLLER_MEMBERSHIP_PATH = os.getenv("POLLER_MEMBERSHIP_PATH", "data/membership.db")
+POLLER_MEMBER_TTL_SECONDS = float(os.getenv("POLLER_MEMBER_TTL_SECONDS", "30"))
+
+# Anomaly detection
+# 장애 집계 단위 (VTErrorEvent 필드, 쉼표로 여러 개. 비어 있으면 장애 유형 단위)
+ANOMALY_DIMENSION = os.getenv("ANOMALY_DIMENSION", "")
+ANOMALY_MAX_KEYS = int(os.getenv("ANOMALY_MAX_KEYS", "10000"))
+# 탐지 상태 저장소: memory (프로세스 내) / redis (replica 간 공유)
+ANOMALY_STATE_BACKEND = os.getenv("ANOMALY_STATE_BACKEND", "memory")
+ANOMALY_REDIS_URL = os.getenv("ANOMALY_REDIS_URL", "redis://localhost:6379/0")
+ANOMALY_REDIS_PREFIX = os.getenv("ANOMALY_REDIS_PREFIX", "vt:anomaly")
+# 탐지 상태 스냅샷 파일 (memory 저장소에서만 사용, 비어 있으면 저장/복원 안 함)
+ANOMALY_SNAPSHOT_PATH = os.getenv("ANOMALY_SNAPSHOT_PATH", "")
+ANOMALY_SNAPSHOT_INTERVAL_SECONDS = float(os.getenv("ANOMALY_SNAPSHOT_INTERVAL_SECONDS", "30"))
+
+# Heavy hitters (failure_reason / project / fingerprint 별 top-K)
+HEAVY_HITTER_WINDOW_SECONDS = float(os.getenv("HEAVY_HITTER_WINDOW_SECONDS", "300"))
+HEAVY_HITTER_TOP_K = int(os.getenv("HEAVY_HITTER_TOP_K", "10"))
+# 장애 카드에 top offender 섹션 추가 여부
+HEAVY_HITTER_ON_INCIDENT_CARD = os.getenv("HEAVY_HITTER_ON_INCIDENT_CARD", "true").lower() == "true"
 
 # Environment
 ENV = os.getenv("ENV", "development")
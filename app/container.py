@@ -2,12 +2,73 @@
 """
 의존성 조립 (Dependency Assembly)
 """
+from datetime import timedelta
 import logging
 
-from app.adapters.teams_notifier import TeamsNotifier
+from app.adapters.memory_anomaly_state import InMemoryAnomalyState
+from app.adapters.memory_outbox import InMemoryOutboxStore
+from app.adapters.sqlite_outbox import SqliteOutboxStore
+from app.adapters.redis_anomaly_state import RedisAnomalyState
+from app.adapters.resp_client import RespClient
+from app.adapters.snapshot_store import FileSnapshotStore
+from app.adapters.sqlite_lease import SqliteLeaseStore
+from app.adapters.sqlite_membership import SqliteMembershipStore
+from app.adapters.teams_notifier import TeamsNotifier, get_default_notifier
+from app.adapters.worker_slot import WorkerSlot, claim_worker_slot
+from app.config import (
+    ANOMALY_DIMENSION,
+    ANOMALY_MAX_KEYS,
+    ANOMALY_REDIS_PREFIX,
+    ANOMALY_REDIS_URL,
+    ANOMALY_SNAPSHOT_INTERVAL_SECONDS,
+    ANOMALY_SNAPSHOT_PATH,
+    ANOMALY_STATE_BACKEND,
+    HEAVY_HITTER_ON_INCIDENT_CARD,
+    HEAVY_HITTER_TOP_K,
+    HEAVY_HITTER_WINDOW_SECONDS,
+    LEADER_LEASE_PATH,
+    LEADER_LEASE_TTL_SECONDS,
+    FORWARD_DIGEST_ENABLED,
+    FORWARD_DIGEST_FLUSH_COUNT,
+    FORWARD_DIGEST_GROUP_BY,
+    FORWARD_DIGEST_SAMPLES,
+    FORWARD_DIGEST_WINDOW_SECONDS,
+    OUTBOX_BACKEND,
+    OUTBOX_BASE_DELAY_SECONDS,
+    OUTBOX_DEAD_LETTER_SIZE,
+    OUTBOX_DRAIN_SECONDS,
+    OUTBOX_ENABLED,
+    OUTBOX_FLUSH_INTERVAL_SECONDS,
+    OUTBOX_FORWARD_DIGEST_BACKLOG,
+    OUTBOX_FORWARD_MAX_AGE_SECONDS,
+    OUTBOX_FORWARD_MAX_PENDING,
+    OUTBOX_FORWARD_SLO_SECONDS,
+    OUTBOX_INCIDENT_SLO_SECONDS,
+    OUTBOX_INCIDENT_WORKERS,
+    OUTBOX_MAX_ATTEMPTS,
+    OUTBOX_MAX_DELAY_SECONDS,
+    OUTBOX_PATH,
+    OUTBOX_WORKERS,
+    POLL_CHANNELS,
+    POLLER_MEMBER_TTL_SECONDS,
+    POLLER_MEMBERSHIP_PATH,
+    POLLER_MODE,
+)
+from app.domain.anomaly import AnomalyDetector
+from app.domain.heavy_hitters import HeavyHitterTracker
+from app.application.ports.anomaly_state import AnomalyStateBackend
+from app.application.ports.notifier import FORWARD_CHANNEL, Notifier
+from app.application.ports.outbox import OutboxStore
+from app.application.services.digest import ForwardDigest
+from app.application.services.forwarding import get_default_engine
 from app.application.services.handler import AlertHandler
 from app.application.services.monitoring import MonitoringHandler
 from app.application.services.incident import IncidentService
+from app.application.services.leader import LeaderElector
+from app.application.services.outbox import NotificationOutbox, QueuedNotifier, default_lanes
+from app.application.services.poll_channels import parse_poll_channels
+from app.application.services.sharding import ShardCoordinator
+from app.application.services.snapshot import AnomalySnapshotService
 
 logger = logging.getLogger(__name__)
 
@@ -20,14 +81,170 @@ class ServiceContainer:
     """
     
     def __init__(self):
-        # Adapter 생성 (Singleton)
-        self._notifier = TeamsNotifier()
+        # worker 프로세스별 파일 slot (close 에서 반납)
+        self._worker_slots: list[WorkerSlot] = []
+
+        # Adapter 생성 (Singleton, 모듈 레벨 함수와 연결 풀 공유)
+        self._notifier = get_default_notifier()
+
+        # 서비스가 쓰는 Notifier: outbox 사용 시 접수만 하고 백그라운드 전송
+        self._outbox: NotificationOutbox | None = None
+        service_notifier: Notifier = self._notifier
+        if OUTBOX_ENABLED:
+            self._outbox = NotificationOutbox(
+                self._build_outbox_store(),
+                self._notifier,
+                max_attempts=OUTBOX_MAX_ATTEMPTS,
+                base_delay=OUTBOX_BASE_DELAY_SECONDS,
+                max_delay=OUTBOX_MAX_DELAY_SECONDS,
+                lanes=default_lanes(
+                    workers=OUTBOX_WORKERS,
+                    incident_workers=OUTBOX_INCIDENT_WORKERS,
+                    incident_slo=OUTBOX_INCIDENT_SLO_SECONDS,
+                    forward_slo=OUTBOX_FORWARD_SLO_SECONDS,
+                    forward_max_pending=OUTBOX_FORWARD_MAX_PENDING,
+                    forward_max_age=OUTBOX_FORWARD_MAX_AGE_SECONDS,
+                ),
+            )
+            service_notifier = QueuedNotifier(self._outbox)
         
+        # Domain 생성 (Feed1/Feed2 가 하나의 탐지기 상태를 공유)
+        self._anomaly_detector = AnomalyDetector(max_keys=ANOMALY_MAX_KEYS)
+        self._heavy_hitters = HeavyHitterTracker(
+            window=timedelta(seconds=HEAVY_HITTER_WINDOW_SECONDS),
+            top_k=HEAVY_HITTER_TOP_K,
+        )
+        self._anomaly_state = self._build_anomaly_state()
+
         # Services 생성
-        self._incident_service = IncidentService(self._notifier)
-        self._alert_handler = AlertHandler(self._notifier, self._incident_service)
-        self._monitoring_handler = MonitoringHandler(self._notifier)
+        self._incident_service = IncidentService(
+            service_notifier,
+            self._anomaly_detector,
+            ANOMALY_DIMENSION,
+            self._heavy_hitters if HEAVY_HITTER_ON_INCIDENT_CARD else None,
+            self._anomaly_state,
+        )
+        # 포워딩 digest: 항상 (FORWARD_DIGEST_ENABLED) 또는 outbox 포워딩 lane 적체 시에만
+        self._forward_digest: ForwardDigest | None = None
+        digest_active = None
+        if not FORWARD_DIGEST_ENABLED and self._outbox and OUTBOX_FORWARD_DIGEST_BACKLOG > 0:
+            outbox = self._outbox
+            digest_active = lambda: outbox.depth(FORWARD_CHANNEL) >= OUTBOX_FORWARD_DIGEST_BACKLOG
+        if FORWARD_DIGEST_ENABLED or digest_active is not None:
+            self._forward_digest = ForwardDigest(
+                service_notifier,
+                window=FORWARD_DIGEST_WINDOW_SECONDS,
+                group_by=FORWARD_DIGEST_GROUP_BY,
+                flush_count=FORWARD_DIGEST_FLUSH_COUNT,
+                max_samples=FORWARD_DIGEST_SAMPLES,
+                active=digest_active,
+            )
+        self._alert_handler = AlertHandler(
+            service_notifier,
+            self._incident_service,
+            get_default_engine(),
+            self._heavy_hitters,
+            self._forward_digest,
+        )
+        self._monitoring_handler = MonitoringHandler(
+            service_notifier,
+            self._anomaly_detector,
+            self._anomaly_state,
+        )
+
+        # 탐지 상태 스냅샷 (memory 저장소 + 경로가 설정된 경우만)
+        # 스냅샷은 worker 별 상태 → worker 마다 다른 파일 (worker slot)
+        self._snapshot_service: AnomalySnapshotService | None = None
+        if ANOMALY_SNAPSHOT_PATH and isinstance(self._anomaly_state, InMemoryAnomalyState):
+            slot = self._claim_worker_slot(ANOMALY_SNAPSHOT_PATH)
+            self._snapshot_service = AnomalySnapshotService(
+                self._anomaly_detector,
+                FileSnapshotStore(slot.path),
+                ANOMALY_SNAPSHOT_INTERVAL_SECONDS,
+            )
+
+        # Graph polling 분배 (HTTP 엔드포인트는 모드와 무관하게 모든 worker 가 처리)
+        self._poll_channels = parse_poll_channels(POLL_CHANNELS)
+        self._leader_elector: LeaderElector | None = None
+        self._shard_coordinator: ShardCoordinator | None = None
+        if POLLER_MODE == "leader":
+            self._leader_elector = LeaderElector(
+                SqliteLeaseStore(LEADER_LEASE_PATH),
+                ttl=LEADER_LEASE_TTL_SECONDS,
+            )
+        elif POLLER_MODE == "sharded":
+            self._shard_coordinator = ShardCoordinator(
+                SqliteMembershipStore(POLLER_MEMBERSHIP_PATH),
+                [channel_id for channel_id, _ in self._poll_channels],
+                ttl=POLLER_MEMBER_TTL_SECONDS,
+            )
+        elif POLLER_MODE != "standalone":
+            raise ValueError(f"unknown POLLER_MODE: {POLLER_MODE!r}")
     
+    def _build_anomaly_state(self) -> AnomalyStateBackend:
+        """ANOMALY_STATE_BACKEND 에 따른 탐지 상태 저장소"""
+        if ANOMALY_STATE_BACKEND == "redis":
+            logger.info(f"🔗 Anomaly state backend: redis ({ANOMALY_REDIS_PREFIX})")
+            return RedisAnomalyState(
+                RespClient.from_url(ANOMALY_REDIS_URL),
+                prefix=ANOMALY_REDIS_PREFIX,
+            )
+        if ANOMALY_STATE_BACKEND != "memory":
+            raise ValueError(f"unknown ANOMALY_STATE_BACKEND: {ANOMALY_STATE_BACKEND!r}")
+        return InMemoryAnomalyState(self._anomaly_detector)
+
+    def _claim_worker_slot(self, path: str) -> WorkerSlot:
+        """같은 경로 설정을 쓰는 다른 worker 와 겹치지 않는 파일 slot"""
+        slot = claim_worker_slot(path)
+        self._worker_slots.append(slot)
+        return slot
+
+    def _build_outbox_store(self) -> OutboxStore:
+        """OUTBOX_BACKEND 에 따른 outbox 저장소"""
+        if OUTBOX_BACKEND == "sqlite":
+            # 파일을 독점(locking_mode=EXCLUSIVE)하므로 worker 마다 다른 파일 (worker slot)
+            slot = self._claim_worker_slot(OUTBOX_PATH)
+            logger.info(f"📮 Outbox backend: sqlite ({slot.path})")
+            return SqliteOutboxStore(
+                slot.path,
+                dead_letter_size=OUTBOX_DEAD_LETTER_SIZE,
+                flush_interval=OUTBOX_FLUSH_INTERVAL_SECONDS,
+            )
+        if OUTBOX_BACKEND != "memory":
+            raise ValueError(f"unknown OUTBOX_BACKEND: {OUTBOX_BACKEND!r}")
+        return InMemoryOutboxStore(OUTBOX_DEAD_LETTER_SIZE)
+
+    async def close(self) -> None:
+        """외부 연결 정리 (shutdown 시 호출)"""
+        if self._forward_digest is not None:
+            # 모아 둔 포워딩 에러를 outbox 종료 전에 보낸다
+            await self._forward_digest.flush_all()
+        if self._outbox is not None:
+            # 남은 알림을 보낸 뒤 연결 풀을 닫는다
+            await self._outbox.close(OUTBOX_DRAIN_SECONDS)
+        await self._notifier.aclose()
+        close = getattr(self._anomaly_state, "close", None)
+        if close is not None:
+            await close()
+        for slot in self._worker_slots:
+            slot.release()
+        self._worker_slots.clear()
+
+    @property
+    def notifier(self) -> TeamsNotifier:
+        """TeamsNotifier 인스턴스"""
+        return self._notifier
+
+    @property
+    def forward_digest(self) -> ForwardDigest | None:
+        """ForwardDigest 인스턴스 (digest 를 쓰지 않으면 None)"""
+        return self._forward_digest
+
+    @property
+    def outbox(self) -> NotificationOutbox | None:
+        """NotificationOutbox 인스턴스 (OUTBOX_ENABLED=false 시 None)"""
+        return self._outbox
+
     @property
     def alert_handler(self) -> AlertHandler:
         """AlertHandler 인스턴스"""
@@ -43,6 +260,41 @@ class ServiceContainer:
         """IncidentService 인스턴스"""
         return self._incident_service
 
+    @property
+    def anomaly_detector(self) -> AnomalyDetector:
+        """AnomalyDetector 인스턴스"""
+        return self._anomaly_detector
+
+    @property
+    def anomaly_state(self) -> AnomalyStateBackend:
+        """탐지 상태 저장소 (memory / redis)"""
+        return self._anomaly_state
+
+    @property
+    def heavy_hitters(self) -> HeavyHitterTracker:
+        """HeavyHitterTracker 인스턴스"""
+        return self._heavy_hitters
+
+    @property
+    def snapshot_service(self) -> AnomalySnapshotService | None:
+        """AnomalySnapshotService 인스턴스 (ANOMALY_SNAPSHOT_PATH 미설정 시 None)"""
+        return self._snapshot_service
+
+    @property
+    def leader_elector(self) -> LeaderElector | None:
+        """LeaderElector 인스턴스 (POLLER_MODE=leader 일 때만)"""
+        return self._leader_elector
+
+    @property
+    def shard_coordinator(self) -> ShardCoordinator | None:
+        """ShardCoordinator 인스턴스 (POLLER_MODE=sharded 일 때만)"""
+        return self._shard_coordinator
+
+    @property
+    def poll_channels(self) -> list[tuple[str, str]]:
+        """polling 대상 (채널 ID, feed 유형) 목록"""
+        return self._poll_channels
+
 
 # 전역 컨테이너 인스턴스
 _container: ServiceContainer | None = None
@@ -1,179 +1,506 @@
 # app/domain/anomaly.py
+"""
+장애 탐지 (슬라이딩 윈도우 + 동일 분 기준 + 쿨다운)
+
+공개 API:
+- AnomalyDetector: 상태(윈도우, minute bucket, 쿨다운)와 설정을 소유하는 탐지기
+- record_event(incident_type, timestamp, dimension=None): 기본 탐지기에 기록 (하위 호환용 shim)
+- reset_state(): 기본 탐지기 상태 초기화 (테스트용)
+- SnapshotVersionError: 스냅샷 포맷 버전이 맞지 않을 때
+- evaluate_counts(config, window_count, minute_count) / label_of(...): 상태 저장소와 무관한 판정/표기
+
+새 코드에서는 AnomalyDetector 인스턴스를 주입받아 사용한다.
+(ServiceContainer → IncidentService / MonitoringHandler)
+
+Event-time 처리:
+- 키별로 지금까지 본 최대 이벤트 시각을 시계(clock)로 쓴다.
+- 윈도우 만료와 쿨다운 판단은 이 시계 기준이므로 늦게 온 이벤트가 시간을 되돌리지 않는다.
+- watermark = clock - allowed_lateness 보다 오래된 이벤트는 버리고
+  `anomaly_late_events_dropped` 메트릭을 증가시킨다.
+
+Dimension 별 탐지:
+- 상태 키는 (IncidentType, dimension) 이다. dimension 은 프로젝트, 에러 시그니처 등
+  호출 측이 정하는 문자열이며 None 이면 장애 유형 단위로만 집계한다 (기존 동작).
+- 키 상태는 접근 순서를 유지하는 OrderedDict 에 두고, 기록할 때마다 맨 뒤로 옮긴다.
+  가장 오래 쓰이지 않은 키부터 idle_ttl(event-time) 이 지나면 제거하고,
+  키 수가 max_keys 를 넘으면 가장 오래된 키를 제거한다 (`anomaly_keys_evicted`).
+- idle_ttl 기본값은 max(window, cooldown) + allowed_lateness 라서
+  idle 제거로는 윈도우/쿨다운 판정이 바뀌지 않는다.
+
+스냅샷:
+- snapshot() 은 전체 상태(윈도우, minute bucket, 시계, 쿨다운)를 JSON 으로 직렬화 가능한
+  정수/문자열 리스트로 내보내고, restore() 가 이를 되살린다 (재시작 직후 중복 장애 알림 방지).
+- 정확한 윈도우는 가장 최근 count 개 타임스탬프만 delta 인코딩으로 저장한다.
+  (count 건 이상 판정은 최근 count 개만으로 결정되므로 이후 판정은 같다)
+- 포맷이 바뀌면 SNAPSHOT_VERSION 을 올린다. 다른 버전은 SnapshotVersionError.
+"""
 from __future__ import annotations
 
-from collections import defaultdict, deque
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Deque, DefaultDict, Dict
+from typing import Any, Dict, Hashable, List, Mapping, Optional
 
 import logging
 
+from app import metrics
+from app.domain.counters import (
+    BucketedWindowCounter,
+    ExactWindowCounter,
+    MinuteRing,
+    epoch_micros,
+    epoch_minute,
+    from_epoch_micros,
+    make_window_counter,
+)
 from app.domain.incident_type import IncidentType
-from app.domain.incident_config import INCIDENT_THRESHOLDS
+from app.domain.incident_config import INCIDENT_THRESHOLDS, IncidentThreshold
 
 logger = logging.getLogger(__name__)
 
+# 늦게 도착한 이벤트를 받아주는 최대 지연
+DEFAULT_ALLOWED_LATENESS = timedelta(minutes=5)
 
-# 각 장애 유형별로 최근 이벤트의 타임스탬프를 저장하는 슬라이딩 윈도우
-_event_windows: DefaultDict[IncidentType, Deque[datetime]] = defaultdict(deque)
+# 동시에 추적하는 (장애 유형, dimension) 키 상한
+DEFAULT_MAX_KEYS = 10_000
 
-# "동일 분 N건 이상" 조건을 위해 minute bucket 을 저장
-_minute_counts: DefaultDict[IncidentType, Dict[str, int]] = defaultdict(dict)
+# snapshot()/restore() 포맷 버전
+SNAPSHOT_VERSION = 1
 
-# 마지막으로 장애 알림을 발생시킨 시각 (쿨다운용)
-_last_alert_ts: Dict[IncidentType, datetime] = {}
+_ONE_MINUTE = timedelta(minutes=1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
 
 
-def reset_state() -> None:
-    """테스트에서 anomaly 상태를 초기화할 때 사용한다."""
-    _event_windows.clear()
-    _minute_counts.clear()
-    _last_alert_ts.clear()
+class SnapshotVersionError(ValueError):
+    """스냅샷 포맷 버전이 현재 코드와 다를 때 발생한다."""
 
 
-def _minute_key(ts: datetime) -> str:
-    """분 단위 버킷 키."""
-    return ts.strftime("%Y-%m-%d %H:%M")
+def _delta_encode(values: List[int]) -> List[int]:
+    return [b - a for a, b in zip([0, *values], values)]
 
 
-def _cleanup_window(
-    incident_type: IncidentType,
-    now: datetime,
-    window: timedelta,
-) -> Deque[datetime]:
-    """슬라이딩 윈도우에서 window 범위 밖의 타임스탬프를 제거한다."""
-    q = _event_windows[incident_type]
-    cutoff = now - window
-    while q and q[0] <= cutoff:
-        q.popleft()
-    return q
-
-
-def _cleanup_minute_counts(
-    incident_type: IncidentType,
-    now: datetime,
-    keep_for: timedelta = timedelta(hours=2),
-) -> Dict[str, int]:
-    """너무 오래된 minute bucket 은 정리한다."""
-    counts = _minute_counts[incident_type]
-    cutoff = now - keep_for
-
-    for key in list(counts.keys()):
-        try:
-            bucket_dt = datetime.strptime(key, "%Y-%m-%d %H:%M")
-            # naive datetime으로 비교하기 위해 cutoff에서 tzinfo 제거
-            cutoff_naive = cutoff.replace(tzinfo=None) if cutoff.tzinfo else cutoff
-            if bucket_dt < cutoff_naive:
-                del counts[key]
-        except ValueError:
-            del counts[key]
-
-    return counts
-
-
-def _check_cooldown(
-    incident_type: IncidentType,
-    now: datetime,
-    cooldown: timedelta,
-) -> bool:
-    """쿨다운 시간 내에 또 발생했다면 False 를 리턴한다."""
-    last = _last_alert_ts.get(incident_type)
-    if last is not None and now - last < cooldown:
-        logger.info(
-            "Incident %s triggered but in cooldown window (last=%s, now=%s)",
-            incident_type.name,
-            last.isoformat(),
-            now.isoformat(),
-        )
-        return False
+def _delta_decode(deltas: List[int]) -> List[int]:
+    values = []
+    total = 0
+    for d in deltas:
+        total += d
+        values.append(total)
+    return values
 
-    _last_alert_ts[incident_type] = now
-    return True
 
+def _default_minute_retention(allowed_lateness: timedelta) -> int:
+    """허용 지연 안의 minute bucket 만 필요하므로 그만큼만 보관한다."""
+    return -(-allowed_lateness // _ONE_MINUTE) + 1
 
-def record_event(incident_type: IncidentType, timestamp: datetime) -> bool:
-    """
-    장애 이벤트 하나를 기록하고, 장애 기준을 만족하는지 판별한다.
-    """
-    if not isinstance(timestamp, datetime):
-        raise TypeError("timestamp must be a datetime instance")
 
-    config = INCIDENT_THRESHOLDS.get(incident_type)
-    if config is None:
-        logger.warning("Unknown incident type: %r", incident_type)
-        return False
+def _default_idle_ttl(
+    thresholds: Mapping[IncidentType, IncidentThreshold],
+    allowed_lateness: timedelta,
+) -> timedelta:
+    """윈도우/쿨다운이 모두 끝난 뒤에야 만료되도록 하는 idle TTL"""
+    longest = _ONE_MINUTE
+    for config in thresholds.values():
+        if config.window is not None:
+            longest = max(longest, config.window)
+        longest = max(longest, config.cooldown)
+    return longest + allowed_lateness
 
+
+class _KeyState:
+    """(장애 유형, dimension) 키 하나의 탐지 상태"""
+
+    __slots__ = ("window", "minutes", "clock_us", "clock_dt", "last_alert", "aware")
+
+    def __init__(self) -> None:
+        # 슬라이딩 윈도우 카운터 (IncidentThreshold.resolution 에 따라 정확/slot 기반)
+        self.window: Optional[ExactWindowCounter | BucketedWindowCounter] = None
+        # "동일 분 N건 이상" 조건용 epoch-minute ring buffer
+        self.minutes: Optional[MinuteRing] = None
+        # event-time 시계: 지금까지 본 최대 시각 (us, datetime)
+        self.clock_us = -1
+        self.clock_dt: Optional[datetime] = None
+        # 마지막으로 장애 알림을 발생시킨 시각 (쿨다운용)
+        self.last_alert: Optional[datetime] = None
+        # 이벤트 시각이 timezone-aware 인지 (스냅샷 복원용)
+        self.aware = True
+
+
+def evaluate_counts(
+    config: IncidentThreshold,
+    window_count: Optional[int],
+    minute_count: Optional[int],
+) -> tuple[bool, str]:
+    """
+    윈도우/동일 분 건수로 장애 기준 충족 여부와 상태 문자열을 만든다.
+    (건수를 어디에 저장하든 같은 판정/로그를 쓰도록 공유)
+
+    Returns:
+        (기준 충족 여부, "60분 내 2/3건 | 동일 분 1/3건" 형태의 상태)
+    """
     triggered = False
     reason_parts = []
 
-    # 조건 1: 슬라이딩 윈도우 기준
-    if config.window is not None and config.count > 0:
-        q = _cleanup_window(incident_type, timestamp, config.window)
-        q.append(timestamp)
-        
-        # 현재 상태
+    if window_count is not None:
         window_minutes = int(config.window.total_seconds() / 60)
-        current_count = len(q)
-        reason_parts.append(
-            f"{window_minutes}분 내 {current_count}/{config.count}건"
-        )
-        
-        if current_count >= config.count:
+        reason_parts.append(f"{window_minutes}분 내 {window_count}/{config.count}건")
+        if window_count >= config.count:
             triggered = True
 
-    # 조건 2: 동일 분 기준
-    if config.same_minute_count is not None:
-        counts = _cleanup_minute_counts(incident_type, timestamp)
-        mkey = _minute_key(timestamp)
-        counts[mkey] = counts.get(mkey, 0) + 1
-        
-        # 현재 상태
-        current_minute_count = counts[mkey]
-        reason_parts.append(
-            f"동일 분 {current_minute_count}/{config.same_minute_count}건"
-        )
-        
-        if current_minute_count >= config.same_minute_count:
+    if minute_count is not None:
+        reason_parts.append(f"동일 분 {minute_count}/{config.same_minute_count}건")
+        if minute_count >= config.same_minute_count:
             triggered = True
 
-    # 상태 출력
     reason = " | ".join(reason_parts) if reason_parts else "기준 없음"
-    
-    if triggered:
-        # 쿨다운 체크
-        if _check_cooldown(incident_type, timestamp, config.cooldown):
-            logger.info(f"✅ Incident triggered: {incident_type.name} ({reason})")
-            logger.info(
-                "Incident triggered: type=%s, time=%s, reason=%s",
+    return triggered, reason
+
+
+def label_of(incident_type: IncidentType, dimension: Optional[Hashable]) -> str:
+    """로그용 키 표기 (ex. TIMEOUT, TIMEOUT[project-a])"""
+    if dimension is None:
+        return incident_type.name
+    return f"{incident_type.name}[{dimension}]"
+
+
+class AnomalyDetector:
+    """
+    장애 탐지기
+
+    책임:
+    - (장애 유형, dimension) 별 이벤트 기록 (슬라이딩 윈도우 / 동일 분 bucket)
+    - 장애 기준 충족 여부 판별
+    - 쿨다운 관리
+    - 메모리 상한 유지 (idle 키 제거, 키 수 상한)
+
+    인스턴스마다 상태를 따로 가지므로 테넌트/채널/워커 단위로 분리해 쓸 수 있다.
+    """
+
+    def __init__(
+        self,
+        thresholds: Mapping[IncidentType, IncidentThreshold] = INCIDENT_THRESHOLDS,
+        minute_retention: int | None = None,
+        allowed_lateness: timedelta = DEFAULT_ALLOWED_LATENESS,
+        max_keys: int = DEFAULT_MAX_KEYS,
+        idle_ttl: timedelta | None = None,
+    ):
+        """
+        Args:
+            thresholds: 장애 유형별 기준 설정
+            minute_retention: minute bucket 보관 기간 (분, None 이면 허용 지연에서 계산)
+            allowed_lateness: watermark 지연 (이보다 늦은 이벤트는 버림)
+            max_keys: 동시에 추적하는 키 수 상한
+            idle_ttl: 이 시간(event-time) 동안 이벤트가 없는 키는 제거 (None 이면 기준 설정에서 계산)
+        """
+        if max_keys <= 0:
+            raise ValueError("max_keys must be positive")
+
+        self.thresholds = thresholds
+        self.allowed_lateness = allowed_lateness
+        self.minute_retention = minute_retention or _default_minute_retention(allowed_lateness)
+        self.max_keys = max_keys
+        self.idle_ttl = idle_ttl if idle_ttl is not None else _default_idle_ttl(
+            thresholds, allowed_lateness
+        )
+        self._allowed_lateness_us = allowed_lateness // _ONE_MICROSECOND
+        self._idle_ttl_us = self.idle_ttl // _ONE_MICROSECOND
+
+        # (장애 유형, dimension) → 키 상태 (오래 쓰이지 않은 키가 앞쪽)
+        self._states: OrderedDict[tuple[IncidentType, Optional[Hashable]], _KeyState] = OrderedDict()
+
+        # 전체 키 중 가장 최근 이벤트 시각 (idle 판정 기준)
+        self._latest_us = -1
+
+        # 기록된 이벤트 수 (스냅샷 변경 감지용)
+        self.updates = 0
+
+    def __len__(self) -> int:
+        """현재 추적 중인 키 수"""
+        return len(self._states)
+
+    def reset(self) -> None:
+        """탐지기 상태를 초기화한다."""
+        self._states.clear()
+        self._latest_us = -1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        전체 탐지 상태를 JSON 직렬화 가능한 dict 로 내보낸다.
+
+        keys 항목: [유형 이름, dimension, clock_us, aware, last_alert_us, window, minutes]
+        - window: ["e", [delta 인코딩 타임스탬프]] | ["b", [head, slot 별 count...]] | None
+        - minutes: [minute, count, ...] | None
+        """
+        keys = []
+        for (incident_type, dimension), state in self._states.items():
+            if state.clock_dt is None:
+                continue
+            config = self.thresholds.get(incident_type)
+
+            window = None
+            if isinstance(state.window, ExactWindowCounter):
+                limit = config.count if config is not None else None
+                window = ["e", _delta_encode(state.window.dump(limit))]
+            elif state.window is not None:
+                window = ["b", state.window.dump()]
+
+            keys.append([
                 incident_type.name,
-                timestamp.isoformat(),
-                reason,
+                dimension,
+                state.clock_us,
+                int(state.aware),
+                epoch_micros(state.last_alert) if state.last_alert is not None else None,
+                window,
+                state.minutes.dump() if state.minutes is not None else None,
+            ])
+        return {"version": SNAPSHOT_VERSION, "latest_us": self._latest_us, "keys": keys}
+
+    def restore(self, snapshot: Mapping[str, Any]) -> int:
+        """
+        snapshot() 결과로 상태를 되살린다 (기존 상태는 지움).
+
+        현재 설정에 없는 장애 유형, 윈도우 종류가 바뀐 카운터는 건너뛴다.
+
+        Returns:
+            복원한 키 수
+
+        Raises:
+            SnapshotVersionError: 포맷 버전이 다른 경우
+        """
+        version = snapshot.get("version")
+        if version != SNAPSHOT_VERSION:
+            raise SnapshotVersionError(
+                f"unsupported anomaly snapshot version {version!r} (expected {SNAPSHOT_VERSION})"
             )
-            return True
+
+        self.reset()
+        for name, dimension, clock_us, aware, last_alert_us, window, minutes in snapshot["keys"]:
+            incident_type = IncidentType.__members__.get(name)
+            config = self.thresholds.get(incident_type) if incident_type is not None else None
+            if config is None:
+                logger.warning("Snapshot key skipped (unknown incident type): %s", name)
+                continue
+            if isinstance(dimension, list):
+                dimension = tuple(dimension)
+
+            state = _KeyState()
+            state.clock_us = clock_us
+            state.aware = bool(aware)
+            state.clock_dt = from_epoch_micros(clock_us, state.aware)
+            if last_alert_us is not None:
+                state.last_alert = from_epoch_micros(last_alert_us, state.aware)
+
+            if window is not None and config.window is not None:
+                kind = "e" if config.resolution is None else "b"
+                if window[0] == kind:
+                    counter = make_window_counter(config.window, config.resolution)
+                    values = window[1]
+                    try:
+                        counter.load(_delta_decode(values) if kind == "e" else values)
+                        state.window = counter
+                    except ValueError:
+                        logger.warning("Snapshot window skipped (resolution changed): %s", name)
+            if minutes is not None and config.same_minute_count is not None:
+                state.minutes = MinuteRing(self.minute_retention)
+                state.minutes.load(minutes)
+
+            self._states[(incident_type, dimension)] = state
+            self._latest_us = max(self._latest_us, clock_us)
+
+        self._latest_us = max(self._latest_us, snapshot.get("latest_us", -1))
+        self._evict()
+        return len(self._states)
+
+    def _state_for(
+        self,
+        key: tuple[IncidentType, Optional[Hashable]],
+        event_us: int,
+    ) -> _KeyState:
+        """키 상태를 찾아 최근 사용으로 표시한다 (없으면 생성, 필요하면 오래된 키 제거)."""
+        states = self._states
+        state = states.get(key)
+        if state is None:
+            state = _KeyState()
+            states[key] = state
         else:
-            # 쿨다운 중
-            last = _last_alert_ts.get(incident_type)
-            cooldown_minutes = int(config.cooldown.total_seconds() / 60)
-            last_str = last.strftime("%H:%M:%S") if last else "N/A"
+            states.move_to_end(key)
 
-            logger.info(f"⏸️ Threshold met but in cooldown: {incident_type.name} ({reason})")
-            logger.info(f"   마지막 알림: {last_str}, 쿨다운: {cooldown_minutes}분")
+        if event_us > self._latest_us:
+            self._latest_us = event_us
+        self._evict()
+        return state
 
+    def _evict(self) -> None:
+        """idle 키와 상한 초과 키를 앞쪽(가장 오래 쓰이지 않은 쪽)부터 제거한다."""
+        states = self._states
+        idle_cutoff = self._latest_us - self._idle_ttl_us
+        while len(states) > 1:
+            oldest = next(iter(states.values()))
+            if len(states) <= self.max_keys and oldest.clock_us >= idle_cutoff:
+                break
+            states.popitem(last=False)
+            metrics.increment("anomaly_keys_evicted")
+
+    def _advance_clock(
+        self,
+        state: _KeyState,
+        incident_type: IncidentType,
+        dimension: Optional[Hashable],
+        event_us: int,
+        timestamp: datetime,
+    ) -> bool:
+        """
+        키의 event-time 시계를 앞으로만 움직인다.
+
+        Returns:
+            False 면 watermark 보다 늦은 이벤트
+        """
+        if event_us >= state.clock_us:
+            state.clock_us = event_us
+            state.clock_dt = timestamp
+            state.aware = timestamp.tzinfo is not None
+            return True
+
+        if event_us < state.clock_us - self._allowed_lateness_us:
+            metrics.increment("anomaly_late_events_dropped")
+            logger.warning(
+                "Late event dropped: type=%s, time=%s, watermark=%s",
+                label_of(incident_type, dimension),
+                timestamp.isoformat(),
+                (state.clock_dt - self.allowed_lateness).isoformat(),
+            )
+            return False
+        return True
+
+    def _check_cooldown(
+        self,
+        state: _KeyState,
+        label: str,
+        now: datetime,
+        cooldown: timedelta,
+    ) -> bool:
+        """쿨다운 시간 내에 또 발생했다면 False 를 리턴한다."""
+        last = state.last_alert
+        if last is not None and now - last < cooldown:
             logger.info(
-                "Incident cooldown: type=%s, reason=%s, last=%s, cooldown=%d",
-                incident_type.name,
+                "Incident %s triggered but in cooldown window (last=%s, now=%s)",
+                label,
+                last.isoformat(),
+                now.isoformat(),
+            )
+            return False
+
+        state.last_alert = now
+        return True
+
+    def record_event(
+        self,
+        incident_type: IncidentType,
+        timestamp: datetime,
+        dimension: Optional[Hashable] = None,
+    ) -> bool:
+        """
+        장애 이벤트 하나를 기록하고, 장애 기준을 만족하는지 판별한다.
+
+        Args:
+            incident_type: 장애 유형
+            timestamp: 이벤트 시각
+            dimension: 집계 단위 (ex. 프로젝트, 에러 시그니처). None 이면 유형 단위로 집계
+        """
+        if not isinstance(timestamp, datetime):
+            raise TypeError("timestamp must be a datetime instance")
+
+        config = self.thresholds.get(incident_type)
+        if config is None:
+            logger.warning("Unknown incident type: %r", incident_type)
+            return False
+
+        self.updates += 1
+        event_us = epoch_micros(timestamp)
+        state = self._state_for((incident_type, dimension), event_us)
+        if not self._advance_clock(state, incident_type, dimension, event_us, timestamp):
+            return False
+        now = state.clock_dt
+        label = label_of(incident_type, dimension)
+
+        window_count = None
+        if config.window is not None and config.count > 0:
+            # 조건 1: 슬라이딩 윈도우 기준 (event-time 시계 기준으로 만료)
+            counter = state.window
+            if counter is None:
+                counter = state.window = make_window_counter(config.window, config.resolution)
+            window_count = counter.add(event_us, state.clock_us)
+
+        minute_count = None
+        if config.same_minute_count is not None:
+            # 조건 2: 동일 분 기준
+            minutes = state.minutes
+            if minutes is None:
+                minutes = state.minutes = MinuteRing(self.minute_retention)
+            minute_count = minutes.increment(epoch_minute(timestamp))
+
+        triggered, reason = evaluate_counts(config, window_count, minute_count)
+
+        if triggered:
+            # 쿨다운 체크 (늦은 이벤트여도 시계는 뒤로 가지 않음)
+            if self._check_cooldown(state, label, now, config.cooldown):
+                logger.info(f"✅ Incident triggered: {label} ({reason})")
+                logger.info(
+                    "Incident triggered: type=%s, time=%s, reason=%s",
+                    label,
+                    timestamp.isoformat(),
+                    reason,
+                )
+                return True
+            else:
+                # 쿨다운 중
+                last = state.last_alert
+                cooldown_minutes = int(config.cooldown.total_seconds() / 60)
+                last_str = last.strftime("%H:%M:%S") if last else "N/A"
+
+                logger.info(f"⏸️ Threshold met but in cooldown: {label} ({reason})")
+                logger.info(f"   마지막 알림: {last_str}, 쿨다운: {cooldown_minutes}분")
+
+                logger.info(
+                    "Incident cooldown: type=%s, reason=%s, last=%s, cooldown=%d",
+                    label,
+                    reason,
+                    last_str,
+                    cooldown_minutes,
+                )
+                return False
+        else:
+            # Threshold 미달
+            logger.info(f"📊 Event recorded: {label} ({reason}) - threshold 미달")
+
+            logger.info(
+                "Event recorded: type=%s, time=%s, reason=%s",
+                label,
+                timestamp.isoformat(),
                 reason,
-                last_str,
-                cooldown_minutes,
             )
             return False
-    else:
-        # Threshold 미달
-        logger.info(f"📊 Event recorded: {incident_type.name} ({reason}) - threshold 미달")
-
-        logger.info(
-            "Event recorded: type=%s, time=%s, reason=%s",
-            incident_type.name,
-            timestamp.isoformat(),
-            reason,
-        )
-        return False
\ No newline at end of file
+
+
+# 하위 호환성을 위한 모듈 레벨 기본 탐지기
+_default_detector = AnomalyDetector()
+
+
+def get_default_detector() -> AnomalyDetector:
+    """모듈 레벨 기본 AnomalyDetector"""
+    return _default_detector
+
+
+def reset_state() -> None:
+    """테스트에서 기본 탐지기 상태를 초기화할 때 사용한다."""
+    _default_detector.reset()
+
+
+def record_event(
+    incident_type: IncidentType,
+    timestamp: datetime,
+    dimension: Optional[Hashable] = None,
+) -> bool:
+    """
+    [호환용] 기본 탐지기에 장애 이벤트를 기록한다.
+    새 코드에서는 AnomalyDetector 인스턴스를 주입받아 사용하세요.
+    """
+    return _default_detector.record_event(incident_type, timestamp, dimension)
@@ -0,0 +1,304 @@
+# app/domain/counters.py
+"""
+장애 탐지용 카운터 자료구조
+
+공개 API:
+- epoch_seconds(ts) / epoch_minute(ts) / epoch_micros(ts): datetime → epoch 값 (naive 는 UTC 로 간주)
+- from_epoch_micros(us, aware): epoch 마이크로초 → datetime
+- MinuteRing: 정수 epoch-minute 키 기반 고정 크기 ring buffer 카운터
+- ExactWindowCounter: 이벤트별 타임스탬프를 보관하는 정확한 슬라이딩 윈도우
+- BucketedWindowCounter: resolution 단위 slot 카운터로 근사하는 슬라이딩 윈도우
+- make_window_counter(window, resolution): resolution 에 따라 위 둘 중 하나 생성
+
+각 카운터는 dump() / load(state) 로 상태를 정수 리스트로 내보내고 복원한다 (스냅샷용).
+
+모든 연산은 O(1) (윈도우 만료는 amortized O(1)) 이고 문자열 포맷/파싱을 하지 않는다.
+"""
+from __future__ import annotations
+
+from array import array
+from bisect import insort
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Deque, List, Optional, Protocol
+
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_EPOCH_AWARE = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def epoch_seconds(ts: datetime) -> float:
+    """datetime → epoch 초 (naive datetime 은 UTC 벽시계로 간주)"""
+    if ts.tzinfo is None:
+        return (ts - _EPOCH_NAIVE).total_seconds()
+    return (ts - _EPOCH_AWARE).total_seconds()
+
+
+def epoch_micros(ts: datetime) -> int:
+    """datetime → 정수 epoch 마이크로초 (경계 비교가 정확하도록 정수 사용)"""
+    if ts.tzinfo is None:
+        return (ts - _EPOCH_NAIVE) // _ONE_MICROSECOND
+    return (ts - _EPOCH_AWARE) // _ONE_MICROSECOND
+
+
+def from_epoch_micros(us: int, aware: bool = True) -> datetime:
+    """epoch_micros() 의 역변환 (aware=True 면 UTC aware datetime)"""
+    return (_EPOCH_AWARE if aware else _EPOCH_NAIVE) + timedelta(microseconds=us)
+
+
+def epoch_minute(ts: datetime) -> int:
+    """datetime → 정수 epoch-minute (epoch // 60)"""
+    return int(epoch_seconds(ts) // 60)
+
+
+class MinuteRing:
+    """
+    분 단위 카운터 ring buffer
+
+    - slot = minute % size, slot 마다 (minute, count) 를 저장
+    - 다른 minute 가 같은 slot 에 들어오면 그 자리에서 덮어쓴다 (만료 = O(1))
+    - 가장 최근 minute 기준 size 분보다 오래된 minute 는 기록하지 않는다
+    """
+
+    __slots__ = ("size", "_minutes", "_counts", "_latest")
+
+    def __init__(self, size: int = 120):
+        """
+        Args:
+            size: 보관할 분 수 (기본 2시간)
+        """
+        if size <= 0:
+            raise ValueError("size must be positive")
+        self.size = size
+        self._minutes = array("q", [-1]) * size
+        self._counts = array("I", [0]) * size
+        self._latest = -1
+
+    def increment(self, minute: int) -> int:
+        """
+        minute bucket 을 1 증가시키고 증가 후 값을 반환한다.
+        보관 범위보다 오래된 minute 면 기록하지 않고 0 을 반환한다.
+        """
+        if minute <= self._latest - self.size:
+            return 0
+        if minute > self._latest:
+            self._latest = minute
+
+        slot = minute % self.size
+        if self._minutes[slot] != minute:
+            self._minutes[slot] = minute
+            self._counts[slot] = 1
+            return 1
+        count = self._counts[slot] + 1
+        self._counts[slot] = count
+        return count
+
+    def get(self, minute: int) -> int:
+        """minute bucket 의 현재 값 (없거나 만료되었으면 0)"""
+        slot = minute % self.size
+        if self._minutes[slot] != minute:
+            return 0
+        return self._counts[slot]
+
+    def clear(self) -> None:
+        """모든 bucket 초기화"""
+        for i in range(self.size):
+            self._minutes[i] = -1
+            self._counts[i] = 0
+        self._latest = -1
+
+    def dump(self) -> List[int]:
+        """[minute, count, minute, count, ...] (보관 범위 안의 bucket 만)"""
+        state: List[int] = []
+        cutoff = self._latest - self.size
+        for minute, count in zip(self._minutes, self._counts):
+            if minute > cutoff and count:
+                state.append(minute)
+                state.append(count)
+        return state
+
+    def load(self, state: List[int]) -> None:
+        """dump() 결과로 복원"""
+        self.clear()
+        if not state:
+            return
+        minutes = state[0::2]
+        self._latest = max(minutes)
+        for minute, count in zip(minutes, state[1::2]):
+            if minute > self._latest - self.size:
+                slot = minute % self.size
+                self._minutes[slot] = minute
+                self._counts[slot] = count
+
+
+class WindowCounter(Protocol):
+    """
+    슬라이딩 윈도우 카운터 인터페이스 (시각은 epoch 마이크로초)
+
+    event_us 는 이벤트 시각, now_us 는 탐지기의 event-time 시계(지금까지 본 최대 시각).
+    늦게 도착한 이벤트(event_us < now_us)도 윈도우 안이면 제자리에 반영된다.
+    """
+
+    def add(self, event_us: int, now_us: Optional[int] = None) -> int:
+        """이벤트 1건을 기록하고, now 기준 윈도우 안의 건수를 반환한다."""
+        ...
+
+    def clear(self) -> None:
+        ...
+
+    def dump(self) -> List[int]:
+        ...
+
+    def load(self, state: List[int]) -> None:
+        ...
+
+
+class ExactWindowCounter:
+    """
+    정확한 슬라이딩 윈도우
+
+    이벤트마다 타임스탬프 하나를 정렬된 deque 에 보관한다.
+    순서대로 오면 append, 늦게 온 이벤트는 정렬 위치에 삽입한다.
+    메모리는 윈도우 안의 이벤트 수에 비례한다.
+    """
+
+    __slots__ = ("window_us", "_q")
+
+    def __init__(self, window: timedelta):
+        self.window_us = window // _ONE_MICROSECOND
+        self._q: Deque[int] = deque()
+
+    def add(self, event_us: int, now_us: Optional[int] = None) -> int:
+        if now_us is None:
+            now_us = event_us
+        q = self._q
+        cutoff = now_us - self.window_us
+        while q and q[0] <= cutoff:
+            q.popleft()
+        if event_us > cutoff:
+            if not q or event_us >= q[-1]:
+                q.append(event_us)
+            else:
+                insort(q, event_us)
+        return len(q)
+
+    def __len__(self) -> int:
+        return len(self._q)
+
+    def clear(self) -> None:
+        self._q.clear()
+
+    def dump(self, limit: Optional[int] = None) -> List[int]:
+        """
+        정렬된 타임스탬프 목록 (limit 이 있으면 가장 최근 limit 개만)
+
+        임계치 count 만큼만 남겨도 이후의 "count 건 이상" 판정은 달라지지 않는다.
+        """
+        q = self._q
+        if limit is not None and len(q) > limit:
+            return list(q)[len(q) - limit:]
+        return list(q)
+
+    def load(self, state: List[int]) -> None:
+        """dump() 결과로 복원"""
+        self._q = deque(sorted(state))
+
+
+class BucketedWindowCounter:
+    """
+    resolution 단위 slot 으로 나눈 슬라이딩 윈도우
+
+    - slot 수 = window / resolution (나누어 떨어져야 함), slot 마다 count 를 4바이트 array 에 저장
+      (head 가 지나가며 윈도우 밖 slot 을 비우므로 slot id 는 따로 보관하지 않는다)
+    - 메모리는 O(window / resolution) 로 이벤트 유입량과 무관하다
+    - 윈도우 합계(total)를 유지하며 시간이 흐를 때 만료된 slot 만 빼준다
+
+    정확도:
+    - 반환값은 정확한 윈도우 건수보다 크지 않다 (윈도우 밖 이벤트는 세지 않음)
+    - 윈도우의 가장 오래된 쪽 resolution 미만 구간의 이벤트는 누락될 수 있다
+    - 이벤트/현재 시각이 resolution 경계에 맞춰져 있으면 정확한 윈도우와 같다
+      (ex. resolution=1초, 타임스탬프가 초 단위면 정확)
+    """
+
+    __slots__ = ("resolution_us", "size", "_counts", "_head", "_total")
+
+    def __init__(self, window: timedelta, resolution: timedelta):
+        self.resolution_us = resolution // _ONE_MICROSECOND
+        if self.resolution_us <= 0:
+            raise ValueError("resolution must be positive")
+        window_us = window // _ONE_MICROSECOND
+        if window_us <= 0 or window_us % self.resolution_us:
+            raise ValueError("window must be a positive multiple of resolution")
+        self.size = window_us // self.resolution_us
+        self._counts = array("I", [0]) * self.size
+        self._head = -1   # 가장 최근 slot id
+        self._total = 0   # (head - size, head] 범위 slot 합계
+
+    def _advance(self, slot_id: int) -> None:
+        """head 를 slot_id 로 옮기며 윈도우 밖으로 밀려난 slot 을 비운다."""
+        counts = self._counts
+        if slot_id - self._head >= self.size:
+            for i in range(self.size):
+                counts[i] = 0
+            self._total = 0
+        else:
+            for sid in range(self._head + 1, slot_id + 1):
+                idx = sid % self.size
+                if counts[idx]:
+                    self._total -= counts[idx]
+                    counts[idx] = 0
+        self._head = slot_id
+
+    def add(self, event_us: int, now_us: Optional[int] = None) -> int:
+        head = (event_us if now_us is None else max(event_us, now_us)) // self.resolution_us
+        if head > self._head:
+            self._advance(head)
+
+        slot_id = event_us // self.resolution_us
+        if slot_id <= self._head - self.size:
+            # 윈도우보다 오래된 slot 은 기록하지 않음
+            return self._total
+
+        self._counts[slot_id % self.size] += 1
+        self._total += 1
+        return self._total
+
+    def __len__(self) -> int:
+        return self._total
+
+    def clear(self) -> None:
+        for i in range(self.size):
+            self._counts[i] = 0
+        self._head = -1
+        self._total = 0
+
+    def dump(self) -> List[int]:
+        """
+        [head, count_0, ..., count_{size-1}] (slot 배열 그대로)
+
+        slot 배열에는 항상 윈도우 안의 slot 만 남아 있으므로 head 와 배열만으로 복원된다.
+        """
+        return [self._head, *self._counts]
+
+    def load(self, state: List[int]) -> None:
+        """
+        dump() 결과로 복원
+
+        Raises:
+            ValueError: slot 수가 다른 경우 (window/resolution 변경)
+        """
+        if len(state) != self.size + 1:
+            raise ValueError("bucketed window state does not match slot count")
+        self._head = state[0]
+        self._counts = array("I", state[1:])
+        self._total = sum(self._counts)
+
+
+def make_window_counter(
+    window: timedelta,
+    resolution: Optional[timedelta] = None,
+) -> ExactWindowCounter | BucketedWindowCounter:
+    """resolution 이 None 이면 정확한 윈도우, 아니면 slot 기반 윈도우"""
+    if resolution is None:
+        return ExactWindowCounter(window)
+    return BucketedWindowCounter(window, resolution)
@@ -0,0 +1,77 @@
+# app/domain/event_time.py
+"""
+VT 이벤트 시각 파서
+
+공개 API:
+- parse_event_time(raw): 시각 문자열 → aware datetime (실패 시 EventTimeParseError)
+- EventTimeParseError
+
+예상 포맷: "2025-12-09T20:10:51.796441041Z[Etc/UTC]"
+그 외 허용: "+0000[UTC]" / "+00:00" 오프셋, 소수점 없는 초, 날짜만 있는 값.
+
+VT 기본 포맷은 고정 위치 검사만으로 판별하고, 마이크로초까지 잘라낸
+ISO 문자열로 `datetime.fromisoformat` 을 한 번만 호출한다 (split/패딩 없음).
+그 외 포맷은 미리 컴파일한 정규식으로 해석한다.
+"""
+from __future__ import annotations
+
+from datetime import datetime
+import re
+
+_PREFIX_LEN = 19  # "YYYY-MM-DDTHH:MM:SS"
+_DATE_LEN = 10    # "YYYY-MM-DD"
+_FAST_FRACTION_END = 26  # "YYYY-MM-DDTHH:MM:SS.ffffff"
+
+# 접두사 이후 부분: [.fraction][Z | ±HH[:]MM][[zone-id]]
+_SUFFIX_PATTERN = re.compile(
+    r"(?:\.(\d+))?(?:(Z)|([+-]\d\d):?(\d\d))?(?:\[[^\]]*\])?"
+)
+
+
+class EventTimeParseError(ValueError):
+    """이벤트 시각 문자열을 해석할 수 없을 때 발생한다."""
+
+
+def _iso(prefix: str, fraction: str | None, offset: str) -> datetime:
+    """정규화된 ISO 문자열 한 번으로 datetime 생성"""
+    if fraction:
+        return datetime.fromisoformat(f"{prefix}.{(fraction + '00000')[:6]}{offset}")
+    return datetime.fromisoformat(prefix + offset)
+
+
+def parse_event_time(raw: str) -> datetime:
+    """
+    이벤트 시각 문자열을 timezone-aware datetime 으로 파싱한다.
+
+    소수점 이하는 마이크로초(6자리)까지만 유지하고, 오프셋이 없으면 UTC 로 본다.
+
+    Raises:
+        EventTimeParseError: 포맷을 해석할 수 없는 경우
+    """
+    try:
+        if len(raw) == _DATE_LEN:
+            return datetime.fromisoformat(raw + "T00:00:00+00:00")
+
+        prefix = raw[:_PREFIX_LEN]
+        if len(prefix) != _PREFIX_LEN or prefix[10] not in "T ":
+            raise ValueError("unexpected date/time prefix")
+
+        # fast path: "....SS.ffffff[fff]Z[Etc/UTC]" (소수점 6자리 이상)
+        if raw[_PREFIX_LEN:_PREFIX_LEN + 1] == ".":
+            z = raw.find("Z", _FAST_FRACTION_END)
+            if (
+                z > 0
+                and raw[_PREFIX_LEN + 1:z].isdigit()
+                and (z + 1 == len(raw) or (raw[z + 1] == "[" and raw[-1] == "]"))
+            ):
+                return datetime.fromisoformat(raw[:_FAST_FRACTION_END] + "+00:00")
+
+        m = _SUFFIX_PATTERN.fullmatch(raw, _PREFIX_LEN)
+        if m is None:
+            raise ValueError("unexpected trailing text")
+
+        fraction, _zulu, offset_hours, offset_minutes = m.groups()
+        offset = f"{offset_hours}:{offset_minutes}" if offset_hours else "+00:00"
+        return _iso(prefix, fraction, offset)
+    except ValueError as exc:
+        raise EventTimeParseError(f"cannot parse event time {raw!r}: {exc}") from exc
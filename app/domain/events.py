@@ -3,12 +3,19 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from typing import Optional
-import re
+import logging
 
 from pydantic import BaseModel
 
+from app import metrics
 from app.adapters.messagecard import VTWebhookMessage
+from app.domain.event_time import EventTimeParseError, parse_event_time
+from app.domain.fingerprint import fingerprint
+from app.domain.incident_classifier import classify_description
 from app.domain.incident_type import IncidentType
+from app.domain.normalization import extract_failure_reason
+
+logger = logging.getLogger(__name__)
 
 
 def _parse_event_datetime(raw: str | None) -> datetime:
@@ -16,29 +23,17 @@ def _parse_event_datetime(raw: str | None) -> datetime:
     이벤트 시각 문자열을 UTC datetime으로 파싱한다.
     
     예상 포맷: "2025-12-09T20:10:51.796441041Z[Etc/UTC]"
-    파싱 실패 시 현재 시각(UTC)으로 fallback.
+    값이 없거나 파싱에 실패하면 현재 시각(UTC)으로 fallback 하되,
+    파싱 실패는 경고 로그와 `event_time_parse_failures` 메트릭으로 남긴다.
     """
     if not raw:
         return datetime.now(timezone.utc)
     
     try:
-        before_z = raw.split("Z", 1)[0]
-        if "." in before_z:
-            date_part, frac = before_z.split(".", 1)
-            frac = (frac + "000000")[:6]
-            trimmed = f"{date_part}.{frac}"
-        else:
-            trimmed = before_z
-        
-        # ✅ timezone 추가!
-        dt = datetime.fromisoformat(trimmed)
-        
-        # ✅ naive datetime이면 UTC로 변환
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        
-        return dt
-    except Exception:
+        return parse_event_time(raw)
+    except EventTimeParseError as exc:
+        metrics.increment("event_time_parse_failures")
+        logger.warning("⚠️ %s - falling back to current time", exc)
         return datetime.now(timezone.utc)
 
 
@@ -63,11 +58,7 @@ class VTErrorEvent(BaseModel):
         time = msg.get_fact("Time") or ""
         cause = msg.get_fact("Cause or Stack Trace") or ""
 
-        failure_reason = None
-        if error_detail:
-            m = re.search(r"Failure Reason:\s*([A-Z0-9_]+)", error_detail)
-            if m:
-                failure_reason = m.group(1)
+        failure_reason = extract_failure_reason(error_detail)
 
         return cls(
             project=project,
@@ -80,6 +71,15 @@ class VTErrorEvent(BaseModel):
 
     def event_datetime(self) -> datetime:
         return _parse_event_datetime(self.time)
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        에러 시그니처 (error_message / error_detail / stack trace 정규화 해시)
+
+        요청 ID, 시각, UUID, 줄 번호가 달라도 같은 장애면 같은 값이다.
+        """
+        return fingerprint(self.error_message, self.error_detail, self.cause_or_stack_trace)
     
     # ✅ 이렇게 추가!
     def to_incident_type(self) -> Optional[IncidentType]:
@@ -94,6 +94,10 @@ class VTErrorEvent(BaseModel):
         return None
 
 
+# 집계 단위(dimension)로 쓸 수 있는 VTErrorEvent 속성 (필드 + fingerprint)
+EVENT_DIMENSIONS = frozenset(VTErrorEvent.model_fields) | {"fingerprint"}
+
+
 class MonitoringEvent(BaseModel):
     """
     Feed2 (VT 실시간 모니터링) 도메인 모델.
@@ -120,16 +124,9 @@ class MonitoringEvent(BaseModel):
     
     # ✅ 이것도 추가!
     def to_incident_type(self) -> Optional[IncidentType]:
-        """이 이벤트에 해당하는 IncidentType 반환"""
-        from app.domain.incident_type import IncidentType
-        
-        description = self.description.lower()
-        
-        if "더빙/오디오 생성 실패" in description:
-            return IncidentType.LIVE_API_DB_OVERLOAD
-        elif "youtube url 다운로드 실패" in description:
-            return IncidentType.YT_DOWNLOAD_FAIL
-        elif "외부 url 다운로드 실패" in description or "video 파일 업로드 실패" in description:
-            return IncidentType.YT_EXTERNAL_FAIL
-        
-        return None
\ No newline at end of file
+        """
+        이 이벤트에 해당하는 IncidentType 반환
+
+        매핑 테이블은 incident_config.MONITORING_INCIDENT_PATTERNS 참고.
+        """
+        return classify_description(self.description)
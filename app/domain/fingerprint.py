@@ -0,0 +1,103 @@
+# app/domain/fingerprint.py
+"""
+에러 시그니처 fingerprint
+
+공개 API:
+- normalize_signature(text): 가변 토큰(UUID, 타임스탬프, hex id, 숫자/줄 번호)을 치환한 문자열
+- fingerprint(*parts): 정규화한 필드들의 안정적인 해시 (16자리 hex)
+- clear_caches(): 테스트용 캐시 초기화
+
+같은 장애의 stack trace / error detail 도 요청 ID, 시각, 줄 번호 때문에 매번 달라 보인다.
+이 값들을 토큰으로 바꾼 뒤 해시하면 동일 장애가 같은 fingerprint 를 갖는다.
+    "req 3f2b...-... failed at 2025-12-09T20:10:51Z (Foo.java:123)"
+    → "req <UUID> failed at <TS> (Foo.java:<N>)"
+
+- HTML 태그와 줄바꿈을 줄 경계로 보고 줄 단위로 정규화한다.
+- 줄 하나의 치환은 미리 컴파일한 정규식 하나로 한 번에 스캔한다 (숫자가 없는 줄은 건너뜀).
+- 에러 코드처럼 글자에 붙은 숫자(VT5001, utf8)는 바꾸지 않는다.
+- 캐시는 두 단계다.
+  - raw 문자열 → 결과 (같은 trace 반복)
+  - 줄 → 정규화된 줄 (요청 ID 가 든 한두 줄만 다르고 나머지 frame 줄은 같은 경우)
+- 입력은 앞쪽 FINGERPRINT_MAX_CHARS 자만 사용한다 (긴 trace 의 비용 상한).
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Optional
+import re
+
+# 캐시 최대 크기 (raw 문자열 / 줄 기준)
+FINGERPRINT_CACHE_SIZE = 1024
+FINGERPRINT_LINE_CACHE_SIZE = 8192
+
+# 정규화에 사용하는 최대 길이
+FINGERPRINT_MAX_CHARS = 8192
+
+# 모든 토큰은 단어 경계에서 hex 문자로 시작하므로 앞쪽 guard 로 대부분의 위치를 바로 건너뛴다.
+_TOKEN_PATTERN = re.compile(
+    r"\b(?=[0-9a-fA-F])(?:"
+    r"(?P<UUID>[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b)"
+    r"|(?P<TS>\d{4}-\d\d-\d\d(?:[T ]\d\d:\d\d:\d\d(?:[.,]\d+)?(?:Z|[+-]\d\d:?\d\d)?(?:\[[^\]\s]*\])?)?)"
+    r"|(?P<HEX>0[xX][0-9a-fA-F]+\b|(?=[0-9a-fA-F]*[a-fA-F])(?=[0-9a-fA-F]*\d)[0-9a-fA-F]{8,}\b)"
+    r"|(?P<N>\d+(?:\.\d+)*\b)"
+    r")"
+)
+_DIGIT_PATTERN = re.compile(r"\d")
+_LINE_BREAK_PATTERN = re.compile(r"<[^>]+>")
+
+_REPLACEMENTS = {
+    "UUID": "<UUID>",
+    "TS": "<TS>",
+    "HEX": "<HEX>",
+    "N": "<N>",
+}
+
+_FIELD_SEPARATOR = "\x1f"
+
+
+def _replace(m: re.Match[str]) -> str:
+    return _REPLACEMENTS[m.lastgroup]
+
+
+@lru_cache(maxsize=FINGERPRINT_LINE_CACHE_SIZE)
+def _normalize_line(line: str) -> str:
+    """줄 하나: 공백 정리 + 가변 토큰 치환"""
+    line = " ".join(line.split())
+    if _DIGIT_PATTERN.search(line) is None:
+        return line
+    return _TOKEN_PATTERN.sub(_replace, line)
+
+
+@lru_cache(maxsize=FINGERPRINT_CACHE_SIZE)
+def normalize_signature(text: str) -> str:
+    """
+    가변 토큰을 치환해 같은 종류의 에러가 같은 문자열이 되도록 만든다.
+    HTML 태그는 줄바꿈으로 보고, 빈 줄은 버린다.
+
+    ex) "<p>Job 42 failed (id=0x7f3a)</p>" -> "Job <N> failed (id=<HEX>)"
+    """
+    if not text:
+        return ""
+    text = text[:FINGERPRINT_MAX_CHARS]
+    if "<" in text:
+        text = _LINE_BREAK_PATTERN.sub("\n", text)
+    return "\n".join(filter(None, map(_normalize_line, text.splitlines())))
+
+
+@lru_cache(maxsize=FINGERPRINT_CACHE_SIZE)
+def fingerprint(*parts: Optional[str]) -> str:
+    """
+    정규화한 필드들을 이어 blake2b(8바이트) 로 해시한다.
+
+    필드 순서가 다르면 다른 fingerprint 가 된다.
+    """
+    normalized = _FIELD_SEPARATOR.join(normalize_signature(p or "") for p in parts)
+    return blake2b(normalized.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def clear_caches() -> None:
+    """테스트에서 fingerprint 캐시를 초기화할 때 사용한다."""
+    _normalize_line.cache_clear()
+    normalize_signature.cache_clear()
+    fingerprint.cache_clear()
@@ -0,0 +1,163 @@
+# app/domain/forward_rules.py
+"""
+포워딩 규칙 결정 테이블
+
+공개 API:
+- compile_rules(spec): 규칙 정의(dict) → ForwardRuleSet
+- ForwardRuleSet.evaluate(event): 이벤트 하나에 대한 ForwardDecision
+- DEFAULT_FORWARD_RULES: rules.py 상수로 만든 기본 규칙
+
+규칙 정의 포맷 (JSON 파일과 동일한 구조):
+    {
+      "failure_reasons": ["AUDIO_PIPELINE_FAILED", ...],
+      "keywords": ["VIDEO_QUEUE_FULL", "VT5001", ...],
+      "projects": {"allow": [], "deny": ["123456"]},
+      "field_keywords": {"error_detail": ["NO_VOICE_DETECTED"], ...}
+    }
+
+- 키가 없으면 rules.py 의 기본값을 쓴다 (비우려면 빈 리스트를 명시).
+- projects.allow 가 비어 있으면 모든 프로젝트를 허용한다.
+
+판정 순서: deny → allow → failure_reason → field_keywords → keywords.
+ForwardDecision 은 컴파일 시점에 미리 만들어 두고 재사용하므로
+evaluate() 는 이벤트마다 문자열 연결이나 컨테이너 생성을 하지 않는다.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from app.domain.events import VTErrorEvent
+from app.domain.keyword_matcher import KeywordMatcher
+from app.domain.rules import FORWARD_FAILURE_REASONS, SPECIAL_FORWARD_KEYWORDS
+
+# field_keywords 에서 사용할 수 있는 VTErrorEvent 필드
+MATCHABLE_FIELDS = frozenset({
+    "project",
+    "error_message",
+    "error_detail",
+    "failure_reason",
+    "cause_or_stack_trace",
+})
+
+
+@dataclass(frozen=True)
+class ForwardDecision:
+    """
+    포워딩 판정 결과
+
+    - forward: 포워딩 여부
+    - rule: 판정 근거 (failure_reason / field_keyword / keyword / project_denied / project_not_allowed / no_match)
+    - detail: 매칭된 값 (failure reason, 키워드, 프로젝트 등)
+    """
+
+    forward: bool
+    rule: str
+    detail: Optional[str] = None
+
+
+_PROJECT_DENIED = ForwardDecision(False, "project_denied")
+_PROJECT_NOT_ALLOWED = ForwardDecision(False, "project_not_allowed")
+_NO_MATCH = ForwardDecision(False, "no_match")
+
+
+@dataclass(frozen=True)
+class ForwardRuleSet:
+    """컴파일된 포워딩 규칙 (불변)"""
+
+    failure_reasons: Dict[str, ForwardDecision]
+    keyword_matcher: KeywordMatcher
+    keyword_decisions: Dict[str, ForwardDecision]
+    project_allow: frozenset
+    project_deny: frozenset
+    field_rules: Tuple[Tuple[str, KeywordMatcher, Dict[str, ForwardDecision]], ...]
+    source: str = field(default="default", compare=False)
+
+    def evaluate(self, event: VTErrorEvent) -> ForwardDecision:
+        """이벤트 하나를 결정 테이블에 한 번 통과시킨다."""
+        project = event.project
+        if project in self.project_deny:
+            return _PROJECT_DENIED
+        if self.project_allow and project not in self.project_allow:
+            return _PROJECT_NOT_ALLOWED
+
+        decision = self.failure_reasons.get(event.failure_reason)
+        if decision is not None:
+            return decision
+
+        for field_name, matcher, decisions in self.field_rules:
+            keyword = matcher.search(getattr(event, field_name))
+            if keyword is not None:
+                return decisions[keyword]
+
+        keyword = self.keyword_matcher.search(
+            event.error_message,
+            event.error_detail,
+            event.cause_or_stack_trace,
+        )
+        if keyword is not None:
+            return self.keyword_decisions[keyword]
+
+        return _NO_MATCH
+
+
+def _string_list(spec: Mapping[str, Any], key: str, default: Any) -> Tuple[str, ...]:
+    value = spec.get(key, default)
+    # null / 숫자 / object 는 TypeError 가 아니라 ValueError (엔진이 이전 규칙을 유지하도록)
+    if not isinstance(value, (list, tuple)) or not all(isinstance(v, str) for v in value):
+        raise ValueError(f"'{key}' must be a list of strings")
+    return tuple(value)
+
+
+def compile_rules(spec: Mapping[str, Any], source: str = "default") -> ForwardRuleSet:
+    """
+    규칙 정의를 결정 테이블로 컴파일한다.
+
+    Args:
+        spec: 규칙 정의 dict
+        source: 규칙 출처 (로그용)
+
+    Raises:
+        ValueError: 규칙 정의가 잘못된 경우
+    """
+    if not isinstance(spec, Mapping):
+        raise ValueError("forward rules must be a JSON object")
+
+    failure_reasons = _string_list(spec, "failure_reasons", sorted(FORWARD_FAILURE_REASONS))
+    keywords = _string_list(spec, "keywords", SPECIAL_FORWARD_KEYWORDS)
+
+    projects = spec.get("projects", {})
+    if not isinstance(projects, Mapping):
+        raise ValueError("'projects' must be an object with 'allow'/'deny'")
+    allow = _string_list(projects, "allow", ())
+    deny = _string_list(projects, "deny", ())
+
+    field_keywords = spec.get("field_keywords", {})
+    if not isinstance(field_keywords, Mapping):
+        raise ValueError("'field_keywords' must be an object")
+
+    field_rules = []
+    for field_name in field_keywords:
+        if field_name not in MATCHABLE_FIELDS:
+            raise ValueError(f"unknown field in 'field_keywords': {field_name!r}")
+        matcher = KeywordMatcher(_string_list(field_keywords, field_name, ()))
+        if matcher:
+            decisions = {
+                k: ForwardDecision(True, "field_keyword", f"{field_name}:{k}")
+                for k in matcher.keywords
+            }
+            field_rules.append((field_name, matcher, decisions))
+
+    keyword_matcher = KeywordMatcher(keywords)
+    return ForwardRuleSet(
+        failure_reasons={r: ForwardDecision(True, "failure_reason", r) for r in failure_reasons},
+        keyword_matcher=keyword_matcher,
+        keyword_decisions={k: ForwardDecision(True, "keyword", k) for k in keyword_matcher.keywords},
+        project_allow=frozenset(allow),
+        project_deny=frozenset(deny),
+        field_rules=tuple(field_rules),
+        source=source,
+    )
+
+
+DEFAULT_FORWARD_RULES = compile_rules({})
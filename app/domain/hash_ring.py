@@ -0,0 +1,69 @@
+# app/domain/hash_ring.py
+"""
+Consistent hashing (가상 노드)
+
+공개 API:
+- HashRing(members, vnodes): 멤버 집합으로 만든 해시 링
+  - owner(key): key 를 맡는 멤버
+  - assign(keys): 멤버 → 맡는 key 목록
+
+- 멤버마다 vnodes 개의 점을 링 위에 두고, key 는 시계 방향으로 처음 만나는 점의 멤버가 맡는다.
+- 멤버가 하나 추가/제거되면 약 1/N 의 key 만 주인이 바뀐다 (나머지는 그대로).
+- 해시는 blake2b 를 사용한다. 내장 hash() 는 프로세스마다 달라서 replica 간에 같은 링이 나오지 않는다.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from hashlib import blake2b
+from typing import Dict, Iterable, List, Optional
+
+DEFAULT_VNODES = 64
+
+
+def stable_hash(value: str) -> int:
+    """프로세스와 무관한 64비트 해시"""
+    return int.from_bytes(blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """가상 노드를 둔 consistent hash ring (생성 후 변경하지 않음)"""
+
+    __slots__ = ("members", "vnodes", "_points", "_owners")
+
+    def __init__(self, members: Iterable[str], vnodes: int = DEFAULT_VNODES):
+        """
+        Args:
+            members: 멤버 식별자 (중복은 무시)
+            vnodes: 멤버당 가상 노드 수 (많을수록 분배가 고르지만 링 생성 비용 증가)
+        """
+        if vnodes <= 0:
+            raise ValueError("vnodes must be positive")
+        self.members = tuple(sorted(set(members)))
+        self.vnodes = vnodes
+
+        points = sorted(
+            (stable_hash(f"{member}#{i}"), member)
+            for member in self.members
+            for i in range(vnodes)
+        )
+        self._points = [p for p, _ in points]
+        self._owners = [m for _, m in points]
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def owner(self, key: str) -> Optional[str]:
+        """key 를 맡는 멤버 (멤버가 없으면 None)"""
+        if not self._points:
+            return None
+        index = bisect_right(self._points, stable_hash(key))
+        return self._owners[index % len(self._owners)]
+
+    def assign(self, keys: Iterable[str]) -> Dict[str, List[str]]:
+        """멤버별로 맡는 key 목록 (key 가 없는 멤버도 빈 목록으로 포함)"""
+        assignment: Dict[str, List[str]] = {member: [] for member in self.members}
+        for key in keys:
+            member = self.owner(key)
+            if member is not None:
+                assignment[member].append(key)
+        return assignment
@@ -0,0 +1,262 @@
+# app/domain/heavy_hitters.py
+"""
+고카디널리티 에러 시그니처의 heavy hitter (top-K) 추적
+
+공개 API:
+- CountMinSketch(width, depth): 고정 크기 빈도 추정기 (conservative update)
+- HeavyHitterTracker(dimensions, window, top_k): dimension 별 시간 윈도우 top-K
+  - add(dimension, value) / record(event): 이벤트 반영
+  - top(dimension, n, previous=False): (값, 추정 건수) 목록
+  - snapshot(): /stats/top 응답용 dict
+
+구조:
+- dimension(failure_reason, project, fingerprint, ...) 마다 현재/직전 윈도우 두 개를 둔다.
+- 윈도우 하나 = CountMinSketch + space-saving 방식 top-K 후보 테이블.
+  후보가 가득 찼을 때 최소 후보보다 추정치가 큰 값이 오면 최소 후보를 교체한다.
+  (교체 시 건수는 min+1 대신 sketch 추정치를 사용)
+- 윈도우가 넘어가면 현재 → 직전으로 돌리고 배열을 제자리에서 비우므로
+  메모리는 O(dimension 수 × (width × depth + top_k)) 로 고정이다.
+- 이벤트당 비용은 O(depth) (최소 후보 재계산은 top_k 크기에 한정).
+
+추정치는 실제 건수보다 작지 않으며, 해시 충돌만큼 과대 추정될 수 있다.
+"""
+from __future__ import annotations
+
+from array import array
+from datetime import timedelta
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import time
+
+from app.domain.events import EVENT_DIMENSIONS, VTErrorEvent
+
+DEFAULT_DIMENSIONS = ("failure_reason", "project", "fingerprint")
+DEFAULT_WINDOW = timedelta(minutes=5)
+DEFAULT_TOP_K = 10
+DEFAULT_SKETCH_WIDTH = 2048
+DEFAULT_SKETCH_DEPTH = 4
+
+_HASH_MASK = (1 << 64) - 1
+_LOW_MASK = (1 << 32) - 1
+
+
+class CountMinSketch:
+    """
+    Count-min sketch (depth 개 행 × width 개 카운터)
+
+    행별 인덱스는 hash() 한 번으로 double hashing (h1 + i*h2) 해서 구한다.
+    conservative update: 최솟값인 카운터만 올려 과대 추정을 줄인다.
+    """
+
+    __slots__ = ("width", "depth", "_counts")
+
+    def __init__(self, width: int = DEFAULT_SKETCH_WIDTH, depth: int = DEFAULT_SKETCH_DEPTH):
+        if width <= 0 or depth <= 0:
+            raise ValueError("width and depth must be positive")
+        self.width = width
+        self.depth = depth
+        self._counts = array("I", [0]) * (width * depth)
+
+    def _indexes(self, value: str) -> List[int]:
+        h = hash(value) & _HASH_MASK
+        h1 = h & _LOW_MASK
+        h2 = (h >> 32) | 1
+        width = self.width
+        return [i * width + (h1 + i * h2) % width for i in range(self.depth)]
+
+    def add(self, value: str) -> int:
+        """value 를 1 증가시키고 증가 후 추정치를 반환한다."""
+        counts = self._counts
+        indexes = self._indexes(value)
+        estimate = min(counts[i] for i in indexes) + 1
+        for i in indexes:
+            if counts[i] < estimate:
+                counts[i] = estimate
+        return estimate
+
+    def estimate(self, value: str) -> int:
+        """value 의 추정 건수"""
+        counts = self._counts
+        return min(counts[i] for i in self._indexes(value))
+
+    def clear(self) -> None:
+        counts = self._counts
+        for i in range(len(counts)):
+            counts[i] = 0
+
+
+class _WindowTopK:
+    """윈도우 하나의 sketch + top-K 후보 테이블"""
+
+    __slots__ = ("sketch", "k", "candidates", "total", "_min_key")
+
+    def __init__(self, k: int, width: int, depth: int):
+        self.sketch = CountMinSketch(width, depth)
+        self.k = k
+        self.candidates: Dict[str, int] = {}
+        self.total = 0
+        self._min_key: Optional[str] = None  # None 이면 다시 계산 필요
+
+    def add(self, value: str) -> None:
+        self.total += 1
+        estimate = self.sketch.add(value)
+        candidates = self.candidates
+
+        if value in candidates:
+            candidates[value] = estimate
+            if value == self._min_key:
+                self._min_key = None
+            return
+
+        if len(candidates) < self.k:
+            candidates[value] = estimate
+            self._min_key = None
+            return
+
+        min_key = self._min_key
+        if min_key is None:
+            min_key = self._min_key = min(candidates, key=candidates.__getitem__)
+        if estimate > candidates[min_key]:
+            del candidates[min_key]
+            candidates[value] = estimate
+            self._min_key = None
+
+    def top(self, n: int) -> List[Tuple[str, int]]:
+        ranked = sorted(self.candidates.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:n]
+
+    def clear(self) -> None:
+        self.sketch.clear()
+        self.candidates.clear()
+        self.total = 0
+        self._min_key = None
+
+
+class HeavyHitterTracker:
+    """
+    dimension 별 고정 메모리 top-K 추적기 (tumbling window)
+    """
+
+    def __init__(
+        self,
+        dimensions: Iterable[str] = DEFAULT_DIMENSIONS,
+        window: timedelta = DEFAULT_WINDOW,
+        top_k: int = DEFAULT_TOP_K,
+        width: int = DEFAULT_SKETCH_WIDTH,
+        depth: int = DEFAULT_SKETCH_DEPTH,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            dimensions: 추적할 VTErrorEvent 속성 이름 (필드 또는 fingerprint)
+            window: 윈도우 길이
+            top_k: dimension 별로 유지할 후보 수
+            width / depth: count-min sketch 크기
+            clock: 현재 시각 (epoch 초)
+
+        Raises:
+            ValueError: VTErrorEvent 에 없는 필드이거나 크기 설정이 잘못된 경우
+        """
+        self.dimensions: Tuple[str, ...] = tuple(dict.fromkeys(dimensions))
+        unknown = [d for d in self.dimensions if d not in EVENT_DIMENSIONS]
+        if unknown:
+            raise ValueError(f"unknown heavy hitter dimension(s): {', '.join(unknown)}")
+        if top_k <= 0:
+            raise ValueError("top_k must be positive")
+        self.window_seconds = window.total_seconds()
+        if self.window_seconds <= 0:
+            raise ValueError("window must be positive")
+
+        self.top_k = top_k
+        self._clock = clock
+        self._extractors: Tuple[Tuple[str, Callable[[Any], Optional[str]]], ...] = tuple(
+            (d, attrgetter(d)) for d in self.dimensions
+        )
+        self._current = {d: _WindowTopK(top_k, width, depth) for d in self.dimensions}
+        self._previous = {d: _WindowTopK(top_k, width, depth) for d in self.dimensions}
+        self._window_id = self._window_of(clock())
+
+    def _window_of(self, now: float) -> int:
+        return int(now // self.window_seconds)
+
+    def _rotate(self) -> None:
+        """윈도우가 넘어갔으면 현재 → 직전으로 돌리고 현재 윈도우를 비운다."""
+        window_id = self._window_of(self._clock())
+        if window_id == self._window_id:
+            return
+        if window_id == self._window_id + 1:
+            self._current, self._previous = self._previous, self._current
+            for counter in self._current.values():
+                counter.clear()
+        else:
+            for counter in self._current.values():
+                counter.clear()
+            for counter in self._previous.values():
+                counter.clear()
+        self._window_id = window_id
+
+    def add(self, dimension: str, value: Optional[str]) -> None:
+        """dimension 에 값 하나를 반영한다 (빈 값은 무시)."""
+        if not value:
+            return
+        self._rotate()
+        self._current[dimension].add(value)
+
+    def record(self, event: VTErrorEvent) -> None:
+        """이벤트의 모든 dimension 값을 반영한다."""
+        self._rotate()
+        current = self._current
+        for dimension, extract in self._extractors:
+            value = extract(event)
+            if value:
+                current[dimension].add(value)
+
+    def top(
+        self,
+        dimension: str,
+        n: Optional[int] = None,
+        previous: bool = False,
+    ) -> List[Tuple[str, int]]:
+        """
+        추정 건수 내림차순 (값, 건수) 목록
+
+        Raises:
+            KeyError: 추적하지 않는 dimension
+        """
+        self._rotate()
+        windows = self._previous if previous else self._current
+        return windows[dimension].top(n or self.top_k)
+
+    def estimate(self, dimension: str, value: str) -> int:
+        """현재 윈도우에서 value 의 추정 건수"""
+        self._rotate()
+        return self._current[dimension].sketch.estimate(value)
+
+    def snapshot(self, n: Optional[int] = None) -> Dict[str, Any]:
+        """현재/직전 윈도우의 dimension 별 top-K"""
+        self._rotate()
+        n = n or self.top_k
+
+        def _window(windows: Dict[str, _WindowTopK]) -> Dict[str, Any]:
+            return {
+                d: {
+                    "total": w.total,
+                    "top": [{"value": v, "count": c} for v, c in w.top(n)],
+                }
+                for d, w in windows.items()
+            }
+
+        return {
+            "window_seconds": self.window_seconds,
+            "window_start": self._window_id * self.window_seconds,
+            "current": _window(self._current),
+            "previous": _window(self._previous),
+        }
+
+    def reset(self) -> None:
+        """모든 윈도우 초기화"""
+        for counter in self._current.values():
+            counter.clear()
+        for counter in self._previous.values():
+            counter.clear()
+        self._window_id = self._window_of(self._clock())
@@ -0,0 +1,68 @@
+# app/domain/incident_classifier.py
+"""
+Feed2 Description → IncidentType 분류기
+
+공개 API:
+- DescriptionClassifier(patterns): (문구, IncidentType) 테이블을 하나의 매처로 컴파일
+- classify_description(description): 기본 테이블(MONITORING_INCIDENT_PATTERNS) 기준 분류
+
+- 문구 전체를 KeywordMatcher 하나로 묶어 텍스트를 한 번만 스캔한다.
+- 여러 문구가 매칭되면 (서로 겹치더라도) 테이블에서 먼저 나온 문구(우선순위 높음)를 택한다.
+- 같은 Description 이 반복되므로 결과는 LRU 캐시에 보관한다.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+
+from app.domain.incident_config import MONITORING_INCIDENT_PATTERNS
+from app.domain.incident_type import IncidentType
+from app.domain.keyword_matcher import KeywordMatcher
+
+
+class DescriptionClassifier:
+    """우선순위가 있는 문구 테이블 기반 IncidentType 분류기"""
+
+    def __init__(
+        self,
+        patterns: Iterable[Tuple[str, IncidentType]],
+        cache_size: int = 1024,
+    ):
+        """
+        Args:
+            patterns: (문구, IncidentType) 목록, 앞쪽일수록 우선순위 높음
+            cache_size: Description 결과 LRU 캐시 크기
+        """
+        # 키워드 → (우선순위, IncidentType), 중복 문구는 먼저 나온 것 유지
+        self._table: Dict[str, Tuple[int, IncidentType]] = {}
+        for priority, (phrase, incident_type) in enumerate(patterns):
+            self._table.setdefault(phrase, (priority, incident_type))
+
+        self._matcher = KeywordMatcher(self._table, ignore_case=True)
+        self.classify = lru_cache(maxsize=cache_size)(self._classify)
+
+    def _classify(self, description: str) -> Optional[IncidentType]:
+        """
+        Description 한 번 스캔으로 가장 우선순위가 높은 IncidentType 을 찾는다.
+        (겹치는 문구도 모두 확인)
+        """
+        best: Optional[Tuple[int, IncidentType]] = None
+        for _, keyword in self._matcher.finditer_overlapping(description):
+            entry = self._table[keyword]
+            if entry[0] == 0:
+                return entry[1]
+            if best is None or entry[0] < best[0]:
+                best = entry
+        return best[1] if best else None
+
+    def cache_clear(self) -> None:
+        """결과 캐시 초기화"""
+        self.classify.cache_clear()
+
+
+_default_classifier = DescriptionClassifier(MONITORING_INCIDENT_PATTERNS)
+
+
+def classify_description(description: str) -> Optional[IncidentType]:
+    """기본 테이블(MONITORING_INCIDENT_PATTERNS) 기준 Description 분류"""
+    return _default_classifier.classify(description)
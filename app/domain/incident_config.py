@@ -10,6 +10,7 @@ class IncidentThreshold:
     count: int                    # threshold 건수
     same_minute_count: int | None # 동일 분 기준 (None이면 사용 안 함)
     cooldown: timedelta           # 쿨다운
+    resolution: timedelta | None = None  # 윈도우 slot 단위 (None이면 이벤트별 정확 윈도우, 기본값)
 
 
 INCIDENT_THRESHOLDS: dict[IncidentType, IncidentThreshold] = {
@@ -18,6 +19,8 @@ INCIDENT_THRESHOLDS: dict[IncidentType, IncidentThreshold] = {
         count=3,
         same_minute_count=None,
         cooldown=timedelta(minutes=10),
+        # 정확 윈도우 (기본). 타임아웃 폭주 시 메모리를 고정하려면 resolution 지정 (opt-in)
+        # ex. resolution=timedelta(seconds=10) → 360 slot, 윈도우 가장 오래된 쪽 10초 미만 누락 가능
     ),
     IncidentType.API_ERROR: IncidentThreshold(
         window=timedelta(minutes=5),
@@ -43,4 +46,12 @@ INCIDENT_THRESHOLDS: dict[IncidentType, IncidentThreshold] = {
         same_minute_count=None,
         cooldown=timedelta(minutes=10),
     ),
-}
\ No newline at end of file
+}
+
+# Feed2 Description → IncidentType 매핑 (위에 있을수록 우선순위 높음, 대소문자 무시)
+MONITORING_INCIDENT_PATTERNS: tuple[tuple[str, IncidentType], ...] = (
+    ("더빙/오디오 생성 실패", IncidentType.LIVE_API_DB_OVERLOAD),
+    ("youtube url 다운로드 실패", IncidentType.YT_DOWNLOAD_FAIL),
+    ("외부 url 다운로드 실패", IncidentType.YT_EXTERNAL_FAIL),
+    ("video 파일 업로드 실패", IncidentType.YT_EXTERNAL_FAIL),
+)
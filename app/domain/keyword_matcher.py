@@ -0,0 +1,178 @@
+# app/domain/keyword_matcher.py
+"""
+다중 키워드 매처
+
+공개 API:
+- KeywordMatcher(keywords): 키워드 목록을 하나의 정규식으로 컴파일
+  - search(*fields): 여러 필드를 이어 붙이지 않고 순서대로 스캔, 처음 매칭된 키워드 반환
+  - finditer(text): 텍스트 안의 모든 매칭 (시작 위치, 키워드), 겹치지 않음
+  - finditer_overlapping(text): 겹치는 매칭까지 모두 (같은 위치에서 시작하는 짧은 키워드 포함)
+
+키워드 목록을 trie 로 묶은 뒤 정규식으로 변환하기 때문에
+(ex. VT5001|VT5002|VT5101 -> VT5(?:00[12]|101))
+각 위치에서의 분기는 공통 접두사 단위로만 일어나고,
+키워드가 수백 개로 늘어나도 매칭 비용이 키워드 수에 비례해 늘지 않는다.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+import re
+
+_END = ""  # trie 에서 키워드 종료를 표시하는 키
+_FOLDED_CACHE_SIZE = 1024  # lower() 로 찾지 못한 매칭 캐시 상한
+
+
+def _build_trie(keywords: Iterable[str]) -> Dict[str, dict]:
+    root: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = root
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[_END] = {}
+    return root
+
+
+def _trie_to_pattern(node: Dict[str, dict]) -> str:
+    """trie 노드를 정규식 문자열로 변환 (긴 키워드 우선)"""
+    terminal = _END in node
+    singles = []
+    branches = []
+    for ch in sorted(k for k in node if k != _END):
+        child = node[ch]
+        if list(child) == [_END]:
+            singles.append(re.escape(ch))
+        else:
+            branches.append(re.escape(ch) + _trie_to_pattern(child))
+
+    if len(singles) == 1:
+        branches.append(singles[0])
+    elif singles:
+        branches.append("[" + "".join(singles) + "]")
+
+    if not branches:
+        return ""
+
+    body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if terminal:
+        if len(branches) == 1 and len(body) > 1 and not body.startswith(("(?:", "[")):
+            body = "(?:" + body + ")"
+        return body + "?"
+    return body
+
+
+class KeywordMatcher:
+    """
+    키워드 목록을 한 번만 컴파일해 두고 재사용하는 매처
+    """
+
+    __slots__ = ("keywords", "_pattern", "_overlapping", "_canonical", "_lengths", "_flags", "_folded")
+
+    def __init__(self, keywords: Iterable[str], ignore_case: bool = False):
+        """
+        Args:
+            keywords: 매칭할 키워드 목록 (빈 문자열/중복은 무시)
+            ignore_case: 대소문자 무시 여부
+        """
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(k for k in keywords if k))
+
+        normalized = [k.lower() for k in self.keywords] if ignore_case else list(self.keywords)
+        # 매칭된 문자열 → 원래 키워드
+        self._canonical: Dict[str, str] = {}
+        for norm, keyword in zip(normalized, self.keywords):
+            self._canonical.setdefault(norm, keyword)
+
+        # 같은 위치에서 시작하는 키워드는 가장 긴 매칭의 접두사 → 이 길이만 확인
+        self._lengths: Tuple[int, ...] = tuple(sorted({len(k) for k in self._canonical}))
+
+        self._flags = re.IGNORECASE if ignore_case else 0
+        # lower() 로 찾을 수 없는 대소문자 매칭 (ex. İ, ı, ſ) → 키워드 캐시
+        self._folded: Dict[str, Optional[str]] = {}
+
+        self._pattern: Optional[re.Pattern[str]] = None
+        self._overlapping: Optional[re.Pattern[str]] = None
+        if self.keywords:
+            flags = self._flags
+            pattern = _trie_to_pattern(_build_trie(self._canonical))
+            self._pattern = re.compile(pattern, flags)
+            # 폭 0 lookahead → 모든 시작 위치에서 가장 긴 매칭
+            self._overlapping = re.compile(f"(?=({pattern}))", flags)
+
+    def _keyword_of(self, matched: str) -> Optional[str]:
+        """
+        매칭된 문자열 → 원래 키워드 (키워드가 아니면 None)
+
+        정규식의 대소문자 무시 규칙은 lower() 와 다르다 (ex. "VİDEO" 는 video 에 매칭되지만
+        lower() 는 "vi̇deo"). lower() 로 못 찾으면 같은 길이의 키워드를 정규식으로 직접 비교한다.
+        """
+        keyword = self._canonical.get(matched)
+        if keyword is not None or not self._flags:
+            return keyword
+        keyword = self._canonical.get(matched.lower())
+        if keyword is not None:
+            return keyword
+        try:
+            return self._folded[matched]
+        except KeyError:
+            pass
+        keyword = next(
+            (k for k in self.keywords
+             if len(k) == len(matched) and re.fullmatch(re.escape(k), matched, self._flags)),
+            None,
+        )
+        if len(self._folded) < _FOLDED_CACHE_SIZE:
+            self._folded[matched] = keyword
+        return keyword
+
+    def search(self, *fields: Optional[str]) -> Optional[str]:
+        """
+        필드를 순서대로 스캔하여 처음 매칭된 키워드를 반환한다.
+
+        Returns:
+            매칭된 키워드 (없으면 None)
+        """
+        if self._pattern is None:
+            return None
+        search = self._pattern.search
+        for field in fields:
+            if field:
+                m = search(field)
+                if m is not None:
+                    keyword = self._keyword_of(m.group(0))
+                    if keyword is not None:
+                        return keyword
+        return None
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, str]]:
+        """텍스트 안의 모든 (시작 위치, 키워드) 매칭"""
+        if self._pattern is None or not text:
+            return
+        for m in self._pattern.finditer(text):
+            keyword = self._keyword_of(m.group(0))
+            if keyword is not None:
+                yield m.start(), keyword
+
+    def finditer_overlapping(self, text: str) -> Iterator[Tuple[int, str]]:
+        """
+        텍스트 안의 모든 (시작 위치, 키워드) 매칭 (겹치는 매칭 포함)
+
+        finditer 는 앞선 매칭이 차지한 구간을 건너뛰므로 그 안에서 시작하거나
+        더 긴 키워드의 접두사인 키워드는 나오지 않는다. 여기서는 위치마다
+        가장 긴 매칭과 그 접두사 중 키워드인 것을 모두 돌려준다.
+        """
+        if self._overlapping is None or not text:
+            return
+        keyword_of = self._keyword_of
+        for m in self._overlapping.finditer(text):
+            matched = m.group(1)
+            for length in self._lengths:
+                if length > len(matched):
+                    break
+                keyword = keyword_of(matched[:length])
+                if keyword is not None:
+                    yield m.start(), keyword
+
+    def __bool__(self) -> bool:
+        return self._pattern is not None
+
+    def __repr__(self) -> str:
+        return f"KeywordMatcher({len(self.keywords)} keywords)"
@@ -0,0 +1,55 @@
+# app/domain/normalization.py
+"""
+텍스트 정규화 유틸리티
+
+공개 API:
+- strip_html_tags(text): HTML 태그 제거 (로그 출력용)
+- extract_failure_reason(error_detail): Error Detail 에서 Failure Reason 추출
+
+장애 상황에서는 동일한 에러 문자열이 수천 번 반복되므로
+정규식은 모듈 로드 시 한 번만 컴파일하고, 결과는 raw 문자열을 키로 하는
+bounded LRU 캐시에 보관한다.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Optional
+import re
+
+# 캐시 최대 크기 (raw 문자열 기준)
+NORMALIZE_CACHE_SIZE = 1024
+
+_HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+_FAILURE_REASON_PATTERN = re.compile(r"Failure Reason:\s*([A-Z0-9_]+)")
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def strip_html_tags(text: str) -> str:
+    """
+    HTML 태그를 한 번의 스캔으로 제거한다.
+
+    태그가 없는 문자열은 정규식을 거치지 않고 그대로 돌려준다.
+    ex) "<p>영상 생성 실패</p>" -> "영상 생성 실패"
+    """
+    if "<" not in text:
+        return text
+    return _HTML_TAG_PATTERN.sub("", text)
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def extract_failure_reason(error_detail: str) -> Optional[str]:
+    """
+    Error Detail 문자열에서 Failure Reason 코드를 추출한다.
+
+    ex) "Failure Reason: TIMEOUT ..." -> "TIMEOUT"
+    """
+    if not error_detail:
+        return None
+    m = _FAILURE_REASON_PATTERN.search(error_detail)
+    return m.group(1) if m else None
+
+
+def clear_caches() -> None:
+    """테스트에서 정규화 캐시를 초기화할 때 사용한다."""
+    strip_html_tags.cache_clear()
+    extract_failure_reason.cache_clear()
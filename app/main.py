@@ -1,11 +1,11 @@
 # app/main.py
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Query
 from contextlib import asynccontextmanager
 import asyncio
 import logging
 
+from app import metrics
 from app.logging_config import setup_logging
-from app.domain.anomaly import reset_state
 from app.adapters.graph_client import GraphClient
 from app.application.services.message_poller import MessagePoller
 from app.container import init_container, get_container
@@ -16,6 +16,15 @@ logger = logging.getLogger(__name__)
 poller: MessagePoller | None = None
 
 
+async def _cancel_and_wait(task: asyncio.Task) -> None:
+    """백그라운드 task 취소 후 끝날 때까지 대기"""
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """앱 시작/종료 시 실행"""
@@ -29,21 +38,70 @@ async def lifespan(app: FastAPI):
     logger.info("🚀 Starting VT Error Feed Filter Server")
     logger.info("=" * 80)
 
-    # 1. 의존성 컨테이너 초기화
-    init_container()
+    # 1. 의존성 컨테이너 초기화 (+ Teams webhook 연결 풀)
+    container = init_container()
+    container.notifier.open()
+    if container.outbox:
+        await container.outbox.start()
+    digest_task = None
+    if container.forward_digest:
+        digest_task = asyncio.create_task(container.forward_digest.run())
+
+    # 2. 탐지 상태 복원 (폴링 시작 전) + 주기 저장
+    snapshot_service = container.snapshot_service
+    snapshot_task = None
+    if snapshot_service:
+        await snapshot_service.restore()
+        snapshot_task = asyncio.create_task(snapshot_service.run())
     
-    # 2. Graph API 클라이언트 생성
+    # 3. Graph API 클라이언트 생성
     graph_client = GraphClient()
     
-    # 3. Message Poller 생성 및 시작
-    poller = MessagePoller(graph_client)
-    asyncio.create_task(poller.start())
+    # 4. 리더 선출 (리더 worker 만 polling)
+    leader = container.leader_elector
+    leader_task = None
+    if leader:
+        await leader.try_acquire()
+        leader_task = asyncio.create_task(leader.run())
+
+    # 5. Message Poller 생성 및 시작 (sharded 모드면 맡은 채널만)
+    shards = container.shard_coordinator
+    poller = MessagePoller(
+        graph_client,
+        leader=leader,
+        channels=container.poll_channels,
+        shards=shards,
+    )
+    poller_task = asyncio.create_task(poller.start())
     
     yield
 
     # Shutdown
     if poller:
         poller.stop()
+        # 처리 중이던 메시지가 끝난 뒤에 리스 반납 / notifier 종료
+        await _cancel_and_wait(poller_task)
+
+    if leader:
+        leader.stop()
+        # 진행 중인 리스 갱신이 끝난 뒤에 반납 (반납 뒤에 갱신이 커밋되지 않도록)
+        await _cancel_and_wait(leader_task)
+        await leader.release()
+
+    if shards:
+        await shards.leave()
+
+    if snapshot_service:
+        snapshot_service.stop()
+        # 진행 중인 주기 저장이 끝난 뒤에 마지막 저장 (오래된 스냅샷이 나중에 덮어쓰지 않도록)
+        await _cancel_and_wait(snapshot_task)
+        await snapshot_service.save(force=True)
+
+    if digest_task:
+        # 진행 중인 flush 가 끝난 뒤에 container.close() (남은 digest 전송 → notifier 종료)
+        await _cancel_and_wait(digest_task)
+
+    await container.close()
 
     logger.info("=" * 80)
     logger.info("👋 Shutting down VT Error Feed Filter Server")
@@ -64,12 +122,62 @@ async def health():
     return {
         "status": "ok",
         "poller_running": poller.running if poller else False,
+        "leader": container.leader_elector.is_leader if container.leader_elector else None,
         "container_initialized": container is not None
     }
 
 
+@app.get("/metrics")
+async def get_metrics():
+    """프로세스 내 메트릭 조회 (+ Teams 전송 속도 제한 상태)"""
+    snapshot = metrics.snapshot()
+    limiter = get_container().notifier.rate_limiter
+    if limiter is not None:
+        snapshot["teams_rate_limits"] = limiter.snapshot()
+    return snapshot
+
+
+@app.get("/stats/top")
+async def top_offenders(dimension: str | None = None, n: int | None = Query(None, ge=1)):
+    """failure_reason / project / fingerprint 별 top-K (현재/직전 윈도우)"""
+    tracker = get_container().heavy_hitters
+    if dimension is None:
+        return tracker.snapshot(n)
+    if dimension not in tracker.dimensions:
+        raise HTTPException(status_code=404, detail=f"unknown dimension: {dimension}")
+    return {
+        "dimension": dimension,
+        "current": [{"value": v, "count": c} for v, c in tracker.top(dimension, n)],
+        "previous": [{"value": v, "count": c} for v, c in tracker.top(dimension, n, previous=True)],
+    }
+
+
+@app.get("/stats/outbox")
+async def outbox_stats(limit: int = 20):
+    """outbox 대기 건수, lane 별 지연/SLO + 최근 dead letter"""
+    outbox = get_container().outbox
+    if outbox is None:
+        raise HTTPException(status_code=404, detail="outbox is disabled")
+    dead = await outbox.store.dead_letters(limit)
+    return {
+        "pending": await outbox.store.pending(),
+        "lanes": outbox.lane_stats(),
+        "dead_letters": [
+            {
+                "id": m.id,
+                "channel": m.channel,
+                "attempts": m.attempts,
+                "error": m.last_error,
+                "enqueued_at": m.enqueued_at,
+                "title": m.card.get("title") or m.card.get("summary"),
+            }
+            for m in dead
+        ],
+    }
+
+
 @app.post("/debug/reset")
 async def reset():
     """장애 상태 리셋 (디버깅용)"""
-    reset_state()
+    await get_container().anomaly_state.reset()
     return {"status": "reset"}
\ No newline at end of file
@@ -0,0 +1,65 @@
+"""
+프로세스 내 메트릭 레지스트리
+
+- increment(name, value): 카운터 증가
+- observe(name, value): 값 관측 (count / sum / max 집계)
+- snapshot(): 현재 메트릭 값 반환 (/metrics 엔드포인트용)
+- reset(): 테스트용 초기화
+
+외부 메트릭 시스템 없이 단일 프로세스 안에서만 집계한다.
+"""
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict
+
+
+_counters: DefaultDict[str, int] = defaultdict(int)
+
+# name -> [count, sum, max]
+_observations: Dict[str, list] = {}
+
+
+def increment(name: str, value: int = 1) -> None:
+    """카운터를 value 만큼 증가시킨다."""
+    _counters[name] += value
+
+
+def observe(name: str, value: float) -> None:
+    """관측값을 기록한다. (count / sum / max 만 유지)"""
+    stat = _observations.get(name)
+    if stat is None:
+        _observations[name] = [1, value, value]
+        return
+    stat[0] += 1
+    stat[1] += value
+    if value > stat[2]:
+        stat[2] = value
+
+
+def get_counter(name: str) -> int:
+    """카운터 현재 값"""
+    return _counters.get(name, 0)
+
+
+def snapshot() -> Dict[str, Any]:
+    """
+    현재 메트릭 스냅샷
+
+    Returns:
+        {"counters": {...}, "observations": {name: {"count", "sum", "max", "avg"}}}
+    """
+    observations = {
+        name: {
+            "count": count,
+            "sum": total,
+            "max": maximum,
+            "avg": total / count if count else 0.0,
+        }
+        for name, (count, total, maximum) in _observations.items()
+    }
+    return {"counters": dict(_counters), "observations": observations}
+
+
+def reset() -> None:
+    """테스트에서 메트릭을 초기화할 때 사용한다."""
+    _counters.clear()
+    _observations.clear()
@@ -0,0 +1,57 @@
+# benchmarks/bench_anomaly.py
+"""
+AnomalyDetector.record_event 벤치마크
+
+동일 분 기준(API_ERROR)에 대해 minute bucket 이력(0 ~ 120분)을 먼저 채운 뒤,
+이벤트 1건 기록 비용이 이력 길이와 무관하게 일정한지 확인한다.
+dimension 키 수(1 ~ 5000)를 늘려도 비용이 같은지도 확인한다.
+
+실행:
+    PYTHONPATH=. python benchmarks/bench_anomaly.py
+"""
+from datetime import datetime, timedelta
+import logging
+import timeit
+
+from app.domain.anomaly import AnomalyDetector
+from app.domain.incident_type import IncidentType
+
+
+def _prepared_detector(history_minutes: int, base: datetime) -> AnomalyDetector:
+    detector = AnomalyDetector()
+    for minute in range(history_minutes):
+        detector.record_event(IncidentType.API_ERROR, base + timedelta(minutes=minute))
+    return detector
+
+
+def main(n: int = 20_000) -> None:
+    logging.disable(logging.CRITICAL)
+    base = datetime(2025, 1, 1, 0, 0, 0)
+
+    for history in (0, 30, 60, 120):
+        detector = _prepared_detector(history, base)
+        now = base + timedelta(minutes=history)
+        timestamps = [now + timedelta(milliseconds=i) for i in range(n)]
+
+        def run():
+            for ts in timestamps:
+                detector.record_event(IncidentType.API_ERROR, ts)
+
+        best = min(timeit.repeat(run, number=1, repeat=3))
+        print(f"history={history:>3}min  {best / n * 1e6:6.2f} us/event")
+
+    for keys in (1, 100, 5000):
+        detector = AnomalyDetector()
+        dimensions = [f"project-{i % keys}" for i in range(n)]
+        timestamps = [base + timedelta(milliseconds=i) for i in range(n)]
+
+        def run_keys():
+            for ts, dimension in zip(timestamps, dimensions):
+                detector.record_event(IncidentType.API_ERROR, ts, dimension)
+
+        best = min(timeit.repeat(run_keys, number=1, repeat=3))
+        print(f"keys={keys:>5}       {best / n * 1e6:6.2f} us/event  (tracked={len(detector)})")
+
+
+if __name__ == "__main__":
+    main()
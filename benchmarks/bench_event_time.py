@@ -0,0 +1,59 @@
+# benchmarks/bench_event_time.py
+"""
+이벤트 시각 파서 벤치마크
+
+- legacy: 기존 split + 패딩 + fromisoformat 구현
+- hit: VT 기본 포맷 (fast path 적중)
+- miss: 오프셋 포맷 (fast path 미스 → 정규식 경로)
+
+실행:
+    PYTHONPATH=. python benchmarks/bench_event_time.py
+"""
+from datetime import datetime, timedelta, timezone
+import timeit
+
+from app.domain.event_time import parse_event_time
+
+
+def _legacy_parse(raw: str) -> datetime:
+    before_z = raw.split("Z", 1)[0]
+    if "." in before_z:
+        date_part, frac = before_z.split(".", 1)
+        frac = (frac + "000000")[:6]
+        trimmed = f"{date_part}.{frac}"
+    else:
+        trimmed = before_z
+    dt = datetime.fromisoformat(trimmed)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def _make_inputs(n: int, suffix: str) -> list[str]:
+    base = datetime(2025, 12, 9, 20, 10, 51, tzinfo=timezone.utc)
+    return [
+        (base + timedelta(milliseconds=i)).strftime("%Y-%m-%dT%H:%M:%S.%f") + suffix
+        for i in range(n)
+    ]
+
+
+def _bench(label: str, fn, inputs: list[str], repeat: int = 5) -> None:
+    def run():
+        for raw in inputs:
+            fn(raw)
+
+    best = min(timeit.repeat(run, number=1, repeat=repeat))
+    print(f"{label:<8} {best / len(inputs) * 1e9:8.1f} ns/op")
+
+
+def main(n: int = 50_000) -> None:
+    vt_inputs = _make_inputs(n, "041Z[Etc/UTC]")
+    offset_inputs = _make_inputs(n, "+0000[UTC]")
+
+    _bench("legacy", _legacy_parse, vt_inputs)
+    _bench("hit", parse_event_time, vt_inputs)
+    _bench("miss", parse_event_time, offset_inputs)
+
+
+if __name__ == "__main__":
+    main()
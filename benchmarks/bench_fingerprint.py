@@ -0,0 +1,57 @@
+# benchmarks/bench_fingerprint.py
+"""
+normalize_signature / fingerprint 벤치마크
+
+~4.5KB Java stack trace (첫 줄에만 요청 ID) 기준:
+- cold: 모든 캐시를 비운 상태
+- line-cache: raw 문자열은 매번 다르지만 frame 줄은 반복
+- hit: 같은 raw trace 반복
+
+실행:
+    PYTHONPATH=. python benchmarks/bench_fingerprint.py
+"""
+import random
+import timeit
+import uuid
+
+from app.domain.fingerprint import clear_caches, fingerprint, normalize_signature
+
+
+def _make_traces(n: int) -> list[str]:
+    frames = "\n".join(
+        f"\tat com.example.service.VideoTranslator{i % 7}.process(VideoTranslator.java:{random.randint(1, 999)})"
+        for i in range(60)
+    )
+    return [
+        f"java.lang.IllegalStateException: job {uuid.uuid4()} failed at 2025-12-09T20:10:51Z\n{frames}"
+        for _ in range(n)
+    ]
+
+
+def main(n: int = 5_000) -> None:
+    traces = _make_traces(n)
+
+    def cold():
+        clear_caches()
+        for t in traces[:200]:
+            normalize_signature(t)
+
+    def line_cache():
+        normalize_signature.cache_clear()
+        fingerprint.cache_clear()
+        for t in traces:
+            fingerprint(t)
+
+    def hit():
+        for t in traces[:1000]:
+            fingerprint(t)
+
+    print(f"trace size  {len(traces[0])} chars")
+    print(f"cold        {min(timeit.repeat(cold, number=1, repeat=3)) / 200 * 1e6:7.2f} us/trace")
+    print(f"line-cache  {min(timeit.repeat(line_cache, number=1, repeat=3)) / n * 1e6:7.2f} us/trace")
+    hit()
+    print(f"hit         {min(timeit.repeat(hit, number=1, repeat=3)) / 1000 * 1e6:7.2f} us/trace")
+
+
+if __name__ == "__main__":
+    main()
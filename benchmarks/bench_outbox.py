@@ -0,0 +1,60 @@
+# benchmarks/bench_outbox.py
+"""
+NotificationOutbox.enqueue 벤치마크 (요청 경로 비용)
+
+- enqueue (memory): 대기 메시지가 쌓이는 상태에서 접수만 (전송 없음)
+- enqueue (sqlite): 같은 접수 + group commit 으로 파일에 기록될 때까지 (flush 포함)
+
+실행:
+    PYTHONPATH=. python benchmarks/bench_outbox.py
+"""
+import asyncio
+import os
+import tempfile
+import time
+import timeit
+
+from app.adapters.memory_outbox import InMemoryOutboxStore
+from app.adapters.sqlite_outbox import SqliteOutboxStore
+from app.application.ports.notifier import FORWARD_CHANNEL, DeliveryResult
+from app.application.services.outbox import NotificationOutbox
+
+CARD = {"@type": "MessageCard", "title": "bench", "sections": [{"facts": [{"name": "a", "value": "b"}]}]}
+
+
+class _NullSender:
+    async def deliver(self, channel, card):
+        return DeliveryResult(ok=True, status=200)
+
+
+async def _sqlite_storm(n: int, batch: int) -> tuple[float, float]:
+    """batch 개씩 접수하고 이벤트 루프에 양보 (webhook 폭주 흉내) → (접수 us/건, 전체 기록 초)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SqliteOutboxStore(os.path.join(tmp, "outbox.db"))
+        await store.open()
+        outbox = NotificationOutbox(store, _NullSender())
+        enqueue_seconds = 0.0
+        started = time.perf_counter()
+        for _ in range(n // batch):
+            t0 = time.perf_counter()
+            for _ in range(batch):
+                outbox.enqueue(FORWARD_CHANNEL, CARD)
+            enqueue_seconds += time.perf_counter() - t0
+            await asyncio.sleep(0)
+        await store.close()
+        return enqueue_seconds / n * 1e6, time.perf_counter() - started
+
+
+def main(n: int = 100_000) -> None:
+    def enqueue():
+        outbox = NotificationOutbox(InMemoryOutboxStore(), _NullSender())
+        for _ in range(n):
+            outbox.enqueue(FORWARD_CHANNEL, CARD)
+
+    print(f"enqueue (memory) {min(timeit.repeat(enqueue, number=1, repeat=3)) / n * 1e6:7.2f} us/message")
+    per_message, total = asyncio.run(_sqlite_storm(n, batch=100))
+    print(f"enqueue (sqlite) {per_message:7.2f} us/message, {n / total:,.0f} messages/s durable")
+
+
+if __name__ == "__main__":
+    main()
@@ -161,6 +161,17 @@ def test_timeout_just_inside_window():
     result = record_event(IncidentType.TIMEOUT, make_time(base, 59))
     assert result is True
 
+
+def test_timeout_fires_with_oldest_event_under_one_second_inside_window():
+    """TIMEOUT: 기본은 정확 윈도우 → 가장 오래된 이벤트가 경계 1초 안쪽이어도 카운트"""
+    base = datetime(2025, 1, 1, 12, 0, 5)
+
+    record_event(IncidentType.TIMEOUT, base)
+    record_event(IncidentType.TIMEOUT, make_time(base, 30))
+
+    # 59분 59.5초 후 (slot 근사였다면 12:00:00~12:00:10 slot 이 빠져 2건)
+    assert record_event(IncidentType.TIMEOUT, base + timedelta(minutes=59, seconds=59.5)) is True
+
 # --- API_ERROR 테스트 (5분 내 5건 OR 동일 분 3건, 쿨다운 5분) --------------------------
 
 
@@ -615,3 +626,222 @@ def test_yt_external_exact_window_boundary_excluded():
 
 
 
+
+
+# --- AnomalyDetector 인스턴스 테스트 --------------------------------------------
+
+
+def test_detector_instances_have_isolated_state():
+    """AnomalyDetector 인스턴스끼리 상태 공유 안 함"""
+    from app.domain.anomaly import AnomalyDetector
+
+    base = datetime(2025, 1, 1, 12, 0, 0)
+    a = AnomalyDetector()
+    b = AnomalyDetector()
+
+    a.record_event(IncidentType.TIMEOUT, make_time(base, 0))
+    a.record_event(IncidentType.TIMEOUT, make_time(base, 10))
+
+    assert b.record_event(IncidentType.TIMEOUT, make_time(base, 20)) is False
+    assert a.record_event(IncidentType.TIMEOUT, make_time(base, 20)) is True
+
+
+def test_detector_uses_injected_thresholds():
+    """탐지기별 기준 설정 주입"""
+    from app.domain.anomaly import AnomalyDetector
+    from app.domain.incident_config import IncidentThreshold
+
+    detector = AnomalyDetector({
+        IncidentType.TIMEOUT: IncidentThreshold(
+            window=timedelta(minutes=1),
+            count=1,
+            same_minute_count=None,
+            cooldown=timedelta(minutes=1),
+        ),
+    })
+    base = datetime(2025, 1, 1, 12, 0, 0)
+
+    assert detector.record_event(IncidentType.TIMEOUT, base) is True
+    assert detector.record_event(IncidentType.API_ERROR, base) is False
+
+
+def test_detector_reset():
+    """reset() 은 해당 탐지기만 초기화"""
+    from app.domain.anomaly import AnomalyDetector
+
+    base = datetime(2025, 1, 1, 12, 0, 0)
+    detector = AnomalyDetector()
+    detector.record_event(IncidentType.TIMEOUT, make_time(base, 0))
+    detector.record_event(IncidentType.TIMEOUT, make_time(base, 10))
+
+    detector.reset()
+
+    assert detector.record_event(IncidentType.TIMEOUT, make_time(base, 20)) is False
+
+
+def test_container_shares_detector_between_services():
+    """ServiceContainer 는 하나의 탐지기를 IncidentService/MonitoringHandler 에 주입"""
+    from app.container import ServiceContainer
+
+    container = ServiceContainer()
+
+    assert container.incident_service.detector is container.anomaly_detector
+    assert container.monitoring_handler.detector is container.anomaly_detector
+
+
+# --- 순서 뒤바뀐 / 늦은 이벤트 테스트 --------------------------------------------
+
+
+def test_out_of_order_event_within_lateness_is_counted():
+    """허용 지연 내 늦은 이벤트는 윈도우에 반영"""
+    base = datetime(2025, 1, 1, 12, 0, 0)
+
+    assert record_event(IncidentType.TIMEOUT, make_time(base, 30)) is False
+    assert record_event(IncidentType.TIMEOUT, make_time(base, 40)) is False
+    # 3분 늦게 도착한 이벤트 (watermark 5분 이내)
+    assert record_event(IncidentType.TIMEOUT, make_time(base, 37)) is True
+
+
+def test_late_event_beyond_watermark_is_dropped_and_counted():
+    """watermark 보다 늦은 이벤트는 버리고 메트릭 증가"""
+    from app import metrics
+
+    metrics.reset()
+    base = datetime(2025, 1, 1, 12, 0, 0)
+
+    record_event(IncidentType.TIMEOUT, make_time(base, 30))
+    record_event(IncidentType.TIMEOUT, make_time(base, 40))
+
+    assert record_event(IncidentType.TIMEOUT, make_time(base, 20)) is False
+    assert metrics.get_counter("anomaly_late_events_dropped") == 1
+
+    # 버린 이벤트는 카운트에도 들어가지 않음 → 다음 이벤트가 3번째
+    assert record_event(IncidentType.TIMEOUT, make_time(base, 41)) is True
+
+
+def test_late_event_does_not_move_window_backwards():
+    """늦은 이벤트 기준으로 만료된 이벤트가 되살아나지 않음"""
+    from app.domain.anomaly import AnomalyDetector
+
+    detector = AnomalyDetector(allowed_lateness=timedelta(hours=2))
+    base = datetime(2025, 1, 1, 12, 0, 0)
+
+    detector.record_event(IncidentType.YT_DOWNLOAD_FAIL, make_time(base, 0))
+    detector.record_event(IncidentType.YT_DOWNLOAD_FAIL, make_time(base, 40))
+    # 시계는 40분, 윈도우(30분)는 10분 이후만 포함 → 5분 이벤트는 반영 안 됨
+    assert detector.record_event(IncidentType.YT_DOWNLOAD_FAIL, make_time(base, 5)) is False
+    assert detector.record_event(IncidentType.YT_DOWNLOAD_FAIL, make_time(base, 15)) is False
+    assert detector.record_event(IncidentType.YT_DOWNLOAD_FAIL, make_time(base, 41)) is True
+
+
+def test_cooldown_clock_does_not_move_backwards():
+    """늦은 이벤트가 쿨다운 시계를 되돌리지 않음"""
+    base = datetime(2025, 1, 1, 12, 0, 0)
+
+    record_event(IncidentType.API_ERROR, make_time(base, 10, 0))
+    record_event(IncidentType.API_ERROR, make_time(base, 10, 10))
+    assert record_event(IncidentType.API_ERROR, make_time(base, 10, 20)) is True
+
+    # 2분 늦은 이벤트들로 동일 분 3건 → 쿨다운(시계 10:20 기준) 중이라 suppress
+    record_event(IncidentType.API_ERROR, make_time(base, 8, 0))
+    record_event(IncidentType.API_ERROR, make_time(base, 8, 10))
+    assert record_event(IncidentType.API_ERROR, make_time(base, 8, 20)) is False
+
+    # 쿨다운은 마지막 알림(10:20) 기준 5분 → 15:20 이후 재트리거 가능
+    record_event(IncidentType.API_ERROR, make_time(base, 15, 30))
+    record_event(IncidentType.API_ERROR, make_time(base, 15, 40))
+    assert record_event(IncidentType.API_ERROR, make_time(base, 15, 50)) is True
+
+
+# --- dimension 별 탐지 테스트 ----------------------------------------------------
+
+
+def test_dimensions_are_counted_separately():
+    """같은 유형이라도 dimension 이 다르면 따로 집계"""
+    base = datetime(2025, 1, 1, 12, 0, 0)
+
+    record_event(IncidentType.TIMEOUT, make_time(base, 0), "project-a")
+    record_event(IncidentType.TIMEOUT, make_time(base, 10), "project-a")
+    assert record_event(IncidentType.TIMEOUT, make_time(base, 20), "project-b") is False
+    assert record_event(IncidentType.TIMEOUT, make_time(base, 30), "project-a") is True
+
+
+def test_cooldown_is_per_dimension():
+    """한 dimension 의 쿨다운이 다른 dimension 알림을 막지 않음"""
+    base = datetime(2025, 1, 1, 12, 0, 0)
+
+    for i in range(3):
+        record_event(IncidentType.TIMEOUT, make_time(base, i), "noisy")
+    assert record_event(IncidentType.TIMEOUT, make_time(base, 3), "noisy") is False
+
+    record_event(IncidentType.TIMEOUT, make_time(base, 4), "quiet")
+    record_event(IncidentType.TIMEOUT, make_time(base, 5), "quiet")
+    assert record_event(IncidentType.TIMEOUT, make_time(base, 6), "quiet") is True
+
+
+def test_idle_keys_are_evicted():
+    """idle_ttl 동안 이벤트가 없는 키는 제거"""
+    from app.domain.anomaly import AnomalyDetector
+
+    detector = AnomalyDetector(idle_ttl=timedelta(minutes=10))
+    base = datetime(2025, 1, 1, 12, 0, 0)
+
+    detector.record_event(IncidentType.TIMEOUT, make_time(base, 0), "a")
+    detector.record_event(IncidentType.TIMEOUT, make_time(base, 1), "b")
+    assert len(detector) == 2
+
+    detector.record_event(IncidentType.TIMEOUT, make_time(base, 10, 30), "b")
+    assert len(detector) == 1
+
+
+def test_default_idle_ttl_keeps_window_and_cooldown():
+    """기본 idle_ttl 은 가장 긴 윈도우/쿨다운 + 허용 지연"""
+    from app.domain.anomaly import AnomalyDetector
+
+    detector = AnomalyDetector()
+
+    assert detector.idle_ttl == timedelta(hours=1, minutes=5)
+
+
+def test_max_keys_evicts_least_recently_used():
+    """키 수 상한 초과 시 가장 오래 쓰이지 않은 키 제거 + 메트릭"""
+    from app import metrics
+    from app.domain.anomaly import AnomalyDetector
+
+    metrics.reset()
+    detector = AnomalyDetector(max_keys=2)
+    base = datetime(2025, 1, 1, 12, 0, 0)
+
+    detector.record_event(IncidentType.TIMEOUT, make_time(base, 0), "a")
+    detector.record_event(IncidentType.TIMEOUT, make_time(base, 1), "b")
+    detector.record_event(IncidentType.TIMEOUT, make_time(base, 2), "a")
+    detector.record_event(IncidentType.TIMEOUT, make_time(base, 3), "c")
+
+    assert len(detector) == 2
+    assert metrics.get_counter("anomaly_keys_evicted") == 1
+    # 최근에 쓰인 "a" 가 남아 있으므로 3건째에서 트리거
+    assert detector.record_event(IncidentType.TIMEOUT, make_time(base, 4), "a") is True
+
+
+def test_incident_service_uses_configured_dimension():
+    """IncidentService 는 설정된 필드 값으로 dimension 을 만든다"""
+    import pytest
+
+    from app.application.services.incident import IncidentService
+    from app.domain.events import VTErrorEvent
+
+    service = IncidentService(notifier=None, dimension="project, failure_reason")
+    event = VTErrorEvent(
+        project="p1",
+        error_message="",
+        error_detail="",
+        time="",
+        failure_reason="TIMEOUT",
+    )
+
+    assert service.dimension_fields == ("project", "failure_reason")
+    assert service._dimension_of(event) == "p1|TIMEOUT"
+    assert IncidentService(notifier=None)._dimension_of(event) is None
+
+    with pytest.raises(ValueError):
+        IncidentService(notifier=None, dimension="unknown_field")
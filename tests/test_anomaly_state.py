@@ -0,0 +1,610 @@
+# tests/test_anomaly_state.py
+from datetime import datetime, timedelta, timezone
+import asyncio
+import fnmatch
+import hashlib
+import os
+import time
+import uuid
+
+import pytest
+
+from app.adapters.memory_anomaly_state import InMemoryAnomalyState
+from app.adapters.redis_anomaly_state import RECORD_EVENT_SCRIPT, RedisAnomalyState
+from app.adapters.resp_client import RespClient, RespError, encode_command, parse_redis_url
+from app.domain.anomaly import AnomalyDetector
+from app.domain.incident_config import IncidentThreshold
+from app.domain.incident_type import IncidentType
+
+
+BASE = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+# 실제 Redis 호환 서버로 스크립트를 검증할 때만 지정 (ex. redis://localhost:6379/15)
+REDIS_TEST_URL = os.getenv("ANOMALY_TEST_REDIS_URL")
+
+
+def at(minutes: int = 0, seconds: int = 0) -> datetime:
+    return BASE + timedelta(minutes=minutes, seconds=seconds)
+
+
+class FakeRespServer:
+    """
+    테스트용 최소 Redis 호환 서버 (필요한 명령만, 단일 스레드)
+
+    EVAL/EVALSHA 는 장애 탐지 스크립트만 Python 으로 흉내 낸다 (Lua 는 실행하지 않음).
+    """
+
+    def __init__(self):
+        self.data: dict = {}
+        self.expires: dict = {}
+        self.password: str | None = None
+        self.scripts: set = set()
+        self.evals = 0
+        self._server: asyncio.AbstractServer | None = None
+        self.port = 0
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    # --- 저장소 -------------------------------------------------------------
+
+    def _alive(self, key):
+        deadline = self.expires.get(key)
+        if deadline is not None and deadline <= time.monotonic():
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+        return key in self.data
+
+    @staticmethod
+    def _bound(raw: bytes):
+        text = raw.decode()
+        if text in ("-inf", "+inf", "inf"):
+            return float(text), False
+        if text.startswith("("):
+            return float(text[1:]), True
+        return float(text), False
+
+    def _in_range(self, score, low, high) -> bool:
+        (lo, lo_ex), (hi, hi_ex) = low, high
+        return (score > lo if lo_ex else score >= lo) and (score < hi if hi_ex else score <= hi)
+
+    def execute(self, cmd: list, session: dict):
+        name = cmd[0].upper().decode()
+        args = cmd[1:]
+
+        if name == "PING":
+            return b"+PONG"
+        if name == "AUTH":
+            return b"+OK" if args[0].decode() == self.password else RespError("ERR invalid password")
+        if name == "SELECT":
+            return b"+OK"
+        if name == "ZADD":
+            key = args[0]
+            if not self._alive(key):
+                self.data[key] = {}
+            zset = self.data[key]
+            added = int(args[2] not in zset)
+            zset[args[2]] = float(args[1])
+            return added
+        if name == "ZREMRANGEBYSCORE":
+            key = args[0]
+            if not self._alive(key):
+                return 0
+            low, high = self._bound(args[1]), self._bound(args[2])
+            zset = self.data[key]
+            doomed = [m for m, s in zset.items() if self._in_range(s, low, high)]
+            for member in doomed:
+                del zset[member]
+            return len(doomed)
+        if name == "ZCOUNT":
+            key = args[0]
+            if not self._alive(key):
+                return 0
+            low, high = self._bound(args[1]), self._bound(args[2])
+            return sum(1 for s in self.data[key].values() if self._in_range(s, low, high))
+        if name == "INCR":
+            key = args[0]
+            value = int(self.data[key]) + 1 if self._alive(key) else 1
+            self.data[key] = str(value).encode()
+            return value
+        if name == "PEXPIRE":
+            key = args[0]
+            if not self._alive(key):
+                return 0
+            self.expires[key] = time.monotonic() + int(args[1]) / 1000
+            return 1
+        if name == "PTTL":
+            key = args[0]
+            if not self._alive(key):
+                return -2
+            deadline = self.expires.get(key)
+            return -1 if deadline is None else int((deadline - time.monotonic()) * 1000)
+        if name == "SET":
+            key, value = args[0], args[1]
+            options = [a.upper() for a in args[2:]]
+            if b"PX" in options and int(args[2 + options.index(b"PX") + 1]) <= 0:
+                return RespError("ERR invalid expire time in 'set' command")
+            if b"NX" in options and self._alive(key):
+                return None
+            self.data[key] = value
+            self.expires.pop(key, None)
+            if b"PX" in options:
+                ms = int(args[2 + options.index(b"PX") + 1])
+                self.expires[key] = time.monotonic() + ms / 1000
+            return b"+OK"
+        if name == "HINCRBY":
+            key = args[0]
+            if not self._alive(key):
+                self.data[key] = {}
+            value = int(self.data[key].get(args[1], b"0")) + int(args[2])
+            self.data[key][args[1]] = str(value).encode()
+            return value
+        if name == "HGETALL":
+            if not self._alive(args[0]):
+                return []
+            return [item for pair in self.data[args[0]].items() for item in pair]
+        if name == "HDEL":
+            if not self._alive(args[0]):
+                return 0
+            fields = self.data[args[0]]
+            return sum(1 for f in args[1:] if fields.pop(f, None) is not None)
+        if name == "EVAL":
+            sha = hashlib.sha1(args[0]).hexdigest().encode()
+            self.scripts.add(sha)
+            return self._eval(args[0], args[1:], session)
+        if name == "EVALSHA":
+            if args[0] not in self.scripts:
+                return RespError("NOSCRIPT No matching script. Please use EVAL.")
+            return self._eval(RECORD_EVENT_SCRIPT.encode(), args[1:], session)
+        if name == "GET":
+            return self.data[args[0]] if self._alive(args[0]) else None
+        if name == "DEL":
+            removed = 0
+            for key in args:
+                if self._alive(key):
+                    del self.data[key]
+                    self.expires.pop(key, None)
+                    removed += 1
+            return removed
+        if name == "SCAN":
+            pattern = args[args.index(b"MATCH") + 1].decode() if b"MATCH" in args else "*"
+            keys = [k for k in list(self.data) if self._alive(k) and fnmatch.fnmatchcase(k.decode(), pattern)]
+            return [b"0", keys]
+        return RespError(f"ERR unknown command '{name}'")
+
+    def _eval(self, script: bytes, args: list, session: dict):
+        """
+        RECORD_EVENT_SCRIPT 를 Python 으로 옮긴 것 (Lua 인터프리터 없이 같은 명령을 같은 순서로 실행)
+
+        단일 스레드 서버에서 끝까지 한 번에 실행되므로 Redis 스크립트처럼 원자적이다.
+        """
+        assert script == RECORD_EVENT_SCRIPT.encode(), "only the anomaly script is emulated"
+        self.evals += 1
+        numkeys = int(args[0])
+        keys, argv = args[1:1 + numkeys], args[1 + numkeys:]
+        run = lambda *cmd: self.execute([c if isinstance(c, bytes) else str(c).encode() for c in cmd], session)
+
+        window_count = -1
+        if argv[0] == b"e":
+            run(b"ZADD", keys[0], argv[1], argv[2])
+            run(b"ZREMRANGEBYSCORE", keys[0], b"-inf", argv[3])
+            window_count = run(b"ZCOUNT", keys[0], argv[4], argv[1])
+            run(b"PEXPIRE", keys[0], argv[5])
+        elif argv[0] == b"b":
+            slot, prune, low = int(argv[1]), int(argv[3]), int(argv[4])
+            run(b"HINCRBY", keys[0], argv[1], 1)
+            window_count = 0
+            fields = run(b"HGETALL", keys[0])
+            for field, value in zip(fields[::2], fields[1::2]):
+                if int(field) < prune:
+                    run(b"HDEL", keys[0], field)
+                elif low < int(field) <= slot:
+                    window_count += int(value)
+            run(b"PEXPIRE", keys[0], argv[5])
+        minute_count = -1
+        if argv[7] != b"":
+            minute_count = run(b"INCR", keys[1])
+            run(b"PEXPIRE", keys[1], argv[8])
+        triggered = (window_count >= 0 and window_count >= int(argv[6])) or (
+            minute_count >= 0 and minute_count >= int(argv[7])
+        )
+        claimed = 0
+        if triggered:
+            if int(argv[9]) <= 0:
+                claimed = 1
+            else:
+                reply = run(b"SET", keys[2], argv[10], b"NX", b"PX", argv[9])
+                if isinstance(reply, RespError):
+                    # redis.call 의 에러는 스크립트 에러 응답이 된다
+                    return RespError(f"ERR Error running script: {reply}")
+                claimed = int(reply is not None)
+        return [window_count, minute_count, claimed, run(b"PTTL", keys[2])]
+
+    def dispatch(self, cmd: list, session: dict):
+        name = cmd[0].upper()
+        if name == b"MULTI":
+            session["queue"] = []
+            return b"+OK"
+        if name == b"EXEC":
+            queued, session["queue"] = session.get("queue"), None
+            if queued is None:
+                return RespError("ERR EXEC without MULTI")
+            return [self.execute(c, session) for c in queued]
+        if session.get("queue") is not None:
+            session["queue"].append(cmd)
+            return b"+QUEUED"
+        return self.execute(cmd, session)
+
+    # --- 프로토콜 -----------------------------------------------------------
+
+    @staticmethod
+    def _encode(value) -> bytes:
+        if value is None:
+            return b"$-1\r\n"
+        if isinstance(value, RespError):
+            return b"-%s\r\n" % str(value).encode()
+        if isinstance(value, int):
+            return b":%d\r\n" % value
+        if isinstance(value, bytes) and value.startswith(b"+"):
+            return value + b"\r\n"
+        if isinstance(value, bytes):
+            return b"$%d\r\n%s\r\n" % (len(value), value)
+        return b"*%d\r\n" % len(value) + b"".join(FakeRespServer._encode(v) for v in value)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        session: dict = {}
+        try:
+            while True:
+                header = await reader.readline()
+                if not header:
+                    break
+                cmd = []
+                for _ in range(int(header[1:-2])):
+                    length = int((await reader.readline())[1:-2])
+                    cmd.append((await reader.readexactly(length + 2))[:-2])
+                writer.write(self._encode(self.dispatch(cmd, session)))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+class CountingClient(RespClient):
+    """pipeline 호출(= 왕복) 횟수를 센다"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.roundtrips = 0
+
+    async def pipeline(self, commands):
+        self.roundtrips += 1
+        return await super().pipeline(commands)
+
+
+@pytest.fixture
+async def server():
+    srv = FakeRespServer()
+    await srv.start()
+    yield srv
+    await srv.stop()
+
+
+async def make_state(server: FakeRespServer, **kwargs) -> RedisAnomalyState:
+    return RedisAnomalyState(CountingClient("127.0.0.1", server.port), **kwargs)
+
+
+# --- RESP 클라이언트 -------------------------------------------------------
+
+def test_encode_command():
+    assert encode_command("SET", "k", 10) == b"*3\r\n$3\r\nSET\r\n$1\r\nk\r\n$2\r\n10\r\n"
+
+
+def test_parse_redis_url():
+    assert parse_redis_url("redis://:s3cret@cache:6380/2") == ("cache", 6380, 2, "s3cret")
+    assert parse_redis_url("redis://localhost") == ("localhost", 6379, 0, None)
+    with pytest.raises(ValueError):
+        parse_redis_url("http://localhost")
+
+
+@pytest.mark.anyio
+async def test_client_auth_and_errors(server):
+    server.password = "s3cret"
+    client = RespClient.from_url(f"redis://:s3cret@127.0.0.1:{server.port}/1")
+    try:
+        assert await client.execute("SET", "k", "v") == b"OK"
+        assert await client.execute("GET", "k") == b"v"
+        with pytest.raises(RespError):
+            await client.execute("NOPE")
+        # 에러 응답 뒤에도 같은 연결로 계속 사용 가능
+        assert await client.execute("PING") == b"PONG"
+    finally:
+        await client.close()
+
+
+@pytest.mark.anyio
+async def test_cancelled_call_does_not_leak_reply_to_next_command():
+    """응답을 기다리다 취소되면 연결을 버려 늦게 온 응답이 다음 명령에 섞이지 않는다"""
+    release = asyncio.Event()
+
+    async def serve(reader, writer):
+        try:
+            while True:
+                header = await reader.readline()
+                if not header:
+                    break
+                cmd = []
+                for _ in range(int(header[1:-2])):
+                    length = int((await reader.readline())[1:-2])
+                    cmd.append((await reader.readexactly(length + 2))[:-2])
+                if cmd[0] == b"SLOW":
+                    await release.wait()
+                writer.write(b"$%d\r\n%s\r\n" % (len(cmd[0]), cmd[0]))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    srv = await asyncio.start_server(serve, "127.0.0.1", 0)
+    client = RespClient("127.0.0.1", srv.sockets[0].getsockname()[1])
+    try:
+        task = asyncio.create_task(client.execute("SLOW"))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        release.set()
+
+        assert await client.execute("PING") == b"PING"
+    finally:
+        await client.close()
+        srv.close()
+        await srv.wait_closed()
+
+
+# --- RedisAnomalyState -----------------------------------------------------
+
+@pytest.mark.anyio
+async def test_record_event_single_roundtrip(server):
+    """스크립트가 등록된 뒤에는 트리거 이벤트를 포함해 이벤트당 왕복 1회"""
+    state = await make_state(server)
+    try:
+        # 첫 호출: EVALSHA → NOSCRIPT → EVAL
+        assert await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(0)) is False
+        assert state.client.roundtrips == 2
+
+        assert await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(1)) is False
+        assert await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(2)) is True
+        assert await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(3)) is False
+        assert state.client.roundtrips == 5
+    finally:
+        await state.close()
+
+
+@pytest.mark.anyio
+async def test_script_reloaded_after_server_flush(server):
+    """서버가 스크립트 캐시를 잃어도 (재시작 등) EVAL 로 다시 등록"""
+    state = await make_state(server)
+    try:
+        await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(0))
+        server.scripts.clear()
+        await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(1))
+        assert await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(2)) is True
+        assert server.evals == 3
+    finally:
+        await state.close()
+
+
+@pytest.mark.anyio
+async def test_same_minute_rule(server):
+    state = await make_state(server)
+    try:
+        assert await state.record_event(IncidentType.LIVE_API_DB_OVERLOAD, at(0, 1)) is False
+        assert await state.record_event(IncidentType.LIVE_API_DB_OVERLOAD, at(0, 2)) is False
+        # 다른 분
+        assert await state.record_event(IncidentType.LIVE_API_DB_OVERLOAD, at(1, 3)) is False
+        assert await state.record_event(IncidentType.LIVE_API_DB_OVERLOAD, at(0, 30)) is True
+    finally:
+        await state.close()
+
+
+@pytest.mark.anyio
+async def test_window_excludes_old_events(server):
+    state = await make_state(server)
+    try:
+        await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(0))
+        await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(10))
+        # 30분 윈도우 밖 (0분 이벤트 제외)
+        assert await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(31)) is False
+        assert await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(32)) is True
+    finally:
+        await state.close()
+
+
+@pytest.mark.anyio
+async def test_replicas_share_state_and_trigger_once(server):
+    """두 replica 이벤트를 합산하고, 알림은 한 replica 만"""
+    a = await make_state(server)
+    b = await make_state(server)
+    try:
+        assert await a.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(0)) is False
+        assert await b.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(1)) is False
+
+        results = await asyncio.gather(
+            a.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(2)),
+            b.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(2)),
+        )
+        assert sorted(results) == [False, True]
+
+        # 쿨다운 동안 어느 쪽도 다시 트리거하지 않음
+        assert await a.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(3)) is False
+        assert await b.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(3)) is False
+    finally:
+        await a.close()
+        await b.close()
+
+
+@pytest.mark.anyio
+async def test_resolution_matches_in_memory_slots(server):
+    """resolution 지정 시 프로세스 내 slot 윈도우와 같은 결과"""
+    thresholds = {
+        IncidentType.TIMEOUT: IncidentThreshold(
+            window=timedelta(hours=1),
+            count=3,
+            same_minute_count=None,
+            cooldown=timedelta(minutes=10),
+            resolution=timedelta(seconds=10),
+        ),
+    }
+    detector = AnomalyDetector(thresholds)
+    state = await make_state(server, thresholds=thresholds)
+    # 12:00:05 는 13:00:01 기준 정확 윈도우 안이지만, slot(12:00:00) 은 윈도우 밖
+    events = [at(0, 5), at(30), at(60, 1), at(60, 2), at(65)]
+    try:
+        results = [await state.record_event(IncidentType.TIMEOUT, ts) for ts in events]
+        expected = [detector.record_event(IncidentType.TIMEOUT, ts) for ts in events]
+        assert results == expected == [False, False, False, True, False]
+    finally:
+        await state.close()
+
+
+@pytest.mark.anyio
+async def test_dimensions_are_separate(server):
+    state = await make_state(server)
+    try:
+        for minute in range(2):
+            assert await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(minute), "proj-a") is False
+            assert await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(minute), "proj-b") is False
+        assert await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(2), "proj-a") is True
+        assert await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(2), "proj-b") is True
+    finally:
+        await state.close()
+
+
+@pytest.mark.anyio
+async def test_none_dimension_does_not_collide_with_dash(server):
+    state = await make_state(server)
+    try:
+        for minute in range(2):
+            await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(minute))
+        assert await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(2), "-") is False
+        assert await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(2)) is True
+    finally:
+        await state.close()
+
+
+@pytest.mark.anyio
+async def test_zero_cooldown_triggers_without_cooldown_key(server):
+    """쿨다운 0 → SET PX 0 (Redis 가 거부) 을 보내지 않고 기준 충족마다 트리거"""
+    thresholds = {
+        IncidentType.API_ERROR: IncidentThreshold(
+            window=timedelta(minutes=5),
+            count=2,
+            same_minute_count=None,
+            cooldown=timedelta(0),
+        ),
+    }
+    state = await make_state(server, thresholds=thresholds)
+    try:
+        assert await state.record_event(IncidentType.API_ERROR, at(0, 1)) is False
+        assert await state.record_event(IncidentType.API_ERROR, at(0, 2)) is True
+        assert await state.record_event(IncidentType.API_ERROR, at(0, 3)) is True
+        assert not any(k.endswith(b":cd") for k in server.data)
+    finally:
+        await state.close()
+
+
+@pytest.mark.anyio
+async def test_cooldown_expires(server):
+    state = await make_state(server)
+    try:
+        for minute in range(3):
+            await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(minute))
+        # 쿨다운 키 만료를 흉내 낸다
+        server.expires = {k: 0 if k.endswith(b":cd") else v for k, v in server.expires.items()}
+        assert await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(4)) is True
+    finally:
+        await state.close()
+
+
+@pytest.mark.anyio
+async def test_reset_clears_prefix_only(server):
+    state = await make_state(server, prefix="test")
+    try:
+        await state.client.execute("SET", "other:key", "keep")
+        for minute in range(3):
+            await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(minute))
+
+        await state.reset()
+
+        assert await state.client.execute("GET", "other:key") == b"keep"
+        assert await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(3)) is False
+    finally:
+        await state.close()
+
+
+@pytest.mark.anyio
+async def test_requires_datetime(server):
+    state = await make_state(server)
+    try:
+        with pytest.raises(TypeError):
+            await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, "2025-01-01")
+    finally:
+        await state.close()
+
+
+@pytest.mark.anyio
+@pytest.mark.skipif(not REDIS_TEST_URL, reason="ANOMALY_TEST_REDIS_URL not set")
+async def test_script_against_real_redis():
+    """테스트용 서버의 Python 흉내가 아닌 실제 Lua 스크립트 실행 (정확/slot 윈도우, 동일 분, 쿨다운 0)"""
+    thresholds = {
+        IncidentType.YT_DOWNLOAD_FAIL: IncidentThreshold(
+            window=timedelta(minutes=30), count=3, same_minute_count=None, cooldown=timedelta(minutes=10),
+        ),
+        IncidentType.TIMEOUT: IncidentThreshold(
+            window=timedelta(hours=1), count=3, same_minute_count=None,
+            cooldown=timedelta(minutes=10), resolution=timedelta(seconds=10),
+        ),
+        IncidentType.LIVE_API_DB_OVERLOAD: IncidentThreshold(
+            window=None, count=0, same_minute_count=2, cooldown=timedelta(0),
+        ),
+    }
+    state = RedisAnomalyState(
+        RespClient.from_url(REDIS_TEST_URL), thresholds=thresholds, prefix=f"test:{uuid.uuid4().hex}",
+    )
+    try:
+        exact = [await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(m)) for m in (0, 10, 31, 32, 33)]
+        assert exact == [False, False, False, True, False]
+
+        slots = [await state.record_event(IncidentType.TIMEOUT, ts) for ts in (at(0, 5), at(30), at(60, 1), at(60, 2))]
+        assert slots == [False, False, False, True]
+
+        minute = [await state.record_event(IncidentType.LIVE_API_DB_OVERLOAD, at(0, s)) for s in (1, 2, 3)]
+        assert minute == [False, True, True]
+
+        assert await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(0), "-") is False
+    finally:
+        await state.reset()
+        await state.close()
+
+
+# --- InMemoryAnomalyState --------------------------------------------------
+
+@pytest.mark.anyio
+async def test_in_memory_state_wraps_detector():
+    detector = AnomalyDetector()
+    state = InMemoryAnomalyState(detector)
+
+    for minute in range(2):
+        assert await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(minute)) is False
+    assert await state.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(2)) is True
+    assert len(detector) == 1
+
+    await state.reset()
+    assert len(detector) == 0
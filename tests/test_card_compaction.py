@@ -0,0 +1,158 @@
+# tests/test_card_compaction.py
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app import metrics
+from app.adapters import card_compaction
+from app.adapters.card_compaction import CardCompactor, truncate_utf8
+from app.adapters.card_encoding import EncodedCard, encode_card
+from app.adapters.teams_notifier import TeamsNotifier
+
+
+def make_card(trace: str = "at x.y(z)", extra_sections=()) -> dict:
+    return {
+        "title": "🚨 Error",
+        "sections": [
+            {"facts": [
+                {"name": "Project", "value": "proj-a"},
+                {"name": "Cause or Stack Trace", "value": trace},
+            ]},
+            *extra_sections,
+        ],
+    }
+
+
+def facts(body: bytes) -> dict:
+    card = json.loads(body)
+    return {f["name"]: f["value"] for f in card["sections"][0]["facts"]}
+
+
+def test_small_card_keeps_existing_encoding():
+    card = EncodedCard(make_card(), b'{"title":"original bytes"}')
+    compactor = CardCompactor(max_bytes=1000, fact_max_bytes=100)
+
+    with patch.object(card_compaction, "dumps_card") as dumps:
+        assert compactor.encode(card) is encode_card(card)
+    dumps.assert_not_called()
+
+
+def test_large_fact_is_truncated_with_marker():
+    before = metrics.get_counter("teams_facts_truncated")
+    compactor = CardCompactor(max_bytes=10_000, fact_max_bytes=100)
+
+    body = compactor.encode(make_card("at x.y(z)\n" * 500))
+
+    trace = facts(body)["Cause or Stack Trace"]
+    assert trace.startswith("at x.y(z)\n")
+    assert trace.endswith("… [truncated 4900 bytes]")
+    assert facts(body)["Project"] == "proj-a"
+    assert len(body) < 400
+    assert metrics.get_counter("teams_facts_truncated") == before + 1
+
+
+def test_truncate_does_not_split_multibyte_characters():
+    value = "가" * 10  # 글자당 3바이트
+    truncated = truncate_utf8(value, 10)
+    assert truncated == "가" * 3 + "\n… [truncated 21 bytes]"
+    assert truncate_utf8(value, 30) is value
+
+
+def test_empty_sections_are_dropped():
+    card = make_card(extra_sections=[{"activityTitle": None, "facts": []}, {}])
+    body = CardCompactor().encode(card)
+    assert len(json.loads(body)["sections"]) == 1
+
+
+def test_fact_budget_shrinks_until_card_fits():
+    sections = [{"facts": [{"name": f"f{i}", "value": "x" * 900}]} for i in range(10)]
+    card = {"title": "many facts", "sections": sections}
+    compactor = CardCompactor(max_bytes=5_000, fact_max_bytes=1_000)
+
+    body = compactor.encode(card)
+
+    assert len(body) <= 5_000
+    assert all("truncated" in s["facts"][0]["value"] for s in json.loads(body)["sections"])
+
+
+def test_long_text_and_title_are_truncated():
+    card = {
+        "title": "t" * 3_000,
+        "text": "x" * 3_000,
+        "sections": [{"activityTitle": "a", "text": "y" * 3_000, "facts": []}],
+    }
+    body = CardCompactor(max_bytes=2_000, fact_max_bytes=1_000).encode(card)
+
+    assert len(body) <= 2_000
+    compacted = json.loads(body)
+    assert compacted["title"].endswith("bytes]")
+    assert compacted["text"].startswith("x") and "truncated" in compacted["text"]
+    assert compacted["sections"][0]["text"].startswith("y") and "truncated" in compacted["sections"][0]["text"]
+
+
+def test_trailing_sections_and_facts_are_dropped_with_marker():
+    before = metrics.get_counter("teams_cards_degraded")
+    sections = [
+        {"activityTitle": f"s{i}", "facts": [{"name": f"f{i}.{j}", "value": "v" * 200} for j in range(5)]}
+        for i in range(20)
+    ]
+    card = {"title": "🚨 Error", "sections": sections}
+
+    body = CardCompactor(max_bytes=3_000, fact_max_bytes=1_000).encode(card)
+
+    assert len(body) <= 3_000
+    compacted = json.loads(body)
+    kept, marker = compacted["sections"][:-1], compacted["sections"][-1]
+    # 앞쪽 section / fact 는 순서대로 남는다
+    assert kept[0]["activityTitle"] == "s0"
+    assert [f["name"] for f in kept[0]["facts"]] == [f"f0.{j}" for j in range(5)]
+    kept_facts = sum(len(s["facts"]) for s in kept)
+    assert marker["text"].startswith(f"… {20 - len(kept)} more sections, {100 - kept_facts} more facts")
+    assert metrics.get_counter("teams_cards_degraded") == before + 1
+
+
+def test_card_that_cannot_fit_is_sent_title_only():
+    before = metrics.get_counter("teams_payload_too_large")
+    card = {"@type": "MessageCard", "title": "🚨 Error", "potentialAction": ["x" * 2_000]}
+    body = CardCompactor(max_bytes=1_000).encode(card)
+
+    assert len(body) <= 1_000
+    compacted = json.loads(body)
+    assert compacted["@type"] == "MessageCard"
+    assert compacted["title"] == "🚨 Error"
+    assert "omitted" in compacted["text"]
+    assert metrics.get_counter("teams_payload_too_large") == before + 1
+
+
+def test_result_is_cached_on_encoded_card():
+    card = EncodedCard(make_card("y" * 10_000))
+    compactor = CardCompactor(max_bytes=28_000, fact_max_bytes=100)
+
+    with patch.object(card_compaction, "dumps_card", wraps=card_compaction.dumps_card) as dumps:
+        first = compactor.encode(card)
+        assert compactor.encode(card) is first
+    assert dumps.call_count == 1
+
+
+@pytest.mark.anyio
+async def test_notifier_posts_degraded_card_instead_of_dropping():
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        return httpx.Response(200, text="1")
+
+    notifier = TeamsNotifier(
+        transport=httpx.MockTransport(handler), compactor=CardCompactor(max_bytes=1_000, fact_max_bytes=100)
+    )
+    url = "https://example.webhook.office.com/webhookb2/x"
+
+    assert (await notifier._post(url, {"title": "x" * 2_000}, "test")).ok
+    assert (await notifier._post(url, make_card("z" * 5_000), "test")).ok
+    first, second = requests
+    assert len(first.content) <= 1_000
+    assert "truncated" in json.loads(first.content)["title"]
+    assert "truncated 4900 bytes" in facts(second.content)["Cause or Stack Trace"]
+    await notifier.aclose()
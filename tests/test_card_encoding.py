@@ -0,0 +1,97 @@
+# tests/test_card_encoding.py
+import json
+from unittest.mock import patch
+
+import pytest
+
+from app.adapters import card_encoding
+from app.adapters.card_encoding import EncodedCard, encode_card
+from app.adapters.messagecard import VTWebhookMessage, with_extra_section
+from app.application.services.handler import AlertHandler
+from app.application.services.incident import IncidentService
+from app.application.services.message_parser import TeamsMessageParser
+
+
+# Graph 첨부 content 그대로 (모델에 없는 필드, 공백 포함)
+RAW = json.dumps({
+    "@type": "MessageCard",
+    "themeColor": "FF0000",
+    "title": "🚨 에러",
+    "sections": [{"facts": [{"name": "Cause or Stack Trace", "value": "at x.y(z)\n" * 3}]}],
+}, ensure_ascii=False, indent=2)
+
+
+def test_encoded_card_is_encoded_once():
+    card = EncodedCard({"title": "한글"})
+    with patch.object(card_encoding, "dumps_card", wraps=card_encoding.dumps_card) as dumps:
+        first = encode_card(card)
+        assert encode_card(card) is first
+    assert dumps.call_count == 1
+    assert first == '{"title":"한글"}'.encode("utf-8")
+
+    # 일반 dict 는 매번 인코딩 (결과는 같음)
+    assert encode_card({"title": "한글"}) == first
+
+
+def test_wrap_keeps_existing_encoded_card():
+    card = EncodedCard({"a": 1})
+    assert EncodedCard.wrap(card) is card
+    wrapped = EncodedCard.wrap({"a": 1})
+    assert isinstance(wrapped, EncodedCard) and wrapped == {"a": 1}
+
+
+def test_from_json_keeps_original_payload_and_bytes():
+    msg = VTWebhookMessage.from_json(RAW)
+    payload = msg.to_payload()
+
+    assert msg.title == "🚨 에러"
+    assert payload["themeColor"] == "FF0000"
+    assert encode_card(payload) == RAW.encode("utf-8")
+
+
+def test_to_payload_without_source_is_model_dump():
+    msg = VTWebhookMessage(title="t")
+    assert msg.to_payload() == msg.model_dump()
+    assert not isinstance(msg.to_payload(), EncodedCard)
+
+
+def test_parse_card_passes_attachment_content_through():
+    message = {"attachments": [{"contentType": "application/vnd.microsoft.teams.card.o365connector", "content": RAW}]}
+    card = TeamsMessageParser.parse_card(message)
+    assert encode_card(card.to_payload()) == RAW.encode("utf-8")
+
+
+def test_extra_section_copy_is_encoded_from_the_new_dict():
+    payload = VTWebhookMessage.from_json(RAW).to_payload()
+    card = with_extra_section(payload, "Top offenders", [("project", "a (3)")])
+    assert json.loads(encode_card(card))["sections"][-1]["activityTitle"] == "Top offenders"
+
+
+@pytest.mark.anyio
+async def test_handler_shares_one_encoded_payload_between_channels():
+    class RecordingNotifier:
+        def __init__(self):
+            self.cards = []
+
+        async def send_to_forward_channel(self, card):
+            self.cards.append(card)
+            return True
+
+        async def send_to_incident_channel(self, card):
+            self.cards.append(card)
+            return True
+
+    class AlwaysIncident(IncidentService):
+        async def _should_trigger_incident(self, event):
+            return True
+
+    notifier = RecordingNotifier()
+    handler = AlertHandler(notifier, AlwaysIncident(notifier))
+    payload = {
+        "title": "err",
+        "sections": [{"facts": [{"name": "Error Detail", "value": "Failure Reason: AUDIO_PIPELINE_FAILED"}]}],
+    }
+
+    assert await handler.handle_raw_alert(payload) is True
+    forward, incident = notifier.cards
+    assert forward is incident and isinstance(forward, EncodedCard)
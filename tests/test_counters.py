@@ -0,0 +1,207 @@
+# tests/test_counters.py
+from datetime import datetime, timedelta, timezone
+import random
+
+import pytest
+
+from app.domain.counters import (
+    BucketedWindowCounter,
+    ExactWindowCounter,
+    MinuteRing,
+    epoch_minute,
+    make_window_counter,
+)
+
+
+# --- epoch_minute 테스트 ---------------------------------------------------
+
+def test_epoch_minute_naive_and_aware_agree():
+    """naive datetime 은 UTC 벽시계로 간주"""
+    naive = datetime(2025, 1, 1, 12, 34, 56)
+    aware = naive.replace(tzinfo=timezone.utc)
+
+    assert epoch_minute(naive) == epoch_minute(aware)
+    assert epoch_minute(naive + timedelta(seconds=3)) == epoch_minute(naive)
+    assert epoch_minute(naive + timedelta(seconds=4)) == epoch_minute(naive) + 1
+
+
+# --- MinuteRing 테스트 -----------------------------------------------------
+
+def test_minute_ring_counts_per_minute():
+    """같은 minute 는 누적, 다른 minute 는 별도"""
+    ring = MinuteRing(size=10)
+
+    assert ring.increment(100) == 1
+    assert ring.increment(100) == 2
+    assert ring.increment(101) == 1
+    assert ring.get(100) == 2
+    assert ring.get(102) == 0
+
+
+def test_minute_ring_overwrites_expired_slot():
+    """size 만큼 지난 minute 는 같은 slot 을 덮어씀"""
+    ring = MinuteRing(size=10)
+    ring.increment(100)
+    ring.increment(100)
+
+    assert ring.increment(110) == 1
+    assert ring.get(100) == 0
+
+
+def test_minute_ring_ignores_too_old_minute():
+    """보관 범위보다 오래된 minute 는 기록하지 않음 (최신 bucket 보호)"""
+    ring = MinuteRing(size=10)
+    ring.increment(110)
+
+    assert ring.increment(100) == 0
+    assert ring.get(110) == 1
+
+    # 범위 안의 늦은 minute 는 기록
+    assert ring.increment(101) == 1
+
+
+def test_minute_ring_clear():
+    """clear() 로 초기화"""
+    ring = MinuteRing(size=4)
+    ring.increment(7)
+    ring.clear()
+
+    assert ring.get(7) == 0
+    assert ring.increment(1) == 1
+
+
+# --- 윈도우 카운터 테스트 --------------------------------------------------
+
+SECOND = 1_000_000  # 마이크로초
+
+
+def test_exact_window_excludes_event_exactly_window_old():
+    """정확 윈도우: window 만큼 지난 이벤트는 제외"""
+    counter = ExactWindowCounter(timedelta(seconds=60))
+    counter.add(0)
+    counter.add(30 * SECOND)
+
+    assert counter.add(60 * SECOND) == 2
+
+
+def test_bucketed_window_matches_exact_for_aligned_timestamps():
+    """resolution 경계에 맞는 타임스탬프면 정확 윈도우와 동일"""
+    exact = ExactWindowCounter(timedelta(minutes=5))
+    bucketed = BucketedWindowCounter(timedelta(minutes=5), timedelta(seconds=1))
+
+    for t in (0, 10, 10, 59, 120, 299, 300, 301, 600, 900, 901):
+        assert bucketed.add(t * SECOND) == exact.add(t * SECOND), t
+
+
+def test_bucketed_window_never_overcounts():
+    """비정렬 타임스탬프에서는 정확 값보다 작거나 같음"""
+    rng = random.Random(42)
+    exact = ExactWindowCounter(timedelta(seconds=60))
+    bucketed = BucketedWindowCounter(timedelta(seconds=60), timedelta(seconds=10))
+
+    t = 0
+    for _ in range(2000):
+        t += rng.randint(0, 3 * SECOND)
+        e = exact.add(t)
+        b = bucketed.add(t)
+        assert b <= e
+
+
+def test_bucketed_window_memory_is_fixed():
+    """이벤트 유입량과 무관하게 slot 수 고정"""
+    counter = BucketedWindowCounter(timedelta(hours=1), timedelta(seconds=10))
+    for i in range(10_000):
+        counter.add(i * 1000)  # 1ms 간격
+
+    assert counter.size == 360
+    assert len(counter) == 10_000
+
+
+def test_bucketed_window_expires_after_gap():
+    """긴 공백 이후에는 이전 slot 이 모두 만료"""
+    counter = BucketedWindowCounter(timedelta(seconds=60), timedelta(seconds=1))
+    for t in range(5):
+        counter.add(t * SECOND)
+
+    assert counter.add(1000 * SECOND) == 1
+
+
+def test_bucketed_window_requires_divisible_resolution():
+    """window 는 resolution 의 배수여야 함"""
+    with pytest.raises(ValueError):
+        BucketedWindowCounter(timedelta(seconds=65), timedelta(seconds=10))
+
+
+def test_make_window_counter_selects_by_resolution():
+    """resolution 설정에 따라 구현 선택"""
+    assert isinstance(make_window_counter(timedelta(minutes=5)), ExactWindowCounter)
+    assert isinstance(
+        make_window_counter(timedelta(minutes=5), timedelta(seconds=1)),
+        BucketedWindowCounter,
+    )
+
+
+def test_exact_window_inserts_late_event_in_order():
+    """늦은 이벤트는 정렬 위치에 삽입되고 시계 기준으로 만료"""
+    counter = ExactWindowCounter(timedelta(seconds=60))
+    counter.add(50 * SECOND)
+    counter.add(70 * SECOND)
+
+    assert counter.add(20 * SECOND, now_us=70 * SECOND) == 3
+    # 10초 이전 이벤트는 시계(70초) 기준 윈도우 밖 → 기록 안 됨
+    assert counter.add(5 * SECOND, now_us=70 * SECOND) == 3
+    assert counter.add(85 * SECOND) == 3  # 20초 이벤트 만료
+
+
+def test_bucketed_window_accepts_late_event_within_window():
+    """slot 윈도우도 늦은 이벤트를 해당 slot 에 반영"""
+    counter = BucketedWindowCounter(timedelta(seconds=60), timedelta(seconds=1))
+    counter.add(70 * SECOND)
+
+    assert counter.add(30 * SECOND, now_us=70 * SECOND) == 2
+    assert counter.add(5 * SECOND, now_us=70 * SECOND) == 2
+    assert counter.add(95 * SECOND) == 2  # 30초 이벤트 만료 (70, 95 남음)
+
+
+# --- dump / load 테스트 -----------------------------------------------------
+
+def test_minute_ring_dump_load():
+    ring = MinuteRing(size=5)
+    for minute in (10, 10, 12, 14):
+        ring.increment(minute)
+
+    restored = MinuteRing(size=3)
+    restored.load(ring.dump())
+
+    # 작은 ring 으로 복원하면 최근 3분만 남음
+    assert restored.get(10) == 0
+    assert restored.get(12) == 1
+    assert restored.get(14) == 1
+
+
+def test_bucketed_window_dump_load():
+    counter = BucketedWindowCounter(timedelta(seconds=60), timedelta(seconds=10))
+    for second in (0, 5, 30, 55):
+        counter.add(second * 1_000_000)
+
+    restored = BucketedWindowCounter(timedelta(seconds=60), timedelta(seconds=10))
+    restored.load(counter.dump())
+
+    assert len(restored) == 4
+    # 복원 후에도 만료 동작이 원본과 같음
+    assert restored.add(61_000_000) == counter.add(61_000_000) == 3
+
+    with pytest.raises(ValueError):
+        BucketedWindowCounter(timedelta(seconds=60), timedelta(seconds=5)).load(counter.dump())
+
+
+def test_exact_window_dump_limit():
+    counter = ExactWindowCounter(timedelta(seconds=60))
+    for second in range(10):
+        counter.add(second * 1_000_000)
+
+    assert counter.dump(3) == [7_000_000, 8_000_000, 9_000_000]
+
+    restored = ExactWindowCounter(timedelta(seconds=60))
+    restored.load([9, 7, 8])
+    assert restored.dump() == [7, 8, 9]
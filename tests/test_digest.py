@@ -0,0 +1,191 @@
+# tests/test_digest.py
+from typing import Any, Dict, List
+
+import pytest
+
+from app.adapters.messagecard import VTWebhookMessage, build_digest_card
+from app.application.services.digest import ForwardDigest
+from app.application.services.handler import AlertHandler
+from app.application.services.incident import IncidentService
+from app.domain.events import VTErrorEvent
+
+
+class FakeNotifier:
+    def __init__(self):
+        self.forward_calls: List[Dict[str, Any]] = []
+        self.incident_calls: List[Dict[str, Any]] = []
+
+    async def send_to_forward_channel(self, card: Dict[str, Any]) -> bool:
+        self.forward_calls.append(card)
+        return True
+
+    async def send_to_incident_channel(self, card: Dict[str, Any]) -> bool:
+        self.incident_calls.append(card)
+        return True
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_payload(reason: str, project: str = "proj-a", n: int = 0) -> Dict[str, Any]:
+    return {
+        "title": f"🚨 Error {n}",
+        "sections": [{
+            "facts": [
+                {"name": "Project", "value": project},
+                {"name": "Error Message", "value": f"job {n} failed"},
+                {"name": "Error Detail", "value": f"Failure Reason: {reason}"},
+                {"name": "Time", "value": "2025-12-09T20:10:51Z"},
+            ]
+        }]
+    }
+
+
+def make_event(payload: Dict[str, Any]) -> VTErrorEvent:
+    return VTErrorEvent.from_message(VTWebhookMessage.model_validate(payload))
+
+
+async def add(digest: ForwardDigest, reason: str, project: str = "proj-a", n: int = 0) -> bool:
+    payload = make_payload(reason, project, n)
+    return await digest.add(make_event(payload), payload)
+
+
+@pytest.fixture
+def notifier():
+    return FakeNotifier()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def digest(notifier, clock):
+    return ForwardDigest(notifier, window=30, flush_count=100, max_samples=2, clock=clock)
+
+
+@pytest.mark.anyio
+async def test_first_event_of_group_is_sent_immediately(digest, notifier):
+    assert await add(digest, "AUDIO_PIPELINE_FAILED") is True
+    assert await add(digest, "VIDEO_DOWNLOAD_FAILED") is True
+    assert await add(digest, "AUDIO_PIPELINE_FAILED", n=1) is False
+
+    assert [c["title"] for c in notifier.forward_calls] == ["🚨 Error 0", "🚨 Error 0"]
+
+
+@pytest.mark.anyio
+async def test_window_expiry_sends_one_digest_per_group(digest, notifier, clock):
+    await add(digest, "AUDIO_PIPELINE_FAILED")
+    for n in range(1, 6):
+        await add(digest, "AUDIO_PIPELINE_FAILED", project="proj-b" if n % 2 else "proj-a", n=n)
+
+    clock.now += 29
+    assert await digest.flush_due() == 0
+    clock.now += 1
+    assert await digest.flush_due() == 1
+
+    card = notifier.forward_calls[-1]
+    assert len(notifier.forward_calls) == 2
+    assert "5 more AUDIO_PIPELINE_FAILED" in card["title"]
+    summary = {f["name"]: f["value"] for f in card["sections"][0]["facts"]}
+    assert summary["failure_reason"] == "AUDIO_PIPELINE_FAILED"
+    assert summary["Count"] == "5"
+    assert summary["Projects"] == "proj-b (3), proj-a (2)"
+    # 샘플은 max_samples 개
+    assert [s["activityTitle"] for s in card["sections"][1:]] == ["Sample 1: 🚨 Error 1", "Sample 2: 🚨 Error 2"]
+
+    # 그룹이 닫혔으므로 다음 이벤트는 다시 바로 전송
+    assert await add(digest, "AUDIO_PIPELINE_FAILED", n=9) is True
+
+
+@pytest.mark.anyio
+async def test_quiet_group_closes_without_digest(digest, notifier, clock):
+    await add(digest, "AUDIO_PIPELINE_FAILED")
+    clock.now += 31
+
+    assert await digest.flush_due() == 0
+    assert len(notifier.forward_calls) == 1
+    assert await add(digest, "AUDIO_PIPELINE_FAILED", n=1) is True
+
+
+@pytest.mark.anyio
+async def test_expired_group_is_flushed_on_next_add(digest, notifier, clock):
+    await add(digest, "AUDIO_PIPELINE_FAILED")
+    await add(digest, "AUDIO_PIPELINE_FAILED", n=1)
+    clock.now += 40
+
+    # run() 이 돌기 전이라도 digest 를 먼저 보내고 새 이벤트는 바로 전송
+    assert await add(digest, "AUDIO_PIPELINE_FAILED", n=2) is True
+    titles = [c["title"] for c in notifier.forward_calls]
+    assert titles[1].startswith("🧾 1 more") and titles[2] == "🚨 Error 2"
+
+
+@pytest.mark.anyio
+async def test_count_based_early_flush(notifier, clock):
+    digest = ForwardDigest(notifier, window=30, flush_count=10, clock=clock)
+    for n in range(25):
+        await add(digest, "AUDIO_PIPELINE_FAILED", n=n)
+
+    # 첫 1건 + 10건 digest 2번, 나머지 4건은 대기
+    assert len(notifier.forward_calls) == 3
+    await digest.flush_all()
+    assert [c["title"].split(" errors")[0] for c in notifier.forward_calls[1:]] == [
+        "🧾 10 more AUDIO_PIPELINE_FAILED",
+        "🧾 10 more AUDIO_PIPELINE_FAILED",
+        "🧾 4 more AUDIO_PIPELINE_FAILED",
+    ]
+
+
+@pytest.mark.anyio
+async def test_group_by_fingerprint(notifier, clock):
+    digest = ForwardDigest(notifier, group_by="fingerprint", clock=clock)
+    # 요청 번호만 다른 같은 에러 → 같은 fingerprint
+    assert await add(digest, "AUDIO_PIPELINE_FAILED", n=1) is True
+    assert await add(digest, "AUDIO_PIPELINE_FAILED", n=2) is False
+    assert await add(digest, "VIDEO_DOWNLOAD_FAILED", n=3) is True
+
+
+@pytest.mark.anyio
+async def test_digest_only_opens_groups_while_active(notifier, clock):
+    overloaded = [False]
+    digest = ForwardDigest(notifier, clock=clock, active=lambda: overloaded[0])
+
+    assert await add(digest, "AUDIO_PIPELINE_FAILED", n=1) is True
+    assert await add(digest, "AUDIO_PIPELINE_FAILED", n=2) is True
+
+    overloaded[0] = True
+    assert await add(digest, "AUDIO_PIPELINE_FAILED", n=3) is True
+    assert await add(digest, "AUDIO_PIPELINE_FAILED", n=4) is False
+    assert len(notifier.forward_calls) == 3
+
+
+def test_invalid_group_by(notifier):
+    with pytest.raises(ValueError):
+        ForwardDigest(notifier, group_by="project")
+
+
+def test_build_digest_card_skips_missing_facts():
+    card = build_digest_card("failure_reason", "X", 2, 30, [{"sections": [{"facts": []}]}])
+    assert card["@type"] == "MessageCard"
+    assert card["sections"][1] == {"activityTitle": "Sample 1", "facts": []}
+    assert [f["name"] for f in card["sections"][0]["facts"]] == ["failure_reason", "Count", "Window"]
+
+
+@pytest.mark.anyio
+async def test_alert_handler_uses_digest(notifier, clock):
+    digest = ForwardDigest(notifier, clock=clock)
+    handler = AlertHandler(notifier, IncidentService(notifier), digest=digest)
+
+    results = [await handler.handle_raw_alert(make_payload("AUDIO_PIPELINE_FAILED", n=n)) for n in range(5)]
+
+    # 포워딩 대상이라는 결과는 그대로, 전송은 첫 건만
+    assert results == [True] * 5
+    assert len(notifier.forward_calls) == 1
+    await digest.flush_all()
+    assert len(notifier.forward_calls) == 2
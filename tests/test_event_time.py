@@ -0,0 +1,85 @@
+# tests/test_event_time.py
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app import metrics
+from app.domain.event_time import EventTimeParseError, parse_event_time
+from app.domain.events import _parse_event_datetime
+
+
+def setup_function():
+    """각 테스트 함수 실행 전에 메트릭 초기화."""
+    metrics.reset()
+
+
+# --- 포맷별 파싱 테스트 -----------------------------------------------------
+
+def test_parse_vt_format_with_nanoseconds():
+    """VT 기본 포맷 (나노초 + Z[Etc/UTC])"""
+    dt = parse_event_time("2025-12-09T20:10:51.796441041Z[Etc/UTC]")
+
+    assert dt == datetime(2025, 12, 9, 20, 10, 51, 796441, tzinfo=timezone.utc)
+
+
+def test_parse_offset_formats():
+    """+0000[UTC], +00:00, 비 UTC 오프셋"""
+    assert parse_event_time("2025-12-17T23:44:04.151606+0000[UTC]") == datetime(
+        2025, 12, 17, 23, 44, 4, 151606, tzinfo=timezone.utc
+    )
+    assert parse_event_time("2025-12-17T23:44:04.5+00:00") == datetime(
+        2025, 12, 17, 23, 44, 4, 500000, tzinfo=timezone.utc
+    )
+
+    kst = parse_event_time("2025-12-18T08:44:04+09:00")
+    assert kst.utcoffset() == timedelta(hours=9)
+    assert kst == datetime(2025, 12, 17, 23, 44, 4, tzinfo=timezone.utc)
+
+
+def test_parse_without_fraction_and_date_only():
+    """소수점 없는 초 / 날짜만 있는 값"""
+    assert parse_event_time("2025-12-09T20:10:51Z") == datetime(
+        2025, 12, 9, 20, 10, 51, tzinfo=timezone.utc
+    )
+    assert parse_event_time("2025-12-17") == datetime(2025, 12, 17, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("raw", [
+    "not-a-timestamp",
+    "2025-13-09T20:10:51Z",
+    "2025-12-09T20:10:51.Z",
+    "2025-12-09T20:10:51Zgarbage",
+    "2025/12/09 20:10:51",
+])
+def test_parse_invalid_raises(raw):
+    """해석할 수 없는 값은 EventTimeParseError"""
+    with pytest.raises(EventTimeParseError):
+        parse_event_time(raw)
+
+
+# --- fast path / 일반 경로 일치 테스트 -------------------------------------
+
+def test_fast_path_matches_general_path():
+    """VT 기본 포맷(fast path)과 일반 포맷 결과가 동일"""
+    fast = parse_event_time("2025-12-09T20:10:51.7964Z[Etc/UTC]")
+    general = parse_event_time("2025-12-09T20:10:51.7964+00:00[Etc/UTC]")
+
+    assert fast == general
+    assert fast.microsecond == 796400
+
+
+# --- fallback 메트릭 테스트 -------------------------------------------------
+
+def test_parse_failure_is_counted():
+    """파싱 실패 시 fallback 하되 메트릭 증가"""
+    dt = _parse_event_datetime("not-a-timestamp")
+
+    assert isinstance(dt, datetime)
+    assert metrics.get_counter("event_time_parse_failures") == 1
+
+
+def test_missing_time_is_not_counted_as_failure():
+    """값이 없는 경우는 파싱 실패로 세지 않음"""
+    _parse_event_datetime("")
+
+    assert metrics.get_counter("event_time_parse_failures") == 0
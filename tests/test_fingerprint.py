@@ -0,0 +1,74 @@
+# tests/test_fingerprint.py
+import pytest
+
+from app.domain.events import VTErrorEvent
+from app.domain.fingerprint import clear_caches, fingerprint, normalize_signature
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    clear_caches()
+    yield
+    clear_caches()
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("Job 42 failed", "Job <N> failed"),
+    ("request 3f2b1c4d-1234-4abc-8def-0123456789ab", "request <UUID>"),
+    ("at 2025-12-09T20:10:51.796441041Z[Etc/UTC] done", "at <TS> done"),
+    ("date 2025-12-09", "date <TS>"),
+    ("ptr 0x7f3a9c and id 5f3e9a1b2c", "ptr <HEX> and id <HEX>"),
+    ("(VideoService.java:123)", "(VideoService.java:<N>)"),
+    ('File "app.py", line 88, in run', 'File "app.py", line <N>, in run'),
+])
+def test_normalize_replaces_variable_tokens(raw, expected):
+    assert normalize_signature(raw) == expected
+
+
+def test_normalize_keeps_error_codes_and_words():
+    """글자에 붙은 숫자와 일반 단어는 유지"""
+    assert normalize_signature("VT5001 utf8 DeadlineExceeded") == "VT5001 utf8 DeadlineExceeded"
+
+
+def test_normalize_html_and_whitespace():
+    """HTML 태그는 줄 경계, 공백은 하나로"""
+    raw = "<p>Error   at\tstep 3</p><br/><p>  caused by   x</p>"
+    assert normalize_signature(raw) == "Error at step <N>\ncaused by x"
+
+
+def test_fingerprint_stable_across_variable_tokens():
+    trace_a = (
+        "IllegalStateException: job 3f2b1c4d-1234-4abc-8def-0123456789ab failed\n"
+        "\tat com.example.Worker.run(Worker.java:41)"
+    )
+    trace_b = (
+        "IllegalStateException: job 9a8b7c6d-0000-4abc-8def-fedcba987654 failed\n"
+        "\tat com.example.Worker.run(Worker.java:57)"
+    )
+    other = "NullPointerException\n\tat com.example.Worker.run(Worker.java:41)"
+
+    assert fingerprint(trace_a) == fingerprint(trace_b)
+    assert fingerprint(trace_a) != fingerprint(other)
+    assert len(fingerprint(trace_a)) == 16
+
+
+def test_fingerprint_field_order_matters():
+    assert fingerprint("a", "b") != fingerprint("b", "a")
+    assert fingerprint("a", None) == fingerprint("a", "")
+
+
+def test_event_fingerprint():
+    """VTErrorEvent.fingerprint 는 프로젝트/시각과 무관"""
+    def make(project: str, request_id: str, time: str) -> VTErrorEvent:
+        return VTErrorEvent(
+            project=project,
+            error_message="Received Failed Webhook Event",
+            error_detail=f"Failure Reason: TIMEOUT request={request_id}",
+            time=time,
+            cause_or_stack_trace="at Worker.run(Worker.java:10)",
+        )
+
+    a = make("p1", "1111", "2025-01-01T00:00:00Z")
+    b = make("p2", "2222", "2025-01-02T00:00:00Z")
+
+    assert a.fingerprint == b.fingerprint
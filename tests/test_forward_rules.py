@@ -0,0 +1,163 @@
+# tests/test_forward_rules.py
+import json
+import os
+
+import pytest
+
+from app.application.services.forwarding import ForwardRuleEngine, should_forward
+from app.domain.events import VTErrorEvent
+from app.domain.forward_rules import DEFAULT_FORWARD_RULES, compile_rules
+
+
+def make_event(
+    *,
+    project: str = "test-project",
+    failure_reason: str | None = None,
+    error_message: str = "",
+    error_detail: str = "",
+    cause_or_stack_trace: str | None = None,
+) -> VTErrorEvent:
+    """규칙 평가에 쓰는 필드만 채운 VTErrorEvent"""
+    return VTErrorEvent(
+        project=project,
+        error_message=error_message,
+        error_detail=error_detail,
+        time="2025-01-01T00:00:00.000000000Z[Etc/UTC]",
+        failure_reason=failure_reason,
+        cause_or_stack_trace=cause_or_stack_trace,
+    )
+
+
+class FakeClock:
+    """테스트용 단조 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def write_rules(path, spec: dict, mtime: float) -> None:
+    path.write_text(json.dumps(spec), encoding="utf-8")
+    os.utime(path, (mtime, mtime))
+
+
+# --- compile_rules / evaluate 테스트 ---------------------------------------
+
+def test_default_rules_match_constants():
+    """기본 규칙은 rules.py 상수와 동일하게 동작"""
+    decision = DEFAULT_FORWARD_RULES.evaluate(make_event(failure_reason="TIMEOUT"))
+    assert decision.forward is True
+    assert decision.rule == "failure_reason"
+
+    decision = DEFAULT_FORWARD_RULES.evaluate(make_event(error_detail="code VT5001"))
+    assert decision.forward is True
+    assert decision.detail == "VT5001"
+
+    assert DEFAULT_FORWARD_RULES.evaluate(make_event(failure_reason="ENGINE_ERROR")).forward is False
+
+
+def test_project_deny_and_allow():
+    """deny 가 가장 먼저, allow 가 있으면 목록 밖 프로젝트는 드롭"""
+    rules = compile_rules({"projects": {"allow": ["p1", "p2"], "deny": ["p2"]}})
+
+    assert rules.evaluate(make_event(project="p1", failure_reason="TIMEOUT")).forward is True
+    assert rules.evaluate(make_event(project="p2", failure_reason="TIMEOUT")).rule == "project_denied"
+    assert rules.evaluate(make_event(project="p3", failure_reason="TIMEOUT")).rule == "project_not_allowed"
+
+
+def test_field_keywords_only_scan_their_field():
+    """field_keywords 는 지정된 필드만 검사"""
+    rules = compile_rules({"field_keywords": {"error_detail": ["NO_VOICE_DETECTED"]}})
+
+    decision = rules.evaluate(make_event(error_detail="Engine Error Code: NO_VOICE_DETECTED"))
+    assert decision.forward is True
+    assert decision.detail == "error_detail:NO_VOICE_DETECTED"
+
+    assert rules.evaluate(make_event(error_message="NO_VOICE_DETECTED")).forward is False
+
+
+def test_decisions_are_preallocated():
+    """동일한 판정은 같은 ForwardDecision 인스턴스를 재사용"""
+    a = DEFAULT_FORWARD_RULES.evaluate(make_event(failure_reason="TIMEOUT"))
+    b = DEFAULT_FORWARD_RULES.evaluate(make_event(failure_reason="TIMEOUT"))
+    assert a is b
+
+
+@pytest.mark.parametrize("spec", [
+    [],
+    {"keywords": "VT5001"},
+    {"keywords": None},
+    {"failure_reasons": 3},
+    {"keywords": {"VT5001": True}},
+    {"projects": {"deny": None}},
+    {"field_keywords": {"unknown_field": ["x"]}},
+    {"projects": ["p1"]},
+])
+def test_invalid_spec_raises(spec):
+    """잘못된 규칙 정의는 ValueError"""
+    with pytest.raises(ValueError):
+        compile_rules(spec)
+
+
+# --- ForwardRuleEngine 테스트 ----------------------------------------------
+
+def test_engine_loads_rules_file(tmp_path):
+    """규칙 파일을 읽어 적용"""
+    path = tmp_path / "rules.json"
+    write_rules(path, {"failure_reasons": ["ENGINE_ERROR"], "keywords": []}, mtime=1000)
+
+    engine = ForwardRuleEngine(str(path))
+
+    assert should_forward(make_event(failure_reason="ENGINE_ERROR"), engine) is True
+    assert should_forward(make_event(failure_reason="TIMEOUT"), engine) is False
+
+
+def test_engine_hot_reloads_after_interval(tmp_path):
+    """reload_interval 이 지난 뒤 파일이 바뀌었으면 새 규칙으로 교체"""
+    path = tmp_path / "rules.json"
+    write_rules(path, {"failure_reasons": ["TIMEOUT"]}, mtime=1000)
+    clock = FakeClock()
+    engine = ForwardRuleEngine(str(path), reload_interval=5.0, clock=clock)
+    event = make_event(failure_reason="API_ERROR")
+
+    assert engine.evaluate(event).forward is False
+
+    write_rules(path, {"failure_reasons": ["TIMEOUT", "API_ERROR"]}, mtime=2000)
+
+    # 주기 전에는 기존 테이블 유지
+    clock.now = 1.0
+    engine.evaluate(event)
+    clock.now = 3.0
+    assert engine.evaluate(event).forward is False
+
+    # 주기가 지나면 교체
+    clock.now = 6.0
+    assert engine.evaluate(event).forward is True
+
+
+def test_engine_keeps_previous_rules_on_invalid_file(tmp_path):
+    """잘못된 파일로 바뀌면 이전 테이블 유지"""
+    path = tmp_path / "rules.json"
+    write_rules(path, {"failure_reasons": ["TIMEOUT"]}, mtime=1000)
+    engine = ForwardRuleEngine(str(path))
+    previous = engine.ruleset
+
+    path.write_text("{not json", encoding="utf-8")
+
+    assert engine.reload() is False
+    assert engine.ruleset is previous
+
+
+def test_engine_keeps_previous_rules_on_wrong_types(tmp_path):
+    """타입이 틀린 값 (null 등) 도 예외 없이 이전 테이블 유지"""
+    path = tmp_path / "rules.json"
+    write_rules(path, {"failure_reasons": ["TIMEOUT"]}, mtime=1000)
+    engine = ForwardRuleEngine(str(path))
+    previous = engine.ruleset
+
+    write_rules(path, {"keywords": None}, mtime=2000)
+
+    assert engine.reload() is False
+    assert engine.ruleset is previous
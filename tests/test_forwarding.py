@@ -66,3 +66,18 @@ def test_should_forward_by_special_keyword_video_queue_full():
     )
 
     assert should_forward(event) is True
+
+
+def test_match_special_keyword_reports_keyword():
+    """
+    어떤 특수 키워드가 매칭되었는지 반환한다.
+    """
+    from app.application.services.forwarding import match_special_keyword
+
+    event = make_event(
+        error_message="Received Failed Webhook Event by Live API.",
+        cause_or_stack_trace="VideoQueueException: VT5001",
+    )
+
+    assert match_special_keyword(event) == "VT5001"
+    assert match_special_keyword(make_event(error_message="ok")) is None
@@ -1,4 +1,6 @@
 # tests/test_handler.py
+import asyncio
+
 import pytest
 from typing import Dict, Any, List
 
@@ -123,4 +125,79 @@ async def test_timeout_incident_after_three_events(alert_handler, fake_notifier)
     assert len(fake_notifier.forward_calls) == 3
     
     # incident는 임계치 도달 시 1번 호출
-    assert len(fake_notifier.incident_calls) == 1
\ No newline at end of file
+    assert len(fake_notifier.incident_calls) == 1
+
+
+@pytest.mark.anyio
+async def test_incident_is_not_blocked_by_slow_forward():
+    """포워딩 전송이 끝나기 전에 장애 알림이 나간다"""
+    order: List[str] = []
+    release = asyncio.Event()
+
+    class SlowForwardNotifier(FakeNotifier):
+        async def send_to_forward_channel(self, card):
+            await release.wait()
+            order.append("forward")
+            return await super().send_to_forward_channel(card)
+
+    class RecordingIncidentService:
+        async def handle_incident(self, event, payload):
+            order.append("incident")
+            # 장애 알림이 나간 뒤에야 포워딩 응답이 온다
+            release.set()
+
+    notifier = SlowForwardNotifier()
+    handler = AlertHandler(notifier, RecordingIncidentService())
+    payload = {
+        "title": "🚨 Error",
+        "sections": [{"facts": [{"name": "Error Detail", "value": "Failure Reason: AUDIO_PIPELINE_FAILED"}]}],
+    }
+
+    assert await asyncio.wait_for(handler.handle_raw_alert(payload), 1.0) is True
+    assert order == ["incident", "forward"]
+
+
+@pytest.mark.anyio
+async def test_forward_failure_does_not_skip_incident():
+    """포워딩 전송이 예외를 내도 장애 처리는 끝까지 수행"""
+    handled: List[str] = []
+
+    class FailingForwardNotifier(FakeNotifier):
+        async def send_to_forward_channel(self, card):
+            raise RuntimeError("webhook down")
+
+    class RecordingIncidentService:
+        async def handle_incident(self, event, payload):
+            handled.append(event.failure_reason)
+
+    handler = AlertHandler(FailingForwardNotifier(), RecordingIncidentService())
+    payload = {
+        "sections": [{"facts": [{"name": "Error Detail", "value": "Failure Reason: AUDIO_PIPELINE_FAILED"}]}],
+    }
+
+    with pytest.raises(RuntimeError):
+        await handler.handle_raw_alert(payload)
+    assert handled == ["AUDIO_PIPELINE_FAILED"]
+
+
+@pytest.mark.anyio
+async def test_incident_error_is_raised_over_forward_error(caplog):
+    """둘 다 실패하면 장애 처리 에러가 올라가고 포워딩 에러는 로그로 남는다"""
+
+    class FailingForwardNotifier(FakeNotifier):
+        async def send_to_forward_channel(self, card):
+            raise RuntimeError("webhook down")
+
+    class FailingIncidentService:
+        async def handle_incident(self, event, payload):
+            await asyncio.sleep(0)
+            raise ValueError("detector broken")
+
+    handler = AlertHandler(FailingForwardNotifier(), FailingIncidentService())
+    payload = {
+        "sections": [{"facts": [{"name": "Error Detail", "value": "Failure Reason: AUDIO_PIPELINE_FAILED"}]}],
+    }
+
+    with pytest.raises(ValueError, match="detector broken"):
+        await handler.handle_raw_alert(payload)
+    assert "webhook down" in caplog.text
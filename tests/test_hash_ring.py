@@ -0,0 +1,68 @@
+# tests/test_hash_ring.py
+import pytest
+
+from app.domain.hash_ring import HashRing, stable_hash
+
+
+CHANNELS = [f"19:channel-{i}@thread.tacv2" for i in range(400)]
+
+
+def test_stable_hash_is_deterministic():
+    assert stable_hash("abc") == stable_hash("abc")
+    assert stable_hash("abc") != stable_hash("abd")
+
+
+def test_empty_ring_has_no_owner():
+    ring = HashRing([])
+    assert ring.owner("x") is None
+    assert ring.assign(["x"]) == {}
+
+
+def test_assignment_covers_every_key_once():
+    ring = HashRing(["a", "b", "c"])
+    assignment = ring.assign(CHANNELS)
+
+    assigned = [key for keys in assignment.values() for key in keys]
+    assert sorted(assigned) == sorted(CHANNELS)
+    assert set(assignment) == {"a", "b", "c"}
+
+
+def test_member_order_does_not_matter():
+    """replica 마다 멤버 목록 순서가 달라도 같은 분배"""
+    a = HashRing(["a", "b", "c"])
+    b = HashRing(["c", "a", "b", "a"])
+    assert all(a.owner(key) == b.owner(key) for key in CHANNELS)
+
+
+def test_distribution_is_roughly_even():
+    ring = HashRing([f"poller-{i}" for i in range(4)])
+    sizes = [len(keys) for keys in ring.assign(CHANNELS).values()]
+    # 평균 100, 가상 노드 덕분에 크게 치우치지 않음
+    assert min(sizes) > 60
+    assert max(sizes) < 140
+
+
+def test_adding_member_moves_only_its_share():
+    before = HashRing(["a", "b", "c"])
+    after = HashRing(["a", "b", "c", "d"])
+
+    moved = [key for key in CHANNELS if before.owner(key) != after.owner(key)]
+
+    # 바뀐 key 는 모두 새 멤버에게 간 것
+    assert all(after.owner(key) == "d" for key in moved)
+    # 약 1/4 만 이동
+    assert len(moved) < len(CHANNELS) * 0.4
+
+
+def test_removing_member_keeps_other_assignments():
+    before = HashRing(["a", "b", "c"])
+    after = HashRing(["a", "b"])
+
+    for key in CHANNELS:
+        if before.owner(key) != "c":
+            assert after.owner(key) == before.owner(key)
+
+
+def test_invalid_vnodes():
+    with pytest.raises(ValueError):
+        HashRing(["a"], vnodes=0)
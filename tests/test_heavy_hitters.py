@@ -0,0 +1,166 @@
+# tests/test_heavy_hitters.py
+from datetime import timedelta
+
+import pytest
+
+from app.domain.events import VTErrorEvent
+from app.domain.heavy_hitters import CountMinSketch, HeavyHitterTracker
+
+
+class FakeClock:
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_event(project: str = "p1", failure_reason: str | None = "TIMEOUT") -> VTErrorEvent:
+    return VTErrorEvent(
+        project=project,
+        error_message="",
+        error_detail="",
+        time="",
+        failure_reason=failure_reason,
+    )
+
+
+# --- CountMinSketch 테스트 ---------------------------------------------------
+
+def test_sketch_never_underestimates():
+    """추정치는 실제 건수보다 작지 않음"""
+    sketch = CountMinSketch(width=64, depth=4)
+    actual = {}
+    for i in range(2000):
+        value = f"v{i % 300}"
+        sketch.add(value)
+        actual[value] = actual.get(value, 0) + 1
+
+    for value, count in actual.items():
+        assert sketch.estimate(value) >= count
+
+
+def test_sketch_exact_without_collisions():
+    """충돌이 없으면 정확한 건수"""
+    sketch = CountMinSketch()
+    for _ in range(5):
+        sketch.add("A")
+    sketch.add("B")
+
+    assert sketch.estimate("A") == 5
+    assert sketch.estimate("B") == 1
+    assert sketch.estimate("C") == 0
+
+
+# --- HeavyHitterTracker 테스트 -----------------------------------------------
+
+def test_tracker_finds_dominant_values():
+    """롱테일 속에서도 다수 값이 top 에 남음"""
+    tracker = HeavyHitterTracker(top_k=3, clock=FakeClock())
+    for i in range(3000):
+        tracker.add("project", f"tail-{i}")
+        if i % 10 == 0:
+            tracker.add("project", "storm")
+        if i % 30 == 0:
+            tracker.add("project", "second")
+
+    top = [value for value, _ in tracker.top("project")]
+    assert top[:2] == ["storm", "second"]
+    assert tracker.top("project", 1)[0][1] >= 300
+
+
+def test_tracker_records_event_fields():
+    """record(event) 는 설정된 모든 dimension 반영, 빈 값은 무시"""
+    tracker = HeavyHitterTracker(clock=FakeClock())
+    tracker.record(make_event("p1", "TIMEOUT"))
+    tracker.record(make_event("p1", None))
+
+    assert tracker.top("project") == [("p1", 2)]
+    assert tracker.top("failure_reason") == [("TIMEOUT", 1)]
+
+
+def test_tracker_rotates_windows():
+    """윈도우가 넘어가면 현재 → 직전, 두 윈도우 이상 지나면 모두 비움"""
+    clock = FakeClock(0)
+    tracker = HeavyHitterTracker(window=timedelta(minutes=5), clock=clock)
+    tracker.add("project", "p1")
+
+    clock.now = 301
+    tracker.add("project", "p2")
+    assert tracker.top("project") == [("p2", 1)]
+    assert tracker.top("project", previous=True) == [("p1", 1)]
+
+    clock.now = 1000
+    assert tracker.top("project") == []
+    assert tracker.top("project", previous=True) == []
+
+
+def test_tracker_rejects_unknown_dimension():
+    with pytest.raises(ValueError):
+        HeavyHitterTracker(dimensions=("no_such_field",))
+
+
+def test_tracker_snapshot():
+    tracker = HeavyHitterTracker(clock=FakeClock(600))
+    tracker.add("failure_reason", "TIMEOUT")
+
+    snapshot = tracker.snapshot()
+    assert snapshot["window_start"] == 600
+    assert snapshot["current"]["failure_reason"] == {
+        "total": 1,
+        "top": [{"value": "TIMEOUT", "count": 1}],
+    }
+    assert snapshot["previous"]["project"]["total"] == 0
+
+
+# --- 서비스 연동 테스트 ------------------------------------------------------
+
+class FakeNotifier:
+    def __init__(self):
+        self.forward_calls = []
+        self.incident_calls = []
+
+    async def send_to_forward_channel(self, card):
+        self.forward_calls.append(card)
+        return True
+
+    async def send_to_incident_channel(self, card):
+        self.incident_calls.append(card)
+        return True
+
+
+def make_payload(project: str, failure_reason: str, time: str) -> dict:
+    return {
+        "title": "🚨 Error",
+        "sections": [{
+            "facts": [
+                {"name": "Project", "value": project},
+                {"name": "Error Detail", "value": f"Failure Reason: {failure_reason}"},
+                {"name": "Time", "value": time},
+            ]
+        }],
+    }
+
+
+@pytest.mark.anyio
+async def test_alert_handler_feeds_tracker_and_incident_card():
+    """AlertHandler 가 추적기에 반영하고, 장애 카드에 top offender 섹션 추가"""
+    from app.application.services.handler import AlertHandler
+    from app.application.services.incident import IncidentService
+
+    notifier = FakeNotifier()
+    tracker = HeavyHitterTracker(clock=FakeClock())
+    incident_service = IncidentService(notifier, heavy_hitters=tracker)
+    handler = AlertHandler(notifier, incident_service, heavy_hitters=tracker)
+
+    for second in range(3):
+        await handler.handle_raw_alert(
+            make_payload("p1", "TIMEOUT", f"2025-01-01T12:00:0{second}Z")
+        )
+
+    assert tracker.top("project") == [("p1", 3)]
+    assert len(notifier.incident_calls) == 1
+
+    card = notifier.incident_calls[0]
+    assert card["sections"][-1]["activityTitle"].startswith("Top offenders")
+    assert {"name": "project", "value": "p1 (3)"} in card["sections"][-1]["facts"]
@@ -0,0 +1,64 @@
+# tests/test_incident_classifier.py
+from app.domain.incident_classifier import DescriptionClassifier, classify_description
+from app.domain.incident_type import IncidentType
+
+
+def test_default_table_mapping():
+    """기본 테이블 매핑 (대소문자 무시)"""
+    assert classify_description("영상 생성 실패 - 더빙/오디오 생성 실패") is IncidentType.LIVE_API_DB_OVERLOAD
+    assert classify_description("YouTube URL 다운로드 실패") is IncidentType.YT_DOWNLOAD_FAIL
+    assert classify_description("외부 URL 다운로드 실패") is IncidentType.YT_EXTERNAL_FAIL
+    assert classify_description("Video 파일 업로드 실패") is IncidentType.YT_EXTERNAL_FAIL
+    assert classify_description("정상 처리") is None
+
+
+def test_priority_order_wins_regardless_of_position():
+    """여러 문구가 매칭되면 테이블 앞쪽 문구 우선"""
+    classifier = DescriptionClassifier([
+        ("db 부하", IncidentType.LIVE_API_DB_OVERLOAD),
+        ("timeout", IncidentType.TIMEOUT),
+    ])
+
+    assert classifier.classify("timeout 이후 DB 부하 발생") is IncidentType.LIVE_API_DB_OVERLOAD
+    assert classifier.classify("timeout 발생") is IncidentType.TIMEOUT
+
+
+def test_overlapping_higher_priority_phrase_wins():
+    """낮은 우선순위 매칭과 겹치는 높은 우선순위 문구도 찾는다"""
+    classifier = DescriptionClassifier([
+        ("db 부하", IncidentType.LIVE_API_DB_OVERLOAD),
+        ("timeout db", IncidentType.TIMEOUT),
+    ])
+    # "timeout db" 가 "db" 를 먼저 차지해도 "db 부하" 가 우선
+    assert classifier.classify("timeout db 부하 발생") is IncidentType.LIVE_API_DB_OVERLOAD
+
+
+def test_shorter_prefix_phrase_with_higher_priority_wins():
+    """같은 위치의 더 긴 문구보다 우선순위 높은 짧은 문구가 이긴다"""
+    classifier = DescriptionClassifier([
+        ("DB", IncidentType.API_ERROR),
+        ("db 부하", IncidentType.LIVE_API_DB_OVERLOAD),
+    ])
+    assert classifier.classify("DB 부하 발생") is IncidentType.API_ERROR
+
+
+def test_results_are_cached():
+    """반복되는 Description 은 캐시에서 반환"""
+    classifier = DescriptionClassifier([("timeout", IncidentType.TIMEOUT)])
+
+    classifier.classify("request timeout")
+    classifier.classify("request timeout")
+
+    info = classifier.classify.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+
+def test_duplicate_phrase_keeps_first_entry():
+    """중복 문구는 먼저 나온 매핑 유지"""
+    classifier = DescriptionClassifier([
+        ("실패", IncidentType.API_ERROR),
+        ("실패", IncidentType.TIMEOUT),
+    ])
+
+    assert classifier.classify("업로드 실패") is IncidentType.API_ERROR
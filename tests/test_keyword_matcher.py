@@ -0,0 +1,81 @@
+# tests/test_keyword_matcher.py
+from app.domain.keyword_matcher import KeywordMatcher
+
+
+def test_search_returns_first_matched_keyword():
+    """처음 매칭된 키워드 반환"""
+    matcher = KeywordMatcher(["VIDEO_QUEUE_FULL", "VT5001"])
+
+    assert matcher.search("Invalid FailureReason value: VIDEO_QUEUE_FULL") == "VIDEO_QUEUE_FULL"
+    assert matcher.search("", None, "code=VT5001") == "VT5001"
+    assert matcher.search("nothing here") is None
+
+
+def test_search_prefers_longest_keyword_with_shared_prefix():
+    """공통 접두사를 가진 키워드는 긴 쪽 우선"""
+    matcher = KeywordMatcher(["VT50", "VT5001", "VT5002"])
+
+    assert matcher.search("err VT5002") == "VT5002"
+    assert matcher.search("err VT5009") == "VT50"
+
+
+def test_search_does_not_match_across_fields():
+    """필드를 이어 붙이지 않으므로 필드 경계를 넘는 매칭은 없음"""
+    matcher = KeywordMatcher(["AB"])
+
+    assert matcher.search("xA", "Bx") is None
+
+
+def test_ignore_case_returns_canonical_keyword():
+    """대소문자 무시 모드에서도 원래 키워드 반환"""
+    matcher = KeywordMatcher(["YouTube URL 다운로드 실패"], ignore_case=True)
+
+    assert matcher.search("youtube url 다운로드 실패 (id=1)") == "YouTube URL 다운로드 실패"
+
+
+def test_special_characters_are_escaped():
+    """정규식 메타문자가 포함된 키워드"""
+    matcher = KeywordMatcher(["a.b", "c+d"])
+
+    assert matcher.search("axb") is None
+    assert matcher.search("x c+d") == "c+d"
+
+
+def test_many_keywords():
+    """수백 개 키워드에서도 정확히 매칭"""
+    keywords = [f"VT{code}" for code in range(5000, 5500)]
+    matcher = KeywordMatcher(keywords)
+
+    assert matcher.search("error code VT5321 occurred") == "VT5321"
+    assert matcher.search("error code VT4999 occurred") is None
+
+
+def test_finditer_and_empty_matcher():
+    """finditer / 빈 키워드 목록"""
+    matcher = KeywordMatcher(["foo", "bar"])
+    assert list(matcher.finditer("bar foo")) == [(0, "bar"), (4, "foo")]
+
+    empty = KeywordMatcher([])
+    assert not empty
+    assert empty.search("foo") is None
+
+
+def test_finditer_overlapping_reports_every_keyword():
+    """겹치는 매칭 / 같은 위치의 짧은 키워드까지 모두"""
+    matcher = KeywordMatcher(["VT5", "VT5001", "5001 ERR"], ignore_case=True)
+    assert list(matcher.finditer("vt5001 err")) == [(0, "VT5001")]
+    assert list(matcher.finditer_overlapping("vt5001 err")) == [(0, "VT5"), (0, "VT5001"), (2, "5001 ERR")]
+    assert list(KeywordMatcher([]).finditer_overlapping("foo")) == []
+
+
+def test_ignore_case_non_ascii_case_folding():
+    """lower() 와 정규식 대소문자 규칙이 다른 입력 (İ, ı, ẞ) 도 원래 키워드로"""
+    matcher = KeywordMatcher(["video", "straße"], ignore_case=True)
+    assert matcher.search("VİDEO failed") == "video"
+    assert matcher.search("vıdeo failed") == "video"
+    assert matcher.search("STRAẞE") == "straße"
+    assert list(matcher.finditer("VİDEO vıdeo")) == [(0, "video"), (6, "video")]
+    assert list(matcher.finditer_overlapping("VİDEO")) == [(0, "video")]
+
+    # 대소문자 구분 매처는 그대로
+    assert KeywordMatcher(["video"]).search("VİDEO") is None
@@ -0,0 +1,276 @@
+# tests/test_leader.py
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.adapters.graph_client import GraphClient
+from app.adapters.sqlite_lease import SqliteLeaseStore
+from app.application.services.leader import LeaderElector
+from app.application.services.message_poller import MessagePoller
+from app.config import TEAMS_FEED1_CHANNEL_ID
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def store(tmp_path, clock):
+    return SqliteLeaseStore(str(tmp_path / "lease" / "leader.db"), clock=clock)
+
+
+# --- SqliteLeaseStore ------------------------------------------------------
+
+@pytest.mark.anyio
+async def test_lease_single_holder(store):
+    assert await store.acquire("poller", "a", 10) == 1
+    assert await store.acquire("poller", "b", 10) is None
+    # 보유 중 갱신은 token 유지
+    assert await store.acquire("poller", "a", 10) == 1
+
+
+@pytest.mark.anyio
+async def test_lease_expiry_increments_token(store, clock):
+    assert await store.acquire("poller", "a", 10) == 1
+    clock.now += 11
+    assert await store.acquire("poller", "b", 10) == 2
+    # 이전 holder 는 갱신 불가 (fencing)
+    assert await store.acquire("poller", "a", 10) is None
+
+
+@pytest.mark.anyio
+async def test_lease_release(store):
+    assert await store.acquire("poller", "a", 10) == 1
+    # 다른 holder 의 release 는 무시
+    await store.release("poller", "b")
+    assert await store.acquire("poller", "b", 10) is None
+
+    await store.release("poller", "a")
+    assert await store.acquire("poller", "b", 10) == 2
+
+
+@pytest.mark.anyio
+async def test_lease_names_are_independent(store):
+    assert await store.acquire("poller", "a", 10) == 1
+    assert await store.acquire("other", "b", 10) == 1
+
+
+@pytest.mark.anyio
+async def test_lease_watermark_is_fenced(store, clock):
+    """이전 holder 의 token 으로는 워터마크를 쓸 수 없다"""
+    assert await store.acquire("poller", "a", 10) == 1
+    assert await store.save_watermark("poller", 1, "ch", "2025-01-01T00:00:00+00:00") is True
+
+    clock.now += 11
+    assert await store.acquire("poller", "b", 10) == 2
+    assert await store.save_watermark("poller", 2, "ch", "2025-01-01T00:01:00+00:00") is True
+    assert await store.save_watermark("poller", 1, "ch", "2025-01-01T00:00:30+00:00") is False
+
+    assert await store.load_watermarks("poller") == {"ch": "2025-01-01T00:01:00+00:00"}
+    assert await store.load_watermarks("other") == {}
+
+
+@pytest.mark.anyio
+async def test_lease_concurrent_acquire_single_winner(tmp_path):
+    path = str(tmp_path / "leader.db")
+    stores = [SqliteLeaseStore(path) for _ in range(8)]
+    results = await asyncio.gather(
+        *(s.acquire("poller", f"w{i}", 10) for i, s in enumerate(stores))
+    )
+    assert results.count(1) == 1
+    assert results.count(None) == 7
+
+
+# --- LeaderElector ---------------------------------------------------------
+
+@pytest.mark.anyio
+async def test_elector_single_leader_and_failover(store, clock):
+    a = LeaderElector(store, holder="a", ttl=10, clock=clock)
+    b = LeaderElector(store, holder="b", ttl=10, clock=clock)
+
+    assert await a.try_acquire() is True
+    assert await b.try_acquire() is False
+    assert a.is_leader and not b.is_leader
+    assert a.token == 1 and b.token is None
+
+    # a 가 갱신하지 못하고 ttl 경과 → a 는 스스로 리더가 아님, b 가 이어받음
+    clock.now += 11
+    assert a.is_leader is False
+    assert await b.try_acquire() is True
+    assert b.token == 2
+    assert await a.try_acquire() is False
+
+
+@pytest.mark.anyio
+async def test_elector_release_hands_over(store, clock):
+    a = LeaderElector(store, holder="a", ttl=10, clock=clock)
+    b = LeaderElector(store, holder="b", ttl=10, clock=clock)
+    await a.try_acquire()
+
+    await a.release()
+
+    assert a.is_leader is False
+    assert await b.try_acquire() is True
+
+
+@pytest.mark.anyio
+async def test_elector_keeps_leadership_until_deadline_on_store_error(clock):
+    store = MagicMock()
+    store.acquire = AsyncMock(return_value=3)
+    elector = LeaderElector(store, holder="a", ttl=10, clock=clock)
+    await elector.try_acquire()
+
+    store.acquire = AsyncMock(side_effect=OSError("disk"))
+    clock.now += 5
+    assert await elector.try_acquire() is True
+    clock.now += 6
+    assert await elector.try_acquire() is False
+
+
+@pytest.mark.anyio
+async def test_elector_steps_down_when_watermark_rejected(store, clock):
+    a = LeaderElector(store, holder="a", ttl=10, clock=clock)
+    b = LeaderElector(store, holder="b", ttl=10, clock=clock)
+    await a.try_acquire()
+    assert await a.save_watermark("ch", "t1") is True
+
+    # a 의 로컬 deadline 안이지만 저장소에서는 b 가 이어받은 상태
+    clock.now += 11
+    await b.try_acquire()
+    a._deadline = clock.now + 5
+
+    assert await a.save_watermark("ch", "t2") is False
+    assert a.is_leader is False
+    assert await store.load_watermarks(a.name) == {"ch": "t1"}
+
+
+@pytest.mark.anyio
+async def test_wait_until_leader(store, clock):
+    a = LeaderElector(store, holder="a", ttl=10, clock=clock)
+    b = LeaderElector(store, holder="b", ttl=10, clock=clock)
+    await a.try_acquire()
+
+    waiter = asyncio.create_task(b.wait_until_leader())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    await a.release()
+    await b.try_acquire()
+    await asyncio.wait_for(waiter, 1)
+
+
+# --- MessagePoller 연동 ----------------------------------------------------
+
+def make_poller(leader):
+    graph = MagicMock(spec=GraphClient)
+    graph.get_channel_messages = AsyncMock(return_value=[])
+    return MessagePoller(graph, leader=leader), graph
+
+
+@pytest.mark.anyio
+async def test_follower_does_not_poll(store, clock):
+    leader = LeaderElector(store, holder="a", ttl=10, clock=clock)
+    follower = LeaderElector(store, holder="b", ttl=10, clock=clock)
+    await leader.try_acquire()
+    await follower.try_acquire()
+
+    poller, graph = make_poller(follower)
+    task = asyncio.create_task(poller.start(poll_interval=0.01))
+    await asyncio.sleep(0.05)
+    graph.get_channel_messages.assert_not_called()
+
+    # 리더가 종료하면 팔로워가 이어받아 polling 시작
+    await leader.release()
+    await follower.try_acquire()
+    await asyncio.sleep(0.05)
+    poller.stop()
+    await asyncio.wait_for(task, 1)
+
+    assert graph.get_channel_messages.called
+    assert poller.last_check[TEAMS_FEED1_CHANNEL_ID]
+
+
+@pytest.mark.anyio
+async def test_poller_stops_processing_after_losing_leadership(store, clock):
+    elector = LeaderElector(store, holder="a", ttl=10, clock=clock)
+    await elector.try_acquire()
+    poller, graph = make_poller(elector)
+    await poller._take_over()
+    poller._process_single_message = AsyncMock()
+    graph.get_channel_messages = AsyncMock(return_value=[{"id": "1"}, {"id": "2"}])
+
+    clock.now += 11
+    await poller.poll_channel("channel", "feed1")
+
+    poller._process_single_message.assert_not_called()
+    assert "channel" not in poller.last_check
+
+
+@pytest.mark.anyio
+async def test_takeover_resumes_from_previous_leader_watermark(store, clock):
+    """재시작/failover 시 리스 ttl 만큼 되감지 않고 이전 리더가 저장한 시각부터"""
+    a = LeaderElector(store, holder="a", ttl=10, clock=clock)
+    await a.try_acquire()
+    poller_a, _ = make_poller(a)
+    await poller_a._take_over()
+    await poller_a.poll_channel(TEAMS_FEED1_CHANNEL_ID, "feed1")
+    saved = poller_a.last_check[TEAMS_FEED1_CHANNEL_ID]
+    await a.release()
+
+    b = LeaderElector(store, holder="b", ttl=10, clock=clock)
+    await b.try_acquire()
+    poller_b, _ = make_poller(b)
+    await poller_b._take_over()
+
+    assert poller_b.last_check[TEAMS_FEED1_CHANNEL_ID] == saved
+
+
+@pytest.mark.anyio
+async def test_first_takeover_starts_from_now(store, clock):
+    """저장된 워터마크가 없으면 (처음 실행) 지금부터"""
+    before = datetime.now(timezone.utc).isoformat()
+    elector = LeaderElector(store, holder="a", ttl=10, clock=clock)
+    await elector.try_acquire()
+    poller, _ = make_poller(elector)
+    await poller._take_over()
+
+    assert poller.last_check[TEAMS_FEED1_CHANNEL_ID] >= before
+
+
+@pytest.mark.anyio
+async def test_cancelled_renewal_finishes_before_release(clock):
+    """갱신 도중 취소되면 진행 중인 저장소 요청이 끝난 뒤에 task 가 끝난다 (release 가 그 뒤에 오도록)"""
+    gate = asyncio.Event()
+    calls = []
+
+    class SlowStore:
+        async def acquire(self, name, holder, ttl):
+            await gate.wait()
+            calls.append("acquire")
+            return 1
+
+        async def release(self, name, holder):
+            calls.append("release")
+
+    elector = LeaderElector(SlowStore(), holder="a", ttl=10, clock=clock)
+    task = asyncio.create_task(elector.try_acquire())
+    await asyncio.sleep(0)
+    task.cancel()
+    await asyncio.sleep(0.01)
+    assert not task.done()
+
+    gate.set()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert calls == ["acquire"]
@@ -241,4 +241,20 @@ def test_section_model_with_facts():
         ]
     )
     assert section.activityTitle == "Title"
-    assert len(section.facts) == 2
\ No newline at end of file
+    assert len(section.facts) == 2
+
+
+def test_with_extra_section_appends_copy():
+    """with_extra_section 은 원본을 바꾸지 않고 섹션을 덧붙인 사본 반환"""
+    from app.adapters.messagecard import with_extra_section
+
+    payload = make_o365_card_feed1()
+    card = with_extra_section(payload, "Top offenders", [("project", "276459 (3)")])
+
+    assert len(payload["sections"]) == 1
+    assert len(card["sections"]) == 2
+    assert card["sections"][-1] == {
+        "activityTitle": "Top offenders",
+        "facts": [{"name": "project", "value": "276459 (3)"}],
+    }
+    assert VTWebhookMessage.model_validate(card).get_fact("project") == "276459 (3)"
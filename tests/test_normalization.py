@@ -0,0 +1,81 @@
+# tests/test_normalization.py
+import logging
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.adapters.messagecard import VTWebhookMessage
+from app.application.services.message_processor import MessageProcessor
+from app.domain.normalization import (
+    clear_caches,
+    extract_failure_reason,
+    strip_html_tags,
+)
+
+
+def setup_function():
+    """각 테스트 함수 실행 전에 캐시 초기화."""
+    clear_caches()
+
+
+# --- strip_html_tags 테스트 ------------------------------------------------
+
+def test_strip_html_tags_removes_tags():
+    """HTML 태그 제거"""
+    assert strip_html_tags("<p>영상 생성 <b>실패</b></p>") == "영상 생성 실패"
+
+
+def test_strip_html_tags_plain_text_unchanged():
+    """태그 없는 문자열은 그대로 반환"""
+    text = "Failure Reason: TIMEOUT"
+    assert strip_html_tags(text) is text
+
+
+def test_strip_html_tags_uses_cache():
+    """동일한 raw 문자열은 캐시에서 반환"""
+    strip_html_tags("<p>a</p>")
+    strip_html_tags("<p>a</p>")
+
+    info = strip_html_tags.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+
+# --- extract_failure_reason 테스트 -----------------------------------------
+
+def test_extract_failure_reason():
+    """Failure Reason 추출"""
+    assert extract_failure_reason("Failure Reason: API_ERROR, code=500") == "API_ERROR"
+
+
+def test_extract_failure_reason_missing():
+    """Failure Reason 이 없으면 None"""
+    assert extract_failure_reason("Invalid FailureReason value: VIDEO_QUEUE_FULL") is None
+    assert extract_failure_reason("") is None
+
+
+# --- 로그 레벨 생략 테스트 --------------------------------------------------
+
+@pytest.mark.anyio
+async def test_processor_skips_normalization_when_info_disabled():
+    """INFO 로그가 꺼져 있으면 정규화를 수행하지 않음"""
+    card = VTWebhookMessage(
+        title="Test",
+        sections=[{
+            "facts": [
+                {"name": "Error Detail", "value": "<p>Failure Reason: TIMEOUT</p>"}
+            ]
+        }]
+    )
+    processor_logger = logging.getLogger("app.application.services.message_processor")
+
+    with patch('app.application.services.message_processor.get_container') as mock_get_container, \
+         patch('app.application.services.message_processor.strip_html_tags') as mock_strip, \
+         patch.object(processor_logger, "isEnabledFor", return_value=False):
+        mock_container = MagicMock()
+        mock_container.alert_handler.handle_raw_alert = AsyncMock(return_value=True)
+        mock_get_container.return_value = mock_container
+
+        await MessageProcessor().process_feed1(card)
+
+        mock_strip.assert_not_called()
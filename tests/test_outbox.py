@@ -0,0 +1,373 @@
+# tests/test_outbox.py
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app import metrics
+from app.adapters import teams_notifier
+from app.adapters.memory_outbox import InMemoryOutboxStore
+from app.adapters.teams_notifier import TeamsNotifier, parse_retry_after
+from app.application.ports.notifier import FORWARD_CHANNEL, INCIDENT_CHANNEL, DeliveryResult
+from app.application.services.outbox import Lane, NotificationOutbox, QueuedNotifier
+
+
+class FakeSender:
+    """미리 정한 결과를 순서대로 돌려주는 NotificationSender"""
+
+    def __init__(self, *results: DeliveryResult):
+        self.results = list(results)
+        self.sent: list[tuple[str, dict]] = []
+
+    async def deliver(self, channel, card):
+        self.sent.append((channel, card))
+        if self.results:
+            return self.results.pop(0)
+        return DeliveryResult(ok=True, status=200)
+
+
+async def wait_for(predicate, timeout: float = 2.0):
+    async def _poll():
+        while not predicate():
+            await asyncio.sleep(0.005)
+    await asyncio.wait_for(_poll(), timeout)
+
+
+def make_outbox(sender, **kwargs):
+    kwargs.setdefault("base_delay", 0.0)
+    return NotificationOutbox(InMemoryOutboxStore(), sender, **kwargs)
+
+
+# --- NotificationOutbox ----------------------------------------------------
+
+@pytest.mark.anyio
+async def test_enqueued_messages_are_delivered():
+    sender = FakeSender()
+    outbox = make_outbox(sender, workers=2)
+    await outbox.start()
+
+    outbox.enqueue(FORWARD_CHANNEL, {"text": "a"})
+    outbox.enqueue(INCIDENT_CHANNEL, {"text": "b"})
+    await wait_for(lambda: len(sender.sent) == 2)
+    await outbox.close()
+
+    assert sorted(c for c, _ in sender.sent) == [FORWARD_CHANNEL, INCIDENT_CHANNEL]
+    assert await outbox.store.pending() == 0
+
+
+@pytest.mark.anyio
+async def test_retryable_failure_is_retried():
+    sender = FakeSender(
+        DeliveryResult(ok=False, status=503, retryable=True),
+        DeliveryResult(ok=False, status=429, retryable=True),
+    )
+    outbox = make_outbox(sender)
+    await outbox.start()
+
+    outbox.enqueue(FORWARD_CHANNEL, {"text": "a"})
+    await wait_for(lambda: len(sender.sent) == 3)
+    await outbox.close()
+
+    assert await outbox.store.pending() == 0
+    assert await outbox.store.dead_letters() == []
+
+
+@pytest.mark.anyio
+async def test_dead_letter_after_max_attempts():
+    failure = DeliveryResult(ok=False, status=500, retryable=True, error="boom")
+    sender = FakeSender(*[failure] * 5)
+    outbox = make_outbox(sender, max_attempts=3)
+    await outbox.start()
+
+    outbox.enqueue(INCIDENT_CHANNEL, {"text": "a"})
+    await wait_for(lambda: outbox.store._dead)
+    await outbox.close()
+
+    dead = await outbox.store.dead_letters()
+    assert len(sender.sent) == 3
+    assert [(m.channel, m.attempts, m.last_error) for m in dead] == [(INCIDENT_CHANNEL, 3, "boom")]
+
+
+@pytest.mark.anyio
+async def test_non_retryable_failure_goes_straight_to_dead_letter():
+    sender = FakeSender(DeliveryResult(ok=False, status=400))
+    outbox = make_outbox(sender)
+    await outbox.start()
+
+    outbox.enqueue(FORWARD_CHANNEL, {"text": "a"})
+    await wait_for(lambda: outbox.store._dead)
+    await outbox.close()
+
+    assert len(sender.sent) == 1
+    assert (await outbox.store.dead_letters())[0].last_error == "status=400"
+
+
+@pytest.mark.anyio
+async def test_sender_exception_is_retried():
+    class FlakySender(FakeSender):
+        async def deliver(self, channel, card):
+            if not self.sent:
+                self.sent.append((channel, card))
+                raise RuntimeError("connection reset")
+            return await super().deliver(channel, card)
+
+    sender = FlakySender()
+    outbox = make_outbox(sender)
+    await outbox.start()
+
+    outbox.enqueue(FORWARD_CHANNEL, {"text": "a"})
+    await wait_for(lambda: len(sender.sent) == 2)
+    await outbox.close()
+
+    assert await outbox.store.pending() == 0
+
+
+def test_backoff_is_capped_exponential_with_jitter():
+    outbox = NotificationOutbox(
+        InMemoryOutboxStore(), FakeSender(), base_delay=1.0, max_delay=10.0, jitter=lambda: 1.0
+    )
+    assert [outbox.backoff(n) for n in (1, 2, 3, 4, 5)] == [1.0, 2.0, 4.0, 8.0, 10.0]
+
+    outbox._jitter = lambda: 0.0
+    assert outbox.backoff(3) == 2.0
+
+    # Retry-After 는 상한과 jitter 없이 그대로
+    assert outbox.backoff(1, retry_after=42.0) == 42.0
+
+
+@pytest.mark.anyio
+async def test_retry_after_schedules_next_attempt():
+    now = [1000.0]
+    sender = FakeSender(DeliveryResult(ok=False, status=429, retryable=True, retry_after=30.0))
+    outbox = NotificationOutbox(InMemoryOutboxStore(), sender, clock=lambda: now[0])
+
+    outbox.enqueue(FORWARD_CHANNEL, {"text": "a"})
+    [message] = await outbox.store.claim(10, now[0])
+    await outbox._deliver(message)
+
+    assert await outbox.store.next_due() == 1030.0
+    assert await outbox.store.claim(10, 1029.0) == []
+    assert [m.id for m in await outbox.store.claim(10, 1030.0)] == [message.id]
+
+
+@pytest.mark.anyio
+async def test_close_drains_due_messages():
+    release = asyncio.Event()
+
+    class SlowSender(FakeSender):
+        async def deliver(self, channel, card):
+            await release.wait()
+            return await super().deliver(channel, card)
+
+    sender = SlowSender()
+    outbox = make_outbox(sender, workers=1)
+    await outbox.start()
+    for i in range(3):
+        outbox.enqueue(FORWARD_CHANNEL, {"text": str(i)})
+
+    asyncio.get_running_loop().call_later(0.05, release.set)
+    await outbox.close(drain_timeout=2.0)
+
+    assert len(sender.sent) == 3
+    assert await outbox.store.pending() == 0
+
+
+@pytest.mark.anyio
+async def test_close_leaves_backed_off_messages_pending():
+    sender = FakeSender(DeliveryResult(ok=False, status=503, retryable=True, retry_after=60.0))
+    outbox = make_outbox(sender)
+    await outbox.start()
+
+    outbox.enqueue(FORWARD_CHANNEL, {"text": "a"})
+    await wait_for(lambda: sender.sent)
+    await outbox.close(drain_timeout=0.5)
+
+    assert await outbox.store.pending() == 1
+
+
+@pytest.mark.anyio
+async def test_queued_notifier_only_enqueues():
+    sender = FakeSender()
+    outbox = make_outbox(sender)
+    notifier = QueuedNotifier(outbox)
+    before = metrics.get_counter("outbox_enqueued")
+
+    assert await notifier.send_to_forward_channel({"text": "a"}) is True
+    assert await notifier.send_to_incident_channel({"text": "b"}) is True
+
+    # 시작 전이므로 아직 아무것도 전송되지 않음
+    assert sender.sent == []
+    assert await outbox.store.pending() == 2
+    assert metrics.get_counter("outbox_enqueued") == before + 2
+
+
+# --- priority lanes --------------------------------------------------------
+
+@pytest.mark.anyio
+async def test_incident_is_not_queued_behind_forward_backlog():
+    release = asyncio.Event()
+
+    class SlowForwardSender(FakeSender):
+        async def deliver(self, channel, card):
+            if channel == FORWARD_CHANNEL:
+                await release.wait()
+            return await super().deliver(channel, card)
+
+    sender = SlowForwardSender()
+    outbox = make_outbox(sender, workers=2)
+    await outbox.start()
+    for i in range(200):
+        outbox.enqueue(FORWARD_CHANNEL, {"n": i})
+    outbox.enqueue(INCIDENT_CHANNEL, {"text": "page"})
+
+    # 포워딩 worker 가 모두 막혀 있어도 장애 알림은 전용 lane 으로 나간다
+    await wait_for(lambda: (INCIDENT_CHANNEL, {"text": "page"}) in sender.sent)
+    assert outbox.lane_stats()[FORWARD_CHANNEL]["pending"] == 200
+
+    release.set()
+    await wait_for(lambda: len(sender.sent) == 201)
+    await outbox.close()
+
+
+@pytest.mark.anyio
+async def test_forward_lane_sheds_when_full():
+    outbox = make_outbox(FakeSender(), lanes=[
+        Lane(INCIDENT_CHANNEL, 1, slo_seconds=10),
+        Lane(FORWARD_CHANNEL, 1, slo_seconds=60, max_pending=2),
+    ])
+    notifier = QueuedNotifier(outbox)
+    before = metrics.get_counter("outbox_shed.forward")
+
+    assert [await notifier.send_to_forward_channel({"n": i}) for i in range(3)] == [True, True, False]
+    # 장애 lane 은 제한 없음
+    assert all([await notifier.send_to_incident_channel({"n": i}) for i in range(5)])
+    assert metrics.get_counter("outbox_shed.forward") == before + 1
+    assert outbox.depth(FORWARD_CHANNEL) == 2
+
+
+@pytest.mark.anyio
+async def test_stale_forward_is_dropped_and_slo_is_tracked():
+    now = [1000.0]
+    sender = FakeSender()
+    outbox = NotificationOutbox(InMemoryOutboxStore(), sender, clock=lambda: now[0], lanes=[
+        Lane(INCIDENT_CHANNEL, 1, slo_seconds=5),
+        Lane(FORWARD_CHANNEL, 1, slo_seconds=60, max_age_seconds=120),
+    ])
+    shed = metrics.get_counter("outbox_shed.forward")
+    missed = metrics.get_counter("outbox_slo_missed.incident")
+
+    outbox.enqueue(FORWARD_CHANNEL, {"text": "old"})
+    outbox.enqueue(INCIDENT_CHANNEL, {"text": "late page"})
+    now[0] += 121
+    for message in await outbox.store.claim(10, now[0]):
+        await outbox._deliver(message)
+
+    assert sender.sent == [(INCIDENT_CHANNEL, {"text": "late page"})]
+    assert metrics.get_counter("outbox_shed.forward") == shed + 1
+    assert metrics.get_counter("outbox_slo_missed.incident") == missed + 1
+    assert outbox.lane_stats()[INCIDENT_CHANNEL]["latency_max"] >= 121
+    assert await outbox.store.pending() == 0
+
+
+def test_unknown_channel_is_rejected():
+    outbox = make_outbox(FakeSender())
+    with pytest.raises(ValueError):
+        outbox.enqueue("slack", {})
+
+
+# --- InMemoryOutboxStore ---------------------------------------------------
+
+@pytest.mark.anyio
+async def test_memory_store_claims_due_messages_in_order():
+    store = InMemoryOutboxStore(dead_letter_size=2)
+    ids = [store.put(FORWARD_CHANNEL, {"n": i}, now=100.0 + i) for i in range(3)]
+
+    claimed = await store.claim(10, now=101.0)
+    assert [m.id for m in claimed] == ids[:2]
+    # claim 된 메시지는 다시 나오지 않는다
+    assert await store.claim(10, now=101.0) == []
+    assert await store.next_due() == 102.0
+
+    for m in claimed + await store.claim(10, now=200.0):
+        await store.dead_letter(m)
+    assert [m.id for m in await store.dead_letters()] == [ids[2], ids[1]]
+    assert await store.pending() == 0
+
+
+@pytest.mark.anyio
+async def test_memory_store_claims_incidents_first():
+    store = InMemoryOutboxStore()
+    forwards = [store.put(FORWARD_CHANNEL, {}, now=100.0) for _ in range(3)]
+    incident = store.put(INCIDENT_CHANNEL, {}, now=105.0)
+
+    assert [m.id for m in await store.claim(2, now=110.0)] == [incident, forwards[0]]
+    assert [m.id for m in await store.claim(10, now=110.0, channel=INCIDENT_CHANNEL)] == []
+    assert await store.next_due(FORWARD_CHANNEL) == 100.0
+    assert await store.pending(FORWARD_CHANNEL) == 3
+    assert await store.pending(INCIDENT_CHANNEL) == 1
+
+
+# --- TeamsNotifier.deliver -------------------------------------------------
+
+URL = "https://example.webhook.office.com/webhookb2/x"
+
+
+def make_notifier(status: int, text: str = "1", headers: dict | None = None) -> TeamsNotifier:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status, text=text, headers=headers or {})
+    return TeamsNotifier(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "status, text, retryable",
+    [
+        (429, "Too Many Requests", True),
+        (503, "unavailable", True),
+        (408, "timeout", True),
+        (400, "Bad payload", False),
+        (404, "gone", False),
+    ],
+)
+async def test_deliver_classifies_errors(status, text, retryable):
+    notifier = make_notifier(status, text)
+    with patch.object(teams_notifier, "TEAMS_FORWARD_WEBHOOK_URL", URL):
+        result = await notifier.deliver(FORWARD_CHANNEL, {"text": "a"})
+    await notifier.aclose()
+
+    assert result.ok is False
+    assert result.status == status
+    assert result.retryable is retryable
+
+
+@pytest.mark.anyio
+async def test_deliver_treats_throttle_body_as_429():
+    notifier = make_notifier(200, "Webhook message delivery failed with error: Microsoft Teams endpoint returned HTTP error 429")
+    with patch.object(teams_notifier, "TEAMS_INCIDENT_WEBHOOK_URL", URL):
+        result = await notifier.deliver(INCIDENT_CHANNEL, {"text": "a"})
+    await notifier.aclose()
+
+    assert (result.ok, result.status, result.retryable) == (False, 429, True)
+
+
+@pytest.mark.anyio
+async def test_deliver_reads_retry_after_and_missing_url():
+    notifier = make_notifier(429, "slow down", headers={"Retry-After": "7"})
+    with patch.object(teams_notifier, "TEAMS_FORWARD_WEBHOOK_URL", URL):
+        assert (await notifier.deliver(FORWARD_CHANNEL, {})).retry_after == 7.0
+    with patch.object(teams_notifier, "TEAMS_FORWARD_WEBHOOK_URL", ""):
+        missing = await notifier.deliver(FORWARD_CHANNEL, {})
+    await notifier.aclose()
+
+    assert (missing.ok, missing.retryable) == (False, False)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("12") == 12.0
+    assert parse_retry_after("-3") == 0.0
+    assert parse_retry_after("not a date") is None
+    # 과거 HTTP-date 는 0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
@@ -0,0 +1,164 @@
+# tests/test_rate_limiter.py
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app import metrics
+from app.adapters import teams_notifier
+from app.adapters.rate_limiter import AdaptiveRateLimiter
+from app.adapters.teams_notifier import TeamsNotifier
+from app.application.ports.notifier import FORWARD_CHANNEL
+
+
+class FakeTime:
+    """sleep 하면 시계가 그만큼 흐르는 가짜 시간"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def clock(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+def make_limiter(fake: FakeTime, **kwargs) -> AdaptiveRateLimiter:
+    return AdaptiveRateLimiter(clock=fake.clock, sleep=fake.sleep, **kwargs)
+
+
+async def send(limiter: AdaptiveRateLimiter, key: str = "url") -> float:
+    started = await limiter.acquire(key)
+    limiter.release(key)
+    return started
+
+
+@pytest.mark.anyio
+async def test_token_bucket_paces_after_burst():
+    fake = FakeTime()
+    limiter = make_limiter(fake, rate=4.0, burst=2.0)
+
+    starts = [await send(limiter) for _ in range(6)]
+
+    # burst 2 개는 바로, 이후 0.25s 간격
+    assert starts == pytest.approx([0.0, 0.0, 0.25, 0.5, 0.75, 1.0])
+
+
+@pytest.mark.anyio
+async def test_destinations_have_independent_buckets():
+    fake = FakeTime()
+    limiter = make_limiter(fake, rate=1.0, burst=1.0)
+
+    assert await send(limiter, "a") == 0.0
+    assert await send(limiter, "b") == 0.0
+    assert await send(limiter, "a") == pytest.approx(1.0)
+
+
+@pytest.mark.anyio
+async def test_concurrency_is_capped_per_destination():
+    limiter = AdaptiveRateLimiter(rate=10.0, burst=10.0, max_concurrency=2)
+    active = peak = 0
+
+    async def worker():
+        nonlocal active, peak
+        await limiter.acquire("url")
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        limiter.release("url")
+
+    await asyncio.gather(*(worker() for _ in range(6)))
+    assert peak == 2
+
+
+@pytest.mark.anyio
+async def test_throttle_halves_rate_once_per_burst_and_success_recovers():
+    fake = FakeTime()
+    limiter = make_limiter(fake, rate=8.0, burst=8.0, min_rate=1.0, max_rate=8.0, increase=1.0)
+
+    # 같은 시점에 시작한 요청들이 연달아 429 → 한 번만 감소
+    started = [await limiter.acquire("url") for _ in range(3)]
+    for s in started:
+        limiter.release("url")
+        limiter.throttled("url", s)
+    assert limiter.rate("url") == 4.0
+
+    # 감소 이후 시작한 요청의 429 는 다시 반영
+    s = await send(limiter)
+    limiter.throttled("url", s)
+    assert limiter.rate("url") == 2.0
+
+    for _ in range(50):
+        await send(limiter)
+        limiter.success("url")
+    assert 2.0 < limiter.rate("url") <= 8.0
+
+
+@pytest.mark.anyio
+async def test_retry_after_pauses_destination():
+    fake = FakeTime()
+    limiter = make_limiter(fake, rate=10.0, burst=10.0)
+
+    s = await send(limiter)
+    limiter.throttled("url", s, retry_after=30.0)
+
+    assert await send(limiter) >= 30.0
+    assert limiter.snapshot()["url"]["paused_seconds"] == 0.0
+
+
+@pytest.mark.anyio
+async def test_queue_delay_is_observed():
+    fake = FakeTime()
+    limiter = make_limiter(fake, rate=2.0, burst=1.0)
+    before = metrics.snapshot()["observations"].get("teams_send_queue_delay_seconds", {"count": 0})
+
+    await send(limiter)
+    await send(limiter)
+
+    after = metrics.snapshot()["observations"]["teams_send_queue_delay_seconds"]
+    assert after["count"] == before["count"] + 2
+    assert after["max"] >= 0.5
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        AdaptiveRateLimiter(rate=20.0, max_rate=10.0)
+    with pytest.raises(ValueError):
+        AdaptiveRateLimiter(max_concurrency=0)
+    with pytest.raises(ValueError):
+        AdaptiveRateLimiter(decrease=1.0)
+
+
+# --- TeamsNotifier 연동 ----------------------------------------------------
+
+URL = "https://example.webhook.office.com/webhookb2/x"
+
+
+@pytest.mark.anyio
+async def test_notifier_feeds_429_into_limiter():
+    responses = [429, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(responses.pop(0), text="1", headers={"Retry-After": "0"})
+
+    limiter = AdaptiveRateLimiter(rate=4.0, burst=4.0)
+    notifier = TeamsNotifier(transport=httpx.MockTransport(handler), rate_limiter=limiter)
+    with patch.object(teams_notifier, "TEAMS_FORWARD_WEBHOOK_URL", URL):
+        throttled = await notifier.deliver(FORWARD_CHANNEL, {"text": "a"})
+        assert limiter.rate(URL) == 2.0
+        ok = await notifier.deliver(FORWARD_CHANNEL, {"text": "b"})
+    await notifier.aclose()
+
+    assert (throttled.status, ok.ok) == (429, True)
+    assert limiter.rate(URL) > 2.0
+    assert limiter.snapshot()["Teams forward"]["in_flight"] == 0
+
+
+def test_rate_limit_can_be_disabled():
+    with patch.object(teams_notifier, "TEAMS_RATE_LIMIT_PER_SECOND", 0):
+        assert TeamsNotifier().rate_limiter is None
+    assert TeamsNotifier().rate_limiter is not None
@@ -0,0 +1,173 @@
+# tests/test_sharding.py
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.adapters.graph_client import GraphClient
+from app.adapters.sqlite_membership import SqliteMembershipStore
+from app.application.services.message_poller import MessagePoller
+from app.application.services.poll_channels import parse_poll_channels
+from app.application.services.sharding import ShardCoordinator
+
+
+CHANNELS = [f"19:channel-{i}@thread.tacv2" for i in range(12)]
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def store(tmp_path, clock):
+    return SqliteMembershipStore(str(tmp_path / "shard" / "membership.db"), clock=clock)
+
+
+# --- parse_poll_channels ---------------------------------------------------
+
+def test_parse_poll_channels():
+    assert parse_poll_channels("feed1:19:a@thread, feed2:19:b@thread") == [
+        ("19:a@thread", "feed1"),
+        ("19:b@thread", "feed2"),
+    ]
+    # 비어 있으면 Feed1/Feed2 기본 채널
+    assert [feed for _, feed in parse_poll_channels("")] == ["feed1", "feed2"]
+    with pytest.raises(ValueError):
+        parse_poll_channels("feed3:19:a@thread")
+    with pytest.raises(ValueError):
+        parse_poll_channels("feed1:")
+
+
+# --- SqliteMembershipStore -------------------------------------------------
+
+@pytest.mark.anyio
+async def test_membership_heartbeat_and_expiry(store, clock):
+    assert await store.heartbeat("a", 30) == ["a"]
+    assert await store.heartbeat("b", 30) == ["a", "b"]
+
+    # a 가 heartbeat 를 멈추면 ttl 후 제외
+    clock.now += 20
+    assert await store.heartbeat("b", 30) == ["a", "b"]
+    clock.now += 15
+    assert await store.heartbeat("b", 30) == ["b"]
+
+
+@pytest.mark.anyio
+async def test_membership_leave(store):
+    await store.heartbeat("a", 30)
+    await store.heartbeat("b", 30)
+    await store.leave("a")
+    assert await store.heartbeat("b", 30) == ["b"]
+
+
+@pytest.mark.anyio
+async def test_watermark_never_moves_backwards(store):
+    assert await store.load_watermark("c1") is None
+
+    await store.save_watermark("c1", "2025-01-01T12:00:10+00:00")
+    await store.save_watermark("c1", "2025-01-01T12:00:05+00:00")
+    assert await store.load_watermark("c1") == "2025-01-01T12:00:10+00:00"
+
+    await store.save_watermark("c1", "2025-01-01T12:00:20+00:00")
+    assert await store.load_watermark("c1") == "2025-01-01T12:00:20+00:00"
+
+
+# --- ShardCoordinator ------------------------------------------------------
+
+@pytest.mark.anyio
+async def test_replicas_split_channels_disjointly(store):
+    coordinators = [ShardCoordinator(store, CHANNELS, member=f"poller-{i}") for i in range(3)]
+    for c in coordinators:
+        await c.refresh()
+    # 먼저 refresh 한 replica 도 전체 멤버를 보도록 한 번 더
+    owned = [await c.refresh() for c in coordinators]
+
+    assert sum(len(o) for o in owned) == len(CHANNELS)
+    assert frozenset().union(*owned) == frozenset(CHANNELS)
+    assert all(o for o in owned)
+
+
+@pytest.mark.anyio
+async def test_rebalance_when_replica_leaves(store):
+    a = ShardCoordinator(store, CHANNELS, member="poller-a")
+    b = ShardCoordinator(store, CHANNELS, member="poller-b")
+    await a.refresh()
+    await b.refresh()
+    owned_a = await a.refresh()
+    assert owned_a != frozenset(CHANNELS)
+
+    await b.leave()
+
+    assert await a.refresh() == frozenset(CHANNELS)
+
+
+@pytest.mark.anyio
+async def test_refresh_keeps_assignment_on_store_error(store):
+    coordinator = ShardCoordinator(store, CHANNELS, member="poller-a")
+    owned = await coordinator.refresh()
+
+    coordinator.store = MagicMock()
+    coordinator.store.heartbeat = AsyncMock(side_effect=OSError("locked"))
+
+    assert await coordinator.refresh() == owned
+
+
+# --- MessagePoller 연동 ----------------------------------------------------
+
+def make_poller(coordinator):
+    graph = MagicMock(spec=GraphClient)
+    graph.get_channel_messages = AsyncMock(return_value=[])
+    channels = [(c, "feed1") for c in CHANNELS]
+    return MessagePoller(graph, channels=channels, shards=coordinator), graph
+
+
+def polled_channels(graph) -> set:
+    return {call.kwargs["channel_id"] for call in graph.get_channel_messages.call_args_list}
+
+
+@pytest.mark.anyio
+async def test_pollers_only_poll_their_shard(store):
+    a, graph_a = make_poller(ShardCoordinator(store, CHANNELS, member="poller-a"))
+    b, graph_b = make_poller(ShardCoordinator(store, CHANNELS, member="poller-b"))
+    # 두 replica 모두 참여한 뒤
+    await a.shards.refresh()
+    await b.shards.refresh()
+
+    for poller in (a, b, a, b):
+        for channel_id, feed_type in await poller._channels_to_poll():
+            await poller.poll_channel(channel_id, feed_type)
+
+    assert polled_channels(graph_a) | polled_channels(graph_b) == set(CHANNELS)
+    assert polled_channels(graph_a) - set(a.shards.owned) == set()
+    assert set(a.last_check) == set(a.shards.owned)
+    assert set(b.last_check) == set(b.shards.owned)
+
+
+@pytest.mark.anyio
+async def test_watermark_handoff_on_takeover(store):
+    a, graph_a = make_poller(ShardCoordinator(store, CHANNELS, member="poller-a"))
+    b, graph_b = make_poller(ShardCoordinator(store, CHANNELS, member="poller-b"))
+    await a.shards.refresh()
+    owned_b = {c for c, _ in await b._channels_to_poll()}
+    await a._channels_to_poll()
+    assert owned_b and not owned_b & a.shards.owned
+
+    for channel_id in owned_b:
+        await b.poll_channel(channel_id, "feed1")
+    handed_over = {c: b.last_check[c] for c in owned_b}
+
+    # b 종료 → a 가 b 의 채널을 b 의 마지막 polling 시각부터 이어서 읽는다
+    await b.shards.leave()
+    await a._channels_to_poll()
+
+    assert a.shards.owned == frozenset(CHANNELS)
+    for channel_id, since in handed_over.items():
+        assert a.last_check[channel_id] == since
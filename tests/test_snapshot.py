@@ -0,0 +1,213 @@
+# tests/test_snapshot.py
+from datetime import datetime, timedelta, timezone
+import asyncio
+import json
+
+import pytest
+
+from app.adapters.snapshot_store import FileSnapshotStore
+from app.application.services.snapshot import AnomalySnapshotService
+from app.domain.anomaly import AnomalyDetector, SnapshotVersionError
+from app.domain.incident_type import IncidentType
+
+
+BASE = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def at(minutes: int = 0, seconds: int = 0) -> datetime:
+    return BASE + timedelta(minutes=minutes, seconds=seconds)
+
+
+def roundtrip(detector: AnomalyDetector) -> AnomalyDetector:
+    """JSON 을 거쳐 새 탐지기로 복원"""
+    restored = AnomalyDetector()
+    restored.restore(json.loads(json.dumps(detector.snapshot())))
+    return restored
+
+
+# --- AnomalyDetector.snapshot / restore ------------------------------------
+
+def test_restore_keeps_cooldown():
+    """복원 후에도 쿨다운 유지 → 재시작 직후 중복 알림 없음"""
+    detector = AnomalyDetector()
+    for second in (0, 10, 20):
+        detector.record_event(IncidentType.API_ERROR, at(0, second))
+
+    restored = roundtrip(detector)
+
+    assert restored.record_event(IncidentType.API_ERROR, at(1, 0)) is False
+    assert restored.record_event(IncidentType.API_ERROR, at(1, 10)) is False
+    assert restored.record_event(IncidentType.API_ERROR, at(1, 20)) is False
+    # 쿨다운(5분) 이후에는 다시 트리거
+    for second in (30, 40):
+        restored.record_event(IncidentType.API_ERROR, at(6, second))
+    assert restored.record_event(IncidentType.API_ERROR, at(6, 50)) is True
+
+
+def test_restore_keeps_exact_window():
+    """정확한 윈도우 (YT_DOWNLOAD_FAIL) 복원"""
+    detector = AnomalyDetector()
+    detector.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(0))
+    detector.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(5))
+
+    restored = roundtrip(detector)
+
+    assert restored.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(10)) is True
+
+
+def test_exact_window_snapshot_keeps_only_threshold_count():
+    """폭주 중에도 정확한 윈도우는 count 개만 저장, 이후 판정은 동일"""
+    detector = AnomalyDetector()
+    for second in range(0, 600, 2):
+        detector.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(0, second))
+
+    snapshot = detector.snapshot()
+    window = snapshot["keys"][0][5]
+    assert window[0] == "e"
+    assert len(window[1]) == 3
+
+    # 쿨다운 이후 시점에 같은 결과인지 비교
+    restored = roundtrip(detector)
+    for minute in (25, 38, 45):
+        assert restored.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(minute)) == \
+            detector.record_event(IncidentType.YT_DOWNLOAD_FAIL, at(minute))
+
+
+def test_restore_keeps_bucketed_window_and_dimension():
+    """slot 기반 윈도우 (TIMEOUT) 와 dimension 키 복원"""
+    detector = AnomalyDetector()
+    detector.record_event(IncidentType.TIMEOUT, at(0), "p1")
+    detector.record_event(IncidentType.TIMEOUT, at(10), "p1")
+    detector.record_event(IncidentType.TIMEOUT, at(10), "p2")
+
+    restored = roundtrip(detector)
+
+    assert len(restored) == 2
+    assert restored.record_event(IncidentType.TIMEOUT, at(20), "p2") is False
+    assert restored.record_event(IncidentType.TIMEOUT, at(20), "p1") is True
+
+
+def test_restore_naive_timestamps():
+    """naive 시각으로 기록한 상태도 naive 로 복원"""
+    detector = AnomalyDetector()
+    naive = datetime(2025, 1, 1, 12, 0, 0)
+    detector.record_event(IncidentType.TIMEOUT, naive)
+    detector.record_event(IncidentType.TIMEOUT, naive + timedelta(minutes=1))
+
+    restored = roundtrip(detector)
+
+    assert restored.record_event(IncidentType.TIMEOUT, naive + timedelta(minutes=2)) is True
+
+
+def test_restore_rejects_other_version():
+    detector = AnomalyDetector()
+    snapshot = detector.snapshot()
+    snapshot["version"] = 999
+
+    with pytest.raises(SnapshotVersionError):
+        AnomalyDetector().restore(snapshot)
+
+
+def test_restore_skips_unknown_incident_type():
+    detector = AnomalyDetector()
+    detector.record_event(IncidentType.TIMEOUT, at(0))
+    snapshot = detector.snapshot()
+    snapshot["keys"][0][0] = "REMOVED_TYPE"
+
+    assert AnomalyDetector().restore(snapshot) == 0
+
+
+# --- FileSnapshotStore / AnomalySnapshotService ----------------------------
+
+@pytest.mark.anyio
+async def test_file_store_roundtrip(tmp_path):
+    store = FileSnapshotStore(str(tmp_path / "state" / "anomaly.snapshot"))
+
+    assert await store.load() is None
+
+    await store.save({"version": 1, "keys": []})
+
+    assert await store.load() == {"version": 1, "keys": []}
+    assert [p.name for p in (tmp_path / "state").iterdir()] == ["anomaly.snapshot"]
+
+
+@pytest.mark.anyio
+async def test_file_store_concurrent_saves_do_not_share_temp_file(tmp_path):
+    """동시에 저장해도 임시 파일이 섞이지 않는다 (마지막 교체본이 온전한 스냅샷)"""
+    path = tmp_path / "anomaly.snapshot"
+    stores = [FileSnapshotStore(str(path)) for _ in range(8)]
+
+    await asyncio.gather(*(s.save({"version": 1, "keys": [i] * 5000}) for i, s in enumerate(stores)))
+
+    loaded = await stores[0].load()
+    assert loaded is not None and len(set(loaded["keys"])) == 1
+    assert [p.name for p in tmp_path.iterdir()] == ["anomaly.snapshot"]
+
+
+@pytest.mark.anyio
+async def test_file_store_ignores_corrupted_file(tmp_path):
+    path = tmp_path / "anomaly.snapshot"
+    path.write_bytes(b"not zlib")
+
+    assert await FileSnapshotStore(str(path)).load() is None
+
+
+@pytest.mark.anyio
+async def test_snapshot_service_save_and_restore(tmp_path):
+    """저장 → 새 탐지기에서 복원, 변경이 없으면 저장 생략"""
+    store = FileSnapshotStore(str(tmp_path / "anomaly.snapshot"))
+    detector = AnomalyDetector()
+    service = AnomalySnapshotService(detector, store)
+
+    for second in (0, 10, 20):
+        detector.record_event(IncidentType.API_ERROR, at(0, second))
+
+    assert await service.save() is True
+    assert await service.save() is False
+    assert await service.save(force=True) is True
+
+    restored = AnomalyDetector()
+    assert await AnomalySnapshotService(restored, store).restore() is True
+    assert restored.record_event(IncidentType.API_ERROR, at(0, 30)) is False
+
+
+@pytest.mark.anyio
+async def test_snapshot_service_without_snapshot(tmp_path):
+    service = AnomalySnapshotService(
+        AnomalyDetector(),
+        FileSnapshotStore(str(tmp_path / "missing.snapshot")),
+    )
+
+    assert await service.restore() is False
+
+
+@pytest.mark.anyio
+async def test_cancelled_save_finishes_write_before_final_save():
+    """주기 저장이 취소되어도 쓰기가 끝난 뒤에 task 가 끝난다 → 마지막 저장이 항상 나중"""
+    gate = asyncio.Event()
+    written = []
+
+    class SlowStore:
+        async def load(self):
+            return None
+
+        async def save(self, snapshot):
+            await gate.wait()
+            written.append(snapshot)
+
+    detector = AnomalyDetector()
+    detector.record_event(IncidentType.API_ERROR, at(0))
+    service = AnomalySnapshotService(detector, SlowStore())
+
+    task = asyncio.create_task(service.save())
+    await asyncio.sleep(0)
+    task.cancel()
+    await asyncio.sleep(0.01)
+    assert not task.done()
+
+    gate.set()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert len(written) == 1
+    assert await service.save(force=True) is True
+    assert len(written) == 2
@@ -0,0 +1,156 @@
+# tests/test_sqlite_outbox.py
+import asyncio
+import sqlite3
+import time
+
+import pytest
+
+from app.adapters.card_encoding import encode_card
+from app.adapters.sqlite_outbox import SqliteOutboxStore
+from app.adapters.worker_slot import claim_worker_slot
+from app.application.ports.notifier import FORWARD_CHANNEL, INCIDENT_CHANNEL
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "outbox" / "outbox.db")
+
+
+def rows(store_or_path) -> list[tuple]:
+    """열린 store 는 파일을 독점하므로 store 의 연결로 조회"""
+    sql = "SELECT id, status, attempts FROM outbox ORDER BY id"
+    if isinstance(store_or_path, SqliteOutboxStore):
+        return store_or_path._conn.execute(sql).fetchall()
+    conn = sqlite3.connect(store_or_path)
+    try:
+        return conn.execute(sql).fetchall()
+    finally:
+        conn.close()
+
+
+@pytest.mark.anyio
+async def test_unsent_and_claimed_messages_are_replayed(path):
+    store = SqliteOutboxStore(path, flush_interval=60)
+    await store.open()
+    ids = [store.put(FORWARD_CHANNEL, {"text": f"m{i}"}, now=100.0) for i in range(3)]
+
+    [first, second] = await store.claim(2, now=100.0)
+    await store.complete(first)
+    # second 는 전송 중 종료 (claimed 상태로 남음)
+    await store.close()
+
+    store = SqliteOutboxStore(path)
+    await store.open()
+    replayed = await store.claim(10, now=100.0)
+    await store.close()
+
+    assert [m.id for m in replayed] == [second.id, ids[2]]
+    assert replayed[0].card == {"text": "m1"}
+    # 저장된 인코딩을 그대로 재사용
+    assert encode_card(replayed[0].card) == b'{"text":"m1"}'
+    # 복구 후에도 id 는 이어서 증가
+    assert store.put(FORWARD_CHANNEL, {}, now=100.0) == ids[-1] + 1
+
+
+@pytest.mark.anyio
+async def test_reschedule_and_dead_letters_survive_restart(path):
+    store = SqliteOutboxStore(path, dead_letter_size=1)
+    await store.open()
+    for i in range(3):
+        store.put(INCIDENT_CHANNEL, {"n": i}, now=100.0)
+    a, b, c = await store.claim(3, now=100.0)
+
+    a.attempts, a.next_attempt_at, a.last_error = 2, 160.0, "status=429"
+    await store.reschedule(a)
+    for m in (b, c):
+        m.attempts, m.last_error = 1, "status=400"
+        await store.dead_letter(m)
+    await store.close()
+
+    # dead letter 는 dead_letter_size 개만 남는다
+    assert rows(path) == [(a.id, "pending", 2), (c.id, "dead", 1)]
+
+    store = SqliteOutboxStore(path, dead_letter_size=1)
+    await store.open()
+    assert await store.next_due() == 160.0
+    assert await store.claim(10, now=159.0) == []
+    [again] = await store.claim(10, now=160.0)
+    assert (again.id, again.attempts, again.last_error) == (a.id, 2, "status=429")
+    assert [m.id for m in await store.dead_letters()] == [c.id]
+    await store.close()
+
+
+@pytest.mark.anyio
+async def test_put_is_group_committed(path):
+    store = SqliteOutboxStore(path, flush_interval=60, batch_size=10_000)
+    await store.open()
+    for i in range(200):
+        store.put(FORWARD_CHANNEL, {"n": i}, now=100.0)
+
+    # put 만으로는 기록하지 않는다
+    assert rows(store) == []
+    assert await store.flush() == 200
+    assert len(rows(store)) == 200
+    assert await store.flush() == 0
+    await store.close()
+
+
+@pytest.mark.anyio
+async def test_flusher_commits_in_background(path):
+    store = SqliteOutboxStore(path, flush_interval=0.01)
+    await store.open()
+    store.put(FORWARD_CHANNEL, {"n": 1}, now=100.0)
+
+    deadline = time.monotonic() + 2
+    while store._journal and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+    # close 전에 이미 기록되어 있어야 한다
+    assert rows(store) == [(1, "pending", 0)]
+    await store.close()
+
+
+@pytest.mark.anyio
+async def test_file_is_exclusive_to_one_process(path):
+    store = SqliteOutboxStore(path)
+    await store.open()
+    store.put(FORWARD_CHANNEL, {}, now=100.0)
+    await store.flush()
+
+    other = SqliteOutboxStore(path, busy_timeout=0.1)
+    with pytest.raises(sqlite3.OperationalError):
+        await other.open()
+    await store.close()
+
+
+@pytest.mark.anyio
+async def test_journal_records_values_at_change_time(path):
+    """flush 전에 message 가 다시 바뀌어도 journal 에는 변경 시점의 값이 기록된다"""
+    store = SqliteOutboxStore(path, flush_interval=60)
+    await store.open()
+    store.put(INCIDENT_CHANNEL, {"n": 1}, now=100.0)
+    [m] = await store.claim(1, now=100.0)
+    m.attempts, m.next_attempt_at, m.last_error = 1, 110.0, "status=429"
+    await store.reschedule(m)
+
+    # 다음 시도 중 (아직 flush 전)
+    m.attempts, m.last_error = 2, "status=503"
+    await store.flush()
+
+    assert rows(store) == [(m.id, "pending", 1)]
+    await store.close()
+
+
+@pytest.mark.anyio
+async def test_workers_sharing_outbox_path_get_separate_files(path):
+    """같은 OUTBOX_PATH 라도 worker slot 으로 파일이 나뉘어 둘 다 열린다"""
+    slots = [claim_worker_slot(path), claim_worker_slot(path)]
+    stores = [SqliteOutboxStore(slot.path, busy_timeout=0.1) for slot in slots]
+    try:
+        for store in stores:
+            await store.open()
+        assert [slot.path for slot in slots] == [path, path[:-len(".db")] + ".1.db"]
+    finally:
+        for store in stores:
+            await store.close()
+        for slot in slots:
+            slot.release()
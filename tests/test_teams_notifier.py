@@ -0,0 +1,119 @@
+# tests/test_teams_notifier.py
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.adapters import teams_notifier
+from app.adapters.messagecard import VTWebhookMessage
+from app.adapters.teams_notifier import TeamsNotifier
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """요청을 기록하고 status 로 응답하는 transport"""
+
+    def __init__(self, status: int = 200):
+        self.status = status
+        self.requests: list[httpx.Request] = []
+        self.closed = False
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(self.status, text="1")
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+URL = "https://example.webhook.office.com/webhookb2/x"
+
+
+@pytest.mark.anyio
+async def test_client_is_reused_across_messages():
+    transport = RecordingTransport()
+    notifier = TeamsNotifier(transport=transport)
+
+    assert await notifier._post_to_teams(URL, {"text": "a"}, "test") is True
+    client = notifier._client
+    assert await notifier._post_to_teams(URL, {"text": "b"}, "test") is True
+
+    assert notifier._client is client
+    assert len(transport.requests) == 2
+    await notifier.aclose()
+
+
+@pytest.mark.anyio
+async def test_open_then_aclose_and_reopen():
+    transport = RecordingTransport()
+    notifier = TeamsNotifier(transport=transport)
+
+    client = notifier.open()
+    assert notifier.open() is client
+
+    await notifier.aclose()
+    assert client.is_closed
+    assert transport.closed
+
+    # 닫힌 뒤 전송하면 새 클라이언트로 다시 연다
+    assert await notifier._post_to_teams(URL, {"text": "a"}, "test") is True
+    assert notifier._client is not client
+    await notifier.aclose()
+
+
+@pytest.mark.anyio
+async def test_error_response_returns_false():
+    notifier = TeamsNotifier(transport=RecordingTransport(status=429))
+    assert await notifier._post_to_teams(URL, {"text": "a"}, "test") is False
+    await notifier.aclose()
+
+
+@pytest.mark.anyio
+async def test_missing_url_skips_without_client():
+    notifier = TeamsNotifier(transport=RecordingTransport())
+    assert await notifier._post_to_teams("", {"text": "a"}, "test") is False
+    assert notifier._client is None
+
+
+def test_pool_limits():
+    notifier = TeamsNotifier(max_connections=7, max_keepalive_connections=3, keepalive_expiry=12.5)
+    assert notifier.limits.max_connections == 7
+    assert notifier.limits.max_keepalive_connections == 3
+    assert notifier.limits.keepalive_expiry == 12.5
+
+
+def test_http2_falls_back_without_h2():
+    with patch.object(teams_notifier, "http2_available", return_value=False):
+        assert TeamsNotifier(http2=True).http2 is False
+    with patch.object(teams_notifier, "http2_available", return_value=True):
+        assert TeamsNotifier(http2=True).http2 is True
+
+
+@pytest.mark.anyio
+async def test_module_functions_share_default_notifier():
+    transport = RecordingTransport()
+    default = teams_notifier.get_default_notifier()
+    await default.aclose()
+
+    with patch.object(default, "_transport", transport), \
+         patch.object(teams_notifier, "TEAMS_FORWARD_WEBHOOK_URL", URL), \
+         patch.object(teams_notifier, "TEAMS_INCIDENT_WEBHOOK_URL", URL):
+        await teams_notifier.post_to_forward_channel({"text": "a"})
+        client = default._client
+        await teams_notifier.post_to_incident_channel({"text": "b"})
+        assert default._client is client
+        await default.aclose()
+
+    assert len(transport.requests) == 2
+
+
+@pytest.mark.anyio
+async def test_graph_card_is_posted_as_original_bytes():
+    transport = RecordingTransport()
+    notifier = TeamsNotifier(transport=transport)
+    raw = '{ "@type": "MessageCard", "title": "🚨 에러", "sections": [] }'
+
+    assert await notifier._post_to_teams(URL, VTWebhookMessage.from_json(raw).to_payload(), "test") is True
+    [request] = transport.requests
+    assert request.content == raw.encode("utf-8")
+    assert request.headers["Content-Type"] == "application/json"
+    await notifier.aclose()
@@ -0,0 +1,45 @@
+# tests/test_worker_slot.py
+import multiprocessing
+
+from app.adapters.worker_slot import claim_worker_slot, slot_path
+
+
+def test_slot_path():
+    assert slot_path("data/outbox.db", 0) == "data/outbox.db"
+    assert slot_path("data/outbox.db", 2) == "data/outbox.2.db"
+    assert slot_path("data/anomaly", 1) == "data/anomaly.1"
+    assert slot_path("data/w{worker}/outbox.db", 0) == "data/w0/outbox.db"
+
+
+def test_each_claim_gets_its_own_slot_until_released(tmp_path):
+    path = str(tmp_path / "state" / "outbox.db")
+    first = claim_worker_slot(path)
+    second = claim_worker_slot(path)
+
+    assert (first.index, first.path) == (0, path)
+    assert (second.index, second.path) == (1, str(tmp_path / "state" / "outbox.1.db"))
+
+    # 반납된 slot 은 다음 프로세스(재시작한 worker)가 이어받는다
+    first.release()
+    again = claim_worker_slot(path)
+    assert again.index == 0
+    for slot in (second, again):
+        slot.release()
+
+
+def _claim_in_child(path, queue):
+    slot = claim_worker_slot(path)
+    queue.put(slot.index)
+    slot.release()
+
+
+def test_other_process_skips_claimed_slot(tmp_path):
+    path = str(tmp_path / "anomaly.snapshot")
+    slot = claim_worker_slot(path)
+    queue = multiprocessing.get_context("fork").Queue()
+    child = multiprocessing.get_context("fork").Process(target=_claim_in_child, args=(path, queue))
+    child.start()
+    child.join(10)
+
+    assert queue.get(timeout=1) == 1
+    slot.release()